@@ -2,6 +2,8 @@ from flask import Flask, jsonify, request, render_template_string
 from flask_cors import CORS
 from database import TradingDatabase
 from autonomous_engine import AutonomousEngine
+from engine_registry import get_engine_registry
+from cycle_jobs import get_job_runner, get_job_store
 from logger import autonomous_logger as logger
 import os
 from datetime import datetime, timedelta
@@ -23,6 +25,32 @@ CORS(app)
 
 db = TradingDatabase()
 
+# Shared, lazily built engine and Opinion.trade client for this worker (see engine_registry.py)
+registry = get_engine_registry(db)
+if os.getenv('REGISTRY_WARMUP', 'false').lower() == 'true':
+    registry.warm_up()
+
+
+def _submit_cycle_job(source):
+    """
+    Queue a daily cycle for the job runner (see cycle_jobs.py) and return the 202 response.
+    If a cycle is already queued or running, its job id is returned instead.
+    """
+    job_id, created = get_job_store().submit(source)
+    # Runner thread of this worker (None when a dedicated worker process runs the queue)
+    runner = get_job_runner(registry.cycle_lease)
+    if runner is not None:
+        runner.wake()
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued' if created else get_job_store().get(job_id)['status'],
+        'created': created,
+        'status_url': f"/api/cycles/{job_id}",
+        'message': 'Daily cycle queued' if created else 'A daily cycle is already queued or running'
+    }), 202
+
 AI_FIRMS = {
     'ChatGPT': {'model': 'gpt-4o', 'color': '#3B82F6'},
     'Gemini': {'model': 'gemini-2.5-pro → gemini-2.5-flash', 'color': '#8B5CF6'},
@@ -495,11 +523,9 @@ def get_active_positions():
 def get_recent_trades():
     """Get recent trades from Opinion.trade (últimos 20 trades)"""
     try:
-        from opinion_trade_api import OpinionTradeAPI
-        
         limit = request.args.get('limit', 20, type=int)
         
-        opinion_api = OpinionTradeAPI()
+        opinion_api = registry.get_opinion_api()
         trades_response = opinion_api.get_my_trades(limit=limit)
         
         if trades_response.get('success'):
@@ -618,13 +644,10 @@ def monitor_orders():
     try:
         print(f"\n[ORDER MONITOR] Triggered via API endpoint at {datetime.now().isoformat()}")
         
-        from autonomous_engine import AutonomousEngine, OrderMonitor
+        from autonomous_engine import OrderMonitor
         
-        # Pass credentials explicitly to avoid Gunicorn multi-worker env var issues
-        api_key = os.getenv('OPINION_TRADE_API_KEY')
-        private_key = os.getenv('OPINION_WALLET_PRIVATE_KEY')
-        
-        engine = AutonomousEngine(db, opinion_api_key=api_key, opinion_private_key=private_key)
+        # Shared engine of this worker (built once, credentials read from env by the registry)
+        engine = registry.get_engine()
         
         order_monitor = OrderMonitor(engine.opinion_api, engine.db, engine.orchestrator)
         monitoring_stats = order_monitor.monitor_all_orders()
@@ -658,8 +681,10 @@ def run_daily_cycle():
     Security: Requires X-Cron-Secret header matching CRON_SECRET environment variable.
     Uses constant-time comparison to prevent timing attacks.
     
+    The cycle runs on the job runner (cycle_jobs.py), not inside the request.
+    
     Returns:
-        JSON with cycle execution results
+        202 with the job id; poll /api/cycles/<job_id> for progress and results
     """
     from flask import request
     import hmac
@@ -686,30 +711,65 @@ def run_daily_cycle():
     
     try:
         print(f"\n[MANUAL TRIGGER] Daily cycle triggered via API endpoint at {datetime.now().isoformat()}")
-        
-        # Pass credentials explicitly to avoid Gunicorn multi-worker env var issues
-        api_key = os.getenv('OPINION_TRADE_API_KEY')
-        private_key = os.getenv('OPINION_WALLET_PRIVATE_KEY')
-        
-        engine = AutonomousEngine(db, opinion_api_key=api_key, opinion_private_key=private_key)
-        results = engine.run_daily_cycle()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Daily cycle completed successfully',
-            'results': results
-        }), 200
+        return _submit_cycle_job('cron')
         
     except Exception as e:
         import traceback
         error_traceback = traceback.format_exc()
-        print(f"[ERROR] Daily cycle failed: {str(e)}")
+        print(f"[ERROR] Daily cycle submission failed: {str(e)}")
         print(error_traceback)
         
         return jsonify({
             'success': False,
             'error': str(e),
-            'message': 'Daily cycle failed'
+            'message': 'Daily cycle submission failed'
+        }), 500
+
+@app.route('/api/cycles/<job_id>', methods=['GET'])
+def get_cycle_job(job_id):
+    """
+    Status of a queued daily cycle (PROTECTED ENDPOINT).
+    
+    Security: Requires the X-Cron-Secret header (CRON_SECRET), or the admin password
+    via query parameter or X-Admin-Password header.
+    
+    Returns:
+        JSON with the job status (queued/running/succeeded/failed), the current stage,
+        per-firm progress and, once finished, the cycle results
+    """
+    import hmac
+    
+    cron_secret = os.getenv('CRON_SECRET')
+    admin_password = os.getenv('ADMIN_PASSWORD')
+    provided_secret = request.headers.get('X-Cron-Secret', '')
+    provided_password = request.args.get('password') or request.headers.get('X-Admin-Password', '')
+    
+    authorized = (
+        (cron_secret and provided_secret and hmac.compare_digest(cron_secret, provided_secret))
+        or (admin_password and provided_password and hmac.compare_digest(admin_password, provided_password))
+    )
+    if not authorized:
+        logger.warning(f"Unauthorized cycle status request from {request.remote_addr}", prefix="SECURITY")
+        return jsonify({
+            'success': False,
+            'error': 'Unauthorized'
+        }), 401
+    
+    try:
+        job = get_job_store().get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+        
+        return jsonify({'success': True, 'job': job}), 200
+        
+    except Exception as e:
+        logger.error(f"Cycle status retrieval failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
         }), 500
 
 @app.route('/admin', methods=['GET'])
@@ -916,7 +976,7 @@ def admin_page():
                 submitBtn.textContent = 'Running...';
                 statusDiv.className = 'status loading';
                 statusDiv.style.display = 'block';
-                statusDiv.innerHTML = '<span class="spinner"></span>Executing daily cycle... This may take 2-3 minutes.';
+                statusDiv.innerHTML = '<span class="spinner"></span>Queueing daily cycle...';
                 
                 try {
                     const response = await fetch('/admin/trigger-cycle', {
@@ -929,12 +989,39 @@ def admin_page():
                     
                     const data = await response.json();
                     
-                    if (response.ok && data.success) {
+                    if (!response.ok || !data.success) {
+                        throw new Error(data.error || data.message || 'Unknown error');
+                    }
+                    
+                    // The cycle runs on the job runner: poll its status until it finishes
+                    let job = null;
+                    while (true) {
+                        const statusResponse = await fetch(data.status_url, {
+                            headers: { 'X-Admin-Password': password }
+                        });
+                        const statusData = await statusResponse.json();
+                        if (!statusResponse.ok || !statusData.success) {
+                            throw new Error(statusData.error || 'Failed to read cycle status');
+                        }
+                        job = statusData.job;
+                        if (job.status === 'succeeded' || job.status === 'failed') break;
+                        
+                        const progress = job.progress || {};
+                        let html = `<span class="spinner"></span>Daily cycle ${job.status}`;
+                        if (progress.stage) html += ` - stage: ${progress.stage}`;
+                        Object.entries(progress.firms || {}).forEach(([firm, state]) => {
+                            html += `<div style="margin-left:10px">• ${firm}: ${state.status}</div>`;
+                        });
+                        statusDiv.innerHTML = html;
+                        await new Promise(resolve => setTimeout(resolve, 3000));
+                    }
+                    
+                    if (job.status === 'succeeded') {
                         statusDiv.className = 'status success';
                         let html = '✅ Daily cycle completed successfully!';
                         
-                        if (data.results) {
-                            const r = data.results;
+                        if (job.result) {
+                            const r = job.result;
                             html += '<div class="results">';
                             html += `<div><strong>Status:</strong> ${r.status || 'completed'}</div>`;
                             html += `<div><strong>Bets Placed:</strong> ${r.total_bets_placed || 0}</div>`;
@@ -953,12 +1040,15 @@ def admin_page():
                         statusDiv.innerHTML = html;
                         passwordInput.value = '';
                     } else {
+                        const errors = (job.result && job.result.errors) || [];
+                        let message = job.error || 'Daily cycle failed';
+                        if (errors.length) message += '. Errors: ' + errors.slice(0, 3).join('; ');
                         statusDiv.className = 'status error';
-                        statusDiv.innerHTML = '❌ ' + (data.error || data.message || 'Unknown error');
+                        statusDiv.innerHTML = '❌ ' + message;
                     }
                 } catch (error) {
                     statusDiv.className = 'status error';
-                    statusDiv.innerHTML = '❌ Network error: ' + error.message;
+                    statusDiv.innerHTML = '❌ ' + error.message;
                 } finally {
                     submitBtn.disabled = false;
                     submitBtn.textContent = 'Run Daily Cycle';
@@ -1050,54 +1140,18 @@ def trigger_cycle():
                 'error': 'Invalid password'
             }), 401
         
-        # Execute daily cycle (now faster with liquidity filter + 600s timeout)
         logger.admin(f"Daily cycle manually triggered from {request.remote_addr} at {datetime.now().isoformat()}")
-        
-        # Pass credentials explicitly from startup context where they ARE available
-        # to avoid Gunicorn multi-worker environment variable issues
-        api_key = os.getenv('OPINION_TRADE_API_KEY')
-        private_key = os.getenv('OPINION_WALLET_PRIVATE_KEY')
-        
-        engine = AutonomousEngine(db, opinion_api_key=api_key, opinion_private_key=private_key)
-        results = engine.run_daily_cycle()
-        
-        # Check if the cycle actually succeeded based on results
-        cycle_success = results.get('success', False)
-        has_critical_error = results.get('critical_error')
-        errors = results.get('errors', [])
-        
-        if cycle_success:
-            logger.admin("Daily cycle completed successfully")
-            return jsonify({
-                'success': True,
-                'message': 'Daily cycle completed successfully',
-                'results': results
-            }), 200
-        else:
-            # Cycle failed - return detailed error information
-            error_message = has_critical_error or 'Daily cycle failed'
-            if errors:
-                error_message = f"{error_message}. Errors: {'; '.join(errors[:3])}"  # Show first 3 errors
-            
-            logger.error(f"Daily cycle failed: {error_message}")
-            
-            return jsonify({
-                'success': False,
-                'message': error_message,
-                'critical_error': has_critical_error,
-                'errors': errors,
-                'results': results
-            }), 500
+        return _submit_cycle_job('admin')
         
     except Exception as e:
         import traceback
         error_traceback = traceback.format_exc()
-        logger.error(f"Admin-triggered cycle failed: {str(e)}\n{error_traceback}")
+        logger.error(f"Admin-triggered cycle submission failed: {str(e)}\n{error_traceback}")
         
         return jsonify({
             'success': False,
             'error': str(e),
-            'message': 'Daily cycle execution failed'
+            'message': 'Daily cycle submission failed'
         }), 500
 
 @app.route('/admin/logs', methods=['GET'])
@@ -1155,6 +1209,137 @@ def get_admin_logs():
             'message': 'Failed to retrieve logs'
         }), 500
 
+@app.route('/admin/rpc-pool', methods=['GET'])
+def get_rpc_pool_state():
+    """
+    Admin endpoint to inspect the BNB Chain RPC pool (health, latency, error rates).
+    Pass probe=1 to re-probe every endpoint before reporting.
+    Requires password authentication via query parameter or header
+    """
+    import hmac
+    from rpc_pool import get_rpc_pool
+    
+    try:
+        provided_password = request.args.get('password') or request.headers.get('X-Admin-Password', '')
+        
+        admin_password = os.getenv('ADMIN_PASSWORD')
+        if not admin_password:
+            return jsonify({
+                'success': False,
+                'error': 'Admin password not configured on server'
+            }), 500
+        
+        if not provided_password or not hmac.compare_digest(admin_password, provided_password):
+            logger.warning(f"Failed admin rpc-pool access attempt from {request.remote_addr}", prefix="SECURITY")
+            return jsonify({
+                'success': False,
+                'error': 'Invalid password'
+            }), 401
+        
+        pool = get_rpc_pool()
+        probe_results = None
+        if request.args.get('probe') in ('1', 'true'):
+            probe_results = pool.probe_all()
+        
+        return jsonify({
+            'success': True,
+            'pool': pool.snapshot(),
+            'probe_results': probe_results,
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Admin rpc-pool retrieval failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/admin/registry', methods=['GET'])
+def get_registry_state():
+    """
+    Admin endpoint to inspect this worker's shared engine/client registry.
+    Pass refresh=1 to drop the shared instances (rebuilt on next use).
+    Requires password authentication via query parameter or header
+    """
+    import hmac
+    
+    try:
+        provided_password = request.args.get('password') or request.headers.get('X-Admin-Password', '')
+        
+        admin_password = os.getenv('ADMIN_PASSWORD')
+        if not admin_password:
+            return jsonify({
+                'success': False,
+                'error': 'Admin password not configured on server'
+            }), 500
+        
+        if not provided_password or not hmac.compare_digest(admin_password, provided_password):
+            logger.warning(f"Failed admin registry access attempt from {request.remote_addr}", prefix="SECURITY")
+            return jsonify({
+                'success': False,
+                'error': 'Invalid password'
+            }), 401
+        
+        if request.args.get('refresh') in ('1', 'true'):
+            registry.refresh('admin')
+        
+        return jsonify({
+            'success': True,
+            'registry': registry.snapshot(),
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Admin registry retrieval failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/admin/memory', methods=['GET'])
+def get_memory_trend():
+    """
+    Admin endpoint to show memory use across recent cycles (MEMORY_PROFILING_ENABLED=true).
+    Pass limit=N for the number of cycles (default 30).
+    Requires password authentication via query parameter or header
+    """
+    import hmac
+    from cycle_memory import summarize_trend
+    
+    try:
+        provided_password = request.args.get('password') or request.headers.get('X-Admin-Password', '')
+        
+        admin_password = os.getenv('ADMIN_PASSWORD')
+        if not admin_password:
+            return jsonify({
+                'success': False,
+                'error': 'Admin password not configured on server'
+            }), 500
+        
+        if not provided_password or not hmac.compare_digest(admin_password, provided_password):
+            logger.warning(f"Failed admin memory access attempt from {request.remote_addr}", prefix="SECURITY")
+            return jsonify({
+                'success': False,
+                'error': 'Invalid password'
+            }), 401
+        
+        limit = min(int(request.args.get('limit', 30)), 200)
+        memory = summarize_trend(db.get_cycle_memory_profiles(limit))
+        
+        return jsonify({
+            'success': True,
+            'memory': memory,
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Admin memory retrieval failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/admin/initialize-portfolios', methods=['POST'])
 def initialize_portfolios():
     """Admin endpoint to initialize portfolios for all 5 AI agents"""
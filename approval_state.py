@@ -0,0 +1,132 @@
+"""
+Approval State
+==============
+Disk cache of "trading enabled" (token approvals) per wallet and chain.
+
+client.enable_trading() and place_order(check_approval=True) both read allowances
+from the chain (and send approval transactions when missing). The SDK only remembers
+the result in memory, per Client, so every OpinionTradeAPI built by an API handler
+repeats those RPC reads. The store records when a wallet was last verified; while
+the record is younger than the TTL, client startup skips enable_trading and orders
+are placed with check_approval=False. Any approval/allowance error invalidates it.
+
+Configuration:
+    APPROVAL_STATE_DB             SQLite file path (default: approval_state.db)
+    APPROVAL_STATE_TTL_SECONDS    Seconds a verification stays valid (default: 86400)
+    APPROVAL_STATE_ENABLED        "false" to always check approvals
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Substrings of SDK/contract errors that mean approvals are missing or were revoked
+APPROVAL_ERROR_MARKERS = (
+    'allowance',
+    'approv',
+    'not enabled',
+    'enable trading',
+    'enable_trading',
+)
+
+
+def is_approval_error(message: str) -> bool:
+    message = (message or '').lower()
+    return any(marker in message for marker in APPROVAL_ERROR_MARKERS)
+
+
+class ApprovalStateStore:
+    """Per-wallet trading-enabled records with a TTL, shared across processes via SQLite."""
+
+    def __init__(self, db_path: str = 'approval_state.db', ttl_seconds: float = 86400.0):
+        """
+        Args:
+            db_path: SQLite file shared by every process
+            ttl_seconds: Seconds a successful verification is trusted
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS approval_state (
+            wallet TEXT NOT NULL,
+            chain_id INTEGER NOT NULL,
+            verified_at REAL NOT NULL,
+            source TEXT,
+            PRIMARY KEY (wallet, chain_id)
+            )
+            ''')
+
+    @classmethod
+    def from_env(cls) -> 'ApprovalStateStore':
+        return cls(
+            db_path=os.environ.get('APPROVAL_STATE_DB', 'approval_state.db'),
+            ttl_seconds=float(os.environ.get('APPROVAL_STATE_TTL_SECONDS', '86400'))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 30000')
+            self._local.conn = conn
+        return conn
+
+    def is_enabled(self, wallet: str, chain_id: int) -> bool:
+        """True if the wallet was verified on this chain within the TTL."""
+        row = self._connection().execute(
+            'SELECT verified_at FROM approval_state WHERE wallet = ? AND chain_id = ?',
+            (wallet.lower(), int(chain_id))
+        ).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl_seconds
+
+    def mark_enabled(self, wallet: str, chain_id: int, source: str = 'enable_trading'):
+        """Record a successful approval check (source: what verified it)."""
+        self._connection().execute('''
+        INSERT INTO approval_state (wallet, chain_id, verified_at, source) VALUES (?, ?, ?, ?)
+        ON CONFLICT(wallet, chain_id) DO UPDATE SET verified_at = excluded.verified_at, source = excluded.source
+        ''', (wallet.lower(), int(chain_id), time.time(), source))
+
+    def invalidate(self, wallet: str, chain_id: Optional[int] = None):
+        """Forget the wallet's verification (on every chain when chain_id is None)."""
+        if chain_id is None:
+            self._connection().execute('DELETE FROM approval_state WHERE wallet = ?', (wallet.lower(),))
+        else:
+            self._connection().execute('DELETE FROM approval_state WHERE wallet = ? AND chain_id = ?',
+                                       (wallet.lower(), int(chain_id)))
+
+    def status(self, wallet: str, chain_id: int) -> Dict:
+        row = self._connection().execute(
+            'SELECT verified_at, source FROM approval_state WHERE wallet = ? AND chain_id = ?',
+            (wallet.lower(), int(chain_id))
+        ).fetchone()
+        if row is None:
+            return {'enabled': False, 'age_seconds': None, 'source': None, 'ttl_seconds': self.ttl_seconds}
+        age = time.time() - row[0]
+        return {
+            'enabled': age < self.ttl_seconds,
+            'age_seconds': round(age, 1),
+            'source': row[1],
+            'ttl_seconds': self.ttl_seconds,
+        }
+
+
+_store: Optional[ApprovalStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_approval_store() -> Optional[ApprovalStateStore]:
+    """Process-wide store, or None when APPROVAL_STATE_ENABLED=false."""
+    global _store
+    if os.environ.get('APPROVAL_STATE_ENABLED', 'true').lower() == 'false':
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ApprovalStateStore.from_env()
+        return _store
@@ -0,0 +1,123 @@
+"""
+Async Opinion.trade Facade
+==========================
+Awaitable wrapper around OpinionTradeAPI.
+
+The SDK is blocking, so every call runs in a dedicated, bounded thread pool and
+an asyncio.Semaphore caps the number of calls in flight. Callers can overlap
+dozens of exchange requests (asyncio.gather) without spawning unbounded threads.
+
+Usage:
+    async with AsyncOpinionTradeAPI(opinion_api) as async_api:
+        books = await async_api.get_orderbooks(token_ids, call_site='monitor')
+
+From synchronous code (Flask handlers, engine) wrap the coroutine in asyncio.run().
+"""
+
+import asyncio
+import functools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+
+class AsyncOpinionTradeAPI:
+    """
+    Async facade over a (shared) OpinionTradeAPI instance.
+    Results are the same dicts the sync methods return.
+    """
+
+    def __init__(self, api=None, max_concurrency: Optional[int] = None, **api_kwargs):
+        """
+        Args:
+            api: Existing OpinionTradeAPI to wrap (shares its client and caches).
+                 If None, one is built with api_kwargs.
+            max_concurrency: Max SDK calls in flight (defaults to OPINION_ASYNC_MAX_CONCURRENCY or 16)
+            api_kwargs: Passed to OpinionTradeAPI() when api is None
+        """
+        if api is None:
+            from opinion_trade_api import OpinionTradeAPI
+            api = OpinionTradeAPI(**api_kwargs)
+        self.api = api
+
+        if max_concurrency is None:
+            max_concurrency = int(os.environ.get('OPINION_ASYNC_MAX_CONCURRENCY', '16'))
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='opinion-async')
+        # asyncio primitives are bound to one event loop; asyncio.run() creates a new loop per call
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._closed = False
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, method, *args, **kwargs):
+        """Run a blocking API method in the bounded executor."""
+        if self._closed:
+            raise RuntimeError('AsyncOpinionTradeAPI is closed')
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    # ------------------------------------------------------------------
+    # Awaitable versions of the OpinionTradeAPI methods
+    # ------------------------------------------------------------------
+
+    async def get_available_events(self, limit: int = 200, category: Optional[str] = None, **kwargs) -> Dict:
+        return await self._run(self.api.get_available_events, limit=limit, category=category, **kwargs)
+
+    async def get_orderbook(self, token_id: str, call_site: str = 'default', fresh: bool = False) -> Dict:
+        return await self._run(self.api.get_orderbook, token_id, call_site=call_site, fresh=fresh)
+
+    async def get_latest_price(self, token_id: str, call_site: str = 'default', fresh: bool = False) -> Dict:
+        return await self._run(self.api.get_latest_price, token_id, call_site=call_site, fresh=fresh)
+
+    async def get_my_orders(self, market_id: Optional[int] = None) -> Dict:
+        return await self._run(self.api.get_my_orders, market_id=market_id)
+
+    async def get_active_positions(self) -> Dict:
+        return await self._run(self.api.get_active_positions)
+
+    async def get_my_trades(self, limit: int = 50, market_id: Optional[int] = None) -> Dict:
+        return await self._run(self.api.get_my_trades, limit=limit, market_id=market_id)
+
+    async def submit_prediction(self, prediction_data: Dict) -> Dict:
+        return await self._run(self.api.submit_prediction, prediction_data)
+
+    # ------------------------------------------------------------------
+    # Fan-out helpers
+    # ------------------------------------------------------------------
+
+    async def get_orderbooks(self, token_ids: Iterable[str], call_site: str = 'default') -> Dict[str, Dict]:
+        """Fetch several orderbooks concurrently. Returns {token_id: response}."""
+        token_ids = list(dict.fromkeys(token_ids))
+        responses = await asyncio.gather(*(self.get_orderbook(t, call_site=call_site) for t in token_ids))
+        return dict(zip(token_ids, responses))
+
+    async def get_latest_prices(self, token_ids: Iterable[str], call_site: str = 'default') -> Dict[str, Dict]:
+        """Fetch several latest prices concurrently. Returns {token_id: response}."""
+        token_ids = list(dict.fromkeys(token_ids))
+        responses = await asyncio.gather(*(self.get_latest_price(t, call_site=call_site) for t in token_ids))
+        return dict(zip(token_ids, responses))
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self, wait: bool = True):
+        """Shut down the executor. The wrapped OpinionTradeAPI stays usable."""
+        self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> 'AsyncOpinionTradeAPI':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
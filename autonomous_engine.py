@@ -1,7 +1,13 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime, timedelta
 import json
+import copy
 import gc
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from types import MappingProxyType
 
 from opinion_trade_api import OpinionTradeAPI
 from tier_risk_guard import TierRiskGuard
@@ -12,6 +18,16 @@ from data_collectors import AlphaVantageCollector, YFinanceCollector, RedditSent
 from prompt_system import create_trading_prompt, format_technical_report, format_fundamental_report, format_sentiment_report, format_news_report, format_volatility_report
 from database import TradingDatabase
 from learning_system import LearningSystem
+from open_orders_index import OpenOrdersIndex
+from event_stream import EventStream
+from data_cache import get_data_cache
+from prescreen import PreScreen
+from event_scheduler import EventScheduler
+from firm_concurrency import DailyLimitLedger, ProviderSlots, current_rss_mb
+from async_opinion_trade_api import AsyncOpinionTradeAPI
+from cassette import get_cassette
+from cycle_checkpoint import get_checkpoint_store
+from cycle_memory import CycleMemoryProfiler
 from logger import autonomous_logger as logger
 import os
 
@@ -21,20 +37,28 @@ class AutonomousEngine:
     y ejecuta apuestas automáticas para cada IA respetando límites de riesgo.
     """
     
+    # Eventos evaluados por categoría y por IA en cada ciclo
+    EVENTS_PER_CATEGORY = 3
+    
     def __init__(self, database: TradingDatabase, initial_bankroll_per_firm: float = 1000.0,
-                 opinion_api_key: Optional[str] = None, opinion_private_key: Optional[str] = None):
+                 opinion_api_key: Optional[str] = None, opinion_private_key: Optional[str] = None,
+                 opinion_api: Optional[OpinionTradeAPI] = None):
         """
         Args:
             database: Instancia de TradingDatabase para persistencia
             initial_bankroll_per_firm: Presupuesto inicial por cada IA (ignorado si BANKROLL_MODE está configurado)
             opinion_api_key: Optional Opinion.trade API key (avoids Gunicorn multi-worker env var issues)
             opinion_private_key: Optional wallet private key (avoids Gunicorn multi-worker env var issues)
+            opinion_api: Optional already-initialized OpinionTradeAPI to share (see engine_registry.py)
         
         Note: Sistema siempre opera en modo real (no simulation). 
         BANKROLL_MODE env var controla cantidades:
         - TEST: $100 inicial, máximo $10 por día (protección para pruebas)
         - PRODUCTION: $5000 inicial, sin límite diario
         """
+        # CASSETTE_MODE=record|replay: grabar o reproducir todo el tráfico HTTP (antes de crear clientes)
+        self.cassette = get_cassette()
+        
         system_enabled = os.environ.get('SYSTEM_ENABLED', 'false').lower() == 'true'
         self.system_enabled = system_enabled
         
@@ -58,7 +82,10 @@ class AutonomousEngine:
         self.simulation_mode = 0
         
         # Pass credentials explicitly to avoid Gunicorn multi-worker env var issues
-        self.opinion_api = OpinionTradeAPI(api_key=opinion_api_key, private_key=opinion_private_key)
+        # The database backs the persistent market catalog (no get_market() for unchanged markets)
+        if opinion_api is None:
+            opinion_api = OpinionTradeAPI(api_key=opinion_api_key, private_key=opinion_private_key, database=database)
+        self.opinion_api = opinion_api
         self.orchestrator = FirmOrchestrator()
         
         self.alpha_vantage_key = os.environ.get("ALPHA_VANTAGE_API_KEY", "")
@@ -70,19 +97,67 @@ class AutonomousEngine:
         
         self._initialize_firms()
         
-        self.execution_log = []
+        # Solo los últimos ciclos: el motor puede vivir todo el proceso (engine_registry.py)
+        self.execution_log = deque(maxlen=50)
         self.daily_analysis_count = 0
         self.last_learning_analysis = None
         
+        # Datos de eventos y predicciones del ciclo actual (se vacía en cada ciclo)
         self._data_cache = {}
+        # Datos de los collectors (technical/news/volatility), persistentes entre ciclos
+        self.data_cache = get_data_cache()
+        
+        # Índice de órdenes abiertas, construido una vez por ciclo (None fuera de un ciclo)
+        self._open_orders_index: Optional[OpenOrdersIndex] = None
+        
+        # Ejecución concurrente de las IAs (ver firm_concurrency.py)
+        self.parallel_firms = os.environ.get('ENGINE_PARALLEL_FIRMS', 'false').lower() == 'true'
+        self.firm_workers = int(os.environ.get('ENGINE_FIRM_WORKERS', '0'))  # 0 = todas a la vez
+        self.parallel_max_rss_mb = float(os.environ.get('ENGINE_PARALLEL_MAX_RSS_MB', '1024'))
+        self.provider_slots = ProviderSlots.from_env()
+        self.daily_ledger = DailyLimitLedger(database, self.daily_bet_limit)
+        # Eventos evaluados a la vez dentro de una IA (1 = uno tras otro)
+        self.eval_workers = int(os.environ.get('ENGINE_EVAL_WORKERS', '4'))
+        # Una predicción por evento para todas las IAs a la vez (false = cada IA pide la suya)
+        self.prediction_fanout = os.environ.get('ENGINE_PREDICTION_FANOUT', 'true').lower() != 'false'
+        # Filtro barato (precio, spread, cutoff, fee) antes de gastar llamadas LLM
+        self.prescreen = PreScreen.from_env() if os.environ.get('PRESCREEN_ENABLED', 'true').lower() != 'false' else None
+        self._prescreen_results: Dict[str, Dict] = {}
+        self._prescreen_lock = threading.Lock()
+        # Ranking global de eventos con presupuesto de llamadas LLM por IA (según BANKROLL_MODE)
+        self.event_scheduler = (EventScheduler.from_env(self.bankroll_mode)
+                                if os.environ.get('EVENT_SCHEDULER_ENABLED', 'true').lower() != 'false' else None)
+        self._schedule: Optional[List[Dict]] = None
+        self._schedule_lock = threading.Lock()
+        # Solapar la descarga de mercados con la evaluación de la primera IA
+        # (ENGINE_STREAM_EVENTS=false vuelve a descargar todo antes de evaluar). El scheduler
+        # necesita todos los eventos para rankearlos: con él activo no hay nada que solapar
+        self.stream_events = os.environ.get('ENGINE_STREAM_EVENTS', 'true').lower() != 'false'
+        if self.stream_events and self.event_scheduler is not None:
+            if os.environ.get('ENGINE_STREAM_EVENTS'):
+                logger.info("ENGINE_STREAM_EVENTS ignored: the event scheduler ranks the full event list")
+            self.stream_events = False
+        # Checkpoints por (IA, evento): un ciclo interrumpido se reanuda sin repetir llamadas LLM
+        self.checkpoints = get_checkpoint_store()
+        self._cycle_id: Optional[str] = None
+        # Progreso del ciclo en curso (etapa y estado por IA), publicado por cycle_jobs.py
+        self._progress: Optional[Dict] = None
+        self._progress_callback: Optional[Callable[[Dict], None]] = None
+        self._progress_lock = threading.Lock()
+        # Memoria (RSS/tracemalloc) por fase del ciclo, opcional (MEMORY_PROFILING_ENABLED)
+        self.memory_profiler = CycleMemoryProfiler.from_env()
+        # Un lock por clave de _data_cache: dos IAs con el mismo símbolo hacen una sola descarga
+        self._data_cache_guard = threading.Lock()
+        self._data_cache_locks: Dict[str, threading.Lock] = {}
+        # Un lock por mercado para re-comprobar órdenes abiertas y apostar (IAs en paralelo)
+        self._market_locks_guard = threading.Lock()
+        self._market_locks: Dict[str, threading.Lock] = {}
     
     def _initialize_firms(self):
         """
         Inicializa gestores de bankroll para cada IA.
         """
-        firms = self.orchestrator.get_all_firms()
-        
-        for firm_name in firms.keys():
+        for firm_name in self.orchestrator.get_firm_names():
             strategy = assign_strategy_to_firm(firm_name)
             self.bankroll_managers[firm_name] = BankrollManager(
                 firm_name=firm_name,
@@ -90,7 +165,7 @@ class AutonomousEngine:
                 initial_bankroll=self.initial_bankroll
             )
     
-    def run_daily_cycle(self) -> Dict:
+    def run_daily_cycle(self, progress_callback: Optional[Callable[[Dict], None]] = None) -> Dict:
         """
         Ejecuta el ciclo diario completo con análisis multi-categoría:
         1. Obtener eventos disponibles de Opinion.trade por categorías
@@ -101,6 +176,10 @@ class AutonomousEngine:
         
         Note: System can be disabled via SYSTEM_ENABLED=false in Replit Secrets
         
+        Args:
+            progress_callback: Recibe una copia del progreso (etapa actual, etapas
+                               completadas y estado por IA) cada vez que cambia
+        
         Returns:
             Resumen de la ejecución diaria con campo 'success' indicando si funcionó
         """
@@ -128,21 +207,60 @@ class AutonomousEngine:
             'critical_error': None
         }
         
+        with self._progress_lock:
+            self._progress = {'stage': None, 'stages': [], 'firms': {}, 'updated_at': None}
+            self._progress_callback = progress_callback
+        
+        cycle_row_id = None
         try:
+            self._report_progress(stage='fetch_events')
             self._data_cache.clear()
-            logger.cache(f"Cleared data cache at start of cycle {cycle_start.isoformat()}")
+            self._data_cache_locks.clear()
+            with self._market_locks_guard:
+                self._market_locks.clear()
+            with self._prescreen_lock:
+                self._prescreen_results.clear()
+            with self._schedule_lock:
+                self._schedule = None
+            logger.cache(f"Cleared per-cycle data cache at start of cycle {cycle_start.isoformat()}")
+            self.opinion_api.reset_orderbook_cache_stats()
+            self.data_cache.reset_stats()
+            self.opinion_api.reset_rate_limit_metrics()
+            self.opinion_api.reset_retry_budget()
+            
+            if self.checkpoints is not None:
+                self._cycle_id, resumed = self.checkpoints.begin_cycle()
+                results['checkpoint'] = {'cycle_id': self._cycle_id, 'resumed': resumed}
+                if resumed:
+                    logger.info(f"Resuming interrupted cycle {self._cycle_id}: {self.checkpoints.progress(self._cycle_id)}")
+            
+            self.memory_profiler.start_cycle()
             
             # Step 1: Fetch events from Opinion.trade
+            # Streaming: the first firm evaluates events while pagination continues;
+            # events_by_category is filled in once the stream has finished
+            fetch_phase = self.memory_profiler.begin('fetch_events')
+            event_stream = None
+            events_by_category = None
             try:
-                events_by_category = self._fetch_events_by_category()
+                if self.stream_events:
+                    event_stream = EventStream(self.opinion_api.iter_available_events(limit=200)).start()
+                    has_events = event_stream.wait_for_first()
+                else:
+                    events_by_category = self._fetch_events_by_category()
+                    has_events = bool(events_by_category)
                 
-                if not events_by_category:
+                if not has_events:
+                    if event_stream is not None and event_stream.error is not None:
+                        logger.error(f"Event stream failed: {event_stream.error}")
                     results['errors'].append("Failed to fetch events from Opinion.trade - No events available")
                     results['critical_error'] = "No events available from Opinion.trade"
+                    results['circuit_breakers'] = self.opinion_api.get_circuit_breaker_state()
                     return results
                 
-                results['categories_analyzed'] = list(events_by_category.keys())
-                results['total_events_analyzed'] = sum(len(events) for events in events_by_category.values())
+                if events_by_category is not None:
+                    results['categories_analyzed'] = list(events_by_category.keys())
+                    results['total_events_analyzed'] = sum(len(events) for events in events_by_category.values())
                 
             except Exception as e:
                 error_msg = f"Exception fetching events: {str(e)}"
@@ -150,39 +268,64 @@ class AutonomousEngine:
                 results['errors'].append(error_msg)
                 results['critical_error'] = error_msg
                 return results
+            self.memory_profiler.end(fetch_phase)
+            
+            # Download open orders ONCE per cycle for duplicate prevention
+            self._open_orders_index = OpenOrdersIndex.from_api(self.opinion_api)
+            results['open_orders_indexed'] = len(self._open_orders_index) if self._open_orders_index is not None else None
             
-            # Step 2: Process each AI firm SEQUENTIALLY with aggressive memory cleanup
+            # Step 2: Process each AI firm, sequentially with aggressive memory cleanup
+            # or concurrently (ENGINE_PARALLEL_FIRMS=true) while RSS is under the ceiling
             try:
-                firm_names = list(self.orchestrator.get_all_firms().keys())
-                logger.info(f"Processing {len(firm_names)} AI firms sequentially: {firm_names}")
+                firm_names = self.orchestrator.get_firm_names()
+                parallel = self._use_parallel_firms()
+                results['firm_execution'] = 'parallel' if parallel else 'sequential'
+                self._report_progress(stage='firms', firms={firm_name: {'status': 'pending'} for firm_name in firm_names})
                 
-                for idx, firm_name in enumerate(firm_names, 1):
-                    try:
-                        logger.info(f"[{idx}/{len(firm_names)}] Starting {firm_name}...")
-                        
-                        firm_result = self._process_firm_multi_category_cycle(firm_name, events_by_category)
-                        results['firms_results'][firm_name] = firm_result
-                        results['total_bets_placed'] += firm_result.get('bets_placed', 0)
-                        results['total_bets_skipped'] += firm_result.get('bets_skipped', 0)
+                if parallel:
+                    logger.info(f"Processing {len(firm_names)} AI firms in parallel: {firm_names}")
+                    self._run_firms_parallel(
+                        firm_names, events_by_category if events_by_category is not None else event_stream, results
+                    )
+                else:
+                    logger.info(f"Processing {len(firm_names)} AI firms sequentially: {firm_names}")
+                    
+                    for idx, firm_name in enumerate(firm_names, 1):
+                        # Abort early if Opinion.trade is failing fast: every remaining firm would error out
+                        open_circuits = self.opinion_api.get_open_circuits()
+                        if open_circuits:
+                            error_msg = f"Opinion.trade circuit open ({', '.join(open_circuits)}) - aborting cycle before {firm_name}"
+                            logger.error(error_msg)
+                            results['errors'].append(error_msg)
+                            results['critical_error'] = error_msg
+                            break
+                    
+                        try:
+                            logger.info(f"[{idx}/{len(firm_names)}] Starting {firm_name}...")
+                            self._report_progress(firms={firm_name: {'status': 'running'}})
                         
-                        # Check if firm had critical errors
-                        if firm_result.get('critical_error'):
-                            results['errors'].append(f"{firm_name}: {firm_result['critical_error']}")
+                            firm_result = self._process_firm_multi_category_cycle(
+                                firm_name, events_by_category if events_by_category is not None else event_stream
+                            )
+                            self._record_firm_result(results, firm_name, firm_result)
                         
-                        # MEMORY OPTIMIZATION: Force garbage collection after each firm
-                        # NOTE: Cache is intentionally preserved across firms to reuse expensive collector data
-                        logger.info(f"[{idx}/{len(firm_names)}] {firm_name} complete - Running garbage collection...")
-                        gc.collect()
-                        logger.info(f"[{idx}/{len(firm_names)}] {firm_name} finished")
+                            # MEMORY OPTIMIZATION: Force garbage collection after each firm
+                            # NOTE: Cache is intentionally preserved across firms to reuse expensive collector data
+                            logger.info(f"[{idx}/{len(firm_names)}] {firm_name} complete - Running garbage collection...")
+                            gc.collect()
+                            logger.info(f"[{idx}/{len(firm_names)}] {firm_name} finished")
                             
-                    except Exception as e:
-                        error_msg = f"Exception processing {firm_name}: {str(e)}"
-                        logger.error(error_msg)
-                        results['errors'].append(error_msg)
-                        results['firms_results'][firm_name] = {'error': str(e), 'bets_placed': 0, 'bets_skipped': 0}
+                        except Exception as e:
+                            self._record_firm_error(results, firm_name, e)
                         
-                        # Run GC even on error
-                        gc.collect()
+                            # Run GC even on error
+                            gc.collect()
+                    
+                        if events_by_category is None:
+                            events_by_category = self._collect_streamed_events(event_stream, results)
+                
+                if events_by_category is None:
+                    events_by_category = self._collect_streamed_events(event_stream, results)
                         
             except Exception as e:
                 error_msg = f"Exception in firm processing loop: {str(e)}"
@@ -191,9 +334,16 @@ class AutonomousEngine:
                 results['critical_error'] = error_msg
                 return results
             
+            # All (firm, event) units are done: a re-trigger starts a new cycle
+            if self.checkpoints is not None:
+                results['checkpoint']['progress'] = self.checkpoints.progress(self._cycle_id)
+                if not results['critical_error']:
+                    self.checkpoints.finish_cycle(self._cycle_id)
+            
             # Step 3: Save to database
+            self._report_progress(stage='save')
             try:
-                self.db.save_autonomous_cycle(results)
+                cycle_row_id = self.db.save_autonomous_cycle(results)
                 self.execution_log.append(results)
                 self.daily_analysis_count += 1
             except Exception as e:
@@ -202,7 +352,13 @@ class AutonomousEngine:
                 results['errors'].append(error_msg)
                 # Continue even if DB save fails
             
+            # Circuit abort: reconciliation and monitoring would only fail fast too
+            if results['critical_error']:
+                results['circuit_breakers'] = self.opinion_api.get_circuit_breaker_state()
+                return results
+            
             # Step 4: Weekly learning check (non-critical)
+            self._report_progress(stage='learning')
             try:
                 self._check_weekly_learning()
             except Exception as e:
@@ -210,25 +366,40 @@ class AutonomousEngine:
                 results['errors'].append(f"Weekly learning check failed: {str(e)}")
             
             # Step 5: Reconciliation (non-critical)
-            try:
-                reconciliation_stats = self.reconcile_bets()
-                results['reconciliation'] = reconciliation_stats
-            except Exception as e:
-                logger.error(f"Reconciliation failed: {e}")
-                results['errors'].append(f"Reconciliation failed: {str(e)}")
-                results['reconciliation'] = {'error': str(e)}
+            self._report_progress(stage='reconciliation')
+            with self.memory_profiler.phase('reconciliation'):
+                try:
+                    reconciliation_stats = self.reconcile_bets()
+                    results['reconciliation'] = reconciliation_stats
+                except Exception as e:
+                    logger.error(f"Reconciliation failed: {e}")
+                    results['errors'].append(f"Reconciliation failed: {str(e)}")
+                    results['reconciliation'] = {'error': str(e)}
             
             # Step 6: Order monitoring (non-critical)
-            try:
-                logger.info("Starting OrderMonitor to review active positions...")
-                order_monitor = OrderMonitor(self.opinion_api, self.db, self.orchestrator)
-                monitoring_stats = order_monitor.monitor_all_orders()
-                results['order_monitoring'] = monitoring_stats
-                logger.info(f"OrderMonitor completed: {monitoring_stats}")
-            except Exception as e:
-                logger.error(f"Order monitoring failed: {e}")
-                results['errors'].append(f"Order monitoring failed: {str(e)}")
-                results['order_monitoring'] = {'error': str(e)}
+            self._report_progress(stage='order_monitoring')
+            with self.memory_profiler.phase('order_monitoring'):
+                try:
+                    logger.info("Starting OrderMonitor to review active positions...")
+                    order_monitor = OrderMonitor(self.opinion_api, self.db, self.orchestrator)
+                    monitoring_stats = order_monitor.monitor_all_orders()
+                    results['order_monitoring'] = monitoring_stats
+                    logger.info(f"OrderMonitor completed: {monitoring_stats}")
+                except Exception as e:
+                    logger.error(f"Order monitoring failed: {e}")
+                    results['errors'].append(f"Order monitoring failed: {str(e)}")
+                    results['order_monitoring'] = {'error': str(e)}
+            
+            results['orderbook_cache'] = self.opinion_api.get_orderbook_cache_stats()
+            logger.info(f"Orderbook cache: {results['orderbook_cache']}")
+            results['transport'] = self.opinion_api.get_transport_stats()
+            results['data_cache'] = self.data_cache.stats()
+            results['prescreen'] = self._prescreen_summary()
+            results['schedule'] = self._schedule_summary()
+            logger.info(f"Data cache: {results['data_cache']['sources']}")
+            results['rate_limiter'] = self.opinion_api.get_rate_limit_metrics()
+            logger.info(f"Rate limiter queue waits: {results['rate_limiter']}")
+            results['circuit_breakers'] = self.opinion_api.get_circuit_breaker_state()
             
             # Mark success only if we got here without critical errors
             if not results['critical_error'] and results['total_events_analyzed'] > 0:
@@ -242,8 +413,141 @@ class AutonomousEngine:
             results['critical_error'] = error_msg
             results['errors'].append(error_msg)
         
+        finally:
+            # The index is only valid for the cycle that built it
+            self._open_orders_index = None
+            if self.cassette is not None:
+                self.cassette.save()
+                results['cassette'] = self.cassette.stats()
+            memory_profile = self.memory_profiler.finish_cycle()
+            if memory_profile is not None:
+                results['memory'] = memory_profile
+                if cycle_row_id is not None:
+                    try:
+                        self.db.save_cycle_memory_profile(cycle_row_id, memory_profile)
+                    except Exception as e:
+                        logger.warning(f"Failed to save memory profile: {e}")
+            self._report_progress(stage='done')
+            with self._progress_lock:
+                self._progress = None
+                self._progress_callback = None
+        
         return results
     
+    def _use_parallel_firms(self) -> bool:
+        """Parallel mode is on and RSS is under ENGINE_PARALLEL_MAX_RSS_MB (0 = no ceiling)."""
+        if not self.parallel_firms:
+            return False
+        if self.parallel_max_rss_mb > 0:
+            rss_mb = current_rss_mb()
+            if rss_mb > self.parallel_max_rss_mb:
+                logger.warning(f"RSS {rss_mb:.0f}MB above {self.parallel_max_rss_mb:.0f}MB - running firms sequentially")
+                return False
+        return True
+    
+    def _report_progress(self, stage: Optional[str] = None, firms: Optional[Dict[str, Dict]] = None):
+        """
+        Actualiza el progreso del ciclo y lo pasa al progress_callback de run_daily_cycle.
+        
+        Args:
+            stage: Nueva etapa (la anterior queda en 'stages' con su duración)
+            firms: Campos a actualizar por IA, e.g. {'Claude': {'status': 'running'}}
+        """
+        with self._progress_lock:
+            progress = self._progress
+            if progress is None:
+                return
+            now = datetime.now()
+            if stage is not None:
+                if progress['stages']:
+                    progress['stages'][-1]['finished_at'] = now.isoformat()
+                progress['stage'] = stage
+                if stage != 'done':
+                    progress['stages'].append({'stage': stage, 'started_at': now.isoformat()})
+            for firm_name, fields in (firms or {}).items():
+                progress['firms'].setdefault(firm_name, {}).update(fields)
+            progress['updated_at'] = now.isoformat()
+            
+            # Dentro del lock: con IAs en paralelo, un snapshot viejo no pisa a uno nuevo
+            if self._progress_callback is not None:
+                try:
+                    self._progress_callback(copy.deepcopy(progress))
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+    
+    def _record_firm_result(self, results: Dict, firm_name: str, firm_result: Dict):
+        results['firms_results'][firm_name] = firm_result
+        results['total_bets_placed'] += firm_result.get('bets_placed', 0)
+        results['total_bets_skipped'] += firm_result.get('bets_skipped', 0)
+        self._report_progress(firms={firm_name: {
+            'status': 'error' if firm_result.get('critical_error') else 'done',
+            'bets_placed': firm_result.get('bets_placed', 0),
+            'bets_skipped': firm_result.get('bets_skipped', 0),
+        }})
+        
+        # Check if firm had critical errors
+        if firm_result.get('critical_error'):
+            results['errors'].append(f"{firm_name}: {firm_result['critical_error']}")
+    
+    def _record_firm_error(self, results: Dict, firm_name: str, error: Exception):
+        error_msg = f"Exception processing {firm_name}: {str(error)}"
+        logger.error(error_msg)
+        results['errors'].append(error_msg)
+        results['firms_results'][firm_name] = {'error': str(error), 'bets_placed': 0, 'bets_skipped': 0}
+        self._report_progress(firms={firm_name: {'status': 'error', 'error': str(error)}})
+    
+    def _run_firms_parallel(self, firm_names: List[str], events_source, results: Dict):
+        """
+        Ejecuta _process_firm_multi_category_cycle para todas las IAs a la vez.
+        
+        Todas leen el mismo EventStream (reproducible) o dict de eventos. Las llamadas LLM
+        quedan limitadas por proveedor (provider_slots), el límite diario se reserva en
+        daily_ledger y _data_cache se bloquea por clave. Los resultados se registran en
+        el orden de firm_names.
+        """
+        def run_firm(firm_name: str):
+            # Firms queued behind ENGINE_FIRM_WORKERS re-check the breakers before starting
+            open_circuits = self.opinion_api.get_open_circuits()
+            if open_circuits:
+                return None, f"Opinion.trade circuit open ({', '.join(open_circuits)}) - skipping {firm_name}"
+            self._report_progress(firms={firm_name: {'status': 'running'}})
+            return self._process_firm_multi_category_cycle(firm_name, events_source), None
+        
+        workers = min(self.firm_workers or len(firm_names), len(firm_names))
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='firm') as pool:
+            futures = {firm_name: pool.submit(run_firm, firm_name) for firm_name in firm_names}
+            for firm_name in firm_names:
+                try:
+                    firm_result, abort_msg = futures[firm_name].result()
+                except Exception as e:
+                    self._record_firm_error(results, firm_name, e)
+                    continue
+                if abort_msg:
+                    logger.error(abort_msg)
+                    results['errors'].append(abort_msg)
+                    results['critical_error'] = abort_msg
+                    self._report_progress(firms={firm_name: {'status': 'skipped'}})
+                    continue
+                self._record_firm_result(results, firm_name, firm_result)
+                logger.info(f"{firm_name} finished (parallel)")
+        gc.collect()
+    
+    def _data_cache_lock(self, key: str) -> threading.Lock:
+        with self._data_cache_guard:
+            return self._data_cache_locks.setdefault(key, threading.Lock())
+    
+    def _market_lock(self, market_id) -> threading.Lock:
+        with self._market_locks_guard:
+            return self._market_locks.setdefault(str(market_id), threading.Lock())
+    
+    def _open_orders_for_market(self, market_id) -> Optional[List[Dict]]:
+        """Órdenes abiertas del mercado: del índice del ciclo, o de la API sin índice (None si falla)."""
+        if self._open_orders_index is not None:
+            # Per-cycle index: no network call per event/firm
+            return self._open_orders_index.orders_for_market(market_id)
+        orders_check = self.opinion_api.get_my_orders(market_id=market_id)
+        return orders_check.get('orders', []) if orders_check.get('success') else None
+    
     def _fetch_events_by_category(self) -> Dict[str, List[Dict]]:
         """
         Obtiene eventos disponibles organizados por categoría.
@@ -251,17 +555,45 @@ class AutonomousEngine:
         Returns:
             Dict con categorías como keys y listas de eventos como values
         """
-        events_by_category = {}
-        
         # Get ALL available events using pagination (fetches up to 200 events across all categories)
         all_events_response = self.opinion_api.get_available_events(limit=200)
         
         if not all_events_response.get('success'):
             error_msg = all_events_response.get('message', 'Unknown error')
             logger.error(f"Failed to fetch events from Opinion.trade: {logger.sanitize_text(error_msg, 100)}")
-            return events_by_category
+            return {}
+        
+        return self._group_events_by_category(all_events_response.get('events', []))
+    
+    def _collect_streamed_events(self, event_stream: EventStream, results: Dict) -> Dict[str, List[Dict]]:
+        """
+        Espera a que termine el stream de eventos, los agrupa por categoría y
+        registra en results las métricas del ciclo (categorías, eventos, latencias).
+        """
+        all_events = event_stream.wait()
+        if event_stream.error is not None:
+            error_msg = f"Event stream ended early: {event_stream.error}"
+            logger.warning(error_msg)
+            results['errors'].append(error_msg)
         
-        all_events = all_events_response.get('events', [])
+        events_by_category = self._group_events_by_category(all_events)
+        results['categories_analyzed'] = list(events_by_category.keys())
+        results['total_events_analyzed'] = sum(len(events) for events in events_by_category.values())
+        results['event_stream'] = {
+            'events': len(all_events),
+            'first_event_seconds': round(event_stream.first_event_seconds, 3) if event_stream.first_event_seconds is not None else None,
+            'total_seconds': round(event_stream.total_seconds, 3) if event_stream.total_seconds is not None else None
+        }
+        return events_by_category
+    
+    def _group_events_by_category(self, all_events: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Agrupa eventos por categoría excluyendo Sports.
+        
+        Returns:
+            Dict con categorías como keys y listas de eventos como values
+        """
+        events_by_category = {}
         logger.info(f"Fetched {len(all_events)} events from Opinion.trade")
         
         # Filtrar eventos de Sports (categoría excluida)
@@ -296,15 +628,23 @@ class AutonomousEngine:
         logger.category(f"Events grouped into {len(events_by_category)} categories: {categories_summary}")
         return events_by_category
     
-    def _process_firm_multi_category_cycle(self, firm_name: str, events_by_category: Dict[str, List[Dict]]) -> Dict:
+    def _process_firm_multi_category_cycle(self, firm_name: str, events_by_category) -> Dict:
         """
         Procesa el ciclo completo para una IA con análisis multi-categoría.
         
         La IA analiza eventos en TODAS las categorías disponibles PRIMERO,
         luego ejecuta solo las mejores oportunidades globales.
+        
+        Args:
+            firm_name: Nombre de la IA
+            events_by_category: Dict categoría → eventos, o un EventStream que aún se
+                                está llenando (se evalúan los eventos según van llegando)
         """
         logger.info(f"\nProcessing cycle for {firm_name}")
-        logger.analysis(firm_name, f"Analyzing {len(events_by_category)} categories")
+        if isinstance(events_by_category, EventStream):
+            logger.analysis(firm_name, "Analyzing events as they stream in from Opinion.trade")
+        else:
+            logger.analysis(firm_name, f"Analyzing {len(events_by_category)} categories")
         
         tier_status = self.risk_guard.get_tier_status(firm_name)
         bankroll_manager = self.bankroll_managers[firm_name]
@@ -325,40 +665,37 @@ class AutonomousEngine:
         active_positions = active_positions_response.get('positions', []) if active_positions_response.get('success') else []
         
         # Fase 1: EVALUAR (sin ejecutar) oportunidades en cada categoría
+        memory_phase = self.memory_profiler.begin(f'evaluate:{firm_name}')
         all_opportunities = []
+        opportunities_by_category = {}
         
-        for category, events in events_by_category.items():
-            category_result = {
+        # Evaluar top 3 eventos de cada categoría (sin ejecutar), varios a la vez;
+        # los resultados llegan en el orden de los candidatos
+        evaluations = self._evaluate_candidates(firm_name, events_by_category, bankroll_manager, active_positions)
+        for category, evaluation in evaluations:
+            category_result = firm_result['category_analysis'].setdefault(category, {
                 'category': category,
                 'events_analyzed': 0,
                 'opportunities_found': 0,
                 'best_opportunity': None,
                 'avg_expected_value': 0
-            }
-            
-            category_opportunities = []
+            })
+            category_opportunities = opportunities_by_category.setdefault(category, [])
             
-            # Evaluar top 3 eventos de cada categoría (sin ejecutar)
-            for event in events[:3]:
-                evaluation = self._evaluate_event_opportunity(
-                    firm_name=firm_name,
-                    event=event,
-                    bankroll_manager=bankroll_manager,
-                    active_positions=active_positions
-                )
-                
-                firm_result['events_analyzed'] += 1
-                category_result['events_analyzed'] += 1
-                
-                if evaluation.get('is_opportunity'):
-                    category_opportunities.append(evaluation)
-                    all_opportunities.append(evaluation)
-                    category_result['opportunities_found'] += 1
-                else:
-                    firm_result['bets_skipped'] += 1
+            firm_result['events_analyzed'] += 1
+            category_result['events_analyzed'] += 1
             
-            # Registrar mejor oportunidad de esta categoría
+            if evaluation.get('is_opportunity'):
+                category_opportunities.append(evaluation)
+                all_opportunities.append(evaluation)
+                category_result['opportunities_found'] += 1
+            else:
+                firm_result['bets_skipped'] += 1
+        
+        # Registrar mejor oportunidad de cada categoría
+        for category, category_opportunities in opportunities_by_category.items():
             if category_opportunities:
+                category_result = firm_result['category_analysis'][category]
                 best_in_category = max(category_opportunities, key=lambda x: x.get('expected_value', 0))
                 category_result['best_opportunity'] = {
                     'event_id': best_in_category.get('event_id'),
@@ -366,10 +703,11 @@ class AutonomousEngine:
                     'probability': best_in_category.get('probability')
                 }
                 category_result['avg_expected_value'] = sum(o.get('expected_value', 0) for o in category_opportunities) / len(category_opportunities)
-            
-            firm_result['category_analysis'][category] = category_result
+        
+        self.memory_profiler.end(memory_phase)
         
         # Fase 2: Ejecutar solo las MEJORES oportunidades globales
+        memory_phase = self.memory_profiler.begin(f'execute:{firm_name}')
         if all_opportunities:
             logger.analysis(firm_name, f"Found {len(all_opportunities)} total opportunities across all categories")
             # Ordenar todas las oportunidades por expected value
@@ -382,26 +720,63 @@ class AutonomousEngine:
             
             for i, opportunity in enumerate(all_opportunities):
                 if i < max_bets:
-                    # Verificar límite diario GLOBAL ANTES de ejecutar (solo en TEST mode)
+                    # Ciclo reanudado: no repetir ejecuciones (at-most-once, ver cycle_checkpoint.py)
+                    unit_key = self._checkpoint_key(opportunity.get('event', {}))
+                    if self.checkpoints is not None:
+                        previous = self.checkpoints.get_execution(self._cycle_id, firm_name, unit_key)
+                        if previous is not None:
+                            decision = previous['decision']
+                            if previous['status'] == 'done' and decision.get('action') == 'BET':
+                                logger.info(f"{firm_name} - Execution of {unit_key} restored from checkpoint")
+                                firm_result['decisions'].append(decision)
+                                firm_result['bets_placed'] += 1
+                                firm_result['total_bet_amount'] += decision.get('bet_size', 0)
+                            else:
+                                if previous['status'] == 'pending':
+                                    logger.warning(f"{firm_name} - Execution of {unit_key} was interrupted, not retrying")
+                                else:
+                                    firm_result['decisions'].append(decision)
+                                firm_result['bets_skipped'] += 1
+                            continue
+                    
+                    # Reservar contra el límite diario GLOBAL ANTES de ejecutar (solo en TEST mode);
+                    # la reserva cubre a las IAs que se ejecutan en paralelo
+                    reserved = 0.0
                     if self.daily_bet_limit is not None:
-                        current_daily_total = self.db.get_daily_bet_total()
                         proposed_bet_size = opportunity.get('bet_size', 0)
+                        current_daily_total = self.daily_ledger.reserve(proposed_bet_size)
                         
-                        if current_daily_total + proposed_bet_size > self.daily_bet_limit:
+                        if current_daily_total is None:
                             logger.info(f"{firm_name} - Proposed ${proposed_bet_size:.2f} would exceed daily limit "
-                                  f"(${current_daily_total:.2f} + ${proposed_bet_size:.2f} > ${self.daily_bet_limit})", prefix="DAILY LIMIT")
+                                  f"(${self.daily_bet_limit}, ${self.daily_ledger.reserved:.2f} reserved by running bets)", prefix="DAILY LIMIT")
                             firm_result['bets_skipped'] += 1
                             continue
+                        reserved = proposed_bet_size
                     
-                    # Ejecutar esta oportunidad
-                    executed_decision = self._execute_opportunity(
-                        firm_name=firm_name,
-                        opportunity=opportunity,
-                        bankroll_manager=bankroll_manager
-                    )
+                    # Otra IA (ENGINE_PARALLEL_FIRMS) puede haber apostado en este mercado después de
+                    # nuestra evaluación: re-comprobar y registrar la orden nueva bajo el mismo lock
+                    market_id = opportunity.get('event', {}).get('market_id')
+                    with self._market_lock(market_id):
+                        active_orders = self._open_orders_for_market(market_id) if market_id else None
+                        if active_orders:
+                            executed_decision = self._skip_duplicate_execution(firm_name, opportunity, market_id, active_orders)
+                        else:
+                            if self.checkpoints is not None:
+                                self.checkpoints.mark_execution_pending(self._cycle_id, firm_name, unit_key)
+                            try:
+                                # Ejecutar esta oportunidad (_execute_bet añade la orden al índice)
+                                executed_decision = self._execute_opportunity(
+                                    firm_name=firm_name,
+                                    opportunity=opportunity,
+                                    bankroll_manager=bankroll_manager
+                                )
+                            except Exception:
+                                self.daily_ledger.release(reserved)
+                                raise
                     firm_result['decisions'].append(executed_decision)
+                    if self.checkpoints is not None:
+                        self.checkpoints.save_execution(self._cycle_id, firm_name, unit_key, executed_decision)
                     
-                    # Solo incrementar si la ejecución fue exitosa
                     logger.analysis(firm_name, f"Executed bet {i+1}/{max_bets}")
                     # Solo incrementar si la ejecución fue exitosa
                     if executed_decision.get('action') == 'BET':
@@ -411,19 +786,192 @@ class AutonomousEngine:
                         
                         # Registrar en tracking diario (solo en TEST mode)
                         if self.daily_bet_limit is not None:
-                            new_daily_total = self.db.add_to_daily_bet_total(bet_size)
+                            new_daily_total = self.daily_ledger.commit(reserved, bet_size)
                             logger.info(f"{firm_name} - Daily total: ${new_daily_total:.2f} / ${self.daily_bet_limit}", prefix="DAILY TRACKING")
                     else:
+                        self.daily_ledger.release(reserved)
                         firm_result['bets_skipped'] += 1
                 else:
                     # Oportunidad no seleccionada para ejecución
                     firm_result['bets_skipped'] += 1
         else:
             logger.analysis(firm_name, "No opportunities found")
+        self.memory_profiler.end(memory_phase)
         
         logger.analysis(firm_name, f"Cycle complete: {firm_result['bets_placed']} bets placed, {firm_result['bets_skipped']} skipped, {firm_result['events_analyzed']} events analyzed")
         return firm_result
     
+    def _iter_evaluation_candidates(self, events_by_category):
+        """
+        Genera (categoría, evento) a evaluar por cada IA.
+        
+        Con el scheduler activo, los eventos elegidos por _get_schedule() en orden de ranking.
+        Si no, los primeros EVENTS_PER_CATEGORY eventos de cada categoría (Sports excluido)
+        que pasan el pre-screen; con un EventStream se generan según llegan y la selección
+        es la misma que con el dict agrupado.
+        """
+        if self.event_scheduler is not None:
+            for entry in self._get_schedule(events_by_category):
+                yield entry['category'], entry['event']
+            return
+        
+        if not isinstance(events_by_category, EventStream):
+            for category, events in events_by_category.items():
+                selected = 0
+                for event in events:
+                    if selected >= self.EVENTS_PER_CATEGORY:
+                        break
+                    if self._passes_prescreen(event):
+                        selected += 1
+                        yield category, event
+            return
+        
+        seen_per_category = {}
+        for event in events_by_category:
+            category = event.get('category', 'general')
+            if category == 'Sports' or seen_per_category.get(category, 0) >= self.EVENTS_PER_CATEGORY:
+                continue
+            if not self._passes_prescreen(event):
+                continue
+            seen_per_category[category] = seen_per_category.get(category, 0) + 1
+            yield category, event
+    
+    def _passes_prescreen(self, event: Dict) -> bool:
+        """Pre-screen del evento, calculado una vez por ciclo y compartido por todas las IAs."""
+        if self.prescreen is None:
+            return True
+        event_id = str(event.get('event_id', event.get('id')))
+        with self._prescreen_lock:
+            result = self._prescreen_results.get(event_id)
+        if result is None:
+            token_id = event.get('yes_token_id')
+            # Cotización capturada por el filtro de liquidez de get_available_events; solo se
+            # descarga el libro de las opciones que el filtro no llegó a mirar
+            quote = event.get('liquidity_quote')
+            if quote is None:
+                quote = self.opinion_api.get_latest_price(token_id, call_site='liquidity') if token_id else {'success': False}
+            fees_response = self.opinion_api.get_fee_rates(use_cache=True)
+            taker_fee = fees_response.get('taker_fee', 0.03) if fees_response.get('success') else 0.03
+            result = self.prescreen.screen(event, quote, taker_fee)
+            result['category'] = event.get('category', 'general')
+            with self._prescreen_lock:
+                result = self._prescreen_results.setdefault(event_id, result)
+            if not result['passed']:
+                logger.info(f"Pre-screen rejected {event_id} ({result['reason']}): {event.get('title', '')[:60]}")
+        return result['passed']
+    
+    def _get_schedule(self, events_by_category) -> List[Dict]:
+        """
+        Eventos elegidos por el EventScheduler para este ciclo (se calcula una vez y lo
+        comparten todas las IAs). Necesita todos los eventos: con el scheduler activo el
+        motor no usa EventStream, y si recibe uno espera a que termine la descarga.
+        """
+        with self._schedule_lock:
+            if self._schedule is not None:
+                return self._schedule
+            
+            if isinstance(events_by_category, EventStream):
+                events = [e for e in events_by_category.wait() if e.get('category', 'general') != 'Sports']
+            else:
+                events = [e for category_events in events_by_category.values() for e in category_events]
+            
+            # Pre-screen de todos los eventos (cotizaciones del filtro de liquidez) en paralelo
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix='prescreen') as pool:
+                passed = list(pool.map(self._passes_prescreen, events))
+            with self._prescreen_lock:
+                candidates = [(event, self._prescreen_results.get(str(event.get('event_id', event.get('id')))))
+                              for event, ok in zip(events, passed) if ok]
+            
+            try:
+                last_decisions = self.db.get_last_decision_times()
+            except Exception as e:
+                logger.warning(f"Could not load last decision times, treating all events as new: {e}")
+                last_decisions = {}
+            
+            self._schedule = self.event_scheduler.schedule(candidates, last_decisions)
+            logger.info(f"Scheduled {len(self._schedule)}/{len(candidates)} events "
+                        f"(budget {self.event_scheduler.budget} per firm, {len(events)} fetched)")
+            return self._schedule
+    
+    def _schedule_summary(self) -> Dict:
+        with self._schedule_lock:
+            schedule = self._schedule
+        if self.event_scheduler is None or schedule is None:
+            return {'enabled': self.event_scheduler is not None, 'scheduled': 0}
+        categories = {}
+        for entry in schedule:
+            categories[entry['category']] = categories.get(entry['category'], 0) + 1
+        return {
+            'enabled': True,
+            'budget': self.event_scheduler.budget,
+            'scheduled': len(schedule),
+            'categories': categories,
+            'events': [{'event_id': entry['event'].get('event_id'), 'category': entry['category'],
+                        'score': entry['score'], 'signals': entry['signals']} for entry in schedule],
+        }
+    
+    def _prescreen_summary(self, top: int = 10) -> Dict:
+        """Shortlist ordenada por score y rechazos por motivo del ciclo actual."""
+        with self._prescreen_lock:
+            screened = list(self._prescreen_results.values())
+        shortlist = sorted((r for r in screened if r['passed']), key=lambda r: r['score'], reverse=True)
+        rejected = {}
+        for result in screened:
+            if not result['passed']:
+                rejected[result['reason']] = rejected.get(result['reason'], 0) + 1
+        return {
+            'enabled': self.prescreen is not None,
+            'screened': len(screened),
+            'shortlisted': len(shortlist),
+            'rejected': rejected,
+            'top': [{'event_id': r['event_id'], 'category': r['category'], 'score': r['score']} for r in shortlist[:top]],
+        }
+    
+    def _evaluate_candidates(self, firm_name: str, events_by_category,
+                             bankroll_manager: BankrollManager, active_positions: List[Dict]):
+        """
+        Genera (categoría, evaluación) para cada candidato de _iter_evaluation_candidates.
+        
+        Con ENGINE_EVAL_WORKERS > 1 los candidatos se envían a un pool según llegan (también
+        desde un EventStream) y las evaluaciones se devuelven en el orden de envío, de modo
+        que la fusión y el orden por expected_value son los mismos que en serie.
+        """
+        def evaluate(event: Dict) -> Dict:
+            unit_key = self._checkpoint_key(event)
+            if self.checkpoints is not None:
+                stored = self.checkpoints.get_evaluation(self._cycle_id, firm_name, unit_key)
+                if stored is not None:
+                    logger.info(f"{firm_name} - Evaluation of {unit_key} restored from checkpoint")
+                    if stored.get('is_opportunity'):
+                        stored = self._refresh_restored_opportunity(firm_name, stored)
+                    return stored
+            evaluation = self._evaluate_event_opportunity(
+                firm_name=firm_name,
+                event=event,
+                bankroll_manager=bankroll_manager,
+                active_positions=active_positions
+            )
+            # Solo resultados definitivos: los fallos transitorios (predicción, precio, circuit
+            # breaker abierto) llevan 'error' y se vuelven a evaluar al reanudar
+            if self.checkpoints is not None and 'error' not in evaluation:
+                self.checkpoints.save_evaluation(self._cycle_id, firm_name, unit_key, evaluation)
+            return evaluation
+        
+        candidates = self._iter_evaluation_candidates(events_by_category)
+        if self.eval_workers <= 1:
+            for category, event in candidates:
+                yield category, evaluate(event)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.eval_workers, thread_name_prefix=f'eval-{firm_name}') as pool:
+            submitted = [(category, pool.submit(evaluate, event)) for category, event in candidates]
+            for category, future in submitted:
+                yield category, future.result()
+    
+    @staticmethod
+    def _checkpoint_key(event: Dict) -> str:
+        return str(event.get('event_id') or event.get('id') or event.get('description', event.get('title', '')))
+    
     def _evaluate_event_opportunity(self, firm_name: str, event: Dict,
                                     bankroll_manager: BankrollManager,
                                     active_positions: List[Dict]) -> Dict:
@@ -455,18 +1003,14 @@ class AutonomousEngine:
         
         # PREVENCIÓN DE DUPLICADOS: Verificar si ya existe orden activa en este mercado
         if market_id:
-            orders_check = self.opinion_api.get_my_orders(market_id=market_id)
-            
-            if orders_check.get('success'):
-                active_orders = orders_check.get('orders', [])
-                
-                if active_orders:
-                    evaluation['reason'] = f"Duplicate prevention: {len(active_orders)} active order(s) already exist for market {market_id}"
-                    logger.info(f"{firm_name} - Skip duplicate: {evaluation['reason']}")
-                    logger.log_event_analysis(firm_name, event_description, {}, evaluation, 'SKIP')
-                    # Save to DB for transparency
-                    self._save_ai_decision(firm_name, event, {}, evaluation, 'ANALYZED', evaluation['reason'])
-                    return evaluation
+            active_orders = self._open_orders_for_market(market_id)
+            if active_orders:
+                evaluation['reason'] = f"Duplicate prevention: {len(active_orders)} active order(s) already exist for market {market_id}"
+                logger.info(f"{firm_name} - Skip duplicate: {evaluation['reason']}")
+                logger.log_event_analysis(firm_name, event_description, {}, evaluation, 'SKIP')
+                # Save to DB for transparency
+                self._save_ai_decision(firm_name, event, {}, evaluation, 'ANALYZED', evaluation['reason'])
+                return evaluation
         
         symbol = self._extract_symbol_from_event(event)
         
@@ -475,6 +1019,7 @@ class AutonomousEngine:
             
             if 'error' in prediction:
                 evaluation['reason'] = f"Prediction error: {prediction.get('error')}"
+                evaluation['error'] = prediction.get('error')
                 evaluation['prediction'] = prediction
                 logger.log_event_analysis(firm_name, event_description, prediction, evaluation, 'SKIP')
                 # Save to DB for transparency
@@ -496,10 +1041,11 @@ class AutonomousEngine:
                 self._save_ai_decision(firm_name, event, prediction, evaluation, 'ANALYZED', evaluation['reason'])
                 return evaluation
             
-            price_response = self.opinion_api.get_latest_price(token_id)
+            price_response = self.opinion_api.get_latest_price(token_id, call_site='evaluation')
             if not price_response.get('success'):
                 error_msg = price_response.get('message', 'Unknown error')
                 evaluation['reason'] = f"Failed to fetch market price: {price_response.get('error')} - {error_msg}"
+                evaluation['error'] = price_response.get('error')
                 logger.warning(f"{firm_name} - Price fetch failed for token_id={token_id}: {price_response.get('error')} | Message: {error_msg}")
                 logger.log_event_analysis(firm_name, event_description, prediction, evaluation, 'SKIP')
                 # Save to DB for transparency
@@ -509,6 +1055,7 @@ class AutonomousEngine:
             market_price = price_response.get('price')
             if market_price is None:
                 evaluation['reason'] = "Market price unavailable"
+                evaluation['error'] = evaluation['reason']
                 logger.log_event_analysis(firm_name, event_description, prediction, evaluation, 'SKIP')
                 # Save to DB for transparency
                 self._save_ai_decision(firm_name, event, prediction, evaluation, 'ANALYZED', evaluation['reason'])
@@ -522,11 +1069,17 @@ class AutonomousEngine:
             # Si compramos NO → usar (1 - probability) porque estamos apostando al evento NO ocurra
             side_probability = probability if buying_yes else (1 - probability)
             
+            # Expected fill price for the nominal size, from the same cached orderbook snapshot
+            fill_estimate = self.opinion_api.estimate_fill(token_id, 10.0, 'BUY', call_site='evaluation')
+            fill_price = fill_estimate.get('vwap') if fill_estimate.get('success') else None
+            evaluation['expected_fill_price'] = fill_price
+            
             # Calcular EV con fees (retorna dict con gross_ev y net_ev)
             ev_calc = self._calculate_expected_value(
                 probability=side_probability,  # Probabilidad del LADO que compramos
                 market_price=market_price,  # Precio real del mercado (garantizado no None)
-                bet_size=10.0  # Tamaño nominal para cálculo inicial
+                bet_size=10.0,  # Tamaño nominal para cálculo inicial
+                fill_price=fill_price  # VWAP esperado según profundidad (None = usar market_price)
             )
             
             evaluation['probability'] = probability  # Guardar probability original del AI
@@ -543,7 +1096,7 @@ class AutonomousEngine:
             # LOGGING DETALLADO para debugging
             print(f"[EV DEBUG] {firm_name} - Event: {event_description[:60]}")
             print(f"[EV DEBUG]   AI Probability: {probability:.2%} | Side Probability: {side_probability:.2%} | Confidence: {confidence}%")
-            print(f"[EV DEBUG]   Market Price: {market_price:.2%} | Buying: {'YES' if buying_yes else 'NO'}")
+            print(f"[EV DEBUG]   Market Price: {market_price:.2%} | Expected Fill: {f'{fill_price:.2%}' if fill_price is not None else 'n/a'} | Buying: {'YES' if buying_yes else 'NO'}")
             print(f"[EV DEBUG]   Gross EV: ${ev_calc['gross_ev']:.2f} | Net EV: ${ev_calc['net_ev']:.2f} | Fee: ${ev_calc['fee_cost']:.2f}")
             print(f"[EV DEBUG]   Should Bet: {should_bet} | Reason: {bet_reason}")
             
@@ -565,6 +1118,20 @@ class AutonomousEngine:
             
             bet_size = bet_calculation['bet_size']
             
+            # Re-check EV at the real bet size: larger orders walk deeper into the book
+            sized_fill = self.opinion_api.estimate_fill(token_id, bet_size, 'BUY', call_site='evaluation')
+            if sized_fill.get('success'):
+                sized_ev = self._calculate_expected_value(side_probability, market_price, bet_size, fill_price=sized_fill['vwap'])
+                evaluation['expected_fill_price'] = sized_fill['vwap']
+                evaluation['expected_slippage_pct'] = sized_fill['slippage_pct']
+                if sized_ev['net_ev'] <= 0:
+                    evaluation['reason'] = (f"Negative EV after slippage: fill ~{sized_fill['vwap']:.3f} for "
+                                            f"${bet_size:.2f} (net EV ${sized_ev['net_ev']:.2f})")
+                    logger.log_event_analysis(firm_name, event_description, prediction, evaluation, 'SKIP')
+                    # Save to DB for transparency
+                    self._save_ai_decision(firm_name, event, prediction, evaluation, 'ANALYZED', evaluation['reason'])
+                    return evaluation
+            
             allowed, risk_reason = self.risk_guard.can_place_bet(
                 firm_name=firm_name,
                 bet_amount=bet_size,
@@ -611,11 +1178,54 @@ class AutonomousEngine:
             error_msg = f"Database save failed: {str(db_error)}"
             logger.error(f"{firm_name} - {error_msg}", prefix="DB ERROR")
             evaluation['reason'] = error_msg
+            evaluation['error'] = error_msg
             logger.log_event_analysis(firm_name, event_description, prediction, evaluation, 'SKIP')
             return evaluation
         
         return evaluation
     
+    def _refresh_restored_opportunity(self, firm_name: str, evaluation: Dict) -> Dict:
+        """
+        Re-cotiza una oportunidad restaurada de un checkpoint antes de ejecutarla.
+        
+        Su precio puede tener hasta CYCLE_RESUME_WINDOW_SECONDS: se recalcula el EV con el
+        libro actual y se descarta si ya no es positivo. Los duplicados se re-comprueban al
+        ejecutar, como en cualquier oportunidad.
+        """
+        event = evaluation.get('event', {})
+        probability = evaluation.get('probability', 0.5)
+        side_probability = evaluation.get('side_probability', probability)
+        bet_size = evaluation.get('bet_size', 0)
+        token_id = event.get('yes_token_id') if probability >= 0.5 else event.get('no_token_id')
+        
+        price_response = self.opinion_api.get_latest_price(token_id, call_site='evaluation') if token_id else {}
+        market_price = price_response.get('price')
+        if not price_response.get('success') or market_price is None:
+            reason = f"Restored opportunity could not be re-priced: {price_response.get('error', 'Missing token_id')}"
+        else:
+            fill_estimate = self.opinion_api.estimate_fill(token_id, 10.0, 'BUY', call_site='evaluation')
+            fill_price = fill_estimate.get('vwap') if fill_estimate.get('success') else None
+            ev_calc = self._calculate_expected_value(side_probability, market_price, 10.0, fill_price=fill_price)
+            sized_fill = self.opinion_api.estimate_fill(token_id, bet_size, 'BUY', call_site='evaluation')
+            sized_ev = self._calculate_expected_value(
+                side_probability, market_price, bet_size,
+                fill_price=sized_fill['vwap'] if sized_fill.get('success') else fill_price
+            )
+            if ev_calc['net_ev'] > 0 and sized_ev['net_ev'] > 0:
+                logger.info(f"{firm_name} - Restored opportunity re-priced at {market_price:.4f} "
+                            f"(net EV ${evaluation.get('expected_value', 0):.2f} → ${ev_calc['net_ev']:.2f})")
+                return dict(evaluation, market_price=market_price, expected_fill_price=fill_price,
+                            expected_value=ev_calc['net_ev'], gross_ev=ev_calc['gross_ev'], fee_cost=ev_calc['fee_cost'])
+            reason = (f"Restored opportunity no longer has positive EV at price {market_price:.3f} "
+                      f"(net EV ${sized_ev['net_ev']:.2f} for ${bet_size:.2f})")
+        
+        logger.info(f"{firm_name} - Skip restored opportunity: {reason}")
+        # Update APPROVED decision to FAILED for transparency
+        approved_bet_id = evaluation.get('approved_bet_id')
+        if approved_bet_id:
+            self.db.update_bet_status(approved_bet_id, 'FAILED', reason)
+        return dict(evaluation, is_opportunity=False, reason=reason)
+    
     def _save_ai_decision(self, firm_name: str, event: Dict, prediction: Dict, evaluation: Dict, status: str, failure_reason: str = None) -> int:
         """
         Guarda TODAS las decisiones AI en la base de datos para transparencia completa.
@@ -667,6 +1277,26 @@ class AutonomousEngine:
         
         return self.db.save_autonomous_bet(bet_data)
     
+    def _skip_duplicate_execution(self, firm_name: str, opportunity: Dict, market_id, active_orders: List[Dict]) -> Dict:
+        """Decisión SKIP para una oportunidad cuyo mercado ya tiene órdenes abiertas al ejecutar."""
+        reason = f"Duplicate prevention at execution: {len(active_orders)} active order(s) already exist for market {market_id}"
+        logger.info(f"{firm_name} - Skip duplicate: {reason}")
+        
+        # Update APPROVED decision to FAILED for transparency
+        approved_bet_id = opportunity.get('approved_bet_id')
+        if approved_bet_id:
+            self.db.update_bet_status(approved_bet_id, 'FAILED', reason)
+        
+        return {
+            'event_id': opportunity.get('event_id', ''),
+            'event_description': opportunity.get('event_description', ''),
+            'category': opportunity.get('category', 'general'),
+            'timestamp': datetime.now().isoformat(),
+            'action': 'SKIP',
+            'reason': reason,
+            'duplicate_at_execution': True
+        }
+    
     def _execute_opportunity(self, firm_name: str, opportunity: Dict,
                             bankroll_manager: BankrollManager) -> Dict:
         """
@@ -847,7 +1477,11 @@ class AutonomousEngine:
     def _get_firm_prediction(self, firm_name: str, event_description: str, symbol: str, market_id: Optional[str] = None) -> Dict:
         """
         Obtiene predicción de una IA para un evento específico, recolectando datos de 5 áreas.
-        Usa caché compartido para reducir llamadas a APIs externas cuando múltiples firmas analizan el mismo símbolo.
+        
+        Los datos del evento se recolectan una sola vez por ciclo (_get_event_context). Con
+        ENGINE_PREDICTION_FANOUT activo, la primera IA que pide el evento lanza la predicción
+        de TODAS las IAs a la vez y las demás reciben la suya ya calculada; el riesgo y el
+        bankroll se siguen evaluando por IA sobre esa predicción.
         
         Args:
             firm_name: Nombre de la IA/firma
@@ -855,6 +1489,71 @@ class AutonomousEngine:
             symbol: Símbolo del asset (BTC, AAPL, etc.) si aplica
             market_id: ID del mercado en Opinion.trade (para price history)
         """
+        event_key = self._event_key(event_description, market_id)
+        context = self._get_event_context(event_key, event_description, symbol, market_id)
+        if self.prediction_fanout:
+            predictions = self._get_event_predictions(event_key, context)
+            if firm_name in predictions:
+                return predictions[firm_name]
+        return self._predict_with_context(firm_name, context)
+    
+    @staticmethod
+    def _event_key(event_description: str, market_id: Optional[str]) -> str:
+        """
+        Clave por evento de los cachés de contexto y predicciones.
+        
+        Todas las opciones de un mercado CATEGORICAL comparten market_id, y cada una tiene su
+        descripción ("Option: X"). Por eso la clave incluye las dos: con market_id solo, la
+        primera opción fijaría el contexto y las predicciones de todas las demás.
+        """
+        return f"{market_id}|{event_description}" if market_id else event_description
+    
+    def _get_event_context(self, event_key: str, event_description: str, symbol: str,
+                           market_id: Optional[str]) -> MappingProxyType:
+        """Contexto inmutable del evento, recolectado una vez por ciclo y compartido por todas las IAs."""
+        cache_key = f"context_{event_key}"
+        with self._data_cache_lock(cache_key):
+            context = self._data_cache.get(cache_key)
+            if context is None:
+                context = self._collect_event_context(event_description, symbol, market_id)
+                self._data_cache[cache_key] = context
+            return context
+    
+    def _get_event_predictions(self, event_key: str, context: MappingProxyType) -> Dict[str, Dict]:
+        """
+        Predicciones de todas las IAs para un evento, lanzadas en paralelo la primera vez.
+        
+        Cada predicción se guarda en los checkpoints del ciclo: al reanudar un ciclo
+        interrumpido (_data_cache vacío) solo se piden las de las IAs que aún no tienen.
+        """
+        cache_key = f"predictions_{event_key}"
+        with self._data_cache_lock(cache_key):
+            predictions = self._data_cache.get(cache_key)
+            if predictions is None:
+                firm_names = self.orchestrator.get_firm_names()
+                predictions = {}
+                if self.checkpoints is not None:
+                    stored = self.checkpoints.get_predictions(self._cycle_id, event_key)
+                    predictions.update({name: stored[name] for name in firm_names if name in stored})
+                missing = [name for name in firm_names if name not in predictions]
+                if missing:
+                    with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix='predict') as pool:
+                        futures = {name: pool.submit(self._predict_with_context, name, context) for name in missing}
+                        for name, future in futures.items():
+                            predictions[name] = future.result()
+                            # Los errores no se guardan: se reintentan al reanudar
+                            if self.checkpoints is not None and 'error' not in predictions[name]:
+                                self.checkpoints.save_prediction(self._cycle_id, name, event_key, predictions[name])
+                self._data_cache[cache_key] = predictions
+                logger.info(f"Fanned out {event_key} to {len(missing)} firms "
+                            f"({len(predictions) - len(missing)} restored from checkpoint)")
+            return predictions
+    
+    def _collect_event_context(self, event_description: str, symbol: str, market_id: Optional[str]) -> MappingProxyType:
+        """
+        Recolecta technical, news, volatility y price history (24h) de un evento.
+        Usa caché compartido para reducir llamadas a APIs externas cuando varios eventos comparten símbolo.
+        """
         # Initialize with more informative default values
         technical_report = "Technical analysis unavailable - API key missing or invalid"
         fundamental_report = "Fundamental analysis unavailable" 
@@ -866,85 +1565,102 @@ class AutonomousEngine:
         api_key_valid = self.alpha_vantage_key and len(self.alpha_vantage_key.strip()) > 0
         
         if symbol and api_key_valid:
-            cache_key_tech = f"tech_{symbol}"
-            cache_key_news = f"news_{symbol}"
-            cache_key_vol = f"vol_{symbol}"
-            
-            # Try cache first for technical data
-            if cache_key_tech in self._data_cache:
-                tech_data = self._data_cache[cache_key_tech]
-                technical_report = format_technical_report(tech_data)
-                logger.cache(f"Technical data for {symbol} retrieved from cache")
-            else:
-                try:
-                    collector = AlphaVantageCollector(self.alpha_vantage_key)
-                    tech_data = collector.get_technical_indicators(symbol)
-                    
-                    # Check for API rate limit or invalid key responses
-                    if 'error' not in tech_data and tech_data.get('indicators'):
-                        self._data_cache[cache_key_tech] = tech_data
-                        technical_report = format_technical_report(tech_data)
-                        logger.cache(f"Technical data for {symbol} fetched and cached")
-                    else:
-                        error_msg = tech_data.get('error', 'No indicators returned')
-                        logger.warning(f"Technical data error for {symbol}: {error_msg}")
-                        # Try to use stale cache if available
-                        stale_key = f"stale_tech_{symbol}"
-                        if stale_key in self._data_cache:
-                            technical_report = f"[USING STALE DATA] {format_technical_report(self._data_cache[stale_key])}"
+            # Caché persistente entre ciclos (data_cache.py); el lock por clave evita que
+            # dos IAs descarguen el mismo símbolo a la vez
+            with self._data_cache_lock(f"tech_{symbol}"):
+                tech_data = self.data_cache.get('technical', symbol)
+                if tech_data is not None:
+                    technical_report = format_technical_report(tech_data)
+                    logger.cache(f"Technical data for {symbol} retrieved from cache")
+                else:
+                    try:
+                        collector = AlphaVantageCollector(self.alpha_vantage_key)
+                        tech_data = collector.get_technical_indicators(symbol)
+                        
+                        # Check for API rate limit or invalid key responses
+                        if 'error' not in tech_data and tech_data.get('indicators'):
+                            self.data_cache.put('technical', symbol, tech_data)
+                            technical_report = format_technical_report(tech_data)
+                            logger.cache(f"Technical data for {symbol} fetched and cached")
                         else:
-                            technical_report = f"Technical analysis failed: {error_msg}"
+                            error_msg = tech_data.get('error', 'No indicators returned')
+                            logger.warning(f"Technical data error for {symbol}: {error_msg}")
+                            # Try to use stale cache if available
+                            stale = self.data_cache.get_stale('technical', symbol)
+                            if stale:
+                                technical_report = f"[USING STALE DATA, {stale[1] / 3600:.1f}h old] {format_technical_report(stale[0])}"
+                            else:
+                                technical_report = f"Technical analysis failed: {error_msg}"
                             
-                except Exception as e:
-                    logger.error(f"Exception fetching technical data for {symbol}: {e}")
-                    # Fallback to stale cache if available
-                    stale_key = f"stale_tech_{symbol}"
-                    if stale_key in self._data_cache:
-                        technical_report = f"[FALLBACK DATA] {format_technical_report(self._data_cache[stale_key])}"
-                    else:
-                        technical_report = f"Technical analysis error: {str(e)[:100]}"
+                    except Exception as e:
+                        logger.error(f"Exception fetching technical data for {symbol}: {e}")
+                        # Fallback to stale cache if available
+                        stale = self.data_cache.get_stale('technical', symbol)
+                        if stale:
+                            technical_report = f"[FALLBACK DATA, {stale[1] / 3600:.1f}h old] {format_technical_report(stale[0])}"
+                        else:
+                            technical_report = f"Technical analysis error: {str(e)[:100]}"
             
-            if cache_key_news in self._data_cache:
-                news_data = self._data_cache[cache_key_news]
-                news_report = format_news_report(news_data)
-                print(f"[CACHE HIT] News data for {symbol}")
-            else:
-                try:
-                    news_collector = NewsCollector(alpha_vantage_key=self.alpha_vantage_key)
-                    news_data = news_collector.get_news_analysis(symbol, event_description)
-                    if 'error' not in news_data:
-                        self._data_cache[cache_key_news] = news_data
-                        print(f"[CACHE MISS] Fetched & cached news data for {symbol}")
-                    else:
-                        print(f"[CACHE SKIP] News data error for {symbol}, not caching")
+            
+            with self._data_cache_lock(f"news_{symbol}"):
+                news_data = self.data_cache.get('news', symbol)
+                if news_data is not None:
                     news_report = format_news_report(news_data)
-                except Exception as e:
-                    print(f"[CACHE ERROR] Failed to fetch news data for {symbol}: {e}")
-                    pass
+                    print(f"[CACHE HIT] News data for {symbol}")
+                else:
+                    try:
+                        news_collector = NewsCollector(alpha_vantage_key=self.alpha_vantage_key)
+                        news_data = news_collector.get_news_analysis(symbol, event_description)
+                        if 'error' not in news_data:
+                            self.data_cache.put('news', symbol, news_data)
+                            print(f"[CACHE MISS] Fetched & cached news data for {symbol}")
+                        else:
+                            stale = self.data_cache.get_stale('news', symbol)
+                            if stale:
+                                print(f"[CACHE STALE] News data error for {symbol}, using {stale[1] / 3600:.1f}h old data")
+                                news_data = stale[0]
+                            else:
+                                print(f"[CACHE SKIP] News data error for {symbol}, not caching")
+                        news_report = format_news_report(news_data)
+                    except Exception as e:
+                        print(f"[CACHE ERROR] Failed to fetch news data for {symbol}: {e}")
+                        stale = self.data_cache.get_stale('news', symbol)
+                        if stale:
+                            news_report = format_news_report(stale[0])
             
-            if cache_key_vol in self._data_cache:
-                volatility_data = self._data_cache[cache_key_vol]
-                volatility_report = format_volatility_report(volatility_data)
-                print(f"[CACHE HIT] Volatility data for {symbol}")
-            else:
-                try:
-                    volatility_collector = VolatilityCollector()
-                    
-                    if symbol in ['BTC', 'ETH', 'SOL', 'BNB', 'DOGE', 'XRP']:
-                        crypto_symbol = f"{symbol}-USD"
-                    else:
-                        crypto_symbol = symbol
-                    
-                    volatility_data = volatility_collector.get_volatility_metrics(crypto_symbol)
-                    if 'error' not in volatility_data:
-                        self._data_cache[cache_key_vol] = volatility_data
-                        print(f"[CACHE MISS] Fetched & cached volatility data for {crypto_symbol}")
-                    else:
-                        print(f"[CACHE SKIP] Volatility data error for {crypto_symbol}, not caching")
+            
+            with self._data_cache_lock(f"vol_{symbol}"):
+                volatility_data = self.data_cache.get('volatility', symbol)
+                if volatility_data is not None:
                     volatility_report = format_volatility_report(volatility_data)
-                except Exception as e:
-                    print(f"[CACHE ERROR] Failed to fetch volatility data for {symbol}: {e}")
-                    pass
+                    print(f"[CACHE HIT] Volatility data for {symbol}")
+                else:
+                    try:
+                        volatility_collector = VolatilityCollector()
+                        
+                        if symbol in ['BTC', 'ETH', 'SOL', 'BNB', 'DOGE', 'XRP']:
+                            crypto_symbol = f"{symbol}-USD"
+                        else:
+                            crypto_symbol = symbol
+                        
+                        volatility_data = volatility_collector.get_volatility_metrics(crypto_symbol)
+                        if 'error' not in volatility_data:
+                            self.data_cache.put('volatility', symbol, volatility_data)
+                            print(f"[CACHE MISS] Fetched & cached volatility data for {crypto_symbol}")
+                        else:
+                            stale = self.data_cache.get_stale('volatility', symbol)
+                            if stale:
+                                print(f"[CACHE STALE] Volatility data error for {crypto_symbol}, using {stale[1] / 3600:.1f}h old data")
+                                volatility_data = stale[0]
+                            else:
+                                print(f"[CACHE SKIP] Volatility data error for {crypto_symbol}, not caching")
+                        volatility_report = format_volatility_report(volatility_data)
+                    except Exception as e:
+                        print(f"[CACHE ERROR] Failed to fetch volatility data for {symbol}: {e}")
+                        stale = self.data_cache.get_stale('volatility', symbol)
+                        if stale:
+                            volatility_report = format_volatility_report(stale[0])
+        
         
         # Agregar price history como contexto (si disponible)
         price_history_report = ""
@@ -974,25 +1690,37 @@ class AutonomousEngine:
             except Exception as e:
                 print(f"[INFO] Could not fetch price history for market {market_id}: {e}")
         
+        # Agregar price history al prompt si disponible
+        extended_event_description = event_description
+        if price_history_report:
+            extended_event_description += price_history_report
+        
+        return MappingProxyType({
+            'event_key': self._event_key(event_description, market_id),
+            'event_description': extended_event_description,
+            'technical_report': technical_report,
+            'fundamental_report': fundamental_report,
+            'sentiment_report': sentiment_report,
+            'news_report': news_report,
+            'volatility_report': volatility_report,
+        })
+    
+    def _predict_with_context(self, firm_name: str, context: MappingProxyType) -> Dict:
         try:
-            firm = self.orchestrator.get_all_firms()[firm_name]
-            
-            # Agregar price history al prompt si disponible
-            extended_event_description = event_description
-            if price_history_report:
-                extended_event_description += price_history_report
+            firm = self.orchestrator.get_firm(firm_name)
             
             prompt = create_trading_prompt(
-                event_description=extended_event_description,
-                technical_report=technical_report,
-                fundamental_report=fundamental_report,
-                sentiment_report=sentiment_report,
-                news_report=news_report,
-                volatility_report=volatility_report,
+                event_description=context['event_description'],
+                technical_report=context['technical_report'],
+                fundamental_report=context['fundamental_report'],
+                sentiment_report=context['sentiment_report'],
+                news_report=context['news_report'],
+                volatility_report=context['volatility_report'],
                 firm_name=firm_name
             )
             
-            prediction = firm.generate_prediction(prompt)
+            with self.provider_slots.slot(firm_name):
+                prediction = firm.generate_prediction(prompt)
             return prediction
             
         except Exception as e:
@@ -1013,7 +1741,8 @@ class AutonomousEngine:
         
         return None
     
-    def _calculate_expected_value(self, probability: float, market_price: Optional[float] = None, bet_size: float = 10.0) -> Dict[str, float]:
+    def _calculate_expected_value(self, probability: float, market_price: Optional[float] = None, bet_size: float = 10.0,
+                                  fill_price: Optional[float] = None) -> Dict[str, float]:
         """
         Calcula el valor esperado de una apuesta con fees reales de Opinion.trade.
         
@@ -1024,14 +1753,20 @@ class AutonomousEngine:
             probability: Probabilidad estimada de que ocurra el evento (0-1)
             market_price: Precio actual del mercado (0-1). Si None, usa probability como proxy
             bet_size: Tamaño de la apuesta en USD
+            fill_price: Precio medio de ejecución esperado (VWAP según profundidad del libro).
+                        Si se indica, sustituye a market_price
         
         Returns:
-            Dictionary con 'gross_ev' y 'net_ev' (valores absolutos en USD)
+            Dictionary con 'gross_ev', 'net_ev' (valores absolutos en USD) y el precio usado
         """
         # Si no hay market_price, usar probability como fallback
         if market_price is None:
             market_price = probability
         
+        # El precio real que pagamos es el VWAP de la orden, no el mid ni el mejor ask
+        if fill_price is not None:
+            market_price = fill_price
+        
         # Obtener fees cacheados de Opinion.trade
         fees_response = self.opinion_api.get_fee_rates(use_cache=True)
         if fees_response.get('success'):
@@ -1059,7 +1794,8 @@ class AutonomousEngine:
             'gross_ev': gross_ev,
             'net_ev': net_ev,
             'fee_cost': fee_cost,
-            'taker_fee_rate': taker_fee
+            'taker_fee_rate': taker_fee,
+            'price_used': market_price
         }
     
     def _execute_bet(self, firm_name: str, event: Dict, event_description: str,
@@ -1091,7 +1827,7 @@ class AutonomousEngine:
         # Get current market price for logging purposes
         # NOTE: We don't reject based on price difference because AI probability
         # vs market price difference is EXACTLY what we're trying to exploit
-        price_check = self.opinion_api.get_latest_price(token_id)
+        price_check = self.opinion_api.get_latest_price(token_id, call_site='evaluation')
         
         if price_check.get('success'):
             current_price = price_check.get('price', probability)
@@ -1120,6 +1856,21 @@ class AutonomousEngine:
             
             if result.get('success'):
                 logger.log_bet_execution(firm_name, event_id, bet_size, event_description, True)
+                
+                # Keep the per-cycle index current so later events see this order
+                if self._open_orders_index is not None:
+                    order_details = result.get('data', {})
+                    self._open_orders_index.add({
+                        'order_id': result.get('prediction_id'),
+                        'market_id': market_id,
+                        'token_id': token_id,
+                        'side': 'BUY',
+                        'price': order_details.get('price'),
+                        'amount': bet_size,
+                        'status': 'pending',
+                        'created_at': order_details.get('timestamp', datetime.now().isoformat())
+                    })
+                
                 return {'status': 'success', **result}
             else:
                 error_msg = result.get('error', 'Unknown error from Opinion.trade')
@@ -1150,7 +1901,7 @@ class AutonomousEngine:
             'firms': {}
         }
         
-        for firm_name in self.orchestrator.get_all_firms().keys():
+        for firm_name in self.orchestrator.get_firm_names():
             tier_status = self.risk_guard.get_tier_status(firm_name)
             bankroll_manager = self.bankroll_managers[firm_name]
             
@@ -1189,7 +1940,7 @@ class AutonomousEngine:
         """
         leaderboard = []
         
-        for firm_name in self.orchestrator.get_all_firms().keys():
+        for firm_name in self.orchestrator.get_firm_names():
             tier_status = self.risk_guard.get_tier_status(firm_name)
             bankroll_manager = self.bankroll_managers[firm_name]
             
@@ -1233,7 +1984,7 @@ class AutonomousEngine:
         """
         cross_insights = self.learning_system.generate_cross_learning_insights()
         
-        for firm_name in self.orchestrator.get_all_firms().keys():
+        for firm_name in self.orchestrator.get_firm_names():
             analysis = self.learning_system.analyze_weekly_performance(firm_name)
             
             if analysis.get('status') not in ['insufficient_data', 'no_recent_activity']:
@@ -1464,6 +2215,8 @@ class OrderMonitor:
         active_orders = orders_response.get('orders', [])
         stats['total_checked'] = len(active_orders)
         
+        self._prefetch_orderbooks(active_orders)
+        
         for order in active_orders:
             order_id = order.get('order_id')
             if not order_id:
@@ -1493,6 +2246,25 @@ class OrderMonitor:
         
         return stats
     
+    def _prefetch_orderbooks(self, orders: List[Dict]):
+        """
+        Descarga en paralelo los orderbooks de todas las órdenes para que
+        _evaluate_order los lea desde la caché 'monitor' en vez de uno a uno.
+        """
+        token_ids = [str(order['token_id']) for order in orders if order.get('token_id')]
+        if len(set(token_ids)) < 2:
+            return
+        
+        async def prefetch():
+            async with AsyncOpinionTradeAPI(self.opinion_api) as async_api:
+                await async_api.get_orderbooks(token_ids, call_site='monitor')
+        
+        try:
+            asyncio.run(prefetch())
+        except RuntimeError as e:
+            # Ya hay un event loop corriendo: se evalúa de forma secuencial como antes
+            logger.warning(f"OrderMonitor - Orderbook prefetch skipped: {e}")
+    
     def _evaluate_order(self, order: Dict) -> Dict:
         """
         Evalúa una orden y retorna si tiene algún problema.
@@ -1517,7 +2289,7 @@ class OrderMonitor:
         
         # FACTOR 1: Precio manipulado (>15% cambio súbito desde última revisión)
         if token_id:
-            latest_price_response = self.opinion_api.get_latest_price(token_id)
+            latest_price_response = self.opinion_api.get_latest_price(token_id, call_site='monitor')
             if latest_price_response.get('success'):
                 latest_price = latest_price_response.get('price', current_price)
                 price_change = abs(latest_price - order_data['original_price']) / order_data['original_price']
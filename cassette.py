@@ -0,0 +1,403 @@
+"""
+HTTP Cassettes
+==============
+Record/replay of every HTTP exchange made during a cycle.
+
+Recording hooks the two transports the stack actually uses:
+
+    urllib3  HTTPConnectionPool.urlopen   Opinion.trade proxy (opinion_api REST client),
+                                          requests sessions (builder SDK, data collectors,
+                                          web3 RPC)
+    httpx    Client.send / AsyncClient.send
+                                          LLM providers (OpenAI-compatible clients, google-genai)
+
+Each exchange is stored as one JSON line (gzip-compressed when the path ends in .gz):
+method, redacted URL, SHA-256 of the request body, status, response headers and the
+decoded response body. Request headers are never stored and credential-like query
+parameters (key, apikey, token, signature, ...) are redacted, so cassettes hold no secrets.
+
+In replay mode nothing reaches the network. A request is served the next unused
+recording with the same method, URL and body hash; if the body changed (prompts with
+timestamps, signed orders with fresh salts) it falls back to the next unused recording
+for the same method and URL. Anything else raises CassetteMiss.
+
+    with Cassette('cassettes/cycle.jsonl.gz', mode='record'):
+        engine.run_daily_cycle()
+
+    with Cassette('cassettes/cycle.jsonl.gz', mode='replay', latency='recorded'):
+        engine.run_daily_cycle()      # same responses, offline
+
+Configuration:
+    CASSETTE_MODE           off | record | replay (default: off)
+    CASSETTE_PATH           Cassette file (default: cassettes/cycle.jsonl.gz)
+    CASSETTE_LATENCY        Replay latency: off | recorded | <seconds> (default: off)
+    CASSETTE_LATENCY_SCALE  Multiplier applied to recorded latency (default: 1.0)
+"""
+
+import asyncio
+import atexit
+import base64
+import datetime
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool
+
+from logger import autonomous_logger as logger
+
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+_SENSITIVE_PARAM = re.compile(r'(key|token|secret|signature|password|auth)', re.IGNORECASE)
+# Bodies are stored decoded, so framing/encoding headers no longer describe them
+_DROPPED_RESPONSE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie', 'connection'}
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode for a request that has no recording left."""
+
+    def __init__(self, transport: str, method: str, url: str):
+        self.transport = transport
+        self.method = method
+        self.url = url
+        super().__init__(f"no recorded {transport} response for {method} {url}")
+
+
+def redact_url(url: str) -> str:
+    """URL with credential-like query parameter values replaced."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(name, 'REDACTED' if _SENSITIVE_PARAM.search(name) else value)
+             for name, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def body_digest(body) -> str:
+    if body is None:
+        return ''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not isinstance(body, (bytes, bytearray)):
+        # Streaming bodies (file objects, generators) cannot be hashed without consuming them
+        return 'stream'
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def _encode_body(content: bytes) -> Dict:
+    try:
+        return {'body': content.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_b64': base64.b64encode(content).decode('ascii')}
+
+
+def _decode_body(entry: Dict) -> bytes:
+    if 'body_b64' in entry:
+        return base64.b64decode(entry['body_b64'])
+    return entry.get('body', '').encode('utf-8')
+
+
+def _keep_headers(items) -> List[Tuple[str, str]]:
+    return [(name, value) for name, value in items if name.lower() not in _DROPPED_RESPONSE_HEADERS]
+
+
+class Cassette:
+    """Recorder/player for urllib3 and httpx traffic. Only one cassette can be installed at a time."""
+
+    def __init__(self, path: str, mode: str = REPLAY, latency: Union[None, str, float] = None,
+                 latency_scale: float = 1.0):
+        """
+        Args:
+            path: Cassette file (.jsonl or .jsonl.gz)
+            mode: 'record' or 'replay'
+            latency: Replay only. None serves instantly, 'recorded' sleeps for the
+                recorded duration (times latency_scale), a number sleeps that many seconds
+            latency_scale: Multiplier for recorded latency
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries: List[Dict] = []
+        self._exact: Dict[Tuple, deque] = defaultdict(deque)
+        self._route: Dict[Tuple, deque] = defaultdict(deque)
+        self._used = set()
+        self._stats = {'exact_hits': 0, 'route_hits': 0, 'misses': 0}
+        self._installed = False
+        self._originals: Dict = {}
+        self._local = threading.local()
+        if mode == REPLAY:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> Optional['Cassette']:
+        mode = os.environ.get('CASSETTE_MODE', 'off').lower()
+        if mode not in (RECORD, REPLAY):
+            return None
+        latency = os.environ.get('CASSETTE_LATENCY', 'off').lower()
+        if latency == 'off':
+            latency = None
+        elif latency != 'recorded':
+            latency = float(latency)
+        return cls(
+            path=os.environ.get('CASSETTE_PATH', 'cassettes/cycle.jsonl.gz'),
+            mode=mode,
+            latency=latency,
+            latency_scale=float(os.environ.get('CASSETTE_LATENCY_SCALE', '1.0'))
+        )
+
+    # ------------------------------------------------------------------ storage
+
+    def _open(self, path: str, mode: str):
+        if self.path.endswith('.gz'):
+            return gzip.open(path, mode + 't', encoding='utf-8')
+        return open(path, mode, encoding='utf-8')
+
+    def _load(self):
+        with self._open(self.path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    self._entries.append(json.loads(line))
+        for index, entry in enumerate(self._entries):
+            route = (entry['transport'], entry['method'], entry['url'])
+            self._route[route].append(index)
+            self._exact[route + (entry['body_sha'],)].append(index)
+
+    def save(self):
+        """Write recorded entries (record mode only); safe to call more than once."""
+        if self.mode != RECORD:
+            return
+        with self._lock:
+            entries = list(self._entries)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with self._open(tmp_path, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = {'mode': self.mode, 'path': self.path, 'entries': len(self._entries)}
+            if self.mode == REPLAY:
+                stats.update(self._stats, served=len(self._used))
+            return stats
+
+    # ------------------------------------------------------------------ record / replay
+
+    def _record(self, transport: str, method: str, url: str, body, status: int, reason: str,
+                headers, content: bytes, elapsed: float):
+        entry = {
+            'transport': transport,
+            'method': method.upper(),
+            'url': redact_url(url),
+            'body_sha': body_digest(body),
+            'status': status,
+            'reason': reason,
+            'headers': _keep_headers(headers),
+            'elapsed': round(elapsed, 4),
+        }
+        entry.update(_encode_body(content))
+        with self._lock:
+            self._entries.append(entry)
+
+    def _next(self, transport: str, method: str, url: str, body) -> Dict:
+        route = (transport, method.upper(), redact_url(url))
+        with self._lock:
+            for queue, stat in ((self._exact[route + (body_digest(body),)], 'exact_hits'),
+                                (self._route[route], 'route_hits')):
+                while queue and queue[0] in self._used:
+                    queue.popleft()
+                if queue:
+                    index = queue.popleft()
+                    self._used.add(index)
+                    self._stats[stat] += 1
+                    return self._entries[index]
+            self._stats['misses'] += 1
+        raise CassetteMiss(transport, route[1], route[2])
+
+    def _delay(self, entry: Dict) -> float:
+        if self.latency is None:
+            return 0.0
+        if self.latency == 'recorded':
+            return entry.get('elapsed', 0.0) * self.latency_scale
+        return float(self.latency)
+
+    # ------------------------------------------------------------------ transport hooks
+
+    def _urlopen(self, pool, method, url, body=None, headers=None, **kwargs):
+        full_url = url if '://' in url else f"{pool.scheme}://{pool.host}:{pool.port}{url}"
+        preload_content = kwargs.get('preload_content', True)
+
+        if self.mode == REPLAY:
+            entry = self._next('urllib3', method, full_url, body)
+            delay = self._delay(entry)
+            if delay:
+                time.sleep(delay)
+            return urllib3.HTTPResponse(
+                body=io.BytesIO(_decode_body(entry)),
+                headers=entry['headers'],
+                status=entry['status'],
+                reason=entry['reason'],
+                preload_content=preload_content,
+                decode_content=False,
+                request_method=method,
+                request_url=full_url
+            )
+
+        # Retries and redirects re-enter urlopen; only the outermost call is recorded
+        if getattr(self._local, 'depth', 0):
+            return self._originals['urlopen'](pool, method, url, body=body, headers=headers, **kwargs)
+        self._local.depth = 1
+        try:
+            started = time.monotonic()
+            response = self._originals['urlopen'](pool, method, url, body=body, headers=headers, **kwargs)
+            content = response.read(decode_content=True) if not preload_content else response.data
+            elapsed = time.monotonic() - started
+        finally:
+            self._local.depth = 0
+        if not preload_content:
+            response.release_conn()
+        headers_out = _keep_headers(response.headers.items())
+        self._record('urllib3', method, full_url, body, response.status, response.reason,
+                     headers_out, content, elapsed)
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(content),
+            headers=headers_out,
+            status=response.status,
+            reason=response.reason,
+            preload_content=preload_content,
+            decode_content=False,
+            request_method=method,
+            request_url=full_url
+        )
+
+    def _replayed_httpx(self, entry: Dict, request: httpx.Request) -> httpx.Response:
+        response = httpx.Response(
+            status_code=entry['status'],
+            headers=entry['headers'],
+            content=_decode_body(entry),
+            request=request
+        )
+        response.elapsed = datetime.timedelta(seconds=entry.get('elapsed', 0.0))
+        return response
+
+    def _record_httpx(self, request: httpx.Request, response: httpx.Response, elapsed: float):
+        self._record('httpx', request.method, str(request.url), request.content, response.status_code,
+                     response.reason_phrase, response.headers.multi_items(), response.content, elapsed)
+
+    def _send(self, client, request, **kwargs):
+        if self.mode == REPLAY:
+            entry = self._next('httpx', request.method, str(request.url), request.content)
+            delay = self._delay(entry)
+            if delay:
+                time.sleep(delay)
+            return self._replayed_httpx(entry, request)
+
+        started = time.monotonic()
+        response = self._originals['send'](client, request, **kwargs)
+        response.read()
+        self._record_httpx(request, response, time.monotonic() - started)
+        return response
+
+    async def _send_async(self, client, request, **kwargs):
+        if self.mode == REPLAY:
+            entry = self._next('httpx', request.method, str(request.url), request.content)
+            delay = self._delay(entry)
+            if delay:
+                await asyncio.sleep(delay)
+            return self._replayed_httpx(entry, request)
+
+        started = time.monotonic()
+        response = await self._originals['send_async'](client, request, **kwargs)
+        await response.aread()
+        self._record_httpx(request, response, time.monotonic() - started)
+        return response
+
+    def install(self) -> 'Cassette':
+        global _installed
+        with _install_lock:
+            if self._installed:
+                return self
+            if _installed is not None:
+                raise RuntimeError(f"another cassette is already installed: {_installed.path}")
+            cassette = self
+            self._originals = {
+                'urlopen': HTTPConnectionPool.urlopen,
+                'send': httpx.Client.send,
+                'send_async': httpx.AsyncClient.send,
+            }
+
+            def urlopen(pool, method, url, body=None, headers=None, **kwargs):
+                return cassette._urlopen(pool, method, url, body=body, headers=headers, **kwargs)
+
+            def send(client, request, **kwargs):
+                return cassette._send(client, request, **kwargs)
+
+            async def send_async(client, request, **kwargs):
+                return await cassette._send_async(client, request, **kwargs)
+
+            HTTPConnectionPool.urlopen = urlopen
+            httpx.Client.send = send
+            httpx.AsyncClient.send = send_async
+            self._installed = True
+            _installed = self
+        logger.info(f"Cassette {self.mode} installed: {self.path}", prefix="CASSETTE")
+        return self
+
+    def uninstall(self):
+        global _installed
+        with _install_lock:
+            if not self._installed:
+                return
+            HTTPConnectionPool.urlopen = self._originals['urlopen']
+            httpx.Client.send = self._originals['send']
+            httpx.AsyncClient.send = self._originals['send_async']
+            self._installed = False
+            _installed = None
+
+    def __enter__(self) -> 'Cassette':
+        return self.install()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.uninstall()
+        self.save()
+
+
+_installed: Optional[Cassette] = None
+_install_lock = threading.Lock()
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+_cassette_checked = False
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Process-wide cassette from CASSETTE_MODE, installed on first call; None when disabled."""
+    global _cassette, _cassette_checked
+    with _cassette_lock:
+        if not _cassette_checked:
+            _cassette_checked = True
+            _cassette = Cassette.from_env()
+            if _cassette is not None:
+                _cassette.install()
+                if _cassette.mode == RECORD:
+                    atexit.register(_cassette.save)
+        return _cassette
@@ -0,0 +1,206 @@
+"""
+Circuit Breaker and Retry Budget
+================================
+Fail-fast protection for Opinion.trade calls.
+
+Each endpoint class (market_data, orders, account) has a circuit breaker:
+
+    closed     calls go through; consecutive failures are counted
+    open       after FAILURE_THRESHOLD consecutive failures every call fails
+               immediately with CircuitOpenError for RECOVERY_SECONDS
+    half_open  after the recovery timeout one trial call is let through;
+               success closes the breaker, failure re-opens it
+
+Retries are jittered (full jitter) and drawn from a per-cycle RetryBudget, so an
+outage of proxy.opinion.trade costs a bounded number of sleeps per cycle instead
+of several backoff sequences per call.
+
+Configuration:
+    CIRCUIT_FAILURE_THRESHOLD   Consecutive failures before opening (default: 5)
+    CIRCUIT_RECOVERY_SECONDS    Seconds an open breaker waits before a trial call (default: 30)
+    OPINION_RETRY_BUDGET        Retries allowed per cycle across all calls (default: 10)
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the exchange while a breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(f"circuit '{name}' is open (retry in {retry_in:.1f}s)")
+
+
+def jittered_delay(attempt: int, initial_delay: float, max_delay: float, backoff_factor: float = 2.0) -> float:
+    """Full-jitter backoff: uniform in [0, min(max_delay, initial_delay * factor**attempt)]."""
+    return random.uniform(0, min(max_delay, initial_delay * backoff_factor ** attempt))
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open breaker for one endpoint class."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            name: Endpoint class guarded by this breaker
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._last_error: Optional[str] = None
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def allow(self):
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._state = HALF_OPEN
+                self._trial_in_flight = True
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Give back a half-open trial slot when the call never reached the endpoint."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self._consecutive_failures += 1
+            self._last_error = error
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            state = self._current_state()
+            return {
+                'state': state,
+                'consecutive_failures': self._consecutive_failures,
+                'rejected_calls': self._rejected,
+                'open_for_seconds': round(time.monotonic() - self._opened_at, 1) if state != CLOSED else None,
+                'last_error': self._last_error,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Breakers keyed by endpoint class, created on first use."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_env(cls) -> 'CircuitBreakerRegistry':
+        return cls(
+            failure_threshold=int(os.environ.get('CIRCUIT_FAILURE_THRESHOLD', '5')),
+            recovery_timeout=float(os.environ.get('CIRCUIT_RECOVERY_SECONDS', '30'))
+        )
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, self.failure_threshold, self.recovery_timeout)
+                self._breakers[name] = breaker
+            return breaker
+
+    def open_circuits(self) -> List[str]:
+        """Names of breakers that are open and still inside their recovery timeout."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [b.name for b in breakers if b.state == OPEN]
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.name: b.to_dict() for b in breakers}
+
+
+class RetryBudget:
+    """Retries allowed per cycle, shared by every retrying call."""
+
+    def __init__(self, max_retries: int = 10):
+        self.max_retries = max(0, max_retries)
+        self._lock = threading.Lock()
+        self._used = 0
+        self._denied = 0
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False when exhausted."""
+        with self._lock:
+            if self._used >= self.max_retries:
+                self._denied += 1
+                return False
+            self._used += 1
+            return True
+
+    def reset(self):
+        with self._lock:
+            self._used = 0
+            self._denied = 0
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self.max_retries - self._used
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {'max_retries': self.max_retries, 'used': self._used, 'denied': self._denied}
+
+
+_registry: Optional[CircuitBreakerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Process-wide breakers shared by every OpinionTradeAPI instance."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CircuitBreakerRegistry.from_env()
+        return _registry
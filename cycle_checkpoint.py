@@ -0,0 +1,191 @@
+"""
+Cycle Checkpoints
+=================
+Per-unit progress of run_daily_cycle, so a killed cycle resumes instead of restarting.
+
+A worker OOM-kill or the Gunicorn timeout used to lose every evaluation of the cycle,
+and the re-trigger repeated all LLM calls. Units are persisted under a cycle id:
+
+    evaluation   (firm, event) result of _evaluate_event_opportunity, replayed on resume.
+                 Transient failures (prediction or price errors) are not stored and are
+                 evaluated again; restored opportunities are re-priced before execution
+    prediction   (firm, event) LLM prediction from the fan-out, so a resumed fan-out only
+                 asks the firms that have none yet
+    execution    (firm, event) bet execution: 'pending' before the order is sent,
+                 'done' with the decision afterwards
+
+begin_cycle() resumes the latest unfinished cycle started within
+CYCLE_RESUME_WINDOW_SECONDS, otherwise it opens a new one. An execution left
+'pending' is not retried, because the order may have reached the exchange before
+the process died. Executions are at-most-once.
+
+Configuration:
+    CYCLE_CHECKPOINTS_ENABLED      "false" to disable checkpoints
+    CYCLE_CHECKPOINT_DB            SQLite file path (default: cycle_checkpoints.db)
+    CYCLE_RESUME_WINDOW_SECONDS    Max age of a cycle that can be resumed (default: 10800)
+    CYCLE_CHECKPOINT_RETENTION_DAYS  Days finished cycles are kept (default: 7)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+
+class CycleCheckpointStore:
+    """SQLite-backed cycle and unit records, shared across processes."""
+
+    def __init__(self, db_path: str = 'cycle_checkpoints.db', resume_window_seconds: float = 10800.0,
+                 retention_days: float = 7.0):
+        """
+        Args:
+            db_path: SQLite file shared by every process
+            resume_window_seconds: Unfinished cycles older than this are abandoned
+            retention_days: Cycles (and their units) older than this are deleted
+        """
+        self.db_path = db_path
+        self.resume_window_seconds = resume_window_seconds
+        self.retention_days = retention_days
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cycles (
+        cycle_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        finished_at REAL
+        )
+        ''')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cycle_units (
+        cycle_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        firm_name TEXT NOT NULL,
+        unit_key TEXT NOT NULL,
+        status TEXT NOT NULL,
+        payload TEXT,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (cycle_id, kind, firm_name, unit_key)
+        )
+        ''')
+
+    @classmethod
+    def from_env(cls) -> 'CycleCheckpointStore':
+        return cls(
+            db_path=os.environ.get('CYCLE_CHECKPOINT_DB', 'cycle_checkpoints.db'),
+            resume_window_seconds=float(os.environ.get('CYCLE_RESUME_WINDOW_SECONDS', '10800')),
+            retention_days=float(os.environ.get('CYCLE_CHECKPOINT_RETENTION_DAYS', '7'))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 30000')
+            self._local.conn = conn
+        return conn
+
+    def begin_cycle(self) -> Tuple[str, bool]:
+        """
+        Returns:
+            (cycle_id, resumed): the unfinished cycle to resume, or a new one
+        """
+        conn = self._connection()
+        now = time.time()
+        cutoff = now - self.retention_days * 86400
+        conn.execute('DELETE FROM cycle_units WHERE cycle_id IN (SELECT cycle_id FROM cycles WHERE started_at < ?)', (cutoff,))
+        conn.execute('DELETE FROM cycles WHERE started_at < ?', (cutoff,))
+
+        row = conn.execute('''
+        SELECT cycle_id FROM cycles WHERE status = 'running' AND started_at >= ?
+        ORDER BY started_at DESC LIMIT 1
+        ''', (now - self.resume_window_seconds,)).fetchone()
+        if row is not None:
+            return row[0], True
+
+        conn.execute("UPDATE cycles SET status = 'abandoned' WHERE status = 'running'")
+        cycle_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        conn.execute("INSERT INTO cycles (cycle_id, status, started_at) VALUES (?, 'running', ?)", (cycle_id, now))
+        return cycle_id, False
+
+    def finish_cycle(self, cycle_id: str, status: str = 'completed'):
+        self._connection().execute('UPDATE cycles SET status = ?, finished_at = ? WHERE cycle_id = ?',
+                                   (status, time.time(), cycle_id))
+
+    def _get(self, cycle_id: str, kind: str, firm_name: str, unit_key: str) -> Optional[Tuple[str, Optional[Dict]]]:
+        row = self._connection().execute('''
+        SELECT status, payload FROM cycle_units
+        WHERE cycle_id = ? AND kind = ? AND firm_name = ? AND unit_key = ?
+        ''', (cycle_id, kind, firm_name, unit_key)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] else None
+
+    def _put(self, cycle_id: str, kind: str, firm_name: str, unit_key: str, status: str, payload: Optional[Dict]):
+        self._connection().execute('''
+        INSERT INTO cycle_units (cycle_id, kind, firm_name, unit_key, status, payload, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(cycle_id, kind, firm_name, unit_key) DO UPDATE SET
+        status = excluded.status, payload = excluded.payload, updated_at = excluded.updated_at
+        ''', (cycle_id, kind, firm_name, unit_key, status,
+              json.dumps(payload, default=str) if payload is not None else None, time.time()))
+
+    def get_evaluation(self, cycle_id: str, firm_name: str, unit_key: str) -> Optional[Dict]:
+        unit = self._get(cycle_id, 'evaluation', firm_name, unit_key)
+        return unit[1] if unit else None
+
+    def save_evaluation(self, cycle_id: str, firm_name: str, unit_key: str, evaluation: Dict):
+        self._put(cycle_id, 'evaluation', firm_name, unit_key, 'done', evaluation)
+
+    def get_predictions(self, cycle_id: str, unit_key: str) -> Dict[str, Dict]:
+        """Stored fan-out predictions of an event: {firm_name: prediction}."""
+        rows = self._connection().execute('''
+        SELECT firm_name, payload FROM cycle_units WHERE cycle_id = ? AND kind = 'prediction' AND unit_key = ?
+        ''', (cycle_id, unit_key)).fetchall()
+        return {firm_name: json.loads(payload) for firm_name, payload in rows if payload}
+
+    def save_prediction(self, cycle_id: str, firm_name: str, unit_key: str, prediction: Dict):
+        self._put(cycle_id, 'prediction', firm_name, unit_key, 'done', prediction)
+
+    def get_execution(self, cycle_id: str, firm_name: str, unit_key: str) -> Optional[Dict]:
+        """{'status': 'pending'|'done', 'decision': dict or None}, or None if never started."""
+        unit = self._get(cycle_id, 'execution', firm_name, unit_key)
+        if unit is None:
+            return None
+        return {'status': unit[0], 'decision': unit[1]}
+
+    def mark_execution_pending(self, cycle_id: str, firm_name: str, unit_key: str):
+        self._put(cycle_id, 'execution', firm_name, unit_key, 'pending', None)
+
+    def save_execution(self, cycle_id: str, firm_name: str, unit_key: str, decision: Dict):
+        self._put(cycle_id, 'execution', firm_name, unit_key, 'done', decision)
+
+    def progress(self, cycle_id: str) -> Dict:
+        """Unit counts per kind and status, e.g. {'evaluation': {'done': 40}, 'execution': {...}}."""
+        rows = self._connection().execute('''
+        SELECT kind, status, COUNT(*) FROM cycle_units WHERE cycle_id = ? GROUP BY kind, status
+        ''', (cycle_id,)).fetchall()
+        progress: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in rows:
+            progress.setdefault(kind, {})[status] = count
+        return progress
+
+
+_store: Optional[CycleCheckpointStore] = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> Optional[CycleCheckpointStore]:
+    """Process-wide store, or None when CYCLE_CHECKPOINTS_ENABLED=false."""
+    global _store
+    if os.environ.get('CYCLE_CHECKPOINTS_ENABLED', 'true').lower() == 'false':
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = CycleCheckpointStore.from_env()
+        return _store
@@ -0,0 +1,337 @@
+"""
+Cycle Jobs
+==========
+SQLite-backed queue of daily cycles, run by a dedicated worker outside HTTP requests.
+
+/api/run-daily-cycle and /admin/trigger-cycle used to run the whole cycle inside the
+request. That is why the Gunicorn timeouts were raised to 900s, and a cron client that
+disconnected lost the response. The endpoints now submit a job and return its id at
+once. A CycleJobRunner claims queued jobs, runs engine.run_daily_cycle() and stores
+per-stage and per-firm progress. Clients poll /api/cycles/<job_id>.
+
+Only one cycle is active at a time: submitting while a job is queued or running returns
+that job. The runner heartbeats while a cycle runs. A job whose heartbeat is older than
+CYCLE_JOB_STALE_SECONDS (worker OOM-killed or restarted) is queued again. The
+checkpointed cycle (cycle_checkpoint.py) then resumes where it stopped.
+
+With CYCLE_JOB_RUNNER=external the API only enqueues, and a separate process works
+the queue:
+
+    python cycle_jobs.py
+
+In production, main.py defaults CYCLE_JOB_RUNNER to external and starts that worker
+next to Gunicorn, so no cycle holds an API worker or its memory. The worker has to
+share the API's disk (cycle_jobs.db), which is why it runs in the same service and not
+as a separate Railway service. Elsewhere (python api.py, tests) the default is a
+daemon runner thread inside the API process (CYCLE_JOB_RUNNER=thread).
+
+Configuration:
+    CYCLE_JOBS_DB               SQLite file path (default: cycle_jobs.db)
+    CYCLE_JOB_RUNNER            "thread" or "external" (default: external under main.py in production,
+                                thread otherwise)
+    CYCLE_JOB_POLL_SECONDS      Seconds between queue polls (default: 5)
+    CYCLE_JOB_STALE_SECONDS     Heartbeat age after which a running job is requeued (default: 600)
+    CYCLE_JOB_MAX_ATTEMPTS      Runs per job before it is marked failed (default: 3)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+from logger import autonomous_logger as logger
+
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class CycleJobStore:
+    """Cycle jobs with status, progress and result, shared across processes via SQLite."""
+
+    def __init__(self, db_path: str = 'cycle_jobs.db', stale_seconds: float = 600.0, max_attempts: int = 3):
+        """
+        Args:
+            db_path: SQLite file shared by the API workers and the runner
+            stale_seconds: Heartbeat age after which a running job is considered dead
+            max_attempts: Runs per job before it is marked failed
+        """
+        self.db_path = db_path
+        self.stale_seconds = stale_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+
+        self._connection().execute('''
+        CREATE TABLE IF NOT EXISTS cycle_jobs (
+        job_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        source TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        submitted_at REAL NOT NULL,
+        started_at REAL,
+        heartbeat_at REAL,
+        finished_at REAL,
+        worker TEXT,
+        progress TEXT,
+        result TEXT,
+        error TEXT
+        )
+        ''')
+
+    @classmethod
+    def from_env(cls) -> 'CycleJobStore':
+        return cls(
+            db_path=os.environ.get('CYCLE_JOBS_DB', 'cycle_jobs.db'),
+            stale_seconds=float(os.environ.get('CYCLE_JOB_STALE_SECONDS', '600')),
+            max_attempts=int(os.environ.get('CYCLE_JOB_MAX_ATTEMPTS', '3'))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 30000')
+            self._local.conn = conn
+        return conn
+
+    def submit(self, source: str) -> Tuple[str, bool]:
+        """
+        Queue a cycle unless one is already queued or running.
+
+        Returns:
+            (job_id, created): the new job, or the active one with created=False
+        """
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                "SELECT job_id FROM cycle_jobs WHERE status IN ('queued', 'running') ORDER BY submitted_at LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                conn.execute('COMMIT')
+                return row[0], False
+            job_id = uuid.uuid4().hex
+            conn.execute("INSERT INTO cycle_jobs (job_id, status, source, submitted_at) VALUES (?, 'queued', ?, ?)",
+                         (job_id, source, time.time()))
+            conn.execute('COMMIT')
+            return job_id, True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def claim_next(self, worker: str) -> Optional[str]:
+        """Atomically move the oldest queued job to running; returns its id or None."""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute("SELECT job_id FROM cycle_jobs WHERE status = 'queued' ORDER BY submitted_at LIMIT 1").fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+            now = time.time()
+            conn.execute('''
+            UPDATE cycle_jobs SET status = 'running', attempts = attempts + 1, started_at = ?, heartbeat_at = ?, worker = ?
+            WHERE job_id = ?
+            ''', (now, now, worker, row[0]))
+            conn.execute('COMMIT')
+            return row[0]
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def heartbeat(self, job_id: str, progress: Optional[Dict] = None):
+        if progress is None:
+            self._connection().execute('UPDATE cycle_jobs SET heartbeat_at = ? WHERE job_id = ?', (time.time(), job_id))
+        else:
+            self._connection().execute('UPDATE cycle_jobs SET heartbeat_at = ?, progress = ? WHERE job_id = ?',
+                                       (time.time(), json.dumps(progress, default=str), job_id))
+
+    def release(self, job_id: str):
+        """Put a claimed job back in the queue without counting the attempt."""
+        self._connection().execute(
+            "UPDATE cycle_jobs SET status = 'queued', attempts = attempts - 1, worker = NULL WHERE job_id = ?", (job_id,))
+
+    def finish(self, job_id: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        status = 'succeeded' if error is None and result and result.get('success') else 'failed'
+        self._connection().execute('''
+        UPDATE cycle_jobs SET status = ?, finished_at = ?, result = ?, error = ? WHERE job_id = ?
+        ''', (status, time.time(), json.dumps(result, default=str) if result is not None else None,
+              error or (result or {}).get('critical_error'), job_id))
+
+    def recover_stale(self) -> int:
+        """Requeue running jobs whose runner stopped heartbeating (failed after max_attempts)."""
+        conn = self._connection()
+        cutoff = time.time() - self.stale_seconds
+        failed = conn.execute('''
+        UPDATE cycle_jobs SET status = 'failed', finished_at = ?, error = 'Runner stopped responding'
+        WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?
+        ''', (time.time(), cutoff, self.max_attempts)).rowcount
+        requeued = conn.execute('''
+        UPDATE cycle_jobs SET status = 'queued', worker = NULL WHERE status = 'running' AND heartbeat_at < ?
+        ''', (cutoff,)).rowcount
+        if failed or requeued:
+            logger.warning(f"Stale cycle jobs: {requeued} requeued, {failed} failed", prefix="JOBS")
+        return requeued
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self._connection().execute('''
+        SELECT job_id, status, source, attempts, submitted_at, started_at, heartbeat_at, finished_at,
+        worker, progress, result, error FROM cycle_jobs WHERE job_id = ?
+        ''', (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'job_id': row[0],
+            'status': row[1],
+            'source': row[2],
+            'attempts': row[3],
+            'submitted_at': row[4],
+            'started_at': row[5],
+            'heartbeat_at': row[6],
+            'finished_at': row[7],
+            'worker': row[8],
+            'progress': json.loads(row[9]) if row[9] else None,
+            'result': json.loads(row[10]) if row[10] else None,
+            'error': row[11],
+        }
+
+
+class CycleJobRunner:
+    """Claims queued cycle jobs and runs them on a background thread."""
+
+    def __init__(self, store: CycleJobStore, cycle_lease: Callable, poll_seconds: float = 5.0,
+                 heartbeat_seconds: float = 30.0):
+        """
+        Args:
+            store: Job queue
+            cycle_lease: Context manager factory yielding the engine, or None while a cycle
+                         is already running (EngineRegistry.cycle_lease)
+            poll_seconds: Seconds between queue polls
+            heartbeat_seconds: Seconds between heartbeats while a cycle runs
+        """
+        self.store = store
+        self.cycle_lease = cycle_lease
+        self.poll_seconds = poll_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'CycleJobRunner':
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._loop, name='cycle-job-runner', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wake(self):
+        """Poll now (called right after a submission)."""
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error(f"Cycle job runner error: {e}", prefix="JOBS")
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+
+    def run_pending(self) -> int:
+        """Run queued jobs until the queue is empty; returns how many ran."""
+        ran = 0
+        self.store.recover_stale()
+        while not self._stop.is_set():
+            job_id = self.store.claim_next(self.worker)
+            if job_id is None:
+                return ran
+            if not self._run_job(job_id):
+                return ran
+            ran += 1
+        return ran
+
+    def _run_job(self, job_id: str) -> bool:
+        """Run one claimed job; False when the engine was busy and the job went back to the queue."""
+        with self.cycle_lease() as engine:
+            if engine is None:
+                self.store.release(job_id)
+                return False
+
+            logger.info(f"Cycle job {job_id} started", prefix="JOBS")
+            done = threading.Event()
+
+            def beat():
+                while not done.wait(self.heartbeat_seconds):
+                    self.store.heartbeat(job_id)
+
+            heart = threading.Thread(target=beat, name='cycle-job-heartbeat', daemon=True)
+            heart.start()
+            try:
+                results = engine.run_daily_cycle(progress_callback=lambda progress: self.store.heartbeat(job_id, progress))
+                self.store.finish(job_id, result=results)
+                logger.info(f"Cycle job {job_id} finished (success={results.get('success')})", prefix="JOBS")
+            except Exception as e:
+                logger.error(f"Cycle job {job_id} failed: {e}", prefix="JOBS")
+                self.store.finish(job_id, error=str(e))
+            finally:
+                done.set()
+                heart.join()
+            return True
+
+
+_store: Optional[CycleJobStore] = None
+_runner: Optional[CycleJobRunner] = None
+_jobs_lock = threading.Lock()
+
+
+def get_job_store() -> CycleJobStore:
+    global _store
+    with _jobs_lock:
+        if _store is None:
+            _store = CycleJobStore.from_env()
+        return _store
+
+
+def get_job_runner(cycle_lease: Callable) -> Optional[CycleJobRunner]:
+    """This process's runner thread (started on first use), or None with CYCLE_JOB_RUNNER=external."""
+    global _runner
+    if os.environ.get('CYCLE_JOB_RUNNER', 'thread').lower() == 'external':
+        return None
+    store = get_job_store()
+    with _jobs_lock:
+        if _runner is None:
+            _runner = CycleJobRunner(store, cycle_lease, poll_seconds=float(os.environ.get('CYCLE_JOB_POLL_SECONDS', '5')))
+        return _runner.start()
+
+
+def main():
+    """Dedicated worker process: work the queue until interrupted."""
+    from database import TradingDatabase
+    from engine_registry import get_engine_registry
+
+    registry = get_engine_registry(TradingDatabase())
+    runner = CycleJobRunner(get_job_store(), registry.cycle_lease,
+                            poll_seconds=float(os.environ.get('CYCLE_JOB_POLL_SECONDS', '5')))
+    logger.info(f"Cycle job worker {runner.worker} polling {runner.store.db_path}", prefix="JOBS")
+    try:
+        runner.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        runner.stop(timeout=5)
+
+
+if __name__ == '__main__':
+    main()
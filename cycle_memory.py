@@ -0,0 +1,297 @@
+"""
+Cycle Memory Profiling
+======================
+Optional RSS and tracemalloc sampling per phase of the daily cycle.
+
+Railway OOM-kills during daily cycles could only be narrowed down through gc.collect()
+and the [1/5] progress logs. When profiling is on, each phase records its start, end and
+peak memory:
+
+    fetch_events        market download (overlaps the first firm when streaming)
+    evaluate:<firm>     candidate evaluation (LLM calls, collectors)
+    execute:<firm>      bet execution
+    reconciliation
+    order_monitoring
+
+Each finished phase is logged right away, so the log shows which phase was growing even
+if the cycle is killed. finish_cycle() returns the summary that the engine stores on the
+autonomous_cycles row. The summary includes the allocation sites that grew the most
+during the cycle (tracemalloc snapshot diff).
+
+A background sampler reads RSS (and traced memory) every MEMORY_PROFILING_SAMPLE_SECONDS.
+Each phase's peak is the highest sample taken while the phase was active. tracemalloc's
+exact peak is also used when no other phase overlapped. With ENGINE_PARALLEL_FIRMS,
+firm phases overlap and share process-wide peaks (marked 'overlapped').
+
+tracemalloc slows allocation-heavy code and costs memory itself. It is started for the
+cycle only, and MEMORY_PROFILING_TRACEMALLOC=false keeps RSS sampling alone.
+
+Configuration:
+    MEMORY_PROFILING_ENABLED         "true" to profile each cycle (default: false)
+    MEMORY_PROFILING_TRACEMALLOC     "false" to sample RSS only (default: true)
+    MEMORY_PROFILING_TOP_N           Allocation sites stored per cycle (default: 10)
+    MEMORY_PROFILING_SAMPLE_SECONDS  Seconds between RSS samples (default: 0.5)
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from firm_concurrency import current_rss_mb
+from logger import autonomous_logger as logger
+
+
+_MB = 1024 * 1024
+
+
+def _traced_mb() -> Optional[float]:
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[0] / _MB
+
+
+class CycleMemoryProfiler:
+    """Per-phase memory records of one cycle at a time; a no-op when disabled."""
+
+    def __init__(self, enabled: bool = False, trace_allocations: bool = True, top_n: int = 10,
+                 sample_seconds: float = 0.5):
+        """
+        Args:
+            enabled: Profile cycles (False = every method is a no-op)
+            trace_allocations: Run tracemalloc during the cycle (False = RSS only)
+            top_n: Allocation sites kept in the summary
+            sample_seconds: Seconds between background RSS samples
+        """
+        self.enabled = enabled
+        self.trace_allocations = trace_allocations
+        self.top_n = top_n
+        self.sample_seconds = sample_seconds
+        self._lock = threading.Lock()
+        self._active: List[Dict] = []
+        self._phases: List[Dict] = []
+        self._cycle: Optional[Dict] = None
+        self._start_snapshot = None
+        self._started_tracing = False
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampler = threading.Event()
+
+    @classmethod
+    def from_env(cls) -> 'CycleMemoryProfiler':
+        return cls(
+            enabled=os.environ.get('MEMORY_PROFILING_ENABLED', 'false').lower() == 'true',
+            trace_allocations=os.environ.get('MEMORY_PROFILING_TRACEMALLOC', 'true').lower() != 'false',
+            top_n=int(os.environ.get('MEMORY_PROFILING_TOP_N', '10')),
+            sample_seconds=float(os.environ.get('MEMORY_PROFILING_SAMPLE_SECONDS', '0.5'))
+        )
+
+    def start_cycle(self):
+        if not self.enabled:
+            return
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        rss = current_rss_mb()
+        traced = _traced_mb()
+        with self._lock:
+            self._active = []
+            self._phases = []
+            self._cycle = {'started': time.time(), 'rss_start_mb': rss, 'rss_peak_mb': rss, 'traced_peak_mb': traced}
+        self._start_snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+
+        self._stop_sampler.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name='memory-sampler', daemon=True)
+        self._sampler.start()
+
+    def _sample_loop(self):
+        while not self._stop_sampler.wait(self.sample_seconds):
+            self._sample()
+
+    def _sample(self):
+        rss = current_rss_mb()
+        traced = _traced_mb()
+        with self._lock:
+            for record in ([self._cycle] if self._cycle else []) + self._active:
+                record['rss_peak_mb'] = max(record['rss_peak_mb'], rss)
+                if traced is not None and record.get('traced_peak_mb') is not None:
+                    record['traced_peak_mb'] = max(record['traced_peak_mb'], traced)
+
+    def begin(self, name: str) -> Optional[Dict]:
+        """Open a phase; pass the returned token to end()."""
+        if not self.enabled or self._cycle is None:
+            return None
+        rss = current_rss_mb()
+        traced = _traced_mb()
+        with self._lock:
+            exclusive = not self._active
+            for other in self._active:
+                other['overlapped'] = True
+            if exclusive and traced is not None:
+                tracemalloc.reset_peak()
+            token = {
+                'phase': name,
+                'started': time.time(),
+                'rss_start_mb': rss,
+                'rss_peak_mb': rss,
+                'traced_start_mb': traced,
+                'traced_peak_mb': traced,
+                'overlapped': not exclusive,
+            }
+            self._active.append(token)
+        return token
+
+    def end(self, token: Optional[Dict], interrupted: bool = False):
+        if token is None:
+            return
+        rss = current_rss_mb()
+        traced = _traced_mb()
+        with self._lock:
+            if token not in self._active:
+                return
+            self._active.remove(token)
+            peak_rss = max(token['rss_peak_mb'], rss)
+            record = {
+                'phase': token['phase'],
+                'seconds': round(time.time() - token['started'], 2),
+                'rss_start_mb': round(token['rss_start_mb'], 1),
+                'rss_end_mb': round(rss, 1),
+                'rss_peak_mb': round(peak_rss, 1),
+                'rss_retained_mb': round(rss - token['rss_start_mb'], 1),
+                'overlapped': token['overlapped'],
+            }
+            if traced is not None and token['traced_start_mb'] is not None:
+                peak_traced = max(token['traced_peak_mb'], traced)
+                if not token['overlapped']:
+                    peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1] / _MB)
+                record['traced_peak_mb'] = round(peak_traced, 1)
+                record['traced_retained_mb'] = round(traced - token['traced_start_mb'], 1)
+            if interrupted:
+                record['interrupted'] = True
+            self._phases.append(record)
+            if self._cycle is not None:
+                self._cycle['rss_peak_mb'] = max(self._cycle['rss_peak_mb'], peak_rss)
+
+        logger.info(f"{record['phase']}: RSS {record['rss_start_mb']:.0f} -> {record['rss_end_mb']:.0f}MB "
+                    f"(peak {record['rss_peak_mb']:.0f}MB) in {record['seconds']}s", prefix="MEMORY")
+
+    @contextmanager
+    def phase(self, name: str):
+        token = self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(token)
+
+    def finish_cycle(self) -> Optional[Dict]:
+        """
+        Close the cycle and stop tracing.
+
+        Returns:
+            rss_start/end/peak, traced_peak, phases in completion order (phases still open are
+            closed as interrupted) and top_allocations, or None when disabled or not started
+        """
+        if not self.enabled or self._cycle is None:
+            return None
+        self._stop_sampler.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self._sample()
+        for token in list(self._active):
+            self.end(token, interrupted=True)
+
+        top_allocations = self._top_allocations()
+        self._start_snapshot = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        with self._lock:
+            cycle, self._cycle = self._cycle, None
+            phases, self._phases = self._phases, []
+        rss_end = current_rss_mb()
+        summary = {
+            'rss_start_mb': round(cycle['rss_start_mb'], 1),
+            'rss_end_mb': round(rss_end, 1),
+            'rss_peak_mb': round(max(cycle['rss_peak_mb'], rss_end), 1),
+            'rss_retained_mb': round(rss_end - cycle['rss_start_mb'], 1),
+            'traced_peak_mb': round(cycle['traced_peak_mb'], 1) if cycle['traced_peak_mb'] is not None else None,
+            'seconds': round(time.time() - cycle['started'], 2),
+            'phases': phases,
+            'top_allocations': top_allocations,
+        }
+        logger.info(f"Cycle RSS {summary['rss_start_mb']:.0f} -> {summary['rss_end_mb']:.0f}MB "
+                    f"(peak {summary['rss_peak_mb']:.0f}MB)", prefix="MEMORY")
+        return summary
+
+    def _top_allocations(self) -> List[Dict]:
+        """Allocation sites that grew the most since start_cycle (memory still held at the end)."""
+        if self._start_snapshot is None or not tracemalloc.is_tracing():
+            return []
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ]
+        snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        stats = snapshot.compare_to(self._start_snapshot.filter_traces(filters), 'lineno')
+        # compare_to orders by absolute change: keep growth only
+        stats.sort(key=lambda stat: stat.size_diff, reverse=True)
+        cwd = os.getcwd() + os.sep
+        sites = []
+        for stat in stats[:self.top_n]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            sites.append({
+                'site': f"{frame.filename.replace(cwd, '')}:{frame.lineno}",
+                'size_kb': round(stat.size / 1024, 1),
+                'size_diff_kb': round(stat.size_diff / 1024, 1),
+                'count_diff': stat.count_diff,
+            })
+        return sites
+
+
+def summarize_trend(cycles: List[Dict]) -> Dict:
+    """
+    Memory trend across saved cycles (TradingDatabase.get_cycle_memory_profiles).
+
+    Args:
+        cycles: {'id', 'cycle_timestamp', 'memory_profile'} rows, newest first
+
+    Returns:
+        Per-cycle summary (oldest first) with the phase that peaked highest, plus the
+        change in starting and peak RSS between the oldest and newest cycle. A rising
+        starting RSS means the long-lived worker keeps memory between cycles.
+    """
+    summaries = []
+    for cycle in reversed(cycles):
+        profile = cycle['memory_profile']
+        phases = profile.get('phases', [])
+        peak_phase = max(phases, key=lambda phase: phase['rss_peak_mb'], default=None)
+        summaries.append({
+            'id': cycle['id'],
+            'cycle_timestamp': cycle['cycle_timestamp'],
+            'rss_start_mb': profile.get('rss_start_mb'),
+            'rss_peak_mb': profile.get('rss_peak_mb'),
+            'rss_end_mb': profile.get('rss_end_mb'),
+            'traced_peak_mb': profile.get('traced_peak_mb'),
+            'peak_phase': peak_phase['phase'] if peak_phase else None,
+            'phase_peaks_mb': {phase['phase']: phase['rss_peak_mb'] for phase in phases},
+        })
+
+    trend = {'cycles': len(summaries)}
+    if summaries:
+        first, last = summaries[0], summaries[-1]
+        trend.update({
+            'max_rss_peak_mb': max(summary['rss_peak_mb'] for summary in summaries),
+            'rss_start_change_mb': round(last['rss_start_mb'] - first['rss_start_mb'], 1),
+            'rss_peak_change_mb': round(last['rss_peak_mb'] - first['rss_peak_mb'], 1),
+        })
+    return {
+        'trend': trend,
+        'cycles': summaries,
+        'latest_top_allocations': cycles[0]['memory_profile'].get('top_allocations', []) if cycles else [],
+    }
@@ -0,0 +1,247 @@
+"""
+Data Cache
+==========
+Two-level (memory LRU + SQLite) cache for collector data that outlives a cycle.
+
+Technical indicators (Alpha Vantage), news and volatility (yfinance) used to be kept
+in a dict cleared at the start of every cycle, so each cycle paid the provider calls
+again. Entries here are fresh while younger than their source's TTL. When a refresh
+fails (rate limit, invalid key, network), get_stale() still serves the last good value
+up to DATA_CACHE_MAX_STALE_SECONDS old.
+
+    memory   OrderedDict LRU bounded by DATA_CACHE_MAX_ENTRIES
+    disk     SQLite table shared by every process, pruned to the same bound by last
+             access, so both levels keep the most recently used entries
+
+Configuration:
+    DATA_CACHE_ENABLED             "false" to keep the cache in memory only
+    DATA_CACHE_DB                  SQLite file path (default: data_cache.db)
+    DATA_CACHE_TTL_TECHNICAL       Seconds technical indicators stay fresh (default: 14400)
+    DATA_CACHE_TTL_NEWS            Seconds news analysis stays fresh (default: 3600)
+    DATA_CACHE_TTL_VOLATILITY      Seconds volatility metrics stay fresh (default: 3600)
+    DATA_CACHE_MAX_ENTRIES         Max entries per level (default: 512)
+    DATA_CACHE_MAX_STALE_SECONDS   Oldest entry served on provider errors (default: 604800)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from logger import autonomous_logger as logger
+
+
+DEFAULT_TTLS = {
+    'technical': 14400.0,
+    'news': 3600.0,
+    'volatility': 3600.0,
+}
+
+
+def _json_default(value):
+    # numpy scalars from yfinance/pandas
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class DataCache:
+    """Per-source TTL cache with LRU eviction in memory and an optional SQLite level."""
+
+    def __init__(self, db_path: Optional[str] = 'data_cache.db', ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = 512, max_stale_seconds: float = 604800.0):
+        """
+        Args:
+            db_path: SQLite file for the disk level, None for memory only
+            ttls: Seconds each source stays fresh (missing sources use DEFAULT_TTLS, else 3600)
+            max_entries: Max entries kept in memory and on disk
+            max_stale_seconds: Max age served by get_stale()
+        """
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max(1, max_entries)
+        self.max_stale_seconds = max_stale_seconds
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[Tuple[str, str], Tuple[float, Any]]' = OrderedDict()
+        self._local = threading.local()
+        self._stats: Dict[str, Dict] = {}
+        self._evictions = 0
+
+        if self.db_path:
+            conn = self._connection()
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS data_cache (
+            source TEXT NOT NULL,
+            key TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            value TEXT NOT NULL,
+            accessed_at REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (source, key)
+            )
+            ''')
+            # Tables created before LRU eviction on disk
+            columns = [row[1] for row in conn.execute('PRAGMA table_info(data_cache)')]
+            if 'accessed_at' not in columns:
+                conn.execute('ALTER TABLE data_cache ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0')
+
+    @classmethod
+    def from_env(cls) -> 'DataCache':
+        enabled = os.environ.get('DATA_CACHE_ENABLED', 'true').lower() != 'false'
+        return cls(
+            db_path=os.environ.get('DATA_CACHE_DB', 'data_cache.db') if enabled else None,
+            ttls={source: float(os.environ.get(f'DATA_CACHE_TTL_{source.upper()}', ttl))
+                  for source, ttl in DEFAULT_TTLS.items()},
+            max_entries=int(os.environ.get('DATA_CACHE_MAX_ENTRIES', '512')),
+            max_stale_seconds=float(os.environ.get('DATA_CACHE_MAX_STALE_SECONDS', '604800'))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 30000')
+            self._local.conn = conn
+        return conn
+
+    def _source_stats(self, source: str) -> Dict:
+        return self._stats.setdefault(source, {'hits': 0, 'misses': 0, 'stale_hits': 0, 'disk_hits': 0,
+                                               'hit_age_total': 0.0, 'max_hit_age': 0.0})
+
+    def _remember(self, entry_key: Tuple[str, str], stored_at: float, value: Any):
+        # Caller holds self._lock
+        self._memory[entry_key] = (stored_at, value)
+        self._memory.move_to_end(entry_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    def _touch(self, source: str, key: str):
+        """Record an access on disk, so the disk level evicts in the same LRU order as memory."""
+        try:
+            self._connection().execute(
+                'UPDATE data_cache SET accessed_at = ? WHERE source = ? AND key = ?', (time.time(), source, key)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Data cache access update failed for {source}/{key}: {e}", prefix="CACHE")
+
+    def _lookup(self, source: str, key: str) -> Optional[Tuple[float, Any]]:
+        """(stored_at, value) from memory, else from disk (promoted to memory)."""
+        entry_key = (source, key)
+        with self._lock:
+            entry = self._memory.get(entry_key)
+            if entry is not None:
+                self._memory.move_to_end(entry_key)
+        if entry is not None:
+            if self.db_path:
+                self._touch(source, key)
+            return entry
+        if not self.db_path:
+            return None
+        try:
+            row = self._connection().execute(
+                'SELECT stored_at, value FROM data_cache WHERE source = ? AND key = ?', (source, key)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Data cache read failed for {source}/{key}: {e}", prefix="CACHE")
+            return None
+        if row is None:
+            return None
+        entry = (row[0], json.loads(row[1]))
+        self._touch(source, key)
+        with self._lock:
+            self._remember(entry_key, *entry)
+            self._source_stats(source)['disk_hits'] += 1
+        return entry
+
+    def get(self, source: str, key: str) -> Optional[Any]:
+        """Value if stored within the source's TTL, else None (counted as a miss)."""
+        entry = self._lookup(source, key)
+        now = time.time()
+        with self._lock:
+            stats = self._source_stats(source)
+            if entry is None or now - entry[0] >= self.ttls.get(source, 3600.0):
+                stats['misses'] += 1
+                return None
+            age = now - entry[0]
+            stats['hits'] += 1
+            stats['hit_age_total'] += age
+            stats['max_hit_age'] = max(stats['max_hit_age'], age)
+            return entry[1]
+
+    def get_stale(self, source: str, key: str) -> Optional[Tuple[Any, float]]:
+        """(value, age_seconds) of the last stored value up to max_stale_seconds old, for provider errors."""
+        entry = self._lookup(source, key)
+        if entry is None:
+            return None
+        age = time.time() - entry[0]
+        if age > self.max_stale_seconds:
+            return None
+        with self._lock:
+            self._source_stats(source)['stale_hits'] += 1
+        return entry[1], age
+
+    def put(self, source: str, key: str, value: Any):
+        stored_at = time.time()
+        with self._lock:
+            self._remember((source, key), stored_at, value)
+        if not self.db_path:
+            return
+        try:
+            conn = self._connection()
+            conn.execute('''
+            INSERT INTO data_cache (source, key, stored_at, value, accessed_at) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(source, key) DO UPDATE SET stored_at = excluded.stored_at, value = excluded.value,
+            accessed_at = excluded.accessed_at
+            ''', (source, key, stored_at, json.dumps(value, default=_json_default), stored_at))
+            # Keep the disk level bounded: drop entries too old to serve, then the least recently used beyond the limit
+            conn.execute('DELETE FROM data_cache WHERE stored_at < ?', (stored_at - self.max_stale_seconds,))
+            conn.execute('''
+            DELETE FROM data_cache WHERE rowid IN (
+            SELECT rowid FROM data_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            ''', (self.max_entries,))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Data cache write failed for {source}/{key}: {e}", prefix="CACHE")
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+            self._evictions = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss/stale counts and average/max age of fresh hits per source."""
+        with self._lock:
+            sources = {}
+            for source, stats in self._stats.items():
+                sources[source] = {
+                    'hits': stats['hits'],
+                    'misses': stats['misses'],
+                    'stale_hits': stats['stale_hits'],
+                    'disk_hits': stats['disk_hits'],
+                    'avg_hit_age_seconds': round(stats['hit_age_total'] / stats['hits'], 1) if stats['hits'] else None,
+                    'max_hit_age_seconds': round(stats['max_hit_age'], 1),
+                    'ttl_seconds': self.ttls.get(source, 3600.0),
+                }
+            return {
+                'sources': sources,
+                'memory_entries': len(self._memory),
+                'evictions': self._evictions,
+                'persistent': bool(self.db_path),
+            }
+
+
+_cache: Optional[DataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_data_cache() -> DataCache:
+    """Process-wide collector data cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DataCache.from_env()
+        return _cache
@@ -1,5 +1,5 @@
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 import threading
@@ -193,7 +193,8 @@ class TradingDatabase:
             total_bets_skipped INTEGER DEFAULT 0,
             simulation_mode INTEGER DEFAULT 1,
             execution_summary TEXT,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL,
+            memory_profile TEXT
             )
             ''')
         
@@ -240,6 +241,20 @@ class TradingDatabase:
             )
             ''')
             
+            # Catálogo de mercados: detalles estáticos por market_id para no re-descargarlos cada ciclo
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS market_catalog (
+            market_id INTEGER PRIMARY KEY,
+            status TEXT NOT NULL,
+            topic_type TEXT,
+            title TEXT,
+            category TEXT,
+            entry_json TEXT NOT NULL,
+            first_seen_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+            )
+            ''')
+            
             self._migrate_schema(cursor)
             
     def _migrate_schema(self, cursor):
@@ -290,6 +305,13 @@ class TradingDatabase:
             cursor.execute('ALTER TABLE virtual_portfolio ADD COLUMN total_bets INTEGER DEFAULT 0')
             cursor.execute('ALTER TABLE virtual_portfolio ADD COLUMN winning_bets INTEGER DEFAULT 0')
             print("Database migrated: Added risk tier tracking columns to virtual_portfolio table")
+        
+        cursor.execute("PRAGMA table_info(autonomous_cycles)")
+        cycle_columns = [row[1] for row in cursor.fetchall()]
+        
+        if 'memory_profile' not in cycle_columns:
+            cursor.execute('ALTER TABLE autonomous_cycles ADD COLUMN memory_profile TEXT')
+            print("Database migrated: Added memory_profile column to autonomous_cycles table")
     
     def initialize_firm_portfolio(self, firm_name: str, initial_balance: float = 10000.0):
         with self.get_connection() as conn:
@@ -643,6 +665,36 @@ class TradingDatabase:
             cycle_id = cursor.lastrowid
             return cycle_id
     
+    def save_cycle_memory_profile(self, cycle_id: int, memory_profile: Dict):
+        """
+        Adjunta el perfil de memoria (cycle_memory.py) a un ciclo ya guardado.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+            UPDATE autonomous_cycles SET memory_profile = ? WHERE id = ?
+            ''', (json.dumps(memory_profile), cycle_id))
+    
+    def get_cycle_memory_profiles(self, limit: int = 30) -> List[Dict]:
+        """
+        Obtiene los perfiles de memoria de los ciclos más recientes que tienen uno.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+            SELECT id, cycle_timestamp, memory_profile FROM autonomous_cycles
+            WHERE memory_profile IS NOT NULL
+            ORDER BY created_at DESC
+            LIMIT ?
+            ''', (limit,))
+            
+            return [
+                {'id': row[0], 'cycle_timestamp': row[1], 'memory_profile': json.loads(row[2])}
+                for row in cursor.fetchall()
+            ]
+    
     def save_strategy_adaptation(self, adaptation_data: Dict) -> int:
         """
         Guarda una adaptación de estrategia.
@@ -1176,3 +1228,117 @@ class TradingDatabase:
             new_total = cursor.fetchone()[0]
             
             return new_total
+    
+    def get_last_decision_times(self, since_days: int = 14) -> Dict[str, float]:
+        """
+        Última decisión de cualquier IA por evento (para el scheduler de eventos).
+        
+        Args:
+            since_days: Solo decisiones de los últimos N días
+            
+        Returns:
+            Diccionario {event_description: epoch seconds}
+        """
+        since = (datetime.now() - timedelta(days=since_days)).isoformat()
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+            SELECT event_description, MAX(created_at) FROM autonomous_bets
+            WHERE created_at >= ?
+            GROUP BY event_description
+            ''', (since,))
+            
+            rows = cursor.fetchall()
+        
+        last_decisions = {}
+        for description, created_at in rows:
+            try:
+                last_decisions[description] = datetime.fromisoformat(created_at).timestamp()
+            except (TypeError, ValueError):
+                continue
+        return last_decisions
+    
+    def save_market_catalog_entries(self, entries: List[Dict]) -> int:
+        """
+        Inserta o actualiza entradas del catálogo de mercados (una por market_id).
+        
+        Args:
+            entries: Entradas construidas por OpinionTradeAPI (market_id, status, topic_type, title, category, ...)
+            
+        Returns:
+            Número de entradas guardadas
+        """
+        if not entries:
+            return 0
+        
+        now = datetime.now().isoformat()
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            for entry in entries:
+                cursor.execute('''
+                INSERT INTO market_catalog (
+                    market_id, status, topic_type, title, category, entry_json, first_seen_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(market_id) DO UPDATE SET
+                    status = excluded.status,
+                    topic_type = excluded.topic_type,
+                    title = excluded.title,
+                    category = excluded.category,
+                    entry_json = excluded.entry_json,
+                    updated_at = excluded.updated_at
+                ''', (
+                    int(entry['market_id']),
+                    entry['status'],
+                    entry.get('topic_type'),
+                    entry.get('title'),
+                    entry.get('category'),
+                    json.dumps(entry),
+                    now,
+                    now
+                ))
+        
+        return len(entries)
+    
+    def get_market_catalog_entries(self, market_ids: Optional[List[int]] = None) -> Dict[int, Dict]:
+        """
+        Obtiene entradas del catálogo de mercados indexadas por market_id.
+        
+        Args:
+            market_ids: IDs a consultar. Si None, devuelve todo el catálogo.
+            
+        Returns:
+            Diccionario {market_id: entry}
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            if market_ids is None:
+                cursor.execute('SELECT market_id, entry_json FROM market_catalog')
+                rows = cursor.fetchall()
+            else:
+                ids = [int(market_id) for market_id in market_ids]
+                rows = []
+                # SQLite limita el número de parámetros por consulta
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f'SELECT market_id, entry_json FROM market_catalog WHERE market_id IN ({placeholders})', chunk)
+                    rows.extend(cursor.fetchall())
+        
+        return {row[0]: json.loads(row[1]) for row in rows}
+    
+    def get_market_catalog_entry(self, market_id: int) -> Optional[Dict]:
+        """
+        Obtiene la entrada del catálogo para un mercado, o None si no está catalogado.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT entry_json FROM market_catalog WHERE market_id = ?', (int(market_id),))
+            row = cursor.fetchone()
+        
+        return json.loads(row[0]) if row else None
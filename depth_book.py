@@ -0,0 +1,112 @@
+"""
+Depth Book
+==========
+Array-backed orderbook for depth-aware fill estimates.
+
+get_orderbook() returns bids and asks as lists of {'price', 'amount'} dicts
+(amount in outcome shares). DepthBook sorts each side best-first into NumPy
+price/size vectors with cumulative shares and cumulative notional (USDT), so
+the expected fill for any order size is a single np.searchsorted, O(log n):
+
+    book = DepthBook.from_orderbook(orderbook_response['orderbook'])
+    fill = book.estimate_fill(25.0, side='BUY')   # spend 25 USDT on asks
+    fill['vwap'], fill['worst_price'], fill['slippage']
+
+Build the book once per snapshot and query it for as many sizes as needed.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+class BookSide:
+    """One side of the book, best level first, with cumulative depth."""
+
+    def __init__(self, prices: np.ndarray, sizes: np.ndarray):
+        self.prices = prices
+        self.sizes = sizes
+        self.cum_shares = np.cumsum(sizes)
+        self.cum_notional = np.cumsum(prices * sizes)
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Dict], descending: bool) -> 'BookSide':
+        rows = [(float(level.get('price', 0) or 0), float(level.get('amount', 0) or 0))
+                for level in levels or [] if level]
+        rows = [(price, size) for price, size in rows if price > 0 and size > 0]
+        if not rows:
+            return cls(np.empty(0), np.empty(0))
+        data = np.array(rows, dtype=float)
+        order = np.argsort(-data[:, 0] if descending else data[:, 0], kind='stable')
+        return cls(data[order, 0], data[order, 1])
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def best_price(self) -> Optional[float]:
+        return float(self.prices[0]) if len(self.prices) else None
+
+    @property
+    def total_notional(self) -> float:
+        return float(self.cum_notional[-1]) if len(self.prices) else 0.0
+
+    def fill(self, usdt_amount: float) -> Optional[Dict]:
+        """
+        Walk the side for an order worth usdt_amount (None if the side is empty).
+        If the side is too thin, the result is a partial fill of the whole side.
+        """
+        if not len(self.prices) or usdt_amount <= 0:
+            return None
+
+        filled_usdt = min(usdt_amount, self.total_notional)
+        # First level whose cumulative notional covers the order
+        level = int(np.searchsorted(self.cum_notional, filled_usdt, side='left'))
+        level = min(level, len(self.prices) - 1)
+
+        notional_before = self.cum_notional[level - 1] if level > 0 else 0.0
+        shares_before = self.cum_shares[level - 1] if level > 0 else 0.0
+        shares = shares_before + (filled_usdt - notional_before) / self.prices[level]
+
+        vwap = filled_usdt / shares
+        best = self.prices[0]
+        return {
+            'vwap': float(vwap),
+            'best_price': float(best),
+            'worst_price': float(self.prices[level]),
+            'shares': float(shares),
+            'filled_usdt': float(filled_usdt),
+            'levels_consumed': level + 1,
+            'fully_filled': bool(usdt_amount <= self.total_notional + 1e-9),
+            'slippage': float(abs(vwap - best)),
+            'slippage_pct': float(abs(vwap - best) / best),
+        }
+
+
+class DepthBook:
+    """Both sides of a normalized orderbook as cumulative-depth arrays."""
+
+    def __init__(self, bids: BookSide, asks: BookSide):
+        self.bids = bids
+        self.asks = asks
+
+    @classmethod
+    def from_orderbook(cls, orderbook: Dict) -> 'DepthBook':
+        """Build from the 'orderbook' dict of a get_orderbook() response."""
+        return cls(
+            bids=BookSide.from_levels(orderbook.get('bids', []), descending=True),
+            asks=BookSide.from_levels(orderbook.get('asks', []), descending=False)
+        )
+
+    def estimate_fill(self, usdt_amount: float, side: str = 'BUY') -> Optional[Dict]:
+        """
+        Expected fill for an order worth usdt_amount.
+        BUY consumes asks (lowest first), SELL consumes bids (highest first).
+
+        Returns:
+            Dict with vwap, best_price, worst_price, shares, filled_usdt,
+            levels_consumed, fully_filled, slippage and slippage_pct,
+            or None if the side to consume is empty
+        """
+        book_side = self.asks if side.upper() == 'BUY' else self.bids
+        return book_side.fill(usdt_amount)
@@ -0,0 +1,206 @@
+"""
+Engine Registry
+===============
+Shared, lazily built AutonomousEngine / OpinionTradeAPI per Gunicorn worker.
+
+Building an AutonomousEngine constructs OpinionTradeAPI (SDK client, RPC pool,
+approval checks), FirmOrchestrator (LLM clients, built on first use), LearningSystem
+and TierRiskGuard, which takes seconds. API handlers used to pay that on every request.
+The registry builds each instance once per worker process, on first use, and hands
+the same warm instance to every later request.
+
+An instance is rebuilt on the next request when its health check fails:
+
+    forked                the worker was forked after the build (Gunicorn --preload)
+    expired               older than REGISTRY_MAX_AGE_SECONDS
+    credentials_changed   OPINION_TRADE_API_KEY / OPINION_WALLET_PRIVATE_KEY changed
+    client_unavailable    credentials are set but the SDK client failed to initialize
+
+refresh() drops both instances explicitly (see /admin/registry).
+
+Cycles on the shared engine are serialized per worker: cycle_lease() yields the
+engine, or None when another request in this worker is already running a cycle.
+
+Configuration:
+    REGISTRY_MAX_AGE_SECONDS   Rebuild instances older than this (default: 21600)
+    REGISTRY_WARMUP            "true" to build the engine in the background at startup
+"""
+
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from logger import autonomous_logger as logger
+
+
+def _credentials() -> tuple:
+    return (os.getenv('OPINION_TRADE_API_KEY'), os.getenv('OPINION_WALLET_PRIVATE_KEY'))
+
+
+def _fingerprint(credentials: tuple) -> str:
+    # Only a digest is kept, never the secrets themselves
+    return hashlib.sha256(repr(credentials).encode()).hexdigest()
+
+
+class _Entry:
+    """One built instance with the context it was built in."""
+
+    def __init__(self, instance, credentials: tuple, build_seconds: float):
+        self.instance = instance
+        self.pid = os.getpid()
+        self.built_at = time.monotonic()
+        self.fingerprint = _fingerprint(credentials)
+        self.has_credentials = all(credentials)
+        self.build_seconds = build_seconds
+        self.hits = 0
+
+
+class EngineRegistry:
+    """Thread-safe holder of the worker's shared OpinionTradeAPI and AutonomousEngine."""
+
+    def __init__(self, database, max_age_seconds: float = 21600.0,
+                 api_factory: Optional[Callable] = None, engine_factory: Optional[Callable] = None):
+        """
+        Args:
+            database: TradingDatabase shared by the engine
+            max_age_seconds: Age after which an instance is rebuilt on next use
+            api_factory: (api_key, private_key) -> OpinionTradeAPI (default: OpinionTradeAPI)
+            engine_factory: (database, api_key, private_key, opinion_api) -> AutonomousEngine
+        """
+        self.database = database
+        self.max_age_seconds = max_age_seconds
+        self._api_factory = api_factory or self._default_api_factory
+        self._engine_factory = engine_factory or self._default_engine_factory
+        self._lock = threading.RLock()
+        self._cycle_lock = threading.Lock()
+        self._api: Optional[_Entry] = None
+        self._engine: Optional[_Entry] = None
+        self._refreshes: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls, database) -> 'EngineRegistry':
+        return cls(database, max_age_seconds=float(os.environ.get('REGISTRY_MAX_AGE_SECONDS', '21600')))
+
+    def _default_api_factory(self, api_key, private_key):
+        from opinion_trade_api import OpinionTradeAPI
+        # The database backs the persistent market catalog, as in AutonomousEngine
+        return OpinionTradeAPI(api_key=api_key, private_key=private_key, database=self.database)
+
+    @staticmethod
+    def _default_engine_factory(database, api_key, private_key, opinion_api):
+        from autonomous_engine import AutonomousEngine
+        return AutonomousEngine(database, opinion_api_key=api_key, opinion_private_key=private_key,
+                                opinion_api=opinion_api)
+
+    def _unhealthy_reason(self, entry: _Entry, opinion_api) -> Optional[str]:
+        if entry.pid != os.getpid():
+            return 'forked'
+        if time.monotonic() - entry.built_at > self.max_age_seconds:
+            return 'expired'
+        if entry.fingerprint != _fingerprint(_credentials()):
+            return 'credentials_changed'
+        if entry.has_credentials and getattr(opinion_api, 'client', None) is None:
+            return 'client_unavailable'
+        return None
+
+    def _drop(self, reason: str):
+        self._api = None
+        self._engine = None
+        self._refreshes[reason] = self._refreshes.get(reason, 0) + 1
+        logger.info(f"Shared instances dropped ({reason}), rebuilding on next use", prefix="REGISTRY")
+
+    def get_opinion_api(self):
+        """Shared OpinionTradeAPI (the one the shared engine uses)."""
+        with self._lock:
+            if self._api is not None:
+                reason = self._unhealthy_reason(self._api, self._api.instance)
+                if reason:
+                    self._drop(reason)
+            if self._api is None:
+                credentials = _credentials()
+                started = time.monotonic()
+                opinion_api = self._api_factory(*credentials)
+                self._api = _Entry(opinion_api, credentials, time.monotonic() - started)
+                logger.info(f"OpinionTradeAPI built in {self._api.build_seconds:.2f}s", prefix="REGISTRY")
+            self._api.hits += 1
+            return self._api.instance
+
+    def get_engine(self):
+        """Shared AutonomousEngine, built around the shared OpinionTradeAPI."""
+        with self._lock:
+            opinion_api = self.get_opinion_api()
+            if self._engine is not None and self._engine.instance.opinion_api is not opinion_api:
+                # The client was rebuilt: the engine holds a stale one
+                self._engine = None
+            if self._engine is None:
+                credentials = _credentials()
+                started = time.monotonic()
+                engine = self._engine_factory(self.database, *credentials, opinion_api)
+                self._engine = _Entry(engine, credentials, time.monotonic() - started)
+                logger.info(f"AutonomousEngine built in {self._engine.build_seconds:.2f}s", prefix="REGISTRY")
+            self._engine.hits += 1
+            return self._engine.instance
+
+    @contextmanager
+    def cycle_lease(self) -> Iterator:
+        """Yield the shared engine for a cycle, or None if this worker is already running one."""
+        if not self._cycle_lock.acquire(blocking=False):
+            yield None
+            return
+        try:
+            yield self.get_engine()
+        finally:
+            self._cycle_lock.release()
+
+    def refresh(self, reason: str = 'manual'):
+        """Drop both instances; the next request rebuilds them."""
+        with self._lock:
+            self._drop(reason)
+
+    def warm_up(self) -> threading.Thread:
+        """Build the engine on a background thread so the first request finds it ready."""
+        def build():
+            try:
+                self.get_engine()
+            except Exception as e:
+                logger.warning(f"Warm-up failed, engine will be built on first use: {e}", prefix="REGISTRY")
+
+        thread = threading.Thread(target=build, name='registry-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            def describe(entry: Optional[_Entry]) -> Optional[Dict]:
+                if entry is None:
+                    return None
+                return {
+                    'age_seconds': round(time.monotonic() - entry.built_at, 1),
+                    'build_seconds': round(entry.build_seconds, 3),
+                    'hits': entry.hits,
+                    'pid': entry.pid,
+                }
+            return {
+                'pid': os.getpid(),
+                'opinion_api': describe(self._api),
+                'engine': describe(self._engine),
+                'cycle_running': self._cycle_lock.locked(),
+                'refreshes': dict(self._refreshes),
+                'max_age_seconds': self.max_age_seconds,
+            }
+
+
+_registry: Optional[EngineRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_engine_registry(database) -> EngineRegistry:
+    """Process-wide registry (one per Gunicorn worker)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EngineRegistry.from_env(database)
+        return _registry
@@ -0,0 +1,172 @@
+"""
+Event Scheduler
+===============
+Ranks every candidate event of a cycle and picks the ones worth an LLM call.
+
+The engine used to evaluate the first EVENTS_PER_CATEGORY events of each category in
+API order. The scheduler scores all pre-screened events on four signals in [0, 1]:
+
+    liquidity     tighter bid/ask spread (from the pre-screen quote)
+    uncertainty   mid price close to 0.5, where a firm's estimate can move the most
+    cutoff        resolves sooner (capital and the learning loop turn over faster)
+    staleness     hours since any firm last decided on the event (never = 1)
+
+The weighted sum is discounted by EVENT_DIVERSITY_DECAY for every event already picked in
+the same category, and events are picked greedily up to the per-firm budget. Every
+firm evaluates the same schedule, so the prediction fan-out still collects each
+event once.
+
+Configuration:
+    EVENT_SCHEDULER_ENABLED      "false" to go back to the first N events per category
+    EVENT_BUDGET_TEST            LLM calls per firm and cycle in BANKROLL_MODE=TEST (default: 8)
+    EVENT_BUDGET_PRODUCTION      LLM calls per firm and cycle in BANKROLL_MODE=PRODUCTION (default: 24)
+    EVENT_SCHEDULER_WEIGHTS      "liquidity=0.3,uncertainty=0.3,cutoff=0.2,staleness=0.2"
+    EVENT_DIVERSITY_DECAY        Score multiplier per event already picked in the category (default: 0.6)
+    EVENT_STALE_AFTER_HOURS      Hours after which a past decision no longer lowers the rank (default: 24)
+
+Ranking needs the full event list, so the engine does not stream events
+(ENGINE_STREAM_EVENTS, see event_stream.py) while the scheduler is enabled: it
+fetches all markets, then ranks. Set EVENT_SCHEDULER_ENABLED=false to get streaming back.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from prescreen import cutoff_seconds
+
+
+DEFAULT_BUDGETS = {
+    'TEST': 8,
+    'PRODUCTION': 24,
+}
+
+DEFAULT_WEIGHTS = {
+    'liquidity': 0.3,
+    'uncertainty': 0.3,
+    'cutoff': 0.2,
+    'staleness': 0.2,
+}
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """Parse "liquidity=0.3,cutoff=0.2" into a dict, ignoring unknown or malformed pairs."""
+    weights = {}
+    for pair in (spec or '').split(','):
+        name, _, value = pair.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_WEIGHTS:
+            continue
+        try:
+            weights[name] = max(0.0, float(value))
+        except ValueError:
+            continue
+    return weights
+
+
+def _clip(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+class EventScheduler:
+    """Greedy value-of-information ranking with a category diversity discount."""
+
+    def __init__(self, budget: int, weights: Optional[Dict[str, float]] = None, diversity_decay: float = 0.6,
+                 stale_after_hours: float = 24.0, cutoff_horizon_days: float = 30.0, spread_reference: float = 0.2):
+        """
+        Args:
+            budget: Events (LLM calls) per firm and cycle
+            weights: Signal weights (missing signals use DEFAULT_WEIGHTS)
+            diversity_decay: Multiplier per event already picked in the same category
+            stale_after_hours: Age at which a past decision stops lowering the rank
+            cutoff_horizon_days: Days to cutoff at which the cutoff signal is 0.5
+            spread_reference: Spread at which the liquidity signal reaches 0
+        """
+        self.budget = max(0, budget)
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.diversity_decay = diversity_decay
+        self.stale_after_hours = stale_after_hours
+        self.cutoff_horizon_days = cutoff_horizon_days
+        self.spread_reference = spread_reference
+
+    @classmethod
+    def from_env(cls, bankroll_mode: str) -> 'EventScheduler':
+        mode = bankroll_mode.upper() if bankroll_mode.upper() in DEFAULT_BUDGETS else 'TEST'
+        return cls(
+            budget=int(os.environ.get(f'EVENT_BUDGET_{mode}', DEFAULT_BUDGETS[mode])),
+            weights=parse_weights(os.environ.get('EVENT_SCHEDULER_WEIGHTS', '')),
+            diversity_decay=float(os.environ.get('EVENT_DIVERSITY_DECAY', '0.6')),
+            stale_after_hours=float(os.environ.get('EVENT_STALE_AFTER_HOURS', '24'))
+        )
+
+    def signals(self, event: Dict, screen: Optional[Dict], last_decision_at: Optional[float],
+                now: float) -> Dict[str, float]:
+        """
+        Args:
+            event: Event from get_available_events()
+            screen: PreScreen result for the event (None = pre-screen disabled, neutral price signals)
+            last_decision_at: Epoch seconds of the last firm decision on the event, None if never
+            now: Epoch seconds
+        """
+        spread = screen.get('spread') if screen else None
+        mid = screen.get('mid') if screen else None
+        cutoff = cutoff_seconds(event.get('cutoff_at'))
+
+        if cutoff is None:
+            cutoff_signal = 0.5
+        else:
+            days_left = max(0.0, cutoff - now) / 86400.0
+            cutoff_signal = 1.0 / (1.0 + days_left / self.cutoff_horizon_days)
+
+        if last_decision_at is None:
+            staleness = 1.0
+        else:
+            staleness = _clip((now - last_decision_at) / 3600.0 / self.stale_after_hours)
+
+        return {
+            'liquidity': 0.5 if spread is None else _clip(1.0 - spread / self.spread_reference),
+            'uncertainty': 0.5 if mid is None else _clip(1.0 - 2.0 * abs(mid - 0.5)),
+            'cutoff': round(cutoff_signal, 4),
+            'staleness': round(staleness, 4),
+        }
+
+    def schedule(self, candidates: List[Tuple[Dict, Optional[Dict]]],
+                 last_decisions: Dict[str, float], now: Optional[float] = None) -> List[Dict]:
+        """
+        Pick up to budget events.
+
+        Args:
+            candidates: (event, pre-screen result) for every event that passed the pre-screen
+            last_decisions: Event description -> epoch seconds of the last firm decision on it
+            now: Epoch seconds (default: time.time())
+
+        Returns:
+            Picked entries in rank order: event, category, score (after the diversity
+            discount) and the raw signals
+        """
+        now = time.time() if now is None else now
+        ranked = []
+        for event, screen in candidates:
+            description = event.get('description', event.get('title', ''))
+            signals = self.signals(event, screen, last_decisions.get(description), now)
+            base = sum(self.weights[name] * value for name, value in signals.items())
+            ranked.append({
+                'event': event,
+                'category': event.get('category', 'general'),
+                'base_score': base,
+                'signals': signals,
+            })
+
+        picked = []
+        per_category: Dict[str, int] = {}
+        remaining = ranked
+        while remaining and len(picked) < self.budget:
+            def discounted(entry):
+                return entry['base_score'] * self.diversity_decay ** per_category.get(entry['category'], 0)
+            # max() keeps the earliest entry on ties, so API order breaks ties
+            best = max(remaining, key=discounted)
+            best['score'] = round(discounted(best), 4)
+            picked.append(best)
+            per_category[best['category']] = per_category.get(best['category'], 0) + 1
+            remaining = [entry for entry in remaining if entry is not best]
+        return picked
@@ -0,0 +1,92 @@
+"""
+Event Stream
+============
+Background producer for OpinionTradeAPI.iter_available_events().
+
+The generator only advances when it is pulled, so a consumer that spends seconds
+on an LLM call per event would stall pagination. EventStream drains the generator
+on a daemon thread into a shared list; any number of consumers can iterate it
+(each from the start), blocking only when they have caught up with the producer.
+
+    stream = EventStream(opinion_api.iter_available_events(limit=200)).start()
+    for event in stream:          # first firm: overlaps with market discovery
+        ...
+    stream.wait()                 # all events fetched
+    for event in stream:          # later firms: replay, no waiting
+        ...
+
+Configuration:
+    ENGINE_STREAM_EVENTS    "false" to fetch all events before evaluating. Ignored (no
+                            streaming) while EVENT_SCHEDULER_ENABLED is on, because the
+                            scheduler ranks the full event list and has nothing to overlap
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class EventStream:
+    """Replayable, thread-safe buffer filled from an event iterator on a background thread."""
+
+    def __init__(self, source: Iterable[Dict]):
+        self._source = source
+        self._events: List[Dict] = []
+        self._cond = threading.Condition()
+        self._done = False
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.first_event_seconds: Optional[float] = None
+        self.total_seconds: Optional[float] = None
+
+    def start(self) -> 'EventStream':
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._produce, name='event-stream', daemon=True)
+        self._thread.start()
+        return self
+
+    def _produce(self):
+        try:
+            for event in self._source:
+                with self._cond:
+                    if not self._events:
+                        self.first_event_seconds = time.monotonic() - self.started_at
+                    self._events.append(event)
+                    self._cond.notify_all()
+        except BaseException as e:
+            self.error = e
+        finally:
+            with self._cond:
+                self._done = True
+                self.total_seconds = time.monotonic() - self.started_at
+                self._cond.notify_all()
+
+    def __iter__(self) -> Iterator[Dict]:
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self._events) and not self._done:
+                    self._cond.wait()
+                if index >= len(self._events):
+                    return
+                event = self._events[index]
+            index += 1
+            yield event
+
+    @property
+    def done(self) -> bool:
+        with self._cond:
+            return self._done
+
+    def wait(self, timeout: Optional[float] = None) -> List[Dict]:
+        """Block until the producer finished; returns every event fetched so far."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._done, timeout=timeout)
+            return list(self._events)
+
+    def wait_for_first(self, timeout: Optional[float] = None) -> bool:
+        """Block until at least one event arrived or the stream ended; True if any event exists."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._events or self._done, timeout=timeout)
+            return bool(self._events)
@@ -0,0 +1,135 @@
+"""
+Firm Concurrency
+================
+Primitives for running the firms of a daily cycle concurrently.
+
+    ProviderSlots      Per-provider cap on in-flight LLM calls (one provider per firm)
+    DailyLimitLedger   Shared TEST-mode daily limit: bets reserve their amount before
+                       executing, so two firms cannot both pass the check and overspend
+    current_rss_mb     Resident memory of this process, for the parallel-mode ceiling
+
+Configuration:
+    ENGINE_PARALLEL_FIRMS        "true" to run firms concurrently (default: false)
+    ENGINE_FIRM_WORKERS          Max firms running at once (default: all firms)
+    ENGINE_PARALLEL_MAX_RSS_MB   Run firms sequentially when RSS is above this, 0 = no ceiling (default: 1024)
+    LLM_CONCURRENCY              "ChatGPT=2,Gemini=1" max in-flight calls per provider
+    LLM_CONCURRENCY_DEFAULT      Cap for providers not listed (default: 2)
+"""
+
+import os
+import resource
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """Parse "ChatGPT=2,Gemini=1" into {name: cap}; malformed pairs are skipped."""
+    limits = {}
+    for part in (spec or '').split(','):
+        if '=' not in part:
+            continue
+        name, value = part.split('=', 1)
+        try:
+            limits[name.strip()] = max(1, int(value))
+        except ValueError:
+            continue
+    return limits
+
+
+class ProviderSlots:
+    """Bounded semaphores per provider, created on first use."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default: int = 2):
+        self.limits = dict(limits or {})
+        self.default = max(1, default)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    @classmethod
+    def from_env(cls) -> 'ProviderSlots':
+        return cls(
+            limits=parse_concurrency(os.environ.get('LLM_CONCURRENCY', '')),
+            default=int(os.environ.get('LLM_CONCURRENCY_DEFAULT', '2'))
+        )
+
+    def _semaphore(self, provider: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(provider)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.limits.get(provider, self.default))
+                self._semaphores[provider] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, provider: str) -> Iterator[None]:
+        """Hold one of the provider's slots for the duration of an LLM call."""
+        semaphore = self._semaphore(provider)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+class DailyLimitLedger:
+    """
+    Daily bet limit shared by concurrently running firms.
+
+    reserve() checks the persisted daily total plus in-flight reservations and holds
+    the amount; commit() adds the placed amount to the database total, release()
+    drops a reservation whose bet was not placed.
+    """
+
+    def __init__(self, database, limit: Optional[float]):
+        """
+        Args:
+            database: TradingDatabase holding the daily total
+            limit: Max USDT per day, None for no limit
+        """
+        self.database = database
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._reserved = 0.0
+
+    def reserve(self, amount: float) -> Optional[float]:
+        """
+        Hold amount against the limit.
+
+        Returns:
+            The committed daily total if the reservation fits, else None
+        """
+        with self._lock:
+            current = self.database.get_daily_bet_total()
+            if self.limit is not None and current + self._reserved + amount > self.limit:
+                return None
+            self._reserved += amount
+            return current
+
+    def commit(self, reserved: float, placed: float) -> float:
+        """Settle a reservation whose bet was placed for `placed` USDT; returns the new daily total."""
+        with self._lock:
+            self._reserved = max(0.0, self._reserved - reserved)
+            return self.database.add_to_daily_bet_total(placed)
+
+    def release(self, reserved: float):
+        with self._lock:
+            self._reserved = max(0.0, self._reserved - reserved)
+
+    @property
+    def reserved(self) -> float:
+        with self._lock:
+            return self._reserved
+
+
+def current_rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, KB elsewhere
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -1,12 +1,13 @@
 import os
 import json
-from typing import Dict, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
 from datetime import datetime
-from openai import OpenAI
-from google import genai
-from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
+# Provider SDKs (openai, google.genai) are imported by the firm that needs them, when it is
+# first built, so processes that never call an LLM don't pay their import cost.
+
 def is_rate_limit_error(exception: BaseException) -> bool:
     error_msg = str(exception)
     return (
@@ -109,6 +110,7 @@ class TradingFirm:
 class ChatGPTFirm(TradingFirm):
     def __init__(self):
         super().__init__("ChatGPT")
+        from openai import OpenAI
         # Use direct OpenAI API (works on both Replit and Railway)
         api_key = os.environ.get("AI_INTEGRATIONS_OPENAI_API_KEY") or os.environ.get("OPENAI_API_KEY")
         base_url = os.environ.get("AI_INTEGRATIONS_OPENAI_BASE_URL")  # None if not on Replit
@@ -162,6 +164,7 @@ class ChatGPTFirm(TradingFirm):
 class GeminiFirm(TradingFirm):
     def __init__(self):
         super().__init__("Gemini")
+        from google import genai
         # Use direct Google Gemini API (works on both Replit and Railway)
         api_key = os.environ.get("AI_INTEGRATIONS_GEMINI_API_KEY") or os.environ.get("GEMINI_API_KEY")
         base_url = os.environ.get("AI_INTEGRATIONS_GEMINI_BASE_URL")
@@ -183,6 +186,8 @@ class GeminiFirm(TradingFirm):
         reraise=True
     )
     def generate_prediction(self, prompt: str) -> Dict:
+        from google.genai import types
+        
         # Try Gemini 2.5 Pro first (best for complex analysis), fallback to Flash
         models_to_try = ["gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.0-flash-exp"]
         
@@ -251,6 +256,7 @@ class GeminiFirm(TradingFirm):
 class QwenFirm(TradingFirm):
     def __init__(self):
         super().__init__("Qwen")
+        from openai import OpenAI
         api_key = os.environ.get("QWEN_API_KEY")
         if not api_key:
             print(f"[{self.firm_name}] WARNING: QWEN_API_KEY not configured")
@@ -300,6 +306,7 @@ class QwenFirm(TradingFirm):
 class DeepseekFirm(TradingFirm):
     def __init__(self):
         super().__init__("Deepseek")
+        from openai import OpenAI
         api_key = os.environ.get("DEEPSEEK_API_KEY")
         if not api_key:
             print(f"[{self.firm_name}] WARNING: DEEPSEEK_API_KEY not configured")
@@ -349,6 +356,7 @@ class DeepseekFirm(TradingFirm):
 class GrokFirm(TradingFirm):
     def __init__(self):
         super().__init__("Grok")
+        from openai import OpenAI
         # Using xAI API endpoint as per blueprint
         api_key = os.environ.get("XAI_API_KEY")
         if not api_key:
@@ -396,18 +404,64 @@ class GrokFirm(TradingFirm):
             }
 
 
+# Firm name -> factory, in evaluation order
+FIRM_FACTORIES: Dict[str, Callable[[], TradingFirm]] = {
+    'ChatGPT': ChatGPTFirm,
+    'Gemini': GeminiFirm,
+    'Qwen': QwenFirm,
+    'Deepseek': DeepseekFirm,
+    'Grok': GrokFirm
+}
+
+
 class FirmOrchestrator:
-    def __init__(self):
-        self.firms = {
-            'ChatGPT': ChatGPTFirm(),
-            'Gemini': GeminiFirm(),
-            'Qwen': QwenFirm(),
-            'Deepseek': DeepseekFirm(),
-            'Grok': GrokFirm()
-        }
+    """
+    Registry of trading firms built on first use.
+    
+    ENABLED_FIRMS (comma-separated, e.g. "ChatGPT,Gemini") limits the firms of this
+    process; by default all firms in FIRM_FACTORIES are enabled.
+    """
+    
+    def __init__(self, enabled_firms: Optional[Iterable[str]] = None,
+                 factories: Optional[Dict[str, Callable[[], TradingFirm]]] = None):
+        factories = FIRM_FACTORIES if factories is None else factories
+        if enabled_firms is None:
+            env_firms = os.environ.get('ENABLED_FIRMS', '')
+            enabled_firms = [name.strip() for name in env_firms.split(',') if name.strip()] or None
+        if enabled_firms is not None:
+            enabled = set(enabled_firms)
+            unknown = enabled - set(factories)
+            if unknown:
+                raise ValueError(f"Unknown firms in ENABLED_FIRMS: {', '.join(sorted(unknown))}")
+            factories = {name: factory for name, factory in factories.items() if name in enabled}
+        self._factories = dict(factories)
+        self._firms: Dict[str, TradingFirm] = {}
+        self._lock = threading.Lock()
+    
+    def get_firm_names(self) -> List[str]:
+        """Enabled firm names, without building any client."""
+        return list(self._factories)
     
     def get_firm(self, firm_name: str) -> Optional[TradingFirm]:
-        return self.firms.get(firm_name)
+        factory = self._factories.get(firm_name)
+        if factory is None:
+            return None
+        with self._lock:
+            firm = self._firms.get(firm_name)
+            if firm is None:
+                firm = factory()
+                self._firms[firm_name] = firm
+            return firm
     
     def get_all_firms(self) -> Dict[str, TradingFirm]:
-        return self.firms
+        """Every enabled firm, building the ones not used yet."""
+        return {name: self.get_firm(name) for name in self._factories}
+    
+    @property
+    def firms(self) -> Dict[str, TradingFirm]:
+        return self.get_all_firms()
+    
+    def built_firms(self) -> List[str]:
+        """Firms whose provider client has been created so far."""
+        with self._lock:
+            return list(self._firms)
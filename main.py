@@ -87,6 +87,11 @@ def main():
     # Start Flask API on port 8000
     print("\n[2/3] Starting Flask API backend on port 8000...")
     
+    # Daily cycles run in a dedicated worker process in production, never inside a
+    # Gunicorn API worker (see cycle_jobs.py). Set CYCLE_JOB_RUNNER=thread to opt out.
+    if is_production():
+        os.environ.setdefault('CYCLE_JOB_RUNNER', 'external')
+    
     # Use Gunicorn in production (Railway/Replit) to avoid Flask debug reloader issues
     # Flask debug reloader loses environment variables on restart
     if is_production():
@@ -113,8 +118,21 @@ def main():
         stderr=sys.stderr   # Inherit stderr to avoid pipe blocking
     )
     processes.append(api_process)
+    service_names = ["Flask API"]
     print("  ✓ Flask API started (PID: {})".format(api_process.pid))
     
+    # Cycle job worker: runs the queued daily cycles the API only enqueues
+    if os.environ.get('CYCLE_JOB_RUNNER', 'thread').lower() == 'external':
+        worker_process = subprocess.Popen(
+            ["python", "cycle_jobs.py"],
+            env=os.environ.copy(),
+            stdout=sys.stdout,
+            stderr=sys.stderr
+        )
+        processes.append(worker_process)
+        service_names.append("Cycle job worker")
+        print("  ✓ Cycle job worker started (PID: {})".format(worker_process.pid))
+    
     # Give API time to start
     time.sleep(3)
     
@@ -141,6 +159,7 @@ def main():
         stderr=sys.stderr   # Inherit stderr to avoid pipe blocking
     )
     processes.append(frontend_process)
+    service_names.append("Next.js Frontend")
     print("  ✓ Next.js frontend started (PID: {})".format(frontend_process.pid))
     
     print("\n" + "=" * 60)
@@ -157,7 +176,7 @@ def main():
             # Check if any process has died
             for i, proc in enumerate(processes):
                 if proc.poll() is not None:
-                    service_name = "Flask API" if i == 0 else "Next.js Frontend"
+                    service_name = service_names[i]
                     print(f"\n✗ Error: {service_name} (PID: {proc.pid}) died unexpectedly")
                     print("  Exit code:", proc.returncode)
                     
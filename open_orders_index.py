@@ -0,0 +1,72 @@
+"""
+Open Orders Index
+=================
+Per-cycle snapshot of our open orders on Opinion.trade, indexed by market_id and token_id.
+
+get_my_orders() downloads the full open-order list on every call, so the engine
+fetches it once per cycle and answers duplicate-prevention checks from this index.
+Orders placed during the cycle are added in place so later checks still see them.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from logger import autonomous_logger as logger
+
+
+class OpenOrdersIndex:
+    """
+    Thread-safe index of open orders (dicts as returned by OpinionTradeAPI.get_my_orders).
+    Keys are normalized to str so int and str market/token ids match.
+    """
+
+    def __init__(self, orders: Optional[List[Dict]] = None):
+        self._lock = threading.Lock()
+        self._by_market: Dict[str, List[Dict]] = {}
+        self._by_token: Dict[str, List[Dict]] = {}
+        self._count = 0
+        for order in orders or []:
+            self.add(order)
+
+    @classmethod
+    def from_api(cls, opinion_api) -> Optional['OpenOrdersIndex']:
+        """
+        Build the index from a single get_my_orders() call.
+
+        Returns:
+            The index, or None if the orders could not be fetched (callers fall back to per-market checks)
+        """
+        response = opinion_api.get_my_orders()
+        if not response.get('success'):
+            logger.warning(f"[OPEN ORDERS] Could not build open-orders index: {response.get('error')}")
+            return None
+        index = cls(response.get('orders', []))
+        logger.info(f"[OPEN ORDERS] Indexed {len(index)} open orders across {index.market_count()} markets")
+        return index
+
+    def add(self, order: Dict):
+        """Add an order (e.g. one just placed by _execute_bet)."""
+        with self._lock:
+            market_id = order.get('market_id')
+            token_id = order.get('token_id')
+            if market_id is not None:
+                self._by_market.setdefault(str(market_id), []).append(order)
+            if token_id is not None:
+                self._by_token.setdefault(str(token_id), []).append(order)
+            self._count += 1
+
+    def orders_for_market(self, market_id) -> List[Dict]:
+        with self._lock:
+            return list(self._by_market.get(str(market_id), []))
+
+    def orders_for_token(self, token_id) -> List[Dict]:
+        with self._lock:
+            return list(self._by_token.get(str(token_id), []))
+
+    def market_count(self) -> int:
+        with self._lock:
+            return len(self._by_market)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
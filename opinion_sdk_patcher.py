@@ -1,14 +1,38 @@
 """
 Monkey-patch for Opinion.trade SDK to inject browser headers and bypass geo-blocking
+
+PatchedSession is also the shared transport for the SDK: install_shared_transport()
+swaps the SDK's per-client urllib3 pool (opinion_api RESTClientObject) for a
+SessionRESTClient backed by one process-wide PatchedSession, so every OpinionTradeAPI
+reuses the same keep-alive connections to proxy.opinion.trade:8443 instead of paying
+a new TLS handshake per instance.
+
+Configuration:
+    OPINION_SHARED_TRANSPORT        Route SDK calls through the shared session (default: true)
+    OPINION_POOL_CONNECTIONS        Hosts kept in the connection pool (default: 4)
+    OPINION_POOL_MAXSIZE            Connections kept per host (default: 16)
+    OPINION_POOL_BLOCK              Wait for a free connection instead of opening extra ones (default: false)
+    OPINION_TCP_KEEPALIVE_SECONDS   Idle seconds before TCP keep-alive probes, 0 = off (default: 60)
+    OPINION_TIMEOUT_MARKET_DATA     "connect,read" seconds for market data calls (default: 5,15)
+    OPINION_TIMEOUT_ORDERS          "connect,read" seconds for order calls (default: 5,30)
+    OPINION_TIMEOUT_ACCOUNT         "connect,read" seconds for account calls (default: 5,15)
+    OPINION_BROWSER_HEADERS         Inject browser/proxy headers into SDK calls (default: false)
 """
 import sys
 import os
+import re
+import socket
+import threading
 import logging
 import json
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
 from unittest.mock import patch
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +60,148 @@ PROXY_BYPASS_HEADERS = {
     'True-Client-IP': '185.28.23.45',
 }
 
+# (connect, read) timeouts per endpoint class, see OpinionTradeAPI._call_sdk
+DEFAULT_TIMEOUTS = {
+    'market_data': (5.0, 15.0),
+    'orders': (5.0, 30.0),
+    'account': (5.0, 15.0),
+}
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+_call_type = threading.local()
+
+
+@contextmanager
+def sdk_call_type(call_type: str):
+    """Tag requests made by this thread inside the block with an endpoint class (selects the timeout)."""
+    previous = getattr(_call_type, 'value', None)
+    _call_type.value = call_type
+    try:
+        yield
+    finally:
+        _call_type.value = previous
+
+
+def parse_timeout(value: Optional[str], default: Tuple[float, float]) -> Tuple[float, float]:
+    """Parse "connect,read" (or a single number for both) into a timeout tuple."""
+    if not value:
+        return default
+    parts = [float(part) for part in value.split(',')]
+    return (parts[0], parts[-1])
+
+
+def keepalive_socket_options(idle_seconds: int):
+    """urllib3 socket options enabling TCP keep-alive probes after idle_seconds."""
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle_seconds))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle_seconds // 4)))
+    return options
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keep-alive and per-host new/reused connection counters."""
+    
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16, pool_block: bool = False,
+                 keepalive_seconds: int = 60):
+        # Read by init_poolmanager(), which HTTPAdapter.__init__ calls
+        self.keepalive_seconds = keepalive_seconds
+        self._stats_lock = threading.Lock()
+        self._retired = defaultdict(lambda: {'new_connections': 0, 'requests': 0})
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keepalive_seconds:
+            pool_kwargs.setdefault('socket_options', keepalive_socket_options(self.keepalive_seconds))
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        # Keep the counters of host pools evicted from the (LRU) pool manager
+        self.poolmanager.pools.dispose_func = self._retire_pool
+    
+    def _retire_pool(self, pool):
+        with self._stats_lock:
+            totals = self._retired[f"{pool.host}:{pool.port}"]
+            totals['new_connections'] += pool.num_connections
+            totals['requests'] += pool.num_requests
+        pool.close()
+    
+    def connection_stats(self) -> Dict:
+        """New vs reused connections per host ("host:port") and in total."""
+        with self._stats_lock:
+            hosts = {host: dict(totals) for host, totals in self._retired.items()}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            totals = hosts.setdefault(f"{pool.host}:{pool.port}", {'new_connections': 0, 'requests': 0})
+            totals['new_connections'] += pool.num_connections
+            totals['requests'] += pool.num_requests
+        for totals in hosts.values():
+            totals['reused_connections'] = max(0, totals['requests'] - totals['new_connections'])
+        return {
+            'new_connections': sum(t['new_connections'] for t in hosts.values()),
+            'reused_connections': sum(t['reused_connections'] for t in hosts.values()),
+            'requests': sum(t['requests'] for t in hosts.values()),
+            'hosts': hosts,
+        }
+
+
 class PatchedSession(Session):
     """Enhanced session that injects browser headers into all requests"""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Set default browser headers
-        self.headers.update(BROWSER_HEADERS)
-        self.headers.update(PROXY_BYPASS_HEADERS)
-        logger.info("PatchedSession initialized with browser headers")
+    def __init__(self, browser_headers: bool = True, pool_connections: int = 4, pool_maxsize: int = 16,
+                 pool_block: bool = False, keepalive_seconds: int = 60,
+                 timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default_timeout: Tuple[float, float] = DEFAULT_TIMEOUT):
+        """
+        Args:
+            browser_headers: Inject BROWSER_HEADERS and PROXY_BYPASS_HEADERS
+            pool_connections: Hosts kept in the connection pool
+            pool_maxsize: Connections kept alive per host
+            pool_block: Block when all pooled connections are busy instead of opening extra ones
+            keepalive_seconds: Idle seconds before TCP keep-alive probes (0 disables)
+            timeouts: (connect, read) timeout per call type, see sdk_call_type()
+            default_timeout: Timeout for requests without a known call type
+        """
+        super().__init__()
+        if browser_headers:
+            self.headers.update(BROWSER_HEADERS)
+            self.headers.update(PROXY_BYPASS_HEADERS)
+        self.timeouts = dict(DEFAULT_TIMEOUTS if timeouts is None else timeouts)
+        self.default_timeout = default_timeout
+        # One adapter for both schemes so counters cover every host
+        self.adapter = PooledAdapter(pool_connections, pool_maxsize, pool_block, keepalive_seconds)
+        self.mount('https://', self.adapter)
+        self.mount('http://', self.adapter)
+        logger.info(f"PatchedSession initialized (browser headers: {browser_headers}, "
+                    f"pool: {pool_connections} hosts x {pool_maxsize} connections)")
+    
+    @classmethod
+    def from_env(cls) -> 'PatchedSession':
+        return cls(
+            browser_headers=os.environ.get('OPINION_BROWSER_HEADERS', 'false').lower() == 'true',
+            pool_connections=int(os.environ.get('OPINION_POOL_CONNECTIONS', '4')),
+            pool_maxsize=int(os.environ.get('OPINION_POOL_MAXSIZE', '16')),
+            pool_block=os.environ.get('OPINION_POOL_BLOCK', 'false').lower() == 'true',
+            keepalive_seconds=int(os.environ.get('OPINION_TCP_KEEPALIVE_SECONDS', '60')),
+            timeouts={
+                call_type: parse_timeout(os.environ.get(f"OPINION_TIMEOUT_{call_type.upper()}"), default)
+                for call_type, default in DEFAULT_TIMEOUTS.items()
+            }
+        )
+    
+    def timeout_for(self, call_type: Optional[str]) -> Tuple[float, float]:
+        return self.timeouts.get(call_type, self.default_timeout)
+    
+    def connection_stats(self) -> Dict:
+        return self.adapter.connection_stats()
     
     def request(self, method, url, **kwargs):
         """Override request to log and inject headers"""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout_for(getattr(_call_type, 'value', None))
+        
         # Ensure our headers are always included
         if 'headers' in kwargs:
             combined_headers = self.headers.copy()
@@ -68,6 +222,79 @@ class PatchedSession(Session):
         
         return response
 
+class _SessionResponse:
+    """The urllib3-response attributes opinion_api.rest.RESTResponse reads, from a requests.Response."""
+    
+    def __init__(self, response: requests.Response):
+        self.status = response.status_code
+        self.reason = response.reason
+        self.data = response.content
+        self.headers = response.headers
+
+
+class SessionRESTClient:
+    """Drop-in for opinion_api.rest.RESTClientObject that sends through a shared PatchedSession."""
+    
+    def __init__(self, session: PatchedSession):
+        self.session = session
+    
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        from opinion_api.exceptions import ApiException, ApiValueError
+        from opinion_api.rest import RESTResponse
+        
+        method = method.upper()
+        if post_params and body:
+            raise ApiValueError("body parameter cannot be used with post_params parameter.")
+        headers = dict(headers or {})
+        kwargs = {'headers': headers}
+        if _request_timeout:
+            kwargs['timeout'] = _request_timeout
+        
+        if method in ('POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE'):
+            content_type = headers.get('Content-Type')
+            if not content_type or re.search('json', content_type, re.IGNORECASE):
+                if body is not None:
+                    kwargs['data'] = json.dumps(body).encode('utf-8')
+            elif content_type == 'application/x-www-form-urlencoded':
+                kwargs['data'] = post_params or {}
+            elif isinstance(body, (str, bytes)):
+                kwargs['data'] = body
+            else:
+                raise ApiException(status=0, reason="Cannot prepare a request message for provided arguments.")
+        
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.SSLError as e:
+            raise ApiException(status=0, reason="\n".join([type(e).__name__, str(e)]))
+        return RESTResponse(_SessionResponse(response))
+
+
+_sdk_session: Optional[PatchedSession] = None
+_sdk_session_lock = threading.Lock()
+
+
+def shared_transport_enabled() -> bool:
+    return os.environ.get('OPINION_SHARED_TRANSPORT', 'true').lower() != 'false'
+
+
+def get_sdk_session() -> PatchedSession:
+    """Process-wide session shared by every SDK client."""
+    global _sdk_session
+    with _sdk_session_lock:
+        if _sdk_session is None:
+            _sdk_session = PatchedSession.from_env()
+        return _sdk_session
+
+
+def install_shared_transport(client) -> bool:
+    """Route an opinion_clob_sdk Client's REST calls through the shared session; False if not applicable."""
+    api_client = getattr(client, 'api_client', None)
+    if api_client is None or not hasattr(api_client, 'rest_client'):
+        return False
+    api_client.rest_client = SessionRESTClient(get_sdk_session())
+    return True
+
+
 def patch_opinion_sdk():
     """Apply monkey-patches to Opinion.trade SDK"""
     logger.info("Applying patches to Opinion.trade SDK...")
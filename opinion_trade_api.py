@@ -1,10 +1,12 @@
 import os
 import time
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from eth_account import Account
 from functools import wraps
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from opinion_clob_sdk import Client, CHAIN_ID_BNB_MAINNET
 from opinion_clob_sdk.model import TopicType, TopicStatusFilter
@@ -12,11 +14,22 @@ from opinion_clob_sdk.chain.py_order_utils.model.order import PlaceOrderDataInpu
 from opinion_clob_sdk.chain.py_order_utils.model.sides import OrderSide
 from opinion_clob_sdk.chain.py_order_utils.model.order_type import LIMIT_ORDER
 from logger import autonomous_logger as logger
+from orderbook_cache import OrderbookCache
+from depth_book import DepthBook
+from rpc_pool import PooledHTTPProvider, get_rpc_pool
+from rate_limiter import get_rate_limiter
+from approval_state import get_approval_store, is_approval_error
+from simulated_exchange import get_simulated_exchange, simulated_exchange_enabled
+from circuit_breaker import CircuitOpenError, RetryBudget, get_circuit_breakers, jittered_delay
+from opinion_sdk_patcher import get_sdk_session, install_shared_transport, sdk_call_type, shared_transport_enabled
 
 
 def retry_with_exponential_backoff(max_retries=3, initial_delay=1.0, max_delay=32.0, backoff_factor=2.0):
     """
-    Decorator for retrying functions with exponential backoff on failure.
+    Decorator for retrying methods with jittered exponential backoff on failure.
+    
+    Retries are drawn from the instance's per-cycle retry budget (self.retry_budget)
+    and are never attempted while a circuit breaker is open.
     
     Args:
         max_retries: Maximum number of retry attempts
@@ -27,36 +40,37 @@ def retry_with_exponential_backoff(max_retries=3, initial_delay=1.0, max_delay=3
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
+            retry_budget = getattr(args[0], 'retry_budget', None) if args else None
             
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                     
-                except Exception as e:
-                    last_exception = e
+                except CircuitOpenError:
+                    # Fail fast: retrying cannot succeed until the breaker half-opens
+                    raise
                     
+                except Exception as e:
                     # Don't retry on the last attempt
                     if attempt == max_retries:
                         logger.error(f"{func.__name__} failed after {max_retries + 1} attempts: {e}")
                         raise
                     
+                    if retry_budget is not None and not retry_budget.try_spend():
+                        logger.error(f"{func.__name__} failed: {e}. Retry budget exhausted for this cycle, not retrying")
+                        raise
+                    
                     # Check if it's a rate limit error
                     error_msg = str(e).lower()
                     if 'rate limit' in error_msg or 'too many requests' in error_msg or '429' in error_msg:
                         # For rate limits, use longer backoff
-                        delay = min(delay * backoff_factor * 2, max_delay)
+                        delay = jittered_delay(attempt + 1, initial_delay, max_delay, backoff_factor)
                         logger.warning(f"{func.__name__} hit rate limit. Waiting {delay:.1f}s before retry {attempt + 1}/{max_retries}...")
                     else:
+                        delay = jittered_delay(attempt, initial_delay, max_delay, backoff_factor)
                         logger.warning(f"{func.__name__} failed: {e}. Retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})...")
                     
                     time.sleep(delay)
-                    delay = min(delay * backoff_factor, max_delay)
-                    
-            # This shouldn't be reached but just in case
-            if last_exception:
-                raise last_exception
                 
         return wrapper
     return decorator
@@ -68,13 +82,17 @@ class OpinionTradeAPI:
     Uses opinion-clob-sdk v0.2.5 with BNB Chain mainnet.
     """
     
-    def __init__(self, api_key: Optional[str] = None, private_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, private_key: Optional[str] = None,
+                 database=None, client=None):
         """
         Initialize Opinion.trade client with SDK.
         
         Args:
             api_key: Opinion.trade API key (defaults to OPINION_TRADE_API_KEY env var)
             private_key: Wallet private key for signing (defaults to OPINION_WALLET_PRIVATE_KEY env var)
+            database: Optional TradingDatabase backing the persistent market catalog
+            client: Optional pre-built client with the SDK Client interface (e.g. SimulatedExchange).
+                    Defaults to the process-wide simulator when OPINION_SIMULATED_EXCHANGE=true.
         """
         # Get credentials from parameters or environment
         env_api_key = os.environ.get("OPINION_TRADE_API_KEY", "")
@@ -89,6 +107,9 @@ class OpinionTradeAPI:
         else:
             self.private_key = raw_private_key
         
+        # Persistent market catalog (None = always fetch market details)
+        self.database = database
+        
         # Derive wallet address from private key
         self.wallet_address = None
         if self.private_key:
@@ -98,37 +119,189 @@ class OpinionTradeAPI:
             except Exception as e:
                 logger.warning(f"Warning: Could not derive wallet address: {e}")
         
-        # Initialize SDK client
+        # Cross-process token buckets per endpoint class (see rate_limiter.py)
+        try:
+            self.rate_limiter = get_rate_limiter()
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, calls will not be throttled: {e}")
+            self.rate_limiter = None
+        
+        # Trading-enabled state per wallet, persisted across instances and processes (see approval_state.py)
+        try:
+            self.approval_store = get_approval_store()
+        except Exception as e:
+            logger.warning(f"Approval state store unavailable, approvals will be checked every time: {e}")
+            self.approval_store = None
+        
+        # Per-endpoint-class circuit breakers (process-wide) and per-cycle retry budget
+        self.circuit_breakers = get_circuit_breakers()
+        self.retry_budget = RetryBudget(int(os.environ.get("OPINION_RETRY_BUDGET", "10")))
+        
+        # Initialize SDK client (or use the injected / simulated one: no credentials or network needed)
         self.client = None
-        self._initialize_client()
+        if client is None and simulated_exchange_enabled():
+            client = get_simulated_exchange()
+        if client is not None:
+            self.client = client
+            logger.info(f"✓ Opinion.trade client provided: {type(client).__name__} (SDK initialization skipped)")
+        else:
+            self._initialize_client()
         
         # Fee cache (1 hour TTL)
         self._cached_fees: Optional[Dict] = None
         self._fees_cache_timestamp: Optional[datetime] = None
         self._fees_cache_ttl_seconds = 3600  # 1 hour
+        
+        # Short-TTL orderbook snapshots shared by all call sites (see orderbook_cache.py)
+        self._orderbook_cache = OrderbookCache()
+        
+        # Max markets converted concurrently in get_available_events (1 = serial)
+        self.fetch_max_workers = max(1, int(os.environ.get("OPINION_FETCH_MAX_WORKERS", "8")))
     
     def _get_bnb_rpc_url(self) -> str:
         """
-        Get BNB Chain RPC URL with fallback support.
-        Tries environment variable first, then falls back to public RPCs.
+        Get the healthiest BNB Chain RPC URL from the shared endpoint pool.
+        Candidates: BNB_RPC_URL, then BNB_RPC_URLS, then public RPCs (see rpc_pool.py).
         """
-        # Try custom RPC from environment first
-        custom_rpc = os.environ.get("BNB_RPC_URL", "").strip()
-        if custom_rpc:
-            logger.info(f"[RPC] Using custom BNB RPC from environment: {custom_rpc}")
-            return custom_rpc
-        
-        # Fallback to public RPCs (prioritized for reliability)
-        public_rpcs = [
-            'https://rpc.ankr.com/bsc',  # Ankr - generally reliable from EU
-            'https://bsc-dataseed1.defibit.io/',  # DeFiBit - alternative
-            'https://bsc-dataseed.binance.org/',  # Binance official - may be blocked in some regions
-        ]
-        
-        selected_rpc = public_rpcs[0]
-        logger.info(f"[RPC] Using public BNB RPC: {selected_rpc}")
+        pool = get_rpc_pool()
+        try:
+            selected_rpc = pool.best()
+        except Exception as e:
+            # Probing must never block initialization: fall back to the first candidate
+            logger.warning(f"[RPC] Could not probe RPC pool: {e}")
+            selected_rpc = pool.urls[0]
+        logger.info(f"[RPC] Using BNB RPC: {selected_rpc}")
         return selected_rpc
     
+    def _call_sdk(self, endpoint_class: str, method_name: str, *args, **kwargs):
+        """
+        Single entry point for SDK calls: fails fast with CircuitOpenError while the
+        endpoint class ('market_data', 'orders', 'account') breaker is open, then
+        waits for the shared rate limiter bucket.
+        
+        Only raised exceptions (transport/proxy failures) count against the breaker;
+        responses with errno != 0 mean the exchange is reachable.
+        """
+        breaker = self.circuit_breakers.get(endpoint_class)
+        breaker.allow()
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint_class)
+        except BaseException:
+            # The call never went out: a half-open breaker must not keep its trial slot
+            breaker.release_trial()
+            raise
+        try:
+            # The call type selects the shared transport's connect/read timeouts
+            with sdk_call_type(endpoint_class):
+                result = getattr(self.client, method_name)(*args, **kwargs)
+        except Exception as e:
+            breaker.record_failure(f"{method_name}: {e}")
+            raise
+        except BaseException:
+            breaker.release_trial()
+            raise
+        breaker.record_success()
+        return result
+    
+    def get_rate_limit_metrics(self) -> Dict:
+        """Queue wait metrics of the shared rate limiter for this process."""
+        return self.rate_limiter.get_metrics() if self.rate_limiter is not None else {}
+    
+    def reset_rate_limit_metrics(self):
+        """Reset rate limiter metrics (called at the start of each cycle)."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.reset_metrics()
+    
+    def get_circuit_breaker_state(self) -> Dict:
+        """Breaker state per endpoint class plus this cycle's retry budget usage."""
+        return {
+            'breakers': self.circuit_breakers.snapshot(),
+            'open': self.circuit_breakers.open_circuits(),
+            'retry_budget': self.retry_budget.to_dict()
+        }
+    
+    def get_open_circuits(self) -> List[str]:
+        """Endpoint classes whose breaker is currently open (calls fail fast)."""
+        return self.circuit_breakers.open_circuits()
+    
+    def reset_retry_budget(self):
+        """Refill the retry budget (called at the start of each cycle)."""
+        self.retry_budget.reset()
+    
+    def _trading_enabled_cached(self) -> bool:
+        """True if this wallet's approvals were verified within the approval store TTL."""
+        if self.approval_store is None or not self.wallet_address:
+            return False
+        try:
+            return self.approval_store.is_enabled(self.wallet_address, CHAIN_ID_BNB_MAINNET)
+        except Exception as e:
+            logger.warning(f"[APPROVAL] Could not read approval state: {e}")
+            return False
+    
+    def _record_trading_enabled(self, source: str):
+        if self.approval_store is None or not self.wallet_address:
+            return
+        try:
+            self.approval_store.mark_enabled(self.wallet_address, CHAIN_ID_BNB_MAINNET, source)
+        except Exception as e:
+            logger.warning(f"[APPROVAL] Could not persist approval state: {e}")
+    
+    def _invalidate_on_approval_error(self, message: str):
+        """Drop the cached approval state if an error says approvals are missing."""
+        if is_approval_error(message):
+            logger.warning(f"[APPROVAL] Approval error, cached trading-enabled state invalidated: {message}")
+            self.invalidate_approval_state()
+    
+    def invalidate_approval_state(self):
+        """Force the next client startup / order to re-check approvals on chain."""
+        if self.approval_store is None or not self.wallet_address:
+            return
+        try:
+            self.approval_store.invalidate(self.wallet_address, CHAIN_ID_BNB_MAINNET)
+        except Exception as e:
+            logger.warning(f"[APPROVAL] Could not invalidate approval state: {e}")
+    
+    def get_approval_state(self) -> Dict:
+        """Cached trading-enabled state of this wallet (empty when the store is disabled)."""
+        if self.approval_store is None or not self.wallet_address:
+            return {}
+        return self.approval_store.status(self.wallet_address, CHAIN_ID_BNB_MAINNET)
+    
+    def get_transport_stats(self) -> Dict:
+        """New vs reused connections of the shared SDK session (empty when it is disabled)."""
+        return get_sdk_session().connection_stats() if shared_transport_enabled() else {}
+    
+    def _attach_shared_transport(self):
+        """
+        Send the SDK's REST calls through the process-wide PatchedSession (see opinion_sdk_patcher.py),
+        so every OpinionTradeAPI reuses the same keep-alive connections to the proxy.
+        """
+        if not shared_transport_enabled():
+            return
+        try:
+            if install_shared_transport(self.client):
+                logger.info("[HTTP] SDK REST calls routed through the shared session")
+            else:
+                logger.warning("[HTTP] SDK client has no REST client, using its own connection pool")
+        except Exception as e:
+            logger.warning(f"[HTTP] Could not attach shared session to SDK (using its own pool): {e}")
+    
+    def _attach_rpc_pool(self):
+        """
+        Route the SDK's web3 calls through the RPC pool so they fail over between endpoints.
+        The SDK builds its own Web3(HTTPProvider(rpc_url)); we swap the provider in place.
+        """
+        w3 = getattr(getattr(self.client, 'contract_caller', None), 'w3', None)
+        if w3 is None:
+            logger.warning("[RPC] SDK client has no web3 instance, RPC failover disabled")
+            return
+        try:
+            w3.provider = PooledHTTPProvider(get_rpc_pool())
+            logger.info("[RPC] SDK web3 provider routed through RPC pool")
+        except Exception as e:
+            logger.warning(f"[RPC] Could not attach RPC pool to SDK (using single endpoint): {e}")
+    
     def _initialize_client(self):
         """Initialize Opinion.trade SDK client with production configuration."""
         if not self.api_key or not self.private_key or not self.wallet_address:
@@ -157,12 +330,18 @@ class OpinionTradeAPI:
                 market_cache_ttl=300
             )
             logger.info(f"✓ Opinion.trade SDK initialized (wallet: {self.wallet_address})")
+            self._attach_shared_transport()
+            self._attach_rpc_pool()
             
             # CRITICAL: Enable trading permissions (required once before placing any orders)
             # According to docs, this must be called before any trading operations
+            if self._trading_enabled_cached():
+                logger.info("[INIT] Trading permissions verified recently, skipping enable_trading")
+                return
             try:
                 logger.info("[INIT] Enabling trading permissions (one-time setup)...")
-                self.client.enable_trading()
+                self._call_sdk('orders', 'enable_trading')
+                self._record_trading_enabled('enable_trading')
                 logger.info("✓ Trading permissions enabled successfully")
             except Exception as e:
                 # Log warning but don't fail initialization - may already be enabled
@@ -173,16 +352,21 @@ class OpinionTradeAPI:
             self.client = None
     
     @retry_with_exponential_backoff(max_retries=3, initial_delay=2.0, max_delay=30.0)
-    def get_available_events(self, limit: int = 200, category: Optional[str] = None) -> Dict:
+    def get_available_events(self, limit: int = 200, category: Optional[str] = None,
+                             max_workers: Optional[int] = None) -> Dict:
         """
         Fetch ALL available markets from Opinion.trade using pagination with automatic retry on failure.
         
+        Market details and liquidity probes are fanned out over a bounded thread pool;
+        the output order and filtering are the same as a serial run.
+        
         Args:
             limit: Maximum total markets to retrieve (default 200, fetched in batches of 20)
             category: Optional category filter (currently not supported by SDK)
+            max_workers: Max markets converted in flight (defaults to OPINION_FETCH_MAX_WORKERS, 1 = serial)
         
         Returns:
-            Dictionary with success status and list of markets
+            Dictionary with success status, list of markets and per-phase timings (seconds)
         """
         if not self.client:
             return {
@@ -191,66 +375,13 @@ class OpinionTradeAPI:
                 'message': 'Please configure OPINION_TRADE_API_KEY and OPINION_WALLET_PRIVATE_KEY'
             }
         
+        if max_workers is None:
+            max_workers = self.fetch_max_workers
+        
         try:
-            all_markets = []
-            batch_size = 20  # SDK enforces max 20 per request
-            last_error = None
-            
-            logger.info(f"[PAGINATION] Starting pagination: target={limit} markets, batch_size={batch_size}")
-            logger.info(f"[PAGINATION] Fetching BOTH binary and multi-choice markets for maximum coverage")
-            
-            # Fetch BOTH BINARY and CATEGORICAL markets to get 100-200+ markets
-            # Binary: Simple YES/NO markets (e.g., "Will BTC hit $100k?")
-            # Categorical: Markets with multiple options (e.g., "Fed Rate Dec" with 4 rate options)
-            for topic_type in [TopicType.BINARY, TopicType.CATEGORICAL]:
-                page = 1
-                topic_type_name = "BINARY" if topic_type == TopicType.BINARY else "CATEGORICAL"
-                logger.info(f"[PAGINATION] Fetching {topic_type_name} markets...")
-                
-                # Fetch markets in batches until we reach the limit or no more markets
-                while len(all_markets) < limit:
-                    response = self.client.get_markets(
-                        topic_type=topic_type,
-                        status=TopicStatusFilter.ALL,
-                        page=page,
-                        limit=batch_size
-                    )
-                    
-                    logger.info(f"[PAGINATION] {topic_type_name} Page {page}: errno={response.errno}, has_result={hasattr(response, 'result')}")
-                    
-                    if response.errno != 0:
-                        logger.warning(f"[PAGINATION] {topic_type_name} error on page {page}: {response.errmsg}")
-                        last_error = response.errmsg
-                        break
-                    
-                    markets = response.result.list
-                    logger.info(f"[PAGINATION] {topic_type_name} Page {page} returned {len(markets)} markets")
-                    
-                    if not markets:
-                        # No more markets available
-                        logger.info(f"[PAGINATION] {topic_type_name} - No more markets found on page {page}, stopping")
-                        break
-                    
-                    # Filter out RESOLVED markets (we can only bet on active markets)
-                    # Note: status is an enum, use getattr to get the name (e.g., "RESOLVED" instead of "TopicStatus.RESOLVED")
-                    active_markets = [m for m in markets if getattr(m.status, "name", str(m.status)).upper() not in ['RESOLVED', 'CLOSED', 'CANCELLED']]
-                    logger.info(f"[PAGINATION] {topic_type_name} Page {page}: {len(active_markets)}/{len(markets)} markets are active (filtered out resolved/closed)")
-                    
-                    all_markets.extend(active_markets)
-                    
-                    # If we got fewer than batch_size, we've reached the end
-                    if len(markets) < batch_size:
-                        logger.info(f"[PAGINATION] {topic_type_name} - Got {len(markets)} < {batch_size}, reached end of markets")
-                        break
-                    
-                    # Stop if we've reached the limit
-                    if len(all_markets) >= limit:
-                        logger.info(f"[PAGINATION] {topic_type_name} - Reached target limit of {limit} markets")
-                        break
-                    
-                    page += 1
-                
-                logger.info(f"[PAGINATION] {topic_type_name} complete: collected {len([m for m in all_markets if getattr(m, 'topic_type', None) == topic_type])} markets")
+            started_at = time.monotonic()
+            all_markets, last_error = self._paginate_markets(limit)
+            pagination_seconds = time.monotonic() - started_at
             
             # Check if we got any markets at all
             if not all_markets:
@@ -263,215 +394,38 @@ class OpinionTradeAPI:
             markets = all_markets[:limit]  # Respect the limit
             logger.info(f"[PAGINATION] Pagination complete: fetched {len(all_markets)} markets, returning {len(markets)} (after limit)")
             
+            # Markets already in the catalog with an unchanged status skip client.get_market()
+            catalog = self._load_market_catalog([market.market_id for market in markets])
+            
+            def convert(market):
+                return self._convert_market(market, catalog.get(market.market_id))
+            
             # Convert SDK market objects to our event format
+            # executor.map() yields results in input order, so the event list matches a serial run
+            conversion_started_at = time.monotonic()
+            if max_workers > 1 and len(markets) > 1:
+                logger.info(f"[FETCH] Converting {len(markets)} markets with max_workers={max_workers}")
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='opinion-fetch') as executor:
+                    converted = list(executor.map(convert, markets))
+            else:
+                converted = [convert(market) for market in markets]
+            conversion_seconds = time.monotonic() - conversion_started_at
+            
             events = []
             skipped_count = 0
+            new_entries = []
+            for market_events, market_skipped, new_entry in converted:
+                events.extend(market_events)
+                skipped_count += market_skipped
+                if new_entry is not None:
+                    new_entries.append(new_entry)
             
-            for market in markets:
-                try:
-                    # Fetch full market details to get options/tokens
-                    # NOTE: get_markets() returns markets WITHOUT options field
-                    # We need to call get_market(id) for each market to get tokens
-                    market_details_response = self.client.get_market(market.market_id)
-                    
-                    if market_details_response.errno != 0:
-                        logger.warning(f"[WARNING] Failed to get details for market {market.market_id}: {market_details_response.errmsg}")
-                        skipped_count += 1
-                        continue
-                    
-                    market_full = market_details_response.result.data
-                    
-                    # LIQUIDITY FILTER: Check if market has any orderbook activity
-                    # Skip markets with ZERO liquidity across ALL options to avoid wasting AI API calls
-                    has_any_liquidity = False
-                    
-                    # For CATEGORICAL markets, check ALL options (must have at least 1 liquid option)
-                    # For BINARY markets, check the single yes_token_id
-                    if hasattr(market_full, 'options') and market_full.options:
-                        # Categorical market: check each option's liquidity
-                        for option in market_full.options:
-                            option_token_id = getattr(option, 'yes_token_id', None)
-                            if option_token_id:
-                                try:
-                                    orderbook_response = self.get_orderbook(option_token_id)
-                                    if orderbook_response.get('success'):
-                                        orderbook = orderbook_response.get('orderbook', {})
-                                        bids_count = len(orderbook.get('bids', []))
-                                        asks_count = len(orderbook.get('asks', []))
-                                        if bids_count > 0 or asks_count > 0:
-                                            has_any_liquidity = True
-                                            break  # Found liquid option, market is tradeable
-                                    else:
-                                        # If orderbook fetch fails, assume this option has liquidity
-                                        has_any_liquidity = True
-                                        break
-                                except Exception:
-                                    # On error, assume liquidity exists to avoid false negatives
-                                    has_any_liquidity = True
-                                    break
-                        
-                        if not has_any_liquidity:
-                            logger.info(f"[LIQUIDITY FILTER] Skipping categorical market '{market.market_title[:50]}...' - no liquid options found")
-                            skipped_count += 1
-                            continue
-                    else:
-                        # Binary market: check single yes_token_id
-                        check_token_id = getattr(market_full, 'yes_token_id', None)
-                        
-                        # CRITICAL FIX: Skip markets without valid yes_token_id BEFORE checking liquidity
-                        if not check_token_id:
-                            skipped_count += 1
-                            logger.info(f"[FILTER] Skipping binary market '{market.market_title[:50]}...' - no yes_token_id (untradeable)")
-                            continue
-                        
-                        # Now check liquidity for this valid token
-                        try:
-                            orderbook_response = self.get_orderbook(check_token_id)
-                            if orderbook_response.get('success'):
-                                orderbook = orderbook_response.get('orderbook', {})
-                                bids_count = len(orderbook.get('bids', []))
-                                asks_count = len(orderbook.get('asks', []))
-                                has_any_liquidity = (bids_count > 0 or asks_count > 0)
-                                
-                                if not has_any_liquidity:
-                                    logger.info(f"[LIQUIDITY FILTER] Skipping binary market '{market.market_title[:50]}...' - no orderbook liquidity (bids={bids_count}, asks={asks_count})")
-                                    skipped_count += 1
-                                    continue
-                            else:
-                                # If we can't fetch orderbook, assume it has liquidity to avoid false negatives
-                                has_any_liquidity = True
-                        except Exception as liquidity_error:
-                            # On error, assume liquidity exists to avoid false negatives
-                            logger.warning(f"[LIQUIDITY FILTER] Could not check liquidity for market {market.market_id}: {liquidity_error}")
-                            has_any_liquidity = True
-                    
-                    # Determine market type (BINARY vs MULTIPLE_CHOICE)
-                    market_type = getattr(market, 'topic_type', TopicType.BINARY)
-                    topic_type_name = getattr(market_type, 'name', str(market_type)) if hasattr(market_type, 'name') else str(market_type)
-                    
-                    # Derive category from market title (comprehensive keyword matching)
-                    title_lower = market.market_title.lower()
-                    
-                    # Crypto currencies
-                    if any(keyword in title_lower for keyword in ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency']):
-                        category = 'Crypto'
-                    
-                    # Interest Rates & Monetary Policy
-                    elif any(keyword in title_lower for keyword in ['fomc', 'ecb', 'boj', 'fed', 'federal reserve', 'interest rate', 'rate decision', 'rates decision', 'monetary policy', 'central bank']):
-                        category = 'Rates'
-                    
-                    # Commodities
-                    elif any(keyword in title_lower for keyword in ['gold', 'comex', 'silver', 'oil', 'commodity', 'commodities', 'wti', 'brent']):
-                        category = 'Commodities'
-                    
-                    # Inflation & CPI
-                    elif any(keyword in title_lower for keyword in ['inflation', 'cpi', 'consumer price', 'pce', 'deflation']):
-                        category = 'Inflation'
-                    
-                    # Employment & Jobs
-                    elif any(keyword in title_lower for keyword in ['unemployment', 'jobs', 'payroll', 'employment', 'jobless', 'labor market']):
-                        category = 'Employment'
-                    
-                    # Stock Markets & Finance
-                    elif any(keyword in title_lower for keyword in ['stock', 'nasdaq', 's&p', 'dow', 'equity', 'market', 'shares']):
-                        category = 'Finance'
-                    
-                    # Politics & Elections
-                    elif any(keyword in title_lower for keyword in ['election', 'vote', 'president', 'congress', 'senate', 'political']):
-                        category = 'Politics'
-                    
-                    # Sports (filtered out later)
-                    elif any(keyword in title_lower for keyword in ['sports', 'nfl', 'nba', 'mlb', 'nhl', 'soccer', 'football', 'basketball']):
-                        category = 'Sports'
-                    
-                    # Fallback
-                    else:
-                        category = 'Other'
-                    
-                    # Skip Sports category early - we don't want AI agents betting on sports
-                    if category == 'Sports':
-                        skipped_count += 1
-                        logger.info(f"[FILTER] Skipping Sports market: '{market.market_title[:50]}...'")
-                        continue
-                    
-                    # Handle BINARY vs CATEGORICAL markets differently
-                    if 'CATEGORICAL' in topic_type_name.upper():
-                        # CATEGORICAL market: e.g., "Fed Rate Dec" with 4 options
-                        # Each option is a separate YES/NO bet (e.g., "50+ bps decrease" → YES or NO)
-                        options = getattr(market_full, 'options', [])
-                        
-                        if not options:
-                            skipped_count += 1
-                            logger.warning(f"[WARNING] Skipping CATEGORICAL market {market.market_id} - no options found")
-                            continue
-                        
-                        logger.info(f"[CATEGORICAL] Market '{market.market_title[:40]}...' has {len(options)} options")
-                        
-                        # Create a separate event for each option
-                        for option in options:
-                            option_title = getattr(option, 'option_name', getattr(option, 'name', 'Unknown'))
-                            yes_token_id = getattr(option, 'yes_token_id', None)
-                            no_token_id = getattr(option, 'no_token_id', None)
-                            
-                            if not yes_token_id or not no_token_id:
-                                logger.warning(f"[WARNING] Option '{option_title}' missing tokens, skipping")
-                                skipped_count += 1
-                                continue
-                            
-                            # Create event for this specific option
-                            events.append({
-                                'event_id': f"{market.market_id}_{option_title.replace(' ', '_')}",
-                                'market_id': market.market_id,
-                                'title': f"{market.market_title} → {option_title}",
-                                'description': f"Option: {option_title} | {market.rules if hasattr(market, 'rules') and market.rules else market.market_title}",
-                                'category': category,
-                                'condition_id': market.condition_id,
-                                'status': str(market.status),
-                                'quote_token': market.quote_token,
-                                'chain_id': market.chain_id,
-                                'yes_label': f"YES ({option_title})",
-                                'no_label': f"NO ({option_title})",
-                                'yes_token_id': yes_token_id,
-                                'no_token_id': no_token_id,
-                                'volume': getattr(market, 'volume', '0'),
-                                'created_at': getattr(market, 'created_at', 0),
-                                'cutoff_at': getattr(market, 'cutoff_at', 0)
-                            })
-                    else:
-                        # BINARY market: Simple YES/NO (e.g., "Will BTC hit $100k?")
-                        # Opinion.trade SDK stores tokens as direct attributes
-                        yes_token_id = getattr(market_full, 'yes_token_id', None)
-                        no_token_id = getattr(market_full, 'no_token_id', None)
-                        yes_label = getattr(market_full, 'yes_label', 'YES')
-                        no_label = getattr(market_full, 'no_label', 'NO')
-                        
-                        # Skip markets without binary YES/NO tokens
-                        if not yes_token_id or not no_token_id:
-                            skipped_count += 1
-                            logger.warning(f"[WARNING] Skipping BINARY market {market.market_id} '{market.market_title[:50]}...' - missing binary tokens")
-                            continue
-                        
-                        events.append({
-                            'event_id': str(market.market_id),
-                            'market_id': market.market_id,
-                            'title': market.market_title,
-                            'description': market.rules if hasattr(market, 'rules') and market.rules else market.market_title,
-                            'category': category,
-                            'condition_id': market.condition_id,
-                            'status': str(market.status),
-                            'quote_token': market.quote_token,
-                            'chain_id': market.chain_id,
-                            'yes_label': yes_label,
-                            'no_label': no_label,
-                            'yes_token_id': yes_token_id,
-                            'no_token_id': no_token_id,
-                            'volume': getattr(market, 'volume', '0'),
-                            'created_at': getattr(market, 'created_at', 0),
-                            'cutoff_at': getattr(market, 'cutoff_at', 0)
-                        })
-                except Exception as e:
-                    logger.error(f"[ERROR] Failed to convert market {getattr(market, 'market_id', 'unknown')}: {e}")
-                    continue
+            self._save_market_catalog(new_entries)
+            catalog_stats = {
+                'reused': len(markets) - len(new_entries),
+                'refreshed': len(new_entries)
+            }
+            logger.info(f"[CATALOG] Reused {catalog_stats['reused']} cached markets, refreshed {catalog_stats['refreshed']}")
             
             # DETAILED LOGGING: Category distribution from Opinion.trade
             category_counts = {}
@@ -484,11 +438,20 @@ class OpinionTradeAPI:
                 print(f"  - {cat}: {count} markets")
             print(f"[OPINION.TRADE API] Total active markets: {len(events)}, Skipped: {skipped_count}\n")
             
+            timings = {
+                'pagination': round(pagination_seconds, 3),
+                'details_and_liquidity': round(conversion_seconds, 3),
+                'total': round(time.monotonic() - started_at, 3)
+            }
+            logger.info(f"[FETCH] Timings: pagination={timings['pagination']}s, details+liquidity={timings['details_and_liquidity']}s, total={timings['total']}s")
+            
             logger.info(f"[INFO] Opinion.trade API: Retrieved {len(events)} active markets (skipped {skipped_count} markets - missing tokens or Sports category)")
             return {
                 'success': True,
                 'count': len(events),
                 'events': events,
+                'timings': timings,
+                'catalog': catalog_stats,
                 'message': f'Retrieved {len(events)} available markets from Opinion.trade (skipped {skipped_count})'
             }
         
@@ -500,6 +463,466 @@ class OpinionTradeAPI:
                 'message': f'Failed to fetch markets: {str(e)}'
             }
     
+    def iter_available_events(self, limit: int = 200, max_workers: Optional[int] = None):
+        """
+        Streaming variant of get_available_events(): yields converted events while
+        pagination is still running, so callers can start evaluating the first
+        markets before the last page has been fetched.
+        
+        Each page is fanned out over the same bounded thread pool as
+        get_available_events(), and events are yielded in the same order and with the
+        same filtering as its 'events' list. Catalog entries are saved page by page.
+        Raises RuntimeError if the client is not initialized; pagination errors
+        simply end the stream.
+        
+        Args:
+            limit: Maximum total markets to convert
+            max_workers: Max markets converted in flight (defaults to OPINION_FETCH_MAX_WORKERS)
+        
+        Yields:
+            Event dictionaries (same format as get_available_events()['events'])
+        """
+        if not self.client:
+            raise RuntimeError('Opinion.trade client not initialized')
+        
+        if max_workers is None:
+            max_workers = self.fetch_max_workers
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='opinion-stream')
+        pending = deque()
+        new_entries = []
+        remaining = limit
+        try:
+            for page in self._iter_market_pages(limit):
+                page = page[:remaining]
+                remaining -= len(page)
+                catalog = self._load_market_catalog([market.market_id for market in page])
+                for market in page:
+                    pending.append(executor.submit(self._convert_market, market, catalog.get(market.market_id)))
+                
+                # Yield whatever finished at the head of the queue, keeping input order
+                while pending and pending[0].done():
+                    market_events, _, new_entry = pending.popleft().result()
+                    if new_entry is not None:
+                        new_entries.append(new_entry)
+                    yield from market_events
+                
+                self._save_market_catalog(new_entries)
+                new_entries = []
+                if remaining <= 0:
+                    break
+            
+            while pending:
+                market_events, _, new_entry = pending.popleft().result()
+                if new_entry is not None:
+                    new_entries.append(new_entry)
+                yield from market_events
+        finally:
+            self._save_market_catalog(new_entries)
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _paginate_markets(self, limit: int) -> Tuple[List, Optional[str]]:
+        """
+        Page through BINARY and CATEGORICAL markets, dropping resolved/closed ones.
+        
+        Returns:
+            Tuple of (active SDK market objects, last pagination error or None)
+        """
+        errors = []
+        all_markets = [market for page in self._iter_market_pages(limit, errors) for market in page]
+        return all_markets, (errors[-1] if errors else None)
+    
+    def _iter_market_pages(self, limit: int, errors: Optional[List[str]] = None):
+        """
+        Yield active SDK market objects page by page (BINARY first, then CATEGORICAL)
+        until at least `limit` markets were yielded or pages run out.
+        
+        Args:
+            limit: Target number of active markets (the last page may overshoot)
+            errors: Optional list that collects pagination error messages
+        """
+        collected = 0
+        batch_size = 20  # SDK enforces max 20 per request
+        
+        logger.info(f"[PAGINATION] Starting pagination: target={limit} markets, batch_size={batch_size}")
+        logger.info(f"[PAGINATION] Fetching BOTH binary and multi-choice markets for maximum coverage")
+        
+        # Fetch BOTH BINARY and CATEGORICAL markets to get 100-200+ markets
+        # Binary: Simple YES/NO markets (e.g., "Will BTC hit $100k?")
+        # Categorical: Markets with multiple options (e.g., "Fed Rate Dec" with 4 rate options)
+        for topic_type in [TopicType.BINARY, TopicType.CATEGORICAL]:
+            page = 1
+            topic_type_name = "BINARY" if topic_type == TopicType.BINARY else "CATEGORICAL"
+            logger.info(f"[PAGINATION] Fetching {topic_type_name} markets...")
+            
+            # Fetch markets in batches until we reach the limit or no more markets
+            topic_collected = 0
+            while collected < limit:
+                response = self._call_sdk(
+                    'market_data', 'get_markets',
+                    topic_type=topic_type,
+                    status=TopicStatusFilter.ALL,
+                    page=page,
+                    limit=batch_size
+                )
+                
+                logger.info(f"[PAGINATION] {topic_type_name} Page {page}: errno={response.errno}, has_result={hasattr(response, 'result')}")
+                
+                if response.errno != 0:
+                    logger.warning(f"[PAGINATION] {topic_type_name} error on page {page}: {response.errmsg}")
+                    if errors is not None:
+                        errors.append(response.errmsg)
+                    break
+                
+                markets = response.result.list
+                logger.info(f"[PAGINATION] {topic_type_name} Page {page} returned {len(markets)} markets")
+                
+                if not markets:
+                    # No more markets available
+                    logger.info(f"[PAGINATION] {topic_type_name} - No more markets found on page {page}, stopping")
+                    break
+                
+                # Filter out RESOLVED markets (we can only bet on active markets)
+                # Note: status is an enum, use getattr to get the name (e.g., "RESOLVED" instead of "TopicStatus.RESOLVED")
+                active_markets = [m for m in markets if getattr(m.status, "name", str(m.status)).upper() not in ['RESOLVED', 'CLOSED', 'CANCELLED']]
+                logger.info(f"[PAGINATION] {topic_type_name} Page {page}: {len(active_markets)}/{len(markets)} markets are active (filtered out resolved/closed)")
+                
+                collected += len(active_markets)
+                topic_collected += len(active_markets)
+                if active_markets:
+                    yield active_markets
+                
+                # If we got fewer than batch_size, we've reached the end
+                if len(markets) < batch_size:
+                    logger.info(f"[PAGINATION] {topic_type_name} - Got {len(markets)} < {batch_size}, reached end of markets")
+                    break
+                
+                # Stop if we've reached the limit
+                if collected >= limit:
+                    logger.info(f"[PAGINATION] {topic_type_name} - Reached target limit of {limit} markets")
+                    break
+                
+                page += 1
+            
+            logger.info(f"[PAGINATION] {topic_type_name} complete: collected {topic_collected} markets")
+    
+    def _load_market_catalog(self, market_ids: List[int]) -> Dict[int, Dict]:
+        """Load cached catalog entries for the given markets (empty without a database)."""
+        if self.database is None:
+            return {}
+        try:
+            return self.database.get_market_catalog_entries(market_ids)
+        except Exception as e:
+            logger.warning(f"[CATALOG] Could not load market catalog, fetching all details: {e}")
+            return {}
+    
+    def _save_market_catalog(self, entries: List[Dict]):
+        """Persist new or refreshed catalog entries (no-op without a database)."""
+        if self.database is None or not entries:
+            return
+        try:
+            self.database.save_market_catalog_entries(entries)
+        except Exception as e:
+            logger.warning(f"[CATALOG] Could not save {len(entries)} market catalog entries: {e}")
+    
+    def _get_catalog_entry(self, market_id) -> Optional[Dict]:
+        """Get the catalog entry for one market, or None if uncached or no database."""
+        if self.database is None:
+            return None
+        try:
+            return self.database.get_market_catalog_entry(market_id)
+        except Exception as e:
+            logger.warning(f"[CATALOG] Could not read catalog entry for market {market_id}: {e}")
+            return None
+    
+    @staticmethod
+    def _derive_category(title: str) -> str:
+        """Derive our category from a market title (comprehensive keyword matching)."""
+        title_lower = title.lower()
+        
+        # Crypto currencies
+        if any(keyword in title_lower for keyword in ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency']):
+            return 'Crypto'
+        
+        # Interest Rates & Monetary Policy
+        if any(keyword in title_lower for keyword in ['fomc', 'ecb', 'boj', 'fed', 'federal reserve', 'interest rate', 'rate decision', 'rates decision', 'monetary policy', 'central bank']):
+            return 'Rates'
+        
+        # Commodities
+        if any(keyword in title_lower for keyword in ['gold', 'comex', 'silver', 'oil', 'commodity', 'commodities', 'wti', 'brent']):
+            return 'Commodities'
+        
+        # Inflation & CPI
+        if any(keyword in title_lower for keyword in ['inflation', 'cpi', 'consumer price', 'pce', 'deflation']):
+            return 'Inflation'
+        
+        # Employment & Jobs
+        if any(keyword in title_lower for keyword in ['unemployment', 'jobs', 'payroll', 'employment', 'jobless', 'labor market']):
+            return 'Employment'
+        
+        # Stock Markets & Finance
+        if any(keyword in title_lower for keyword in ['stock', 'nasdaq', 's&p', 'dow', 'equity', 'market', 'shares']):
+            return 'Finance'
+        
+        # Politics & Elections
+        if any(keyword in title_lower for keyword in ['election', 'vote', 'president', 'congress', 'senate', 'political']):
+            return 'Politics'
+        
+        # Sports (filtered out later)
+        if any(keyword in title_lower for keyword in ['sports', 'nfl', 'nba', 'mlb', 'nhl', 'soccer', 'football', 'basketball']):
+            return 'Sports'
+        
+        # Fallback
+        return 'Other'
+    
+    def _convert_market(self, market, catalog_entry: Optional[Dict] = None) -> Tuple[List[Dict], int, Optional[Dict]]:
+        """
+        Convert one market to our event format, re-fetching details only when needed.
+        
+        Full details (client.get_market) are only fetched when the market is not in the
+        catalog yet or its status changed; the liquidity probe runs every cycle.
+        Safe to run from worker threads: it only reads shared state.
+        
+        Args:
+            market: SDK market object from get_markets()
+            catalog_entry: Cached catalog entry for this market, if any
+        
+        Returns:
+            Tuple of (events, number of skipped markets/options, new catalog entry or None if reused)
+        """
+        new_entry = None
+        
+        try:
+            if catalog_entry is None or catalog_entry.get('status') != str(market.status):
+                # Fetch full market details to get options/tokens
+                # NOTE: get_markets() returns markets WITHOUT options field
+                # We need to call get_market(id) for each market to get tokens
+                market_details_response = self._call_sdk('market_data', 'get_market', market.market_id)
+                
+                if market_details_response.errno != 0:
+                    logger.warning(f"[WARNING] Failed to get details for market {market.market_id}: {market_details_response.errmsg}")
+                    return [], 1, None
+                
+                new_entry = self._build_catalog_entry(market, market_details_response.result.data)
+                catalog_entry = new_entry
+            else:
+                logger.debug(f"[CATALOG] Reusing cached details for market {market.market_id}")
+            
+            if catalog_entry['skip_reason']:
+                logger.info(f"[FILTER] Skipping market '{market.market_title[:50]}...' - {catalog_entry['skip_reason']}")
+                return [], 1, new_entry
+            
+            # LIQUIDITY FILTER: Check if market has any orderbook activity
+            # Skip markets with ZERO liquidity across ALL options to avoid wasting AI API calls
+            probe_quotes = {}
+            if not self._has_any_liquidity(catalog_entry['liquidity_token_ids'], probe_quotes):
+                logger.info(f"[LIQUIDITY FILTER] Skipping market '{market.market_title[:50]}...' - no orderbook liquidity")
+                return [], 1, new_entry
+            
+            # Status and volume change between cycles; everything else comes from the catalog.
+            # liquidity_quote: YES quote seen by the probe, reused by the engine's pre-screen
+            # (the 30s liquidity snapshot has expired by the time pagination finishes)
+            events = []
+            for cached_event in catalog_entry['events']:
+                event = dict(cached_event)
+                event['status'] = str(market.status)
+                event['volume'] = getattr(market, 'volume', '0')
+                if event.get('yes_token_id') in probe_quotes:
+                    event['liquidity_quote'] = probe_quotes[event['yes_token_id']]
+                events.append(event)
+            
+            return events, catalog_entry['skipped_options'], new_entry
+        
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to convert market {getattr(market, 'market_id', 'unknown')}: {e}")
+            return [], 0, new_entry
+    
+    def _has_any_liquidity(self, token_ids: List[str], quotes: Optional[Dict[str, Dict]] = None) -> bool:
+        """
+        Check whether at least one of the given tokens has bids or asks.
+        
+        Orderbook failures count as liquid to avoid false negatives.
+        
+        Args:
+            token_ids: Tokens to probe, in order (stops at the first liquid one)
+            quotes: Filled with token_id -> get_latest_price()-style quote for every book fetched
+        """
+        for token_id in token_ids:
+            try:
+                orderbook_response = self.get_orderbook(token_id, call_site='liquidity')
+                if orderbook_response.get('success'):
+                    orderbook = orderbook_response.get('orderbook', {})
+                    if quotes is not None:
+                        quote = self._quote_from_orderbook(token_id, orderbook)
+                        quotes[token_id] = {key: value for key, value in quote.items() if key != 'data'}
+                    bids_count = len(orderbook.get('bids', []))
+                    asks_count = len(orderbook.get('asks', []))
+                    if bids_count > 0 or asks_count > 0:
+                        return True  # Found liquid option, market is tradeable
+                else:
+                    # If we can't fetch orderbook, assume it has liquidity
+                    return True
+            except Exception as liquidity_error:
+                # On error, assume liquidity exists to avoid false negatives
+                logger.warning(f"[LIQUIDITY FILTER] Could not check liquidity for token {token_id}: {liquidity_error}")
+                return True
+        
+        return False
+    
+    @staticmethod
+    def _market_details(market_full) -> Dict:
+        """
+        get_market_details() data for a client.get_market() result.
+        
+        JSON-serializable, so the market catalog stores it as is and cached and
+        fetched details share one schema.
+        """
+        title = getattr(market_full, 'market_title', getattr(market_full, 'marketTitle', None))
+        return {
+            'market_id': getattr(market_full, 'market_id', getattr(market_full, 'marketId', None)),
+            'title': title,
+            'description': getattr(market_full, 'marketDescription', None) or getattr(market_full, 'rules', None) or title,
+            'condition_id': getattr(market_full, 'condition_id', getattr(market_full, 'conditionId', None)),
+            'status': str(market_full.status),
+            'quote_token': getattr(market_full, 'quote_token', getattr(market_full, 'quoteToken', None)),
+            'chain_id': getattr(market_full, 'chain_id', getattr(market_full, 'chainId', None)),
+            'yes_token_id': getattr(market_full, 'yes_token_id', None),
+            'no_token_id': getattr(market_full, 'no_token_id', None),
+            'options': [
+                {
+                    'option_name': getattr(option, 'option_name', getattr(option, 'name', 'Unknown')),
+                    'yes_token_id': getattr(option, 'yes_token_id', None),
+                    'no_token_id': getattr(option, 'no_token_id', None)
+                }
+                for option in (getattr(market_full, 'options', None) or [])
+            ]
+        }
+    
+    def _build_catalog_entry(self, market, market_full) -> Dict:
+        """
+        Build the static (cacheable) part of a market's conversion from its full details.
+        
+        Returns:
+            Catalog entry with converted events, the tokens to probe for liquidity,
+            the count of skipped options and a skip_reason when the whole market is untradeable
+        """
+        # Determine market type (BINARY vs MULTIPLE_CHOICE)
+        market_type = getattr(market, 'topic_type', TopicType.BINARY)
+        topic_type_name = getattr(market_type, 'name', str(market_type)) if hasattr(market_type, 'name') else str(market_type)
+        category = self._derive_category(market.market_title)
+        
+        entry = {
+            'market_id': market.market_id,
+            'status': str(market.status),
+            'topic_type': topic_type_name,
+            'title': market.market_title,
+            'category': category,
+            'events': [],
+            'liquidity_token_ids': [],
+            'skipped_options': 0,
+            'skip_reason': None,
+            # Served by get_market_details() until the market's status changes
+            'details': self._market_details(market_full)
+        }
+        
+        # For CATEGORICAL markets, probe ALL options (must have at least 1 liquid option)
+        # For BINARY markets, probe the single yes_token_id
+        if hasattr(market_full, 'options') and market_full.options:
+            entry['liquidity_token_ids'] = [
+                getattr(option, 'yes_token_id', None) for option in market_full.options
+                if getattr(option, 'yes_token_id', None)
+            ]
+        else:
+            check_token_id = getattr(market_full, 'yes_token_id', None)
+            
+            # CRITICAL FIX: Skip markets without valid yes_token_id BEFORE checking liquidity
+            if not check_token_id:
+                entry['skip_reason'] = 'no yes_token_id (untradeable)'
+                return entry
+            
+            entry['liquidity_token_ids'] = [check_token_id]
+        
+        # Skip Sports category early - we don't want AI agents betting on sports
+        if category == 'Sports':
+            entry['skip_reason'] = 'Sports category'
+            return entry
+        
+        # Handle BINARY vs CATEGORICAL markets differently
+        if 'CATEGORICAL' in topic_type_name.upper():
+            # CATEGORICAL market: e.g., "Fed Rate Dec" with 4 options
+            # Each option is a separate YES/NO bet (e.g., "50+ bps decrease" → YES or NO)
+            options = getattr(market_full, 'options', [])
+            
+            if not options:
+                entry['skip_reason'] = 'CATEGORICAL market without options'
+                return entry
+            
+            logger.info(f"[CATEGORICAL] Market '{market.market_title[:40]}...' has {len(options)} options")
+            
+            # Create a separate event for each option
+            for option in options:
+                option_title = getattr(option, 'option_name', getattr(option, 'name', 'Unknown'))
+                yes_token_id = getattr(option, 'yes_token_id', None)
+                no_token_id = getattr(option, 'no_token_id', None)
+                
+                if not yes_token_id or not no_token_id:
+                    logger.warning(f"[WARNING] Option '{option_title}' missing tokens, skipping")
+                    entry['skipped_options'] += 1
+                    continue
+                
+                # Create event for this specific option
+                entry['events'].append({
+                    'event_id': f"{market.market_id}_{option_title.replace(' ', '_')}",
+                    'market_id': market.market_id,
+                    'title': f"{market.market_title} → {option_title}",
+                    'description': f"Option: {option_title} | {market.rules if hasattr(market, 'rules') and market.rules else market.market_title}",
+                    'category': category,
+                    'condition_id': market.condition_id,
+                    'status': str(market.status),
+                    'quote_token': market.quote_token,
+                    'chain_id': market.chain_id,
+                    'yes_label': f"YES ({option_title})",
+                    'no_label': f"NO ({option_title})",
+                    'yes_token_id': yes_token_id,
+                    'no_token_id': no_token_id,
+                    'volume': getattr(market, 'volume', '0'),
+                    'created_at': getattr(market, 'created_at', 0),
+                    'cutoff_at': getattr(market, 'cutoff_at', 0)
+                })
+        else:
+            # BINARY market: Simple YES/NO (e.g., "Will BTC hit $100k?")
+            # Opinion.trade SDK stores tokens as direct attributes
+            yes_token_id = getattr(market_full, 'yes_token_id', None)
+            no_token_id = getattr(market_full, 'no_token_id', None)
+            yes_label = getattr(market_full, 'yes_label', 'YES')
+            no_label = getattr(market_full, 'no_label', 'NO')
+            
+            # Skip markets without binary YES/NO tokens
+            if not yes_token_id or not no_token_id:
+                entry['skip_reason'] = 'missing binary tokens'
+                return entry
+            
+            entry['events'].append({
+                'event_id': str(market.market_id),
+                'market_id': market.market_id,
+                'title': market.market_title,
+                'description': market.rules if hasattr(market, 'rules') and market.rules else market.market_title,
+                'category': category,
+                'condition_id': market.condition_id,
+                'status': str(market.status),
+                'quote_token': market.quote_token,
+                'chain_id': market.chain_id,
+                'yes_label': yes_label,
+                'no_label': no_label,
+                'yes_token_id': yes_token_id,
+                'no_token_id': no_token_id,
+                'volume': getattr(market, 'volume', '0'),
+                'created_at': getattr(market, 'created_at', 0),
+                'cutoff_at': getattr(market, 'cutoff_at', 0)
+            })
+        
+        return entry
+    
     def submit_prediction(self, prediction_data: Dict) -> Dict:
         """
         Submit a prediction to Opinion.trade by placing a limit order.
@@ -541,12 +964,20 @@ class OpinionTradeAPI:
             # CRITICAL: Get REAL market price from orderbook, NOT AI probability
             # AI probability is used to DECIDE if we should bet, but ORDER price comes from market
             # Retry logic with exponential backoff for price fetch
+            # One fresh book per order: the best prices and the depth walk below both read it
             price_response = None
+            orderbook = {}
             for attempt in range(3):
-                price_response = self.get_latest_price(token_id)
+                # Order price must come from a fresh book, never a cached snapshot
+                price_response = self.get_orderbook(token_id, call_site='order', fresh=True)
+                if price_response.get('success'):
+                    orderbook = price_response.get('orderbook', {})
+                    price_response = self._quote_from_orderbook(token_id, orderbook)
                 if price_response.get('success'):
                     break
                 logger.warning(f"[PRICE RETRY] Attempt {attempt + 1}/3 failed for token {token_id}: {price_response.get('error')}")
+                if 'market_data' in self.get_open_circuits():
+                    break  # Circuit open: further attempts would fail immediately
                 if attempt < 2:
                     import time
                     time.sleep(0.5 * (attempt + 1))  # 0.5s, 1s backoff
@@ -565,15 +996,27 @@ class OpinionTradeAPI:
             bid_price = price_response.get('bid_price')
             mid_price = price_response.get('price')  # midpoint or last trade
             
+            # Walk the book for the full order size: the limit must reach the deepest level
+            # the order consumes, and the VWAP is what we actually expect to pay/receive
+            fill_estimate = self._fill_from_orderbook(token_id, orderbook, amount, side_str)
+            if fill_estimate.get('success'):
+                logger.info(f"[FILL ESTIMATE] token {token_id}: {amount} USDT {side_str} → VWAP {fill_estimate['vwap']:.4f}, worst level {fill_estimate['worst_price']:.4f}, slippage {fill_estimate['slippage_pct']:.2%} over {fill_estimate['levels_consumed']} levels")
+                if not fill_estimate['fully_filled']:
+                    logger.warning(f"[FILL ESTIMATE] Book only covers {fill_estimate['filled_usdt']:.2f}/{amount} USDT, remainder will rest on the book")
+            
             # Determine execution price with fallbacks:
             # 1. For BUY: prefer ASK, fallback to MID, then BID + spread
             # 2. For SELL: prefer BID, fallback to MID, then ASK - spread
             MIN_PRICE = 0.001  # Minimum valid price (Opinion.trade requirement)
             MAX_PRICE = 0.999  # Maximum valid price (to avoid rounding to 1.000 with 3 decimals)
             BUFFER = 0.01  # 1% buffer for immediate execution
+            # No buffer when the limit already sits at the deepest level the order consumes
+            buffer = 0.0 if fill_estimate.get('fully_filled') else BUFFER
             
             if side_str == 'BUY':
-                if ask_price is not None and ask_price > 0:
+                if fill_estimate.get('success'):
+                    market_price = max(fill_estimate['worst_price'], ask_price or 0)
+                elif ask_price is not None and ask_price > 0:
                     market_price = ask_price
                 elif mid_price is not None and mid_price > 0:
                     logger.warning(f"[PRICE FALLBACK] ASK missing for token {token_id}, using MID: {mid_price}")
@@ -590,10 +1033,12 @@ class OpinionTradeAPI:
                     }
                 # Apply buffer and clamp to valid range [0.001, 0.999]
                 # MAX_PRICE is 0.999 to prevent rounding to 1.000 with 3 decimal formatting
-                execution_price = min(market_price * (1 + BUFFER), MAX_PRICE)
+                execution_price = min(market_price * (1 + buffer), MAX_PRICE)
                 execution_price = max(execution_price, MIN_PRICE)
             else:  # SELL
-                if bid_price is not None and bid_price > 0:
+                if fill_estimate.get('success'):
+                    market_price = min(fill_estimate['worst_price'], bid_price or fill_estimate['worst_price'])
+                elif bid_price is not None and bid_price > 0:
                     market_price = bid_price
                 elif mid_price is not None and mid_price > 0:
                     logger.warning(f"[PRICE FALLBACK] BID missing for token {token_id}, using MID: {mid_price}")
@@ -609,7 +1054,7 @@ class OpinionTradeAPI:
                         'message': f"ASK={ask_price}, BID={bid_price}, MID={mid_price} all invalid"
                     }
                 # Apply buffer and clamp to valid range [0.001, 0.999]
-                execution_price = max(market_price * (1 - BUFFER), MIN_PRICE)
+                execution_price = max(market_price * (1 - buffer), MIN_PRICE)
                 execution_price = min(execution_price, MAX_PRICE)
             
             # CRITICAL: Format price as string with exactly 3 decimals (Opinion.trade SDK requirement)
@@ -646,12 +1091,16 @@ class OpinionTradeAPI:
                 makerAmountInQuoteToken=amount_num  # Amount in USDT as float/int
             )
             
-            # Place order with check_approval=True to ensure trading permissions are enabled
-            logger.info(f"[ORDER DEBUG] Placing order: market_id={market_id}, token_id={token_id}, price={price}, amount={amount_num} USDT, side={side_str}")
-            result = self.client.place_order(order_data, check_approval=True)
+            # check_approval=True makes the SDK read allowances on chain; skip it while the
+            # persisted approval state is fresh (an approval error invalidates it below)
+            check_approval = not self._trading_enabled_cached()
+            logger.info(f"[ORDER DEBUG] Placing order: market_id={market_id}, token_id={token_id}, price={price}, amount={amount_num} USDT, side={side_str}, check_approval={check_approval}")
+            result = self._call_sdk('orders', 'place_order', order_data, check_approval=check_approval)
             
             # Check if order was successful
             if hasattr(result, 'errno') and result.errno == 0:
+                if check_approval:
+                    self._record_trading_enabled('place_order')
                 order_info = result.result if hasattr(result, 'result') else {}
                 logger.info(f"[ORDER SUCCESS] Order placed: orderId={getattr(order_info, 'orderId', 'unknown')}")
                 return {
@@ -664,6 +1113,8 @@ class OpinionTradeAPI:
                         'price': price,
                         'amount': amount,
                         'side': side_str,
+                        'expected_fill_price': fill_estimate.get('vwap'),
+                        'expected_slippage_pct': fill_estimate.get('slippage_pct'),
                         'timestamp': datetime.now().isoformat(),
                         'metadata': prediction_data.get('metadata', {})
                     }
@@ -672,6 +1123,7 @@ class OpinionTradeAPI:
                 error_msg = getattr(result, 'errmsg', str(result))
                 error_code = getattr(result, 'errno', 'unknown')
                 logger.error(f"[ORDER FAILED] Opinion.trade SDK Error: errno={error_code}, errmsg={error_msg}")
+                self._invalidate_on_approval_error(str(error_msg))
                 logger.error(f"[ORDER FAILED] Full result object: {result}")
                 return {
                     'success': False,
@@ -683,6 +1135,7 @@ class OpinionTradeAPI:
             import traceback
             error_trace = traceback.format_exc()
             logger.error(f"[ORDER EXCEPTION] Failed to place order: {str(e)}")
+            self._invalidate_on_approval_error(str(e))
             logger.error(f"[ORDER EXCEPTION] Full traceback:\n{error_trace}")
             return {
                 'success': False,
@@ -704,7 +1157,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            balances_response = self.client.get_my_balances()
+            balances_response = self._call_sdk('account', 'get_my_balances')
             
             if balances_response.errno == 0:
                 balances = balances_response.result.list
@@ -767,7 +1220,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            positions_response = self.client.get_my_positions(limit=100)
+            positions_response = self._call_sdk('account', 'get_my_positions', limit=100)
             
             if positions_response.errno == 0:
                 positions = positions_response.result.list
@@ -818,6 +1271,15 @@ class OpinionTradeAPI:
         Returns:
             Market details or error dictionary
         """
+        # Static details: served from the market catalog, which get_available_events()
+        # refreshes when a market's status changes
+        catalog_entry = self._get_catalog_entry(market_id)
+        if catalog_entry and catalog_entry.get('details'):
+            return {
+                'success': True,
+                'data': catalog_entry['details']
+            }
+        
         if not self.client:
             return {
                 'success': False,
@@ -825,22 +1287,12 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.get_market(market_id)
+            response = self._call_sdk('market_data', 'get_market', market_id)
             
             if response.errno == 0:
-                market = response.result.data
                 return {
                     'success': True,
-                    'data': {
-                        'market_id': market.marketId,
-                        'title': market.marketTitle,
-                        'description': getattr(market, 'marketDescription', ''),
-                        'condition_id': market.conditionId,
-                        'status': market.status,
-                        'quote_token': market.quoteToken,
-                        'chain_id': market.chainId,
-                        'options': getattr(market, 'options', [])
-                    }
+                    'data': self._market_details(response.result.data)
                 }
             else:
                 return {
@@ -856,12 +1308,17 @@ class OpinionTradeAPI:
                 'message': str(e)
             }
     
-    def get_orderbook(self, token_id: str) -> Dict:
+    def get_orderbook(self, token_id: str, call_site: str = 'default', fresh: bool = False) -> Dict:
         """
         Get orderbook for a specific outcome token.
         
+        Snapshots are cached per token with a TTL that depends on call_site, and
+        concurrent requests for the same token share a single SDK call.
+        
         Args:
             token_id: The outcome token ID
+            call_site: Caller name selecting the cache TTL ('liquidity', 'evaluation', 'monitor', 'order', ...)
+            fresh: Bypass cached snapshots (used for order placement)
         
         Returns:
             Orderbook data or error dictionary
@@ -872,8 +1329,25 @@ class OpinionTradeAPI:
                 'error': 'Opinion.trade client not initialized'
             }
         
+        return self._orderbook_cache.get(
+            token_id,
+            lambda: self._fetch_orderbook(token_id),
+            call_site=call_site,
+            fresh=fresh
+        )
+    
+    def get_orderbook_cache_stats(self) -> Dict:
+        """Hit/miss/coalesced counters of the orderbook cache."""
+        return self._orderbook_cache.get_stats()
+    
+    def reset_orderbook_cache_stats(self):
+        """Reset orderbook cache counters (called at the start of each cycle)."""
+        self._orderbook_cache.reset_stats()
+    
+    def _fetch_orderbook(self, token_id: str) -> Dict:
+        """Fetch and normalize an orderbook from the SDK (uncached)."""
         try:
-            response = self.client.get_orderbook(token_id)
+            response = self._call_sdk('market_data', 'get_orderbook', token_id)
             
             # DEBUG: Log raw response to understand SDK structure
             logger.info(f"[ORDERBOOK DEBUG] token_id={token_id[:20]}... | errno={response.errno} | has_result={hasattr(response, 'result')}")
@@ -1076,7 +1550,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.get_fee_rates()
+            response = self._call_sdk('market_data', 'get_fee_rates')
             
             if response.errno == 0:
                 fees = response.result.data
@@ -1141,7 +1615,66 @@ class OpinionTradeAPI:
             logger.warning(f"_extract_price: Could not extract price from {type(order_entry)}: {e}")
             return 0.0
     
-    def get_latest_price(self, token_id: str) -> Dict:
+    def _quote_from_orderbook(self, token_id: str, orderbook: Dict) -> Dict:
+        """
+        get_latest_price() response (mid, bid and ask prices) from an orderbook already fetched.
+        """
+        best_bid = orderbook.get('best_bid')
+        best_ask = orderbook.get('best_ask')
+        
+        # Calculate mid-price from best bid/ask (handle both dict and object)
+        if best_bid and best_ask:
+            bid_price = self._extract_price(best_bid)
+            ask_price = self._extract_price(best_ask)
+            
+            if bid_price > 0 and ask_price > 0:
+                mid_price = (bid_price + ask_price) / 2.0
+                logger.info(f"get_latest_price: token_id={token_id}, bid={bid_price}, ask={ask_price}, mid={mid_price}")
+                return {
+                    'success': True,
+                    'price': mid_price,
+                    'bid_price': bid_price,
+                    'ask_price': ask_price,
+                    'spread': ask_price - bid_price,
+                    'timestamp': int(datetime.now().timestamp()),
+                    'data': {'source': 'orderbook', 'bid': best_bid, 'ask': best_ask}
+                }
+        
+        # Fallback: if only bid or only ask available
+        if best_bid:
+            bid_price = self._extract_price(best_bid)
+            if bid_price > 0:
+                logger.info(f"get_latest_price: token_id={token_id}, using bid_price={bid_price} (no ask available)")
+                return {
+                    'success': True,
+                    'price': bid_price,
+                    'bid_price': bid_price,
+                    'timestamp': int(datetime.now().timestamp()),
+                    'data': {'source': 'orderbook_bid_only', 'bid': best_bid}
+                }
+        
+        if best_ask:
+            ask_price = self._extract_price(best_ask)
+            if ask_price > 0:
+                logger.info(f"get_latest_price: token_id={token_id}, using ask_price={ask_price} (no bid available)")
+                return {
+                    'success': True,
+                    'price': ask_price,
+                    'ask_price': ask_price,
+                    'timestamp': int(datetime.now().timestamp()),
+                    'data': {'source': 'orderbook_ask_only', 'ask': best_ask}
+                }
+        
+        # No valid prices found
+        logger.warning(f"get_latest_price: token_id={token_id} - No valid bid/ask prices in orderbook")
+        return {
+            'success': False,
+            'error': 'No market price available',
+            'message': 'Orderbook has no valid bid or ask prices',
+            'token_id': token_id
+        }
+    
+    def get_latest_price(self, token_id: str, call_site: str = 'default', fresh: bool = False) -> Dict:
         """
         Get the latest price for a specific outcome token.
         
@@ -1151,6 +1684,8 @@ class OpinionTradeAPI:
         
         Args:
             token_id: The outcome token ID
+            call_site: Passed to get_orderbook() to select the snapshot cache TTL
+            fresh: Bypass cached orderbook snapshots
         
         Returns:
             Latest price data or error dictionary
@@ -1163,7 +1698,7 @@ class OpinionTradeAPI:
         
         try:
             # WORKAROUND: Use orderbook instead of buggy get_latest_price SDK method
-            orderbook_response = self.get_orderbook(token_id)
+            orderbook_response = self.get_orderbook(token_id, call_site=call_site, fresh=fresh)
             
             if not orderbook_response.get('success'):
                 logger.warning(f"get_latest_price: orderbook fetch failed for token_id={token_id}: {orderbook_response.get('message', 'Unknown error')}")
@@ -1174,70 +1709,68 @@ class OpinionTradeAPI:
                     'token_id': token_id
                 }
             
-            orderbook = orderbook_response.get('orderbook', {})
-            best_bid = orderbook.get('best_bid')
-            best_ask = orderbook.get('best_ask')
-            
-            # Calculate mid-price from best bid/ask (handle both dict and object)
-            if best_bid and best_ask:
-                bid_price = self._extract_price(best_bid)
-                ask_price = self._extract_price(best_ask)
-                
-                if bid_price > 0 and ask_price > 0:
-                    mid_price = (bid_price + ask_price) / 2.0
-                    logger.info(f"get_latest_price: token_id={token_id}, bid={bid_price}, ask={ask_price}, mid={mid_price}")
-                    return {
-                        'success': True,
-                        'price': mid_price,
-                        'bid_price': bid_price,
-                        'ask_price': ask_price,
-                        'spread': ask_price - bid_price,
-                        'timestamp': int(datetime.now().timestamp()),
-                        'data': {'source': 'orderbook', 'bid': best_bid, 'ask': best_ask}
-                    }
-            
-            # Fallback: if only bid or only ask available
-            if best_bid:
-                bid_price = self._extract_price(best_bid)
-                if bid_price > 0:
-                    logger.info(f"get_latest_price: token_id={token_id}, using bid_price={bid_price} (no ask available)")
-                    return {
-                        'success': True,
-                        'price': bid_price,
-                        'bid_price': bid_price,
-                        'timestamp': int(datetime.now().timestamp()),
-                        'data': {'source': 'orderbook_bid_only', 'bid': best_bid}
-                    }
-            
-            if best_ask:
-                ask_price = self._extract_price(best_ask)
-                if ask_price > 0:
-                    logger.info(f"get_latest_price: token_id={token_id}, using ask_price={ask_price} (no bid available)")
-                    return {
-                        'success': True,
-                        'price': ask_price,
-                        'ask_price': ask_price,
-                        'timestamp': int(datetime.now().timestamp()),
-                        'data': {'source': 'orderbook_ask_only', 'ask': best_ask}
-                    }
-            
-            # No valid prices found
-            logger.warning(f"get_latest_price: token_id={token_id} - No valid bid/ask prices in orderbook")
+            return self._quote_from_orderbook(token_id, orderbook_response.get('orderbook', {}))
+        
+        except Exception as e:
+            logger.error(f"get_latest_price exception for token_id={token_id}: {str(e)}")
             return {
                 'success': False,
-                'error': 'No market price available',
-                'message': 'Orderbook has no valid bid or ask prices',
+                'error': 'Unexpected error',
+                'message': str(e),
                 'token_id': token_id
             }
+    
+    def estimate_fill(self, token_id: str, usdt_amount: float, side: str = 'BUY',
+                      call_site: str = 'default', fresh: bool = False) -> Dict:
+        """
+        Estimate the fill of an order of usdt_amount against the orderbook depth.
         
+        Args:
+            token_id: The outcome token ID
+            usdt_amount: Order size in USDT
+            side: 'BUY' walks the asks, 'SELL' walks the bids
+            call_site: Passed to get_orderbook() to select the snapshot cache TTL
+            fresh: Bypass cached orderbook snapshots
+        
+        Returns:
+            Dictionary with success status and the DepthBook fill estimate
+            (vwap, worst_price, slippage, fully_filled, ...)
+        """
+        orderbook_response = self.get_orderbook(token_id, call_site=call_site, fresh=fresh)
+        if not orderbook_response.get('success'):
+            return {
+                'success': False,
+                'error': orderbook_response.get('error', 'Orderbook fetch failed'),
+                'message': orderbook_response.get('message', 'Could not fetch orderbook'),
+                'token_id': token_id
+            }
+        
+        return self._fill_from_orderbook(token_id, orderbook_response.get('orderbook', {}), usdt_amount, side)
+    
+    def _fill_from_orderbook(self, token_id: str, orderbook: Dict, usdt_amount: float, side: str = 'BUY') -> Dict:
+        """
+        estimate_fill() response (DepthBook fill estimate) from an orderbook already fetched.
+        """
+        try:
+            fill = DepthBook.from_orderbook(orderbook).estimate_fill(usdt_amount, side)
         except Exception as e:
-            logger.error(f"get_latest_price exception for token_id={token_id}: {str(e)}")
+            logger.error(f"estimate_fill exception for token_id={token_id}: {str(e)}")
             return {
                 'success': False,
                 'error': 'Unexpected error',
                 'message': str(e),
                 'token_id': token_id
             }
+        
+        if fill is None:
+            return {
+                'success': False,
+                'error': 'No liquidity',
+                'message': f"Orderbook has no {'asks' if side.upper() == 'BUY' else 'bids'} to fill against",
+                'token_id': token_id
+            }
+        
+        return {'success': True, 'token_id': token_id, 'side': side.upper(), **fill}
     
     def get_my_orders(self, market_id: Optional[int] = None) -> Dict:
         """
@@ -1256,7 +1789,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.get_my_orders()
+            response = self._call_sdk('account', 'get_my_orders')
             
             if response.errno == 0:
                 orders = response.result.list
@@ -1315,21 +1848,22 @@ class OpinionTradeAPI:
             }
         
         try:
-            # Get market details to get token IDs
+            # Get market details to get token IDs (served from the catalog when cached)
             market_response = self.get_market_details(market_id)
             if not market_response.get('success'):
                 return market_response
             
-            options = market_response['data'].get('options', [])
-            if not options:
+            market_data = market_response['data']
+            options = market_data.get('options', [])
+            if not options and not market_data.get('yes_token_id'):
                 return {
                     'success': False,
                     'error': 'No options found',
                     'message': 'Market has no outcome tokens'
                 }
             
-            # Get price history for first token (YES token typically)
-            token_id = getattr(options[0], 'token_id', None) if options else None
+            # Get price history for the YES token (the first option's for categorical markets)
+            token_id = market_data.get('yes_token_id') or options[0].get('yes_token_id')
             if not token_id:
                 return {
                     'success': False,
@@ -1337,7 +1871,7 @@ class OpinionTradeAPI:
                     'message': 'Could not extract token ID from market options'
                 }
             
-            response = self.client.get_price_history(token_id)
+            response = self._call_sdk('market_data', 'get_price_history', token_id)
             
             if response.errno == 0:
                 history = response.result.list
@@ -1389,7 +1923,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.get_my_trades(limit=limit)
+            response = self._call_sdk('account', 'get_my_trades', limit=limit)
             
             if response.errno == 0:
                 trades = response.result.list
@@ -1450,7 +1984,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.redeem(token_ids)
+            response = self._call_sdk('orders', 'redeem', token_ids)
             
             if response.errno == 0:
                 return {
@@ -1489,7 +2023,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.cancel_order(order_id)
+            response = self._call_sdk('orders', 'cancel_order', order_id)
             
             if response.errno == 0:
                 return {
@@ -1528,7 +2062,7 @@ class OpinionTradeAPI:
             }
         
         try:
-            response = self.client.cancel_all_orders()
+            response = self._call_sdk('orders', 'cancel_all_orders')
             
             if response.errno == 0:
                 cancelled_count = getattr(response.result, 'cancelledCount', 0)
@@ -0,0 +1,168 @@
+"""
+Orderbook Snapshot Cache
+========================
+Short-TTL cache for normalized orderbook responses, keyed by token_id.
+
+Each call site (liquidity filter, firm evaluation, order monitor, ...) gets its own
+TTL so stale-tolerant readers can share a snapshot while order placement can
+always demand a fresh book. Concurrent requests for the same token are coalesced
+into a single SDK call (single-flight).
+
+TTLs can be overridden with ORDERBOOK_CACHE_TTLS, e.g. "liquidity=60,evaluation=20,monitor=0".
+A TTL of 0 disables caching for that call site (requests are still coalesced).
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_CALL_SITE_TTLS = {
+    'default': 5.0,
+    'liquidity': 30.0,    # get_available_events liquidity filter
+    'evaluation': 20.0,   # get_latest_price during firm evaluation (5 firms per event)
+    'monitor': 10.0,      # OrderMonitor price checks
+    'order': 0.0,         # order placement always refetches
+}
+
+
+def parse_ttls(raw: str) -> Dict[str, float]:
+    """Parse "site=seconds,site=seconds" into a dict, ignoring malformed pairs."""
+    ttls = {}
+    for pair in raw.split(','):
+        if '=' not in pair:
+            continue
+        site, _, seconds = pair.partition('=')
+        try:
+            ttls[site.strip()] = max(0.0, float(seconds))
+        except ValueError:
+            continue
+    return ttls
+
+
+class _InFlight:
+    """A fetch in progress that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+
+
+class OrderbookCache:
+    """
+    Thread-safe per-token orderbook cache with per-call-site TTLs and request coalescing.
+    Only successful responses are cached; failures are always retried by the next caller.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 2000):
+        """
+        Args:
+            ttls: Per-call-site TTL overrides in seconds (merged over DEFAULT_CALL_SITE_TTLS)
+            max_entries: Max cached tokens before the oldest snapshots are evicted
+        """
+        self.ttls = dict(DEFAULT_CALL_SITE_TTLS)
+        self.ttls.update(parse_ttls(os.environ.get('ORDERBOOK_CACHE_TTLS', '')))
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}  # token_id -> (fetched_at, response)
+        self._inflight: Dict[str, _InFlight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, call_site: str) -> float:
+        return self.ttls.get(call_site, self.ttls['default'])
+
+    def get(self, token_id: str, fetch: Callable[[], Dict], call_site: str = 'default',
+            fresh: bool = False) -> Dict:
+        """
+        Return the orderbook response for token_id, calling fetch() only when needed.
+
+        Args:
+            token_id: Outcome token ID
+            fetch: Zero-arg callable performing the real SDK request
+            call_site: Name used to pick the TTL and attribute hit/miss counters
+            fresh: Ignore any cached snapshot (a request already in flight is still joined)
+        """
+        ttl = self.ttl_for(call_site)
+
+        with self._lock:
+            stats = self._stats.setdefault(call_site, {'hits': 0, 'misses': 0, 'coalesced': 0})
+
+            cached = self._entries.get(token_id)
+            if not fresh and cached and ttl > 0 and time.monotonic() - cached[0] < ttl:
+                stats['hits'] += 1
+                return dict(cached[1])
+
+            inflight = self._inflight.get(token_id)
+            if inflight is not None:
+                stats['coalesced'] += 1
+                is_leader = False
+            else:
+                inflight = _InFlight()
+                self._inflight[token_id] = inflight
+                stats['misses'] += 1
+                is_leader = True
+
+        if not is_leader:
+            inflight.done.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return dict(inflight.result)
+
+        try:
+            inflight.result = fetch()
+            return dict(inflight.result)
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(token_id, None)
+                if inflight.result is not None and inflight.result.get('success'):
+                    self._entries[token_id] = (time.monotonic(), inflight.result)
+                    self._evict_if_needed()
+            inflight.done.set()
+
+    def _evict_if_needed(self):
+        """Drop the oldest snapshots once max_entries is exceeded (caller holds the lock)."""
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self._entries.items(), key=lambda item: item[1][0])[:overflow]
+        for token_id, _ in oldest:
+            del self._entries[token_id]
+
+    def invalidate(self, token_id: Optional[str] = None):
+        """Forget one token's snapshot, or all snapshots when token_id is None."""
+        with self._lock:
+            if token_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(token_id, None)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def get_stats(self) -> Dict:
+        """Hit/miss/coalesced counters per call site plus totals."""
+        with self._lock:
+            by_call_site = {site: dict(counts) for site, counts in self._stats.items()}
+            entries = len(self._entries)
+
+        totals = {'hits': 0, 'misses': 0, 'coalesced': 0}
+        for counts in by_call_site.values():
+            for key in totals:
+                totals[key] += counts[key]
+        requests = sum(totals.values())
+
+        return {
+            **totals,
+            'hit_rate': round((totals['hits'] + totals['coalesced']) / requests, 3) if requests else 0.0,
+            'entries': entries,
+            'by_call_site': by_call_site
+        }
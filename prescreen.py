@@ -0,0 +1,130 @@
+"""
+Pre-Screen
+==========
+Cheap checks that drop events before any firm spends an LLM call on them.
+
+Every candidate event used to reach the LLM, including markets already priced at
+0.01/0.99, markets whose cutoff is minutes away, and books whose spread leaves no
+edge after the taker fee. The pre-screen looks at the event's own fields and its
+YES quote, as captured by the liquidity probe in get_available_events. It returns a
+score and, for rejected events, the reason:
+
+    no_quote            no bid/ask on the YES token (evaluation would skip it after the LLM call)
+    price_at_bound      mid price outside [PRESCREEN_MIN_PRICE, PRESCREEN_MAX_PRICE]
+    closing_soon        cutoff_at within PRESCREEN_MIN_SECONDS_TO_CUTOFF
+    low_volume          volume below PRESCREEN_MIN_VOLUME
+    wide_spread         bid/ask spread above PRESCREEN_MAX_SPREAD
+    no_edge_after_fee   even a certain outcome cannot beat the ask on either side after the fee
+
+The score is the best edge per share that a firm could still find. The engine's EV
+model charges the taker fee on winnings only, so buying at ask p with probability q
+nets q * (1 - fee) - p, which is at most (1 - fee) - p. The NO ask is taken as
+1 - YES bid.
+
+Configuration:
+    PRESCREEN_ENABLED                "false" to send every candidate to the firms
+    PRESCREEN_MIN_PRICE              Lowest mid price kept (default: 0.02)
+    PRESCREEN_MAX_PRICE              Highest mid price kept (default: 0.98)
+    PRESCREEN_MAX_SPREAD             Widest bid/ask spread kept (default: 0.2)
+    PRESCREEN_MIN_SECONDS_TO_CUTOFF  Seconds before cutoff_at below which events are dropped (default: 3600)
+    PRESCREEN_MIN_VOLUME             Minimum market volume (default: 0, disabled)
+"""
+
+import os
+import time
+from typing import Dict, Optional
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def cutoff_seconds(cutoff_at) -> Optional[float]:
+    """cutoff_at as epoch seconds (the API may send milliseconds), None when unknown."""
+    cutoff = _to_float(cutoff_at)
+    if cutoff <= 0:
+        return None
+    return cutoff / 1000.0 if cutoff > 1e12 else cutoff
+
+
+class PreScreen:
+    """Stateless per-event filter; the engine runs it once per event and cycle."""
+
+    def __init__(self, min_price: float = 0.02, max_price: float = 0.98, max_spread: float = 0.2,
+                 min_seconds_to_cutoff: float = 3600.0, min_volume: float = 0.0):
+        self.min_price = min_price
+        self.max_price = max_price
+        self.max_spread = max_spread
+        self.min_seconds_to_cutoff = min_seconds_to_cutoff
+        self.min_volume = min_volume
+
+    @classmethod
+    def from_env(cls) -> 'PreScreen':
+        return cls(
+            min_price=float(os.environ.get('PRESCREEN_MIN_PRICE', '0.02')),
+            max_price=float(os.environ.get('PRESCREEN_MAX_PRICE', '0.98')),
+            max_spread=float(os.environ.get('PRESCREEN_MAX_SPREAD', '0.2')),
+            min_seconds_to_cutoff=float(os.environ.get('PRESCREEN_MIN_SECONDS_TO_CUTOFF', '3600')),
+            min_volume=float(os.environ.get('PRESCREEN_MIN_VOLUME', '0'))
+        )
+
+    def screen(self, event: Dict, quote: Dict, taker_fee: float, now: Optional[float] = None) -> Dict:
+        """
+        Args:
+            event: Event from get_available_events()
+            quote: get_latest_price() response for the event's YES token
+            taker_fee: Taker fee rate (get_fee_rates)
+            now: Epoch seconds (default: time.time())
+
+        Returns:
+            Dict with event_id, passed, reason (None when passed), score, mid and spread
+        """
+        now = time.time() if now is None else now
+        result = {
+            'event_id': event.get('event_id', event.get('id')),
+            'passed': False,
+            'reason': None,
+            'score': 0.0,
+            'mid': None,
+            'spread': None,
+        }
+
+        cutoff = cutoff_seconds(event.get('cutoff_at'))
+        if cutoff is not None and cutoff - now < self.min_seconds_to_cutoff:
+            result['reason'] = 'closing_soon'
+            return result
+
+        if self.min_volume > 0 and _to_float(event.get('volume')) < self.min_volume:
+            result['reason'] = 'low_volume'
+            return result
+
+        if not quote.get('success') or not quote.get('price'):
+            result['reason'] = 'no_quote'
+            return result
+
+        bid = quote.get('bid_price')
+        ask = quote.get('ask_price')
+        result['mid'] = mid = quote['price']
+        if not self.min_price <= mid <= self.max_price:
+            result['reason'] = 'price_at_bound'
+            return result
+
+        if bid and ask:
+            result['spread'] = round(ask - bid, 4)
+            if ask - bid > self.max_spread:
+                result['reason'] = 'wide_spread'
+                return result
+
+        # One-sided books: assume the missing side sits at the quoted price
+        yes_ask = ask or mid
+        no_ask = 1.0 - (bid or mid)
+        result['score'] = score = round((1.0 - taker_fee) - min(yes_ask, no_ask), 4)
+        if score <= 0:
+            result['reason'] = 'no_edge_after_fee'
+            return result
+
+        result['passed'] = True
+        return result
@@ -0,0 +1,193 @@
+"""
+Shared Rate Limiter
+===================
+Token-bucket rate limiter for Opinion.trade calls, shared across processes.
+
+Gunicorn workers, cron-triggered endpoints and scripts each build their own
+OpinionTradeAPI. Bucket state lives in a small SQLite file, so they all draw from
+the same buckets. Each bucket is an endpoint class (market_data, orders, account)
+with a refill rate (calls/second) and a burst size.
+
+A caller reserves a token inside a BEGIN IMMEDIATE transaction. If the bucket is
+empty, the balance goes negative and the caller sleeps until its reserved slot
+comes due. Callers are therefore spaced out instead of hammering the API and
+backing off on errors.
+
+Configuration:
+    OPINION_RATE_LIMITS      "market_data=8:16,orders=2:4,account=2:4" (rate:burst per bucket)
+    RATE_LIMIT_DB            SQLite file path (default: rate_limits.db)
+    RATE_LIMIT_MAX_WAIT      Max seconds a caller may queue before failing (default: 30)
+    RATE_LIMIT_ENABLED       "false" to disable
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_LIMITS = {
+    'market_data': (8.0, 16.0),
+    'orders': (2.0, 4.0),
+    'account': (2.0, 4.0),
+}
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call would have to queue longer than max_wait."""
+
+
+def parse_limits(raw: str) -> Dict[str, Tuple[float, float]]:
+    """Parse "bucket=rate:burst,..." into {bucket: (rate, burst)}, ignoring malformed entries."""
+    limits = {}
+    for pair in raw.split(','):
+        if '=' not in pair:
+            continue
+        bucket, _, spec = pair.partition('=')
+        rate, _, burst = spec.partition(':')
+        try:
+            rate = float(rate)
+            burst = float(burst) if burst else max(1.0, rate)
+        except ValueError:
+            continue
+        if rate > 0 and burst >= 1:
+            limits[bucket.strip()] = (rate, burst)
+    return limits
+
+
+class SharedRateLimiter:
+    """
+    Cross-process token buckets backed by SQLite.
+    Wait-time metrics are kept per process and per bucket.
+    """
+
+    def __init__(self, db_path: str = 'rate_limits.db', limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 max_wait: float = 30.0):
+        """
+        Args:
+            db_path: SQLite file shared by every process using the limiter
+            limits: {bucket: (refill rate per second, burst size)}
+            max_wait: Max seconds a caller may queue before RateLimitExceeded
+        """
+        self.db_path = db_path
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.max_wait = max_wait
+
+        self._local = threading.local()
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+        with self._connection() as conn:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+            bucket TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+            )
+            ''')
+
+    @classmethod
+    def from_env(cls) -> 'SharedRateLimiter':
+        return cls(
+            db_path=os.environ.get('RATE_LIMIT_DB', 'rate_limits.db'),
+            limits=parse_limits(os.environ.get('OPINION_RATE_LIMITS', '')),
+            max_wait=float(os.environ.get('RATE_LIMIT_MAX_WAIT', '30'))
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Thread-local autocommit connection (transactions are managed explicitly)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA busy_timeout = 30000')
+            self._local.conn = conn
+        return conn
+
+    def _reserve(self, bucket: str, rate: float, burst: float) -> float:
+        """Reserve one token and return how long the caller must wait for it (0 if available)."""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            row = conn.execute('SELECT tokens, updated_at FROM rate_limit_buckets WHERE bucket = ?', (bucket,)).fetchone()
+            tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if wait > self.max_wait:
+                conn.execute('ROLLBACK')
+                raise RateLimitExceeded(f"{bucket}: queue wait {wait:.1f}s exceeds max {self.max_wait:.1f}s")
+
+            conn.execute('''
+            INSERT INTO rate_limit_buckets (bucket, tokens, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(bucket) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at
+            ''', (bucket, tokens - 1, now))
+            conn.execute('COMMIT')
+            return wait
+        except RateLimitExceeded:
+            raise
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def acquire(self, bucket: str) -> float:
+        """
+        Block until a call in this bucket is allowed.
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        limit = self.limits.get(bucket)
+        if limit is None:
+            return 0.0
+
+        wait = self._reserve(bucket, *limit)
+        if wait > 0:
+            time.sleep(wait)
+        self._record(bucket, wait)
+        return wait
+
+    def _record(self, bucket: str, wait: float):
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(bucket, {'calls': 0, 'queued': 0, 'total_wait': 0.0, 'max_wait': 0.0})
+            metrics['calls'] += 1
+            if wait > 0:
+                metrics['queued'] += 1
+                metrics['total_wait'] += wait
+                metrics['max_wait'] = max(metrics['max_wait'], wait)
+
+    def get_metrics(self) -> Dict:
+        """Queue wait metrics per bucket for this process."""
+        with self._metrics_lock:
+            return {
+                bucket: {
+                    'calls': int(m['calls']),
+                    'queued': int(m['queued']),
+                    'total_wait_seconds': round(m['total_wait'], 3),
+                    'avg_wait_seconds': round(m['total_wait'] / m['calls'], 4) if m['calls'] else 0.0,
+                    'max_wait_seconds': round(m['max_wait'], 3),
+                }
+                for bucket, m in self._metrics.items()
+            }
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            self._metrics = {}
+
+
+_limiter: Optional[SharedRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[SharedRateLimiter]:
+    """Process-wide limiter, or None when RATE_LIMIT_ENABLED=false."""
+    global _limiter
+    if os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'false':
+        return None
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = SharedRateLimiter.from_env()
+        return _limiter
@@ -21,7 +21,7 @@ class ReconciliationEngine:
     
     def __init__(self, database: TradingDatabase):
         self.db = database
-        self.opinion_api = OpinionTradeAPI()
+        self.opinion_api = OpinionTradeAPI(database=database)
     
     def run_full_reconciliation(self) -> Dict:
         """
@@ -0,0 +1,256 @@
+"""
+BNB Chain RPC Endpoint Pool
+===========================
+Health-scored pool of BNB Chain RPC endpoints with automatic failover.
+
+Candidates come from BNB_RPC_URL (preferred), BNB_RPC_URLS (comma-separated) and a
+list of public fallbacks. Each endpoint keeps a rolling window of latencies and
+outcomes; endpoints are ranked by error rate, then latency, and failing endpoints
+are put on an exponential cooldown.
+
+PooledHTTPProvider is a web3 HTTPProvider that sends every JSON-RPC call to the
+healthiest endpoint and fails over to the next one within the same request, so a
+slow or blocked RPC no longer stalls enable_trading, approvals or redemption.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from web3 import HTTPProvider
+
+from logger import autonomous_logger as logger
+
+
+DEFAULT_BNB_RPCS = [
+    'https://rpc.ankr.com/bsc',  # Ankr - generally reliable from EU
+    'https://bsc-dataseed1.defibit.io/',  # DeFiBit - alternative
+    'https://bsc-dataseed.binance.org/',  # Binance official - may be blocked in some regions
+    'https://bsc-rpc.publicnode.com',  # PublicNode
+]
+
+BNB_CHAIN_ID = 56
+
+
+class RpcEndpointStats:
+    """Rolling health statistics for one RPC endpoint."""
+
+    WINDOW = 20
+    MAX_COOLDOWN_SECONDS = 300.0
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latencies = deque(maxlen=self.WINDOW)
+        self.outcomes = deque(maxlen=self.WINDOW)  # True = success
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_error: Optional[str] = None
+        self.last_used_at: Optional[float] = None
+
+    def record_success(self, latency: float):
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_used_at = time.time()
+
+    def record_failure(self, error: str):
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        self.last_error = error
+        self.last_used_at = time.time()
+        # 5s, 10s, 20s ... capped at MAX_COOLDOWN_SECONDS
+        cooldown = min(5.0 * 2 ** (self.consecutive_failures - 1), self.MAX_COOLDOWN_SECONDS)
+        self.cooldown_until = time.monotonic() + cooldown
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def avg_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return sum(self.latencies) / len(self.latencies)
+
+    def in_cooldown(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def sort_key(self):
+        # Untested endpoints rank after measured healthy ones but before failing ones
+        latency = self.avg_latency if self.avg_latency is not None else 10.0
+        return (self.in_cooldown(), round(self.error_rate, 2), latency)
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'error_rate': round(self.error_rate, 3),
+            'avg_latency_ms': round(self.avg_latency * 1000, 1) if self.avg_latency is not None else None,
+            'samples': len(self.outcomes),
+            'consecutive_failures': self.consecutive_failures,
+            'in_cooldown': self.in_cooldown(),
+            'last_error': self.last_error,
+        }
+
+
+class RpcEndpointPool:
+    """Thread-safe pool of RPC endpoints ranked by rolling health."""
+
+    def __init__(self, urls: List[str], chain_id: int = BNB_CHAIN_ID,
+                 probe_timeout: float = 5.0, reprobe_interval: float = 300.0):
+        """
+        Args:
+            urls: Candidate endpoints in preference order (duplicates ignored)
+            chain_id: Expected eth_chainId of every endpoint
+            probe_timeout: Timeout in seconds for probes and pooled requests
+            reprobe_interval: Seconds after which the whole pool is probed again (lazily)
+        """
+        urls = [u.strip() for u in dict.fromkeys(urls) if u and u.strip()]
+        if not urls:
+            raise ValueError('RpcEndpointPool needs at least one endpoint')
+        self.chain_id = chain_id
+        self.probe_timeout = probe_timeout
+        self.reprobe_interval = reprobe_interval
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, RpcEndpointStats] = {url: RpcEndpointStats(url) for url in urls}
+        self._order = urls
+        self._last_probe_at: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> 'RpcEndpointPool':
+        """Build the pool from BNB_RPC_URL, BNB_RPC_URLS and the public defaults."""
+        urls = []
+        custom_rpc = os.environ.get('BNB_RPC_URL', '').strip()
+        if custom_rpc:
+            urls.append(custom_rpc)
+        urls.extend(u.strip() for u in os.environ.get('BNB_RPC_URLS', '').split(',') if u.strip())
+        urls.extend(DEFAULT_BNB_RPCS)
+        return cls(urls, probe_timeout=float(os.environ.get('BNB_RPC_TIMEOUT', '5')))
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._order)
+
+    def probe(self, url: str) -> bool:
+        """Call eth_chainId on one endpoint and record the outcome."""
+        payload = {'jsonrpc': '2.0', 'method': 'eth_chainId', 'params': [], 'id': 1}
+        started = time.monotonic()
+        try:
+            response = requests.post(url, json=payload, timeout=self.probe_timeout)
+            response.raise_for_status()
+            chain_id = int(response.json()['result'], 16)
+            if chain_id != self.chain_id:
+                raise ValueError(f"wrong chain id {chain_id} (expected {self.chain_id})")
+        except Exception as e:
+            self.record_failure(url, f"probe failed: {e}")
+            return False
+        self.record_success(url, time.monotonic() - started)
+        return True
+
+    def probe_all(self) -> Dict[str, bool]:
+        """Probe every endpoint concurrently."""
+        with ThreadPoolExecutor(max_workers=len(self._order), thread_name_prefix='rpc-probe') as executor:
+            results = dict(zip(self._order, executor.map(self.probe, self._order)))
+        with self._lock:
+            self._last_probe_at = time.monotonic()
+        healthy = [url for url, ok in results.items() if ok]
+        logger.info(f"Probed {len(results)} endpoints, {len(healthy)} healthy", prefix="RPC POOL")
+        return results
+
+    def ensure_probed(self):
+        """Probe the pool if it has never been probed or the last probe is stale."""
+        with self._lock:
+            stale = self._last_probe_at is None or time.monotonic() - self._last_probe_at > self.reprobe_interval
+        if stale:
+            self.probe_all()
+
+    def ranked(self) -> List[str]:
+        """Endpoints from healthiest to least healthy (stable on ties)."""
+        with self._lock:
+            return sorted(self._order, key=lambda url: self._endpoints[url].sort_key())
+
+    def best(self) -> str:
+        self.ensure_probed()
+        return self.ranked()[0]
+
+    def record_success(self, url: str, latency: float):
+        with self._lock:
+            if url in self._endpoints:
+                self._endpoints[url].record_success(latency)
+
+    def record_failure(self, url: str, error: str):
+        with self._lock:
+            if url in self._endpoints:
+                self._endpoints[url].record_failure(error)
+
+    def snapshot(self) -> Dict:
+        """Pool state for the admin endpoint."""
+        ranked = self.ranked()
+        with self._lock:
+            endpoints = [self._endpoints[url].to_dict() for url in ranked]
+            last_probe_age = time.monotonic() - self._last_probe_at if self._last_probe_at is not None else None
+        return {
+            'best': ranked[0],
+            'chain_id': self.chain_id,
+            'last_probe_seconds_ago': round(last_probe_age, 1) if last_probe_age is not None else None,
+            'endpoints': endpoints,
+        }
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    web3 HTTPProvider that routes each JSON-RPC request to the healthiest endpoint
+    of an RpcEndpointPool and fails over to the next one on error.
+
+    Each endpoint has its own HTTPProvider, so concurrent requests never share a
+    mutable endpoint_uri: a call is sent to, and charged to, the endpoint it picked.
+    """
+
+    def __init__(self, pool: RpcEndpointPool, **kwargs):
+        self.pool = pool
+        kwargs.setdefault('request_kwargs', {'timeout': pool.probe_timeout})
+        # Failover replaces web3's own retry-with-sleep on the same endpoint
+        kwargs.setdefault('exception_retry_configuration', None)
+        super().__init__(pool.ranked()[0], **kwargs)
+        self._providers: Dict[str, HTTPProvider] = {url: HTTPProvider(url, **kwargs) for url in pool.urls}
+
+    def _with_failover(self, method: str, send):
+        """Call send(provider) on each endpoint from healthiest to least healthy until one succeeds."""
+        last_error = None
+        for url in self.pool.ranked():
+            started = time.monotonic()
+            try:
+                result = send(self._providers[url])
+            except Exception as e:
+                self.pool.record_failure(url, f"{method}: {e}")
+                logger.warning(f"{method} failed on {url}, failing over: {e}", prefix="RPC POOL")
+                last_error = e
+                continue
+            self.pool.record_success(url, time.monotonic() - started)
+            return result
+        raise last_error
+
+    def _make_request(self, method, request_data: bytes) -> bytes:
+        return self._with_failover(method, lambda provider: provider._make_request(method, request_data))
+
+    def make_batch_request(self, batch_requests):
+        return self._with_failover('batch', lambda provider: provider.make_batch_request(batch_requests))
+
+
+_pool: Optional[RpcEndpointPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_rpc_pool() -> RpcEndpointPool:
+    """Process-wide pool shared by every OpinionTradeAPI instance."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RpcEndpointPool.from_env()
+        return _pool
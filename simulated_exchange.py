@@ -0,0 +1,606 @@
+"""
+Simulated Opinion.trade Exchange
+================================
+In-process stand-in for the opinion_clob_sdk Client, for offline cycles.
+
+SimulatedExchange answers the same SDK calls OpinionTradeAPI makes (get_markets,
+get_market, get_orderbook, place_order, get_my_balances, get_my_positions, ...)
+with the same response shapes (errno/errmsg/result.list/result.data, amounts in
+wei), backed by:
+
+- synthetic BINARY and CATEGORICAL markets (seeded, deterministic)
+- per-token limit orderbooks quoted by a synthetic market maker around a hidden
+  "true" probability
+- price-time priority matching: marketable orders sweep the opposite side,
+  the remainder rests on the book
+- USDT balance, positions, trades and market resolution with redemption
+
+Enable it with OPINION_SIMULATED_EXCHANGE=true (no credentials or network needed),
+or pass client=SimulatedExchange(...) to OpinionTradeAPI. advance() moves the
+simulated clock, re-quotes the market maker and matches resting orders;
+resolve_market() settles a market.
+
+Configuration:
+    OPINION_SIMULATED_EXCHANGE   "true" to use the simulator in OpinionTradeAPI
+    SIM_EXCHANGE_SEED            Random seed (default: 42)
+    SIM_EXCHANGE_BALANCE         Starting USDT balance (default: 1000)
+    SIM_EXCHANGE_START_TIME      Simulated clock start in unix seconds (default: now)
+"""
+
+import os
+import random
+import threading
+import time
+from itertools import count
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from opinion_clob_sdk.model import TopicStatus, TopicStatusFilter, TopicType
+from opinion_clob_sdk.chain.py_order_utils.model.sides import OrderSide
+
+
+WEI = 10 ** 18
+MAKER = 'market_maker'
+ME = 'me'
+
+ERR_NOT_FOUND = 10404
+ERR_INVALID = 10400
+ERR_INSUFFICIENT_BALANCE = 10601
+ERR_MARKET_CLOSED = 10603
+
+BINARY_TITLES = [
+    "Will Bitcoin close above $100k this month?",
+    "Will the Fed cut interest rates at the next FOMC meeting?",
+    "Will gold trade above $2,500 by Friday?",
+    "Will US CPI inflation come in below 3%?",
+    "Will the unemployment rate rise next month?",
+    "Will the S&P 500 close the week higher?",
+    "Will Ethereum outperform Bitcoin this week?",
+    "Will WTI oil close above $80?",
+    "Will the Senate pass the budget bill this month?",
+    "Will the ECB hold rates in December?",
+    "Will Nasdaq hit a new all-time high this month?",
+    "Will silver close above $30?",
+]
+
+CATEGORICAL_TITLES = [
+    ("Fed rate decision in December", ["50+ bps decrease", "25 bps decrease", "No change", "Increase"]),
+    ("Bitcoin price range on Dec 31", ["Below $80k", "$80k-$100k", "$100k-$120k", "Above $120k"]),
+    ("US CPI YoY next release", ["Below 2.5%", "2.5%-3.0%", "Above 3.0%"]),
+    ("Presidential election approval poll leader", ["Candidate A", "Candidate B", "Candidate C"]),
+]
+
+
+def _response(result=None, errno: int = 0, errmsg: str = '') -> SimpleNamespace:
+    return SimpleNamespace(errno=errno, errmsg=errmsg, result=result)
+
+
+def _error(errno: int, errmsg: str) -> SimpleNamespace:
+    return _response(None, errno, errmsg)
+
+
+class _Order:
+    """A resting or filled limit order on one token's book."""
+
+    def __init__(self, order_id: str, owner: str, market_id: int, token_id: str,
+                 side: OrderSide, price: float, shares: float, created_at: int):
+        self.order_id = order_id
+        self.owner = owner
+        self.market_id = market_id
+        self.token_id = token_id
+        self.side = side
+        self.price = price
+        self.shares = shares
+        self.filled_shares = 0.0
+        self.created_at = created_at
+        self.status = 'open'
+        self.resting = False  # True once on the book (BUY reservations are locked)
+
+    @property
+    def remaining(self) -> float:
+        return self.shares - self.filled_shares
+
+
+class SimulatedExchange:
+    """Deterministic in-memory exchange implementing the SDK Client methods the bot uses."""
+
+    def __init__(self, seed: int = 42, starting_balance: float = 1000.0,
+                 num_binary: Optional[int] = None, num_categorical: Optional[int] = None,
+                 maker_fee_bps: int = 0, taker_fee_bps: int = 200, start_time: Optional[int] = None):
+        """
+        Args:
+            seed: Random seed for markets, quotes and price moves
+            starting_balance: Our USDT balance
+            num_binary: Number of BINARY markets (default: all built-in titles)
+            num_categorical: Number of CATEGORICAL markets (default: all built-in titles)
+            maker_fee_bps / taker_fee_bps: Fee rates reported by get_fee_rates (taker fee is
+                charged on redemption payouts, like Opinion.trade)
+            start_time: Simulated clock start (unix seconds, default: now). The engine's
+                pre-screen and scheduler compare cutoff_at with the wall clock, so a clock
+                in the past would reject every market as closing soon
+        """
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._ids = count(1)
+        self.now = int(time.time()) if start_time is None else start_time
+        self.maker_fee_bps = maker_fee_bps
+        self.taker_fee_bps = taker_fee_bps
+
+        self.balance = float(starting_balance)
+        self.locked = 0.0  # USDT reserved by our resting BUY orders
+        self.positions: Dict[str, float] = {}  # token_id -> shares
+        self.trades: List[SimpleNamespace] = []
+        self.price_history: Dict[str, List[SimpleNamespace]] = {}
+
+        self.markets: Dict[int, Dict] = {}
+        self.tokens: Dict[str, Dict] = {}  # token_id -> {'market_id', 'outcome', 'fair'}
+        self.books: Dict[str, Dict[str, List[_Order]]] = {}
+        self.orders: Dict[str, _Order] = {}
+
+        binary_titles = BINARY_TITLES[:num_binary] if num_binary is not None else BINARY_TITLES
+        categorical = CATEGORICAL_TITLES[:num_categorical] if num_categorical is not None else CATEGORICAL_TITLES
+        for title in binary_titles:
+            self._create_market(title, None)
+        for title, options in categorical:
+            self._create_market(title, options)
+
+    @classmethod
+    def from_env(cls) -> 'SimulatedExchange':
+        return cls(
+            seed=int(os.environ.get('SIM_EXCHANGE_SEED', '42')),
+            starting_balance=float(os.environ.get('SIM_EXCHANGE_BALANCE', '1000')),
+            start_time=int(os.environ['SIM_EXCHANGE_START_TIME']) if os.environ.get('SIM_EXCHANGE_START_TIME') else None
+        )
+
+    # ------------------------------------------------------------------
+    # Market setup and market maker
+    # ------------------------------------------------------------------
+
+    def _create_market(self, title: str, options: Optional[List[str]]):
+        market_id = 1000 + len(self.markets) + 1
+        market = {
+            'market_id': market_id,
+            'title': title,
+            'topic_type': TopicType.CATEGORICAL if options else TopicType.BINARY,
+            'status': TopicStatus.ACTIVATED,
+            'rules': f"Resolves per official sources. {title}",
+            'created_at': self.now,
+            'cutoff_at': self.now + 30 * 86400,
+            'volume': 0.0,
+            'options': [],
+            'winner': None,
+        }
+
+        if options:
+            weights = [self._rng.random() + 0.2 for _ in options]
+            total = sum(weights)
+            for index, name in enumerate(options):
+                fair = min(max(weights[index] / total, 0.03), 0.97)
+                yes_id, no_id = self._create_token_pair(market_id, f"o{index}", fair)
+                market['options'].append({'option_name': name, 'yes_token_id': yes_id, 'no_token_id': no_id})
+        else:
+            fair = self._rng.uniform(0.1, 0.9)
+            market['yes_token_id'], market['no_token_id'] = self._create_token_pair(market_id, 'b', fair)
+
+        self.markets[market_id] = market
+
+    def _create_token_pair(self, market_id: int, key: str, fair_yes: float):
+        yes_id = f"sim-{market_id}-{key}-yes"
+        no_id = f"sim-{market_id}-{key}-no"
+        self.tokens[yes_id] = {'market_id': market_id, 'outcome': 'YES', 'fair': fair_yes, 'pair': no_id}
+        self.tokens[no_id] = {'market_id': market_id, 'outcome': 'NO', 'fair': 1 - fair_yes, 'pair': yes_id}
+        for token_id in (yes_id, no_id):
+            self.books[token_id] = {'bids': [], 'asks': []}
+            self.price_history[token_id] = []
+            self._quote(token_id)
+        return yes_id, no_id
+
+    def _quote(self, token_id: str):
+        """Replace the market maker's ladder on a token: 5 levels per side around fair value."""
+        book = self.books[token_id]
+        for side in ('bids', 'asks'):
+            for order in book[side]:
+                if order.owner == MAKER:
+                    order.status = 'cancelled'
+            book[side] = [o for o in book[side] if o.owner != MAKER]
+
+        fair = self.tokens[token_id]['fair']
+        half_spread = 0.01 + self._rng.random() * 0.01
+        for level in range(5):
+            offset = half_spread + level * 0.01
+            size = round(self._rng.uniform(20, 200) * (level + 1), 2)
+            bid_price = round(fair - offset, 3)
+            ask_price = round(fair + offset, 3)
+            if bid_price >= 0.001:
+                self._rest(_Order(self._next_id(), MAKER, self.tokens[token_id]['market_id'], token_id,
+                                  OrderSide.BUY, bid_price, size, self.now))
+            if ask_price <= 0.999:
+                self._rest(_Order(self._next_id(), MAKER, self.tokens[token_id]['market_id'], token_id,
+                                  OrderSide.SELL, ask_price, size, self.now))
+        self.price_history[token_id].append(SimpleNamespace(timestamp=self.now, price=str(round(fair, 4)), volume='0'))
+
+    def _next_id(self) -> str:
+        return f"sim-order-{next(self._ids)}"
+
+    def _rest(self, order: _Order):
+        book = self.books[order.token_id]
+        if order.side == OrderSide.BUY:
+            book['bids'].append(order)
+            book['bids'].sort(key=lambda o: (-o.price, o.created_at))
+        else:
+            book['asks'].append(order)
+            book['asks'].sort(key=lambda o: (o.price, o.created_at))
+        self.orders[order.order_id] = order
+        order.resting = True
+
+    def advance(self, seconds: int = 3600, volatility: float = 0.02):
+        """
+        Move the simulated clock: fair values random-walk, the market maker re-quotes
+        and our resting orders that became marketable are filled.
+        """
+        with self._lock:
+            self.now += seconds
+            for market in self.markets.values():
+                if market['status'] != TopicStatus.ACTIVATED:
+                    continue
+                for yes_id in self._yes_tokens(market):
+                    token = self.tokens[yes_id]
+                    token['fair'] = min(max(token['fair'] + self._rng.gauss(0, volatility), 0.02), 0.98)
+                    self.tokens[token['pair']]['fair'] = 1 - token['fair']
+                    self._quote(yes_id)
+                    self._quote(token['pair'])
+            for order in [o for o in self.orders.values() if o.owner == ME and o.status == 'open']:
+                self._match_resting(order)
+
+    @staticmethod
+    def _yes_tokens(market: Dict) -> List[str]:
+        if market['options']:
+            return [option['yes_token_id'] for option in market['options']]
+        return [market['yes_token_id']]
+
+    # ------------------------------------------------------------------
+    # Matching engine
+    # ------------------------------------------------------------------
+
+    def _match(self, order: _Order, usdt_budget: Optional[float] = None):
+        """Sweep the opposite side at maker prices (price-time priority)."""
+        book = self.books[order.token_id]
+        opposite = book['asks'] if order.side == OrderSide.BUY else book['bids']
+        for maker in list(opposite):
+            # A BUY with a USDT budget is limited by what it can afford, not by a share count
+            if usdt_budget is None and order.remaining <= 1e-9:
+                break
+            crosses = maker.price <= order.price if order.side == OrderSide.BUY else maker.price >= order.price
+            if not crosses:
+                break
+            if maker.owner == order.owner:
+                continue  # No self-trades
+            if usdt_budget is not None:
+                shares = min(maker.remaining, usdt_budget / maker.price)
+                usdt_budget -= shares * maker.price
+            else:
+                shares = min(order.remaining, maker.remaining)
+            if shares <= 1e-9:
+                break
+            self._fill(order, maker, shares, maker.price)
+            if maker.remaining <= 1e-9:
+                maker.status = 'filled'
+                opposite.remove(maker)
+        return usdt_budget
+
+    def _fill(self, taker: _Order, maker: _Order, shares: float, price: float):
+        taker.filled_shares += shares
+        maker.filled_shares += shares
+        notional = shares * price
+        market = self.markets[taker.market_id]
+        market['volume'] += notional
+
+        for order in (taker, maker):
+            if order.owner != ME:
+                continue
+            if order.side == OrderSide.BUY:
+                if order.resting:
+                    # Release the reservation made at the order's limit price
+                    self.locked -= shares * order.price
+                self.balance -= notional
+                self.positions[order.token_id] = self.positions.get(order.token_id, 0.0) + shares
+            else:
+                self.positions[order.token_id] = self.positions.get(order.token_id, 0.0) - shares
+                self.balance += notional
+            self.trades.append(SimpleNamespace(
+                tradeId=f"sim-trade-{next(self._ids)}",
+                orderId=order.order_id,
+                marketId=order.market_id,
+                tokenId=order.token_id,
+                side=order.side.name,
+                price=str(price),
+                amount=str(int(notional * WEI)),
+                fee='0',
+                timestamp=self.now,
+                status='filled'
+            ))
+        self.price_history[taker.token_id].append(
+            SimpleNamespace(timestamp=self.now, price=str(price), volume=str(int(notional * WEI)))
+        )
+
+    def _match_resting(self, order: _Order):
+        book = self.books[order.token_id]
+        own_side = book['bids'] if order.side == OrderSide.BUY else book['asks']
+        if order in own_side:
+            own_side.remove(order)
+        self._match(order)
+        if order.remaining <= 1e-9:
+            order.status = 'filled'
+        else:
+            own_side.append(order)
+            own_side.sort(key=(lambda o: (-o.price, o.created_at)) if order.side == OrderSide.BUY
+                          else (lambda o: (o.price, o.created_at)))
+
+    # ------------------------------------------------------------------
+    # SDK Client: market data
+    # ------------------------------------------------------------------
+
+    def get_markets(self, topic_type=TopicType.ALL, status=TopicStatusFilter.ALL, page: int = 1, limit: int = 20, **kwargs):
+        with self._lock:
+            markets = list(self.markets.values())
+            if topic_type not in (None, TopicType.ALL):
+                markets = [m for m in markets if m['topic_type'] == topic_type]
+            if status == TopicStatusFilter.ACTIVATED:
+                markets = [m for m in markets if m['status'] == TopicStatus.ACTIVATED]
+            elif status == TopicStatusFilter.RESOLVED:
+                markets = [m for m in markets if m['status'] == TopicStatus.RESOLVED]
+            start = (max(page, 1) - 1) * limit
+            return _response(SimpleNamespace(list=[self._market_summary(m) for m in markets[start:start + limit]],
+                                             total=len(markets)))
+
+    def _market_summary(self, market: Dict) -> SimpleNamespace:
+        return SimpleNamespace(
+            market_id=market['market_id'],
+            market_title=market['title'],
+            status=market['status'],
+            topic_type=market['topic_type'],
+            rules=market['rules'],
+            condition_id=f"0xsimcondition{market['market_id']}",
+            quote_token='0xsimusdt',
+            chain_id='56',
+            volume=str(round(market['volume'], 2)),
+            created_at=market['created_at'],
+            cutoff_at=market['cutoff_at']
+        )
+
+    def get_market(self, market_id, **kwargs):
+        with self._lock:
+            market = self.markets.get(int(market_id))
+            if market is None:
+                return _error(ERR_NOT_FOUND, f"market {market_id} not found")
+            if market['options']:
+                data = SimpleNamespace(
+                    options=[SimpleNamespace(**option) for option in market['options']],
+                    yes_token_id=None, no_token_id=None, yes_label=None, no_label=None
+                )
+            else:
+                data = SimpleNamespace(options=None, yes_token_id=market['yes_token_id'], no_token_id=market['no_token_id'],
+                                       yes_label='YES', no_label='NO')
+            for key, value in vars(self._market_summary(market)).items():
+                setattr(data, key, value)
+            return _response(SimpleNamespace(data=data))
+
+    def get_orderbook(self, token_id):
+        with self._lock:
+            book = self.books.get(token_id)
+            if book is None:
+                return _error(ERR_NOT_FOUND, f"token {token_id} not found")
+            return _response(SimpleNamespace(
+                bids=[{'price': str(o.price), 'size': str(round(o.remaining, 6))} for o in book['bids']],
+                asks=[{'price': str(o.price), 'size': str(round(o.remaining, 6))} for o in book['asks']]
+            ))
+
+    def get_fee_rates(self, **kwargs):
+        return _response(SimpleNamespace(data=SimpleNamespace(makerFee=self.maker_fee_bps, takerFee=self.taker_fee_bps)))
+
+    def get_price_history(self, token_id, **kwargs):
+        with self._lock:
+            if token_id not in self.price_history:
+                return _error(ERR_NOT_FOUND, f"token {token_id} not found")
+            return _response(SimpleNamespace(list=list(self.price_history[token_id])))
+
+    # ------------------------------------------------------------------
+    # SDK Client: trading
+    # ------------------------------------------------------------------
+
+    def enable_trading(self, **kwargs):
+        return _response(SimpleNamespace(enabled=True))
+
+    def place_order(self, order_data, check_approval: bool = False, **kwargs):
+        with self._lock:
+            token = self.tokens.get(str(order_data.tokenId))
+            if token is None or token['market_id'] != int(order_data.marketId):
+                return _error(ERR_NOT_FOUND, f"token {order_data.tokenId} not in market {order_data.marketId}")
+            if self.markets[token['market_id']]['status'] != TopicStatus.ACTIVATED:
+                return _error(ERR_MARKET_CLOSED, f"market {order_data.marketId} is not active")
+            try:
+                price = float(order_data.price)
+            except (TypeError, ValueError):
+                return _error(ERR_INVALID, f"invalid price {order_data.price!r}")
+            if not 0 < price < 1:
+                return _error(ERR_INVALID, f"price {price} outside (0, 1)")
+
+            side = OrderSide(int(order_data.side))
+            usdt = getattr(order_data, 'makerAmountInQuoteToken', None)
+            base = getattr(order_data, 'makerAmountInBaseToken', None)
+            if side == OrderSide.BUY:
+                usdt = float(usdt or 0)
+                if usdt <= 0:
+                    return _error(ERR_INVALID, 'makerAmountInQuoteToken must be positive')
+                if usdt > self.available_balance + 1e-9:
+                    return _error(ERR_INSUFFICIENT_BALANCE, f"insufficient balance: {self.available_balance:.2f} < {usdt:.2f}")
+                shares = usdt / price
+            else:
+                shares = float(base) if base else float(usdt or 0) / price
+                if shares <= 0 or shares > self.positions.get(str(order_data.tokenId), 0.0) + 1e-9:
+                    return _error(ERR_INSUFFICIENT_BALANCE, 'insufficient position to sell')
+
+            order = _Order(self._next_id(), ME, token['market_id'], str(order_data.tokenId), side, price, shares, self.now)
+            self.orders[order.order_id] = order
+            leftover_budget = self._match(order, usdt_budget=usdt if side == OrderSide.BUY else None)
+
+            if side == OrderSide.BUY and leftover_budget is not None:
+                # Spending is capped by the USDT amount, so the share count is what was affordable
+                order.shares = order.filled_shares + leftover_budget / price
+            if order.remaining <= 1e-9:
+                order.status = 'filled'
+            else:
+                if side == OrderSide.BUY:
+                    self.locked += order.remaining * price
+                self._rest(order)
+
+            return _response(SimpleNamespace(orderId=order.order_id, status=order.status,
+                                             filledShares=order.filled_shares))
+
+    def cancel_order(self, order_id, **kwargs):
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None or order.owner != ME:
+                return _error(ERR_NOT_FOUND, f"order {order_id} not found")
+            if order.status != 'open':
+                return _error(ERR_INVALID, f"order {order_id} is {order.status}")
+            self._cancel(order)
+            return _response(SimpleNamespace(orderId=order_id, status='cancelled'))
+
+    def cancel_all_orders(self, **kwargs):
+        with self._lock:
+            open_orders = [o for o in self.orders.values() if o.owner == ME and o.status == 'open']
+            for order in open_orders:
+                self._cancel(order)
+            return _response(SimpleNamespace(cancelledCount=len(open_orders)))
+
+    def _cancel(self, order: _Order):
+        book = self.books[order.token_id]
+        side = book['bids'] if order.side == OrderSide.BUY else book['asks']
+        if order in side:
+            side.remove(order)
+        if order.side == OrderSide.BUY:
+            self.locked -= order.remaining * order.price
+        order.status = 'cancelled'
+
+    def redeem(self, token_ids, **kwargs):
+        """Pay 1 USDT per winning share (minus the taker fee); losing shares are burned."""
+        with self._lock:
+            payout = 0.0
+            for token_id in token_ids:
+                token = self.tokens.get(token_id)
+                if token is None:
+                    return _error(ERR_NOT_FOUND, f"token {token_id} not found")
+                if self.markets[token['market_id']]['status'] != TopicStatus.RESOLVED:
+                    return _error(ERR_INVALID, f"market {token['market_id']} is not resolved")
+                shares = self.positions.pop(token_id, 0.0)
+                if token.get('won'):
+                    payout += shares * (1 - self.taker_fee_bps / 10000)
+            self.balance += payout
+            return _response(SimpleNamespace(redeemed=list(token_ids), payout=str(int(payout * WEI))))
+
+    def resolve_market(self, market_id: int, winner: Optional[str] = None):
+        """
+        Resolve a market. winner is 'YES'/'NO' for BINARY markets or an option name for
+        CATEGORICAL ones; by default it is drawn from the current fair values.
+        Our resting orders in the market are cancelled.
+        """
+        with self._lock:
+            market = self.markets[market_id]
+            if market['options']:
+                names = [option['option_name'] for option in market['options']]
+                if winner is None:
+                    fairs = [self.tokens[option['yes_token_id']]['fair'] for option in market['options']]
+                    winner = self._rng.choices(names, weights=fairs)[0]
+                if winner not in names:
+                    raise ValueError(f"unknown option {winner!r}")
+                for option in market['options']:
+                    won = option['option_name'] == winner
+                    self.tokens[option['yes_token_id']]['won'] = won
+                    self.tokens[option['no_token_id']]['won'] = not won
+            else:
+                if winner is None:
+                    winner = 'YES' if self._rng.random() < self.tokens[market['yes_token_id']]['fair'] else 'NO'
+                self.tokens[market['yes_token_id']]['won'] = winner == 'YES'
+                self.tokens[market['no_token_id']]['won'] = winner == 'NO'
+
+            for order in [o for o in self.orders.values() if o.market_id == market_id and o.status == 'open']:
+                if order.owner == ME:
+                    self._cancel(order)
+                else:
+                    order.status = 'cancelled'
+            for token_id in self._yes_tokens(market):
+                self.books[token_id] = {'bids': [], 'asks': []}
+                self.books[self.tokens[token_id]['pair']] = {'bids': [], 'asks': []}
+
+            market['status'] = TopicStatus.RESOLVED
+            market['winner'] = winner
+            return winner
+
+    # ------------------------------------------------------------------
+    # SDK Client: account
+    # ------------------------------------------------------------------
+
+    @property
+    def available_balance(self) -> float:
+        return self.balance - self.locked
+
+    def get_my_balances(self, **kwargs):
+        with self._lock:
+            return _response(SimpleNamespace(list=[SimpleNamespace(
+                token='USDT',
+                balance=str(int(self.balance * WEI)),
+                availableBalance=str(int(self.available_balance * WEI))
+            )]))
+
+    def get_my_positions(self, limit: int = 100, **kwargs):
+        with self._lock:
+            positions = []
+            for token_id, shares in self.positions.items():
+                if shares <= 1e-9:
+                    continue
+                token = self.tokens[token_id]
+                market = self.markets[token['market_id']]
+                positions.append(SimpleNamespace(
+                    marketId=token['market_id'],
+                    tokenId=token_id,
+                    amount=str(int(shares * WEI)),
+                    outcome=token['outcome'],
+                    status='resolved' if market['status'] == TopicStatus.RESOLVED else 'active'
+                ))
+            return _response(SimpleNamespace(list=positions[:limit]))
+
+    def get_my_orders(self, **kwargs):
+        with self._lock:
+            orders = [SimpleNamespace(
+                orderId=o.order_id,
+                marketId=o.market_id,
+                tokenId=o.token_id,
+                side=o.side.name,
+                price=str(o.price),
+                amount=str(int(o.remaining * o.price * WEI)),
+                status=o.status,
+                createdAt=o.created_at
+            ) for o in self.orders.values() if o.owner == ME and o.status == 'open']
+            return _response(SimpleNamespace(list=orders))
+
+    def get_my_trades(self, limit: int = 50, **kwargs):
+        with self._lock:
+            return _response(SimpleNamespace(list=list(reversed(self.trades))[:limit]))
+
+
+_exchange: Optional[SimulatedExchange] = None
+_exchange_lock = threading.Lock()
+
+
+def simulated_exchange_enabled() -> bool:
+    return os.environ.get('OPINION_SIMULATED_EXCHANGE', 'false').lower() == 'true'
+
+
+def get_simulated_exchange() -> SimulatedExchange:
+    """Process-wide simulator shared by every OpinionTradeAPI instance."""
+    global _exchange
+    with _exchange_lock:
+        if _exchange is None:
+            _exchange = SimulatedExchange.from_env()
+        return _exchange
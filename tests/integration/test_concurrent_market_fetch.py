@@ -0,0 +1,102 @@
+"""
+Integration test for concurrent market conversion in get_available_events
+Tests that the thread-pool fetch keeps the serial output order and filtering
+"""
+
+import pytest
+import os
+import random
+import time
+from unittest.mock import Mock, patch
+
+# Set dummy env vars to avoid real SDK initialization
+os.environ['OPINION_TRADE_API_KEY'] = 'test_key_123'
+os.environ['OPINION_WALLET_PRIVATE_KEY'] = '0x' + '1' * 64
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from opinion_clob_sdk.model import TopicType
+from opinion_trade_api import OpinionTradeAPI
+
+
+def _make_market(market_id, title):
+    market = Mock()
+    market.market_id = market_id
+    market.market_title = title
+    market.status = Mock()
+    market.status.name = 'ACTIVATED'
+    market.topic_type = TopicType.BINARY
+    market.rules = None
+    return market
+
+
+class TestConcurrentMarketFetch:
+    """Test suite for bounded-concurrency conversion of markets to events"""
+
+    def _build_api(self, markets):
+        with patch('opinion_trade_api.OpinionTradeAPI._initialize_client'):
+            api = OpinionTradeAPI()
+        api.client = Mock()
+
+        def get_markets(topic_type, status, page, limit):
+            response = Mock()
+            response.errno = 0
+            response.result.list = markets if topic_type == TopicType.BINARY and page == 1 else []
+            return response
+
+        def get_market(market_id):
+            # Random latency so worker threads finish out of order
+            time.sleep(random.random() * 0.01)
+            response = Mock()
+            response.errno = 0
+            response.result.data = Mock(
+                options=None,
+                yes_token_id=f"yes_{market_id}" if market_id != 3 else None,
+                no_token_id=f"no_{market_id}",
+                yes_label='YES',
+                no_label='NO'
+            )
+            return response
+
+        api.client.get_markets.side_effect = get_markets
+        api.client.get_market.side_effect = get_market
+        api.get_orderbook = Mock(return_value={'success': True, 'orderbook': {'bids': [{'price': 0.5}], 'asks': []}})
+        return api
+
+    @pytest.mark.parametrize('max_workers', [1, 8])
+    def test_output_order_and_filtering_match_serial(self, max_workers):
+        markets = [_make_market(i, f"Will bitcoin close above {i}k?") for i in range(12)]
+        markets[5].market_title = "NBA finals winner"
+        api = self._build_api(markets)
+
+        response = api.get_available_events(limit=12, max_workers=max_workers)
+
+        assert response['success'] is True
+        # Market 3 has no yes_token_id, market 5 is Sports
+        assert [e['market_id'] for e in response['events']] == [0, 1, 2, 4, 6, 7, 8, 9, 10, 11]
+        assert response['message'].endswith('(skipped 2)')
+
+    def test_timings_reported(self):
+        api = self._build_api([_make_market(1, "Will ETH flip BTC?")])
+
+        response = api.get_available_events(limit=5)
+
+        assert set(response['timings']) == {'pagination', 'details_and_liquidity', 'total'}
+        assert response['timings']['total'] >= response['timings']['pagination']
+    
+    def test_streaming_yields_same_events_as_batch(self):
+        markets = [_make_market(i, f"Will bitcoin close above {i}k?") for i in range(12)]
+        markets[5].market_title = "NBA finals winner"
+        api = self._build_api(markets)
+
+        batch = api.get_available_events(limit=12, max_workers=8)['events']
+        streamed = list(api.iter_available_events(limit=12, max_workers=8))
+
+        assert [e['market_id'] for e in streamed] == [e['market_id'] for e in batch]
+
+    def test_streaming_respects_limit(self):
+        api = self._build_api([_make_market(i, f"Will ETH hit {i}k?") for i in range(12)])
+
+        streamed = list(api.iter_available_events(limit=4, max_workers=2))
+
+        # Market 3 has no yes_token_id
+        assert [e['market_id'] for e in streamed] == [0, 1, 2]
@@ -0,0 +1,129 @@
+"""
+Integration test for the persistent market catalog
+Tests that unchanged markets are served from TradingDatabase instead of client.get_market
+"""
+
+import pytest
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Set dummy env vars to avoid real SDK initialization
+os.environ['OPINION_TRADE_API_KEY'] = 'test_key_123'
+os.environ['OPINION_WALLET_PRIVATE_KEY'] = '0x' + '1' * 64
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from opinion_clob_sdk.model import TopicType
+from database import TradingDatabase
+from opinion_trade_api import OpinionTradeAPI
+
+
+def _make_market(market_id, status='ACTIVATED', volume='100'):
+    return SimpleNamespace(
+        market_id=market_id,
+        market_title=f"Will bitcoin close above {market_id}k?",
+        status=status,
+        topic_type=TopicType.BINARY,
+        rules=None,
+        condition_id=f"0xcond{market_id}",
+        quote_token='0xusdt',
+        chain_id='56',
+        volume=volume,
+        created_at=1700000000,
+        cutoff_at=1800000000
+    )
+
+
+class TestMarketCatalog:
+    """Test suite for incremental market detail refresh"""
+
+    def _build_api(self, tmp_path, markets):
+        database = TradingDatabase(db_path=str(tmp_path / 'catalog.db'))
+        with patch('opinion_trade_api.OpinionTradeAPI._initialize_client'):
+            api = OpinionTradeAPI(database=database)
+        api.client = Mock()
+
+        def get_markets(topic_type, status, page, limit):
+            response = Mock()
+            response.errno = 0
+            response.result.list = markets if topic_type == TopicType.BINARY and page == 1 else []
+            return response
+
+        def get_market(market_id):
+            response = Mock()
+            response.errno = 0
+            response.result.data = SimpleNamespace(
+                marketId=market_id,
+                marketTitle=f"Will bitcoin close above {market_id}k?",
+                conditionId=f"0xcond{market_id}",
+                status='ACTIVATED',
+                quoteToken='0xusdt',
+                chainId='56',
+                options=None,
+                yes_token_id=f"yes_{market_id}",
+                no_token_id=f"no_{market_id}",
+                yes_label='YES',
+                no_label='NO'
+            )
+            return response
+
+        api.client.get_markets.side_effect = get_markets
+        api.client.get_market.side_effect = get_market
+        api.get_orderbook = Mock(return_value={'success': True, 'orderbook': {'bids': [{'price': 0.5}], 'asks': []}})
+        return api
+
+    def test_second_cycle_only_refetches_new_or_changed_markets(self, tmp_path):
+        markets = [_make_market(1), _make_market(2)]
+        api = self._build_api(tmp_path, markets)
+
+        first = api.get_available_events(limit=10, max_workers=1)
+        assert first['catalog'] == {'reused': 0, 'refreshed': 2}
+        assert api.client.get_market.call_count == 2
+
+        # Market 2 changes status, market 3 is new, market 1 only changes volume
+        markets[:] = [_make_market(1, volume='250'), _make_market(2, status='PAUSED'), _make_market(3)]
+        api.client.get_market.reset_mock()
+
+        second = api.get_available_events(limit=10, max_workers=1)
+
+        assert second['catalog'] == {'reused': 1, 'refreshed': 2}
+        assert sorted(call.args[0] for call in api.client.get_market.call_args_list) == [2, 3]
+        assert [e['market_id'] for e in second['events']] == [1, 2, 3]
+        # Dynamic fields come from the current listing, not the catalog
+        assert second['events'][0]['volume'] == '250'
+        assert second['events'][1]['status'] == 'PAUSED'
+
+    def test_liquidity_is_rechecked_for_cached_markets(self, tmp_path):
+        api = self._build_api(tmp_path, [_make_market(1)])
+        api.get_available_events(limit=10, max_workers=1)
+
+        api.get_orderbook.return_value = {'success': True, 'orderbook': {'bids': [], 'asks': []}}
+        response = api.get_available_events(limit=10, max_workers=1)
+
+        assert response['events'] == []
+        assert response['catalog']['reused'] == 1
+
+    def test_market_details_served_from_catalog_with_the_network_schema(self, tmp_path):
+        api = self._build_api(tmp_path, [_make_market(7)])
+        fetched = api.get_market_details(7)
+        api.get_available_events(limit=10, max_workers=1)
+        api.client.get_market.reset_mock()
+
+        cached = api.get_market_details(7)
+
+        assert cached == fetched
+        assert cached['data']['yes_token_id'] == 'yes_7'
+        assert not api.client.get_market.called
+
+    def test_price_history_token_is_the_same_for_cached_and_uncached_binary_markets(self, tmp_path):
+        api = self._build_api(tmp_path, [_make_market(7)])
+        api.client.get_price_history.return_value = Mock(errno=0, result=Mock(list=[]))
+
+        uncached = api.get_price_history(7)
+        api.get_available_events(limit=10, max_workers=1)
+        api.client.get_market.reset_mock()
+        cached = api.get_price_history(7)
+
+        assert uncached['token_id'] == cached['token_id'] == 'yes_7'
+        assert api.client.get_price_history.call_args_list == [(('yes_7',),), (('yes_7',),)]
+        assert not api.client.get_market.called
@@ -0,0 +1,87 @@
+"""
+Tests for the persisted trading-enabled / approval state
+"""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+os.environ['OPINION_TRADE_API_KEY'] = 'test_key_123'
+os.environ['OPINION_WALLET_PRIVATE_KEY'] = '0x' + '1' * 64
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from approval_state import ApprovalStateStore, is_approval_error
+from opinion_trade_api import OpinionTradeAPI
+from simulated_exchange import SimulatedExchange
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ApprovalStateStore(db_path=str(tmp_path / 'approval.db'), ttl_seconds=60)
+
+
+class TestApprovalStateStore:
+    """Test suite for the SQLite approval store"""
+
+    def test_mark_expire_and_invalidate(self, tmp_path, store):
+        assert store.is_enabled('0xABC', 56) is False
+        store.mark_enabled('0xABC', 56)
+        # Wallet addresses are case-insensitive; other chains are separate
+        assert store.is_enabled('0xabc', 56) is True
+        assert store.is_enabled('0xabc', 97) is False
+
+        # Shared with another store (process) on the same file
+        other = ApprovalStateStore(db_path=store.db_path, ttl_seconds=0.05)
+        time.sleep(0.06)
+        assert other.is_enabled('0xabc', 56) is False
+        assert store.is_enabled('0xabc', 56) is True
+
+        store.invalidate('0xAbC')
+        assert store.status('0xabc', 56)['enabled'] is False
+
+    def test_is_approval_error(self):
+        assert is_approval_error('ERC20: insufficient allowance')
+        assert is_approval_error('Trading not enabled for this wallet')
+        assert not is_approval_error('Insufficient balance')
+        assert not is_approval_error(None)
+
+
+class TestOpinionTradeApiApprovals:
+    """Test suite for skipping redundant approval checks"""
+
+    def test_second_client_startup_skips_enable_trading(self, store):
+        sdk_client = Mock()
+        with patch('opinion_trade_api.get_approval_store', return_value=store), \
+                patch('opinion_trade_api.Client', return_value=sdk_client), \
+                patch.object(OpinionTradeAPI, '_get_bnb_rpc_url', return_value='http://rpc'), \
+                patch.object(OpinionTradeAPI, '_attach_rpc_pool'), \
+                patch.object(OpinionTradeAPI, '_attach_shared_transport'):
+            first = OpinionTradeAPI()
+            second = OpinionTradeAPI()
+
+        assert sdk_client.enable_trading.call_count == 1
+        assert first.get_approval_state()['source'] == 'enable_trading'
+        assert second.client is sdk_client
+
+    def test_orders_skip_check_approval_until_approval_error(self, store):
+        exchange = SimulatedExchange(seed=3, starting_balance=200)
+        client = Mock(wraps=exchange)
+        with patch('opinion_trade_api.get_approval_store', return_value=store):
+            api = OpinionTradeAPI(client=client)
+        event = api.get_available_events(limit=50, max_workers=1)['events'][0]
+        prediction = {'market_id': event['market_id'], 'token_id': event['yes_token_id'], 'amount': 5, 'side': 'BUY'}
+
+        assert api.submit_prediction(prediction)['success'] is True
+        assert api.submit_prediction(prediction)['success'] is True
+        flags = [c.kwargs['check_approval'] for c in client.place_order.call_args_list]
+        assert flags == [True, False]
+
+        client.place_order.side_effect = RuntimeError('ERC20: transfer amount exceeds allowance')
+        assert api.submit_prediction(prediction)['success'] is False
+        assert api.get_approval_state()['enabled'] is False
+
+        client.place_order.side_effect = None
+        api.submit_prediction(prediction)
+        assert client.place_order.call_args.kwargs['check_approval'] is True
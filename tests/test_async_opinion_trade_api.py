@@ -0,0 +1,66 @@
+"""
+Tests for the asyncio facade over OpinionTradeAPI (bounded concurrency, passthrough results).
+"""
+
+import asyncio
+import threading
+import time
+
+from async_opinion_trade_api import AsyncOpinionTradeAPI
+
+
+class FakeOpinionAPI:
+    """Blocking stand-in that records peak concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, result):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return result
+
+    def get_orderbook(self, token_id, call_site='default', fresh=False):
+        return self._call({'success': True, 'token_id': token_id, 'call_site': call_site})
+
+    def get_latest_price(self, token_id, call_site='default', fresh=False):
+        return self._call({'success': True, 'price': 0.5, 'token_id': token_id})
+
+    def get_my_orders(self, market_id=None):
+        return self._call({'success': True, 'orders': [], 'market_id': market_id})
+
+
+class TestAsyncOpinionTradeAPI:
+
+    def test_concurrency_is_bounded(self):
+        fake = FakeOpinionAPI()
+
+        async def run():
+            async with AsyncOpinionTradeAPI(fake, max_concurrency=4) as async_api:
+                return await async_api.get_orderbooks([f"tok{i}" for i in range(20)], call_site='monitor')
+
+        started = time.monotonic()
+        books = asyncio.run(run())
+        elapsed = time.monotonic() - started
+
+        assert len(books) == 20
+        assert books['tok7']['call_site'] == 'monitor'
+        assert fake.peak == 4
+        # 20 calls, 4 at a time, 50ms each -> well under the 1s a serial run would take
+        assert elapsed < 0.8
+
+    def test_usable_across_event_loops(self):
+        async_api = AsyncOpinionTradeAPI(FakeOpinionAPI(delay=0), max_concurrency=2)
+        try:
+            assert asyncio.run(async_api.get_my_orders(market_id=3))['market_id'] == 3
+            prices = asyncio.run(async_api.get_latest_prices(['a', 'b', 'a']))
+            assert list(prices) == ['a', 'b']
+        finally:
+            async_api.close()
@@ -0,0 +1,136 @@
+"""
+Tests for HTTP cassette record/replay
+Records real urllib3/requests traffic against a local server and httpx traffic
+through a mock transport, then replays both with the server/transport gone
+"""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+import pytest
+import requests
+import urllib3
+
+from cassette import Cassette, CassetteMiss, redact_url
+
+
+class _Handler(BaseHTTPRequestHandler):
+    calls = 0
+
+    def _reply(self):
+        type(self).calls += 1
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        payload = json.dumps({'path': self.path, 'call': type(self).calls, 'echo': body.decode()}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Set-Cookie', 'session=secret')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.calls = 0
+    httpd = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _llm_transport(request: httpx.Request) -> httpx.Response:
+    prompt = json.loads(request.content)['prompt']
+    return httpx.Response(200, json={'answer': prompt.upper()})
+
+
+class TestCassette:
+    """Test suite for cassette recording and replay"""
+
+    def test_urllib3_and_requests_round_trip(self, server, tmp_path):
+        path = str(tmp_path / 'cycle.jsonl.gz')
+        pool = urllib3.PoolManager()
+
+        with Cassette(path, mode='record') as cassette:
+            first = pool.request('GET', f"{server}/markets?page=1&apikey=abc123").data
+            second = requests.post(f"{server}/order", data='{"side": "BUY"}').json()
+            third = pool.request('GET', f"{server}/markets?page=1&apikey=abc123").data
+        assert cassette.stats()['entries'] == 3
+
+        # Compact, gzip JSON lines without secrets
+        with gzip.open(path, 'rt') as f:
+            entries = [json.loads(line) for line in f]
+        assert len(entries) == 3
+        assert entries[0]['url'].endswith('/markets?page=1&apikey=REDACTED')
+        assert all('Set-Cookie' not in dict(entry['headers']) for entry in entries)
+
+        with Cassette(path, mode='replay') as replay:
+            assert pool.request('GET', f"{server}/markets?page=1&apikey=other").data == first
+            assert requests.post(f"{server}/order", data='{"side": "BUY"}').json() == second
+            assert pool.request('GET', f"{server}/markets?page=1&apikey=other").data == third
+            with pytest.raises(CassetteMiss):
+                pool.request('GET', f"{server}/markets?page=1&apikey=other")
+
+        assert _Handler.calls == 3
+        assert replay.stats()['exact_hits'] == 3
+        assert replay.stats()['misses'] == 1
+
+    def test_httpx_round_trip_with_changed_body_falls_back_to_route(self, tmp_path):
+        path = str(tmp_path / 'llm.jsonl')
+
+        with Cassette(path, mode='record'):
+            client = httpx.Client(transport=httpx.MockTransport(_llm_transport))
+            recorded = client.post('https://api.example.com/v1/chat', json={'prompt': 'at 09:00'}).json()
+
+        # The server is gone: any real call would fail
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: pytest.fail('network used')))
+        with Cassette(path, mode='replay') as replay:
+            response = client.post('https://api.example.com/v1/chat', json={'prompt': 'at 09:05'})
+
+        assert response.json() == recorded == {'answer': 'AT 09:00'}
+        assert replay.stats()['route_hits'] == 1
+
+    def test_recorded_latency_is_injected(self, tmp_path):
+        path = str(tmp_path / 'slow.jsonl')
+
+        def slow(request):
+            time.sleep(0.1)
+            return httpx.Response(200, text='ok')
+
+        with Cassette(path, mode='record'):
+            httpx.Client(transport=httpx.MockTransport(slow)).get('https://api.example.com/slow')
+
+        client = httpx.Client(transport=httpx.MockTransport(slow))
+        with Cassette(path, mode='replay', latency='recorded', latency_scale=2.0):
+            started = time.monotonic()
+            assert client.get('https://api.example.com/slow').text == 'ok'
+            assert time.monotonic() - started >= 0.19
+
+        with Cassette(path, mode='replay'):
+            started = time.monotonic()
+            client.get('https://api.example.com/slow')
+            assert time.monotonic() - started < 0.1
+
+    def test_only_one_cassette_installed_and_hooks_restored(self, tmp_path):
+        original = httpx.Client.send
+        with Cassette(str(tmp_path / 'a.jsonl'), mode='record'):
+            with pytest.raises(RuntimeError):
+                Cassette(str(tmp_path / 'b.jsonl'), mode='record').install()
+        assert httpx.Client.send is original
+
+    def test_redact_url(self):
+        url = redact_url('https://www.alphavantage.co/query?function=NEWS&apikey=XYZ&access_token=t')
+        assert 'XYZ' not in url and '=t' not in url
+        assert 'function=NEWS' in url
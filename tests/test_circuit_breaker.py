@@ -0,0 +1,152 @@
+"""
+Tests for the Opinion.trade circuit breakers and per-cycle retry budget.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+os.environ['OPINION_TRADE_API_KEY'] = 'test_key_123'
+os.environ['OPINION_WALLET_PRIVATE_KEY'] = '0x' + '1' * 64
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry,
+                             CircuitOpenError, RetryBudget)
+from opinion_trade_api import OpinionTradeAPI, retry_with_exponential_backoff
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker('market_data', failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure('boom')
+        assert breaker.state == CLOSED
+        breaker.record_failure('boom')
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        assert breaker.to_dict()['rejected_calls'] == 1
+
+    def test_half_open_allows_single_trial(self):
+        breaker = CircuitBreaker('orders', failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure('boom')
+
+        assert breaker.state == HALF_OPEN
+        breaker.allow()
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker('orders', failure_threshold=3, recovery_timeout=0)
+        for _ in range(3):
+            breaker.record_failure('boom')
+        breaker.allow()
+
+        breaker.recovery_timeout = 60
+        breaker.record_failure('still down')
+
+        assert breaker.state == OPEN
+
+
+class TestRetryBudget:
+
+    def test_budget_is_shared_and_resettable(self):
+        budget = RetryBudget(max_retries=2)
+
+        assert budget.try_spend() and budget.try_spend()
+        assert not budget.try_spend()
+        assert budget.to_dict() == {'max_retries': 2, 'used': 2, 'denied': 1}
+
+        budget.reset()
+        assert budget.remaining == 2
+
+    def test_decorator_stops_retrying_when_budget_exhausted(self):
+        calls = []
+
+        class Client:
+            retry_budget = RetryBudget(max_retries=1)
+
+            @retry_with_exponential_backoff(max_retries=3, initial_delay=0.001, max_delay=0.001)
+            def fetch(self):
+                calls.append(1)
+                raise RuntimeError('proxy down')
+
+        with pytest.raises(RuntimeError):
+            Client().fetch()
+        assert len(calls) == 2
+
+    def test_decorator_does_not_retry_open_circuit(self):
+        calls = []
+
+        @retry_with_exponential_backoff(max_retries=3, initial_delay=0.001, max_delay=0.001)
+        def fetch():
+            calls.append(1)
+            raise CircuitOpenError('market_data', 10)
+
+        with pytest.raises(CircuitOpenError):
+            fetch()
+        assert len(calls) == 1
+
+
+class TestOpinionTradeAPIBreakers:
+
+    def _build_api(self):
+        with patch('opinion_trade_api.OpinionTradeAPI._initialize_client'), \
+             patch('opinion_trade_api.get_circuit_breakers',
+                   return_value=CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)):
+            api = OpinionTradeAPI()
+        api.client = Mock()
+        return api
+
+    def test_transport_failures_open_the_endpoint_class(self):
+        api = self._build_api()
+        api.client.get_orderbook.side_effect = ConnectionError('proxy.opinion.trade:8443 unreachable')
+
+        for _ in range(2):
+            assert api.get_orderbook('tok', fresh=True)['success'] is False
+        api.client.get_orderbook.reset_mock()
+
+        response = api.get_orderbook('tok', fresh=True)
+
+        assert response['success'] is False
+        assert not api.client.get_orderbook.called
+        assert api.get_open_circuits() == ['market_data']
+        # Other endpoint classes are unaffected
+        assert api.get_circuit_breaker_state()['breakers'].get('orders') is None
+
+    def test_rate_limit_error_releases_half_open_trial(self):
+        from rate_limiter import RateLimitExceeded
+
+        api = self._build_api()
+        breaker = api.circuit_breakers.get('market_data')
+        breaker.record_failure('boom')
+        breaker.record_failure('boom')
+        breaker.recovery_timeout = 0
+        assert breaker.state == HALF_OPEN
+
+        api.rate_limiter = Mock()
+        api.rate_limiter.acquire.side_effect = RateLimitExceeded('market_data: queue wait above max_wait')
+        with pytest.raises(RateLimitExceeded):
+            api._call_sdk('market_data', 'get_orderbook', 'tok')
+
+        # The trial slot is free again: the next call is the half-open trial
+        api.rate_limiter.acquire.side_effect = None
+        api.client.get_orderbook.return_value = Mock(errno=0)
+        api._call_sdk('market_data', 'get_orderbook', 'tok')
+        assert breaker.state == CLOSED
+
+    def test_errno_responses_do_not_trip_the_breaker(self):
+        api = self._build_api()
+        api.client.get_orderbook.return_value = Mock(errno=1, errmsg='bad token')
+
+        for _ in range(3):
+            api.get_orderbook('tok', fresh=True)
+
+        assert api.get_open_circuits() == []
@@ -0,0 +1,196 @@
+"""
+Tests for resumable daily cycle checkpoints
+"""
+
+import threading
+import time
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+from autonomous_engine import AutonomousEngine
+from cycle_checkpoint import CycleCheckpointStore
+from firm_concurrency import ProviderSlots
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CycleCheckpointStore(db_path=str(tmp_path / 'checkpoints.db'), resume_window_seconds=60)
+
+
+class TestCycleCheckpointStore:
+    """Test suite for cycle resume and unit records"""
+
+    def test_unfinished_cycle_is_resumed_until_finished(self, store):
+        cycle_id, resumed = store.begin_cycle()
+        assert resumed is False
+
+        # Another process (the re-triggered worker) sees the same unfinished cycle
+        other = CycleCheckpointStore(db_path=store.db_path, resume_window_seconds=60)
+        assert other.begin_cycle() == (cycle_id, True)
+
+        store.finish_cycle(cycle_id)
+        new_id, resumed = store.begin_cycle()
+        assert new_id != cycle_id and resumed is False
+
+    def test_cycles_outside_resume_window_are_abandoned(self, store):
+        cycle_id, _ = store.begin_cycle()
+        store.resume_window_seconds = 0.01
+        time.sleep(0.02)
+        new_id, resumed = store.begin_cycle()
+        assert new_id != cycle_id and resumed is False
+        status = store._connection().execute('SELECT status FROM cycles WHERE cycle_id = ?', (cycle_id,)).fetchone()
+        assert status == ('abandoned',)
+
+    def test_units(self, store):
+        cycle_id, _ = store.begin_cycle()
+        assert store.get_evaluation(cycle_id, 'Qwen', 'e1') is None
+        store.save_evaluation(cycle_id, 'Qwen', 'e1', {'is_opportunity': True, 'expected_value': 1.5})
+        assert store.get_evaluation(cycle_id, 'Qwen', 'e1')['expected_value'] == 1.5
+        assert store.get_evaluation(cycle_id, 'Grok', 'e1') is None
+
+        store.mark_execution_pending(cycle_id, 'Qwen', 'e1')
+        assert store.get_execution(cycle_id, 'Qwen', 'e1') == {'status': 'pending', 'decision': None}
+        store.save_execution(cycle_id, 'Qwen', 'e1', {'action': 'BET', 'bet_size': 2.0})
+        assert store.get_execution(cycle_id, 'Qwen', 'e1')['status'] == 'done'
+
+        assert store.progress(cycle_id) == {'evaluation': {'done': 1}, 'execution': {'done': 1}}
+
+
+class TestEngineResume:
+    """Test suite for skipping completed evaluations on resume"""
+
+    def test_restarted_cycle_skips_completed_evaluations(self, store):
+        cycle_id, _ = store.begin_cycle()
+        events = {'Crypto': [{'event_id': f'e{i}', 'category': 'Crypto'} for i in range(3)]}
+        evaluated = []
+
+        def engine():
+            instance = AutonomousEngine.__new__(AutonomousEngine)
+            instance.eval_workers = 1
+            instance.prescreen = None
+            instance.event_scheduler = None
+            instance.checkpoints = store
+            instance._cycle_id = cycle_id
+            return instance
+
+        def evaluate(firm_name, event, bankroll_manager, active_positions):
+            if event['event_id'] == 'e2' and not evaluated_after_crash:
+                raise MemoryError('worker killed')
+            evaluated.append(event['event_id'])
+            return {'event_id': event['event_id'], 'is_opportunity': False}
+
+        evaluated_after_crash = False
+        first = engine()
+        first._evaluate_event_opportunity = evaluate
+        with pytest.raises(MemoryError):
+            list(first._evaluate_candidates('Gemini', events, None, []))
+
+        evaluated_after_crash = True
+        second = engine()
+        second._evaluate_event_opportunity = evaluate
+        results = [evaluation['event_id'] for _, evaluation in second._evaluate_candidates('Gemini', events, None, [])]
+
+        assert results == ['e0', 'e1', 'e2']
+        assert evaluated == ['e0', 'e1', 'e2']
+
+    def test_transient_failures_are_not_checkpointed(self, store):
+        cycle_id, _ = store.begin_cycle()
+        events = {'Crypto': [{'event_id': 'e0', 'category': 'Crypto'}, {'event_id': 'e1', 'category': 'Crypto'}]}
+        evaluated = []
+
+        def evaluate(firm_name, event, bankroll_manager, active_positions):
+            evaluated.append(event['event_id'])
+            if event['event_id'] == 'e1' and evaluated.count('e1') == 1:
+                return {'event_id': 'e1', 'is_opportunity': False, 'reason': 'Prediction error: circuit open',
+                        'error': 'circuit open'}
+            return {'event_id': event['event_id'], 'is_opportunity': False, 'reason': 'Negative EV'}
+
+        for _ in range(2):
+            engine = AutonomousEngine.__new__(AutonomousEngine)
+            engine.eval_workers = 1
+            engine.prescreen = None
+            engine.event_scheduler = None
+            engine.checkpoints = store
+            engine._cycle_id = cycle_id
+            engine._evaluate_event_opportunity = evaluate
+            results = [evaluation for _, evaluation in engine._evaluate_candidates('Qwen', events, None, [])]
+
+        # e0 is restored, the failed e1 is evaluated again on resume
+        assert evaluated == ['e0', 'e1', 'e1']
+        assert [evaluation['reason'] for evaluation in results] == ['Negative EV', 'Negative EV']
+
+    def test_restored_opportunities_are_repriced(self, store):
+        cycle_id, _ = store.begin_cycle()
+        event = {'event_id': 'e0', 'category': 'Crypto', 'yes_token_id': 'y0', 'no_token_id': 'n0'}
+        opportunity = {'event': event, 'event_id': 'e0', 'is_opportunity': True, 'probability': 0.7,
+                       'side_probability': 0.7, 'bet_size': 5.0, 'market_price': 0.5, 'expected_value': 1.8}
+        store.save_evaluation(cycle_id, 'Qwen', 'e0', opportunity)
+        prices = {'y0': 0.55}
+
+        engine = AutonomousEngine.__new__(AutonomousEngine)
+        engine.eval_workers = 1
+        engine.prescreen = None
+        engine.event_scheduler = None
+        engine.checkpoints = store
+        engine._cycle_id = cycle_id
+        engine.opinion_api = SimpleNamespace(
+            get_latest_price=lambda token_id, call_site='default': {'success': True, 'price': prices[token_id]},
+            estimate_fill=lambda token_id, amount, side, call_site='default': {'success': True, 'vwap': prices[token_id]},
+            get_fee_rates=lambda use_cache=True: {'success': True, 'taker_fee': 0.0},
+        )
+
+        def evaluate():
+            return [evaluation for _, evaluation in engine._evaluate_candidates('Qwen', {'Crypto': [event]}, None, [])][0]
+
+        repriced = evaluate()
+        assert repriced['is_opportunity'] is True
+        assert repriced['market_price'] == 0.55
+        assert repriced['expected_value'] == pytest.approx((0.7 - 0.55) * 10)
+
+        # The market moved past our probability while the cycle was down
+        prices['y0'] = 0.75
+        stale = evaluate()
+        assert stale['is_opportunity'] is False
+        assert stale['reason'].startswith('Restored opportunity no longer has positive EV')
+
+    def test_resumed_fanout_only_asks_firms_without_a_prediction(self, store):
+        cycle_id, _ = store.begin_cycle()
+        prompts = []
+
+        class Firm:
+            def __init__(self, name):
+                self.name = name
+
+            def generate_prediction(self, prompt):
+                prompts.append(self.name)
+                if self.name == 'Grok' and len(prompts) <= 3:
+                    return {'error': 'timeout'}
+                return {'probability': 0.6, 'firm': self.name}
+
+        firms = {name: Firm(name) for name in ('ChatGPT', 'Gemini', 'Grok')}
+
+        def engine():
+            # A restarted worker: empty per-cycle cache, same checkpointed cycle
+            instance = AutonomousEngine.__new__(AutonomousEngine)
+            instance.checkpoints = store
+            instance._cycle_id = cycle_id
+            instance.prediction_fanout = True
+            instance.provider_slots = ProviderSlots(default=1)
+            instance._data_cache = {}
+            instance._data_cache_guard = threading.Lock()
+            instance._data_cache_locks = {}
+            instance.orchestrator = SimpleNamespace(get_firm_names=lambda: list(firms), get_firm=firms.get)
+            instance._collect_event_context = lambda description, symbol, market_id: MappingProxyType({
+                'event_key': description, 'event_description': description, 'technical_report': 't',
+                'fundamental_report': 'f', 'sentiment_report': 's', 'news_report': 'n', 'volatility_report': 'v',
+            })
+            return instance
+
+        engine()._get_firm_prediction('ChatGPT', 'BTC above 100k?', 'BTC')
+        assert sorted(prompts) == ['ChatGPT', 'Gemini', 'Grok']
+
+        # Only Grok (whose call failed) is asked again after the restart
+        prediction = engine()._get_firm_prediction('Gemini', 'BTC above 100k?', 'BTC')
+        assert prediction == {'probability': 0.6, 'firm': 'Gemini'}
+        assert sorted(prompts) == ['ChatGPT', 'Gemini', 'Grok', 'Grok']
@@ -0,0 +1,158 @@
+"""
+Tests for the daily cycle job queue and runner
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from autonomous_engine import AutonomousEngine
+from cycle_jobs import CycleJobRunner, CycleJobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CycleJobStore(db_path=str(tmp_path / 'jobs.db'), stale_seconds=60, max_attempts=2)
+
+
+class FakeEngine:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = 0
+
+    def run_daily_cycle(self, progress_callback=None):
+        self.calls += 1
+        progress_callback({'stage': 'firms', 'firms': {'Qwen': {'status': 'running'}}})
+        if self.error:
+            raise self.error
+        return {'success': True, 'total_bets_placed': 1, 'errors': [], 'critical_error': None}
+
+
+def lease_of(engine):
+    @contextmanager
+    def cycle_lease():
+        yield engine
+    return cycle_lease
+
+
+class TestCycleJobStore:
+    """Test suite for job submission, claiming and stale recovery"""
+
+    def test_submit_returns_active_job(self, store):
+        job_id, created = store.submit('cron')
+        assert created is True
+        assert store.submit('admin') == (job_id, False)
+
+        assert store.claim_next('w1') == job_id
+        assert store.submit('admin') == (job_id, False)
+
+        store.finish(job_id, result={'success': True})
+        new_id, created = store.submit('admin')
+        assert created is True and new_id != job_id
+
+    def test_job_is_claimed_once(self, store):
+        job_id, _ = store.submit('cron')
+        other = CycleJobStore(db_path=store.db_path)
+        assert store.claim_next('w1') == job_id
+        assert other.claim_next('w2') is None
+
+        job = other.get(job_id)
+        assert job['status'] == 'running'
+        assert job['worker'] == 'w1'
+        assert job['attempts'] == 1
+
+    def test_finish_status_follows_cycle_success(self, store):
+        job_id, _ = store.submit('cron')
+        store.claim_next('w1')
+        store.finish(job_id, result={'success': False, 'critical_error': 'No events available'})
+        job = store.get(job_id)
+        assert job['status'] == 'failed'
+        assert job['error'] == 'No events available'
+        assert store.get('missing') is None
+
+    def test_stale_running_job_is_requeued_then_failed(self, store):
+        job_id, _ = store.submit('cron')
+        store.claim_next('w1')
+        store.stale_seconds = 0.01
+        time.sleep(0.02)
+        assert store.recover_stale() == 1
+        assert store.get(job_id)['status'] == 'queued'
+
+        # Second attempt reaches max_attempts=2
+        store.claim_next('w2')
+        time.sleep(0.02)
+        assert store.recover_stale() == 0
+        job = store.get(job_id)
+        assert job['status'] == 'failed'
+        assert job['attempts'] == 2
+
+
+class TestCycleJobRunner:
+    """Test suite for running queued cycles outside the request"""
+
+    def test_runs_job_and_stores_progress_and_result(self, store):
+        engine = FakeEngine()
+        runner = CycleJobRunner(store, lease_of(engine))
+        job_id, _ = store.submit('admin')
+
+        assert runner.run_pending() == 1
+        job = store.get(job_id)
+        assert job['status'] == 'succeeded'
+        assert job['progress']['firms'] == {'Qwen': {'status': 'running'}}
+        assert job['result']['total_bets_placed'] == 1
+        assert engine.calls == 1
+
+    def test_exception_fails_job(self, store):
+        runner = CycleJobRunner(store, lease_of(FakeEngine(error=RuntimeError('boom'))))
+        job_id, _ = store.submit('cron')
+        runner.run_pending()
+        job = store.get(job_id)
+        assert job['status'] == 'failed'
+        assert job['error'] == 'boom'
+
+    def test_busy_engine_requeues_job(self, store):
+        runner = CycleJobRunner(store, lease_of(None))
+        job_id, _ = store.submit('cron')
+        assert runner.run_pending() == 0
+        job = store.get(job_id)
+        assert job['status'] == 'queued'
+        assert job['attempts'] == 0
+
+    def test_background_thread_picks_up_submissions(self, store):
+        runner = CycleJobRunner(store, lease_of(FakeEngine()), poll_seconds=10).start()
+        try:
+            job_id, _ = store.submit('cron')
+            runner.wake()
+            deadline = time.time() + 5
+            while store.get(job_id)['status'] != 'succeeded' and time.time() < deadline:
+                time.sleep(0.02)
+            assert store.get(job_id)['status'] == 'succeeded'
+        finally:
+            runner.stop(timeout=5)
+
+
+class TestEngineProgress:
+    """Test suite for run_daily_cycle progress reporting"""
+
+    def test_stage_and_firm_updates_reach_callback(self):
+        engine = AutonomousEngine.__new__(AutonomousEngine)
+        engine._progress_lock = threading.Lock()
+        engine._progress = {'stage': None, 'stages': [], 'firms': {}, 'updated_at': None}
+        snapshots = []
+        engine._progress_callback = snapshots.append
+
+        engine._report_progress(stage='firms', firms={'Qwen': {'status': 'pending'}, 'Grok': {'status': 'pending'}})
+        results = {'firms_results': {}, 'total_bets_placed': 0, 'total_bets_skipped': 0, 'errors': []}
+        engine._record_firm_result(results, 'Qwen', {'bets_placed': 2, 'bets_skipped': 1})
+        engine._report_progress(stage='save')
+
+        last = snapshots[-1]
+        assert last['stage'] == 'save'
+        assert [stage['stage'] for stage in last['stages']] == ['firms', 'save']
+        assert 'finished_at' in last['stages'][0]
+        assert last['firms']['Qwen'] == {'status': 'done', 'bets_placed': 2, 'bets_skipped': 1}
+        assert last['firms']['Grok'] == {'status': 'pending'}
+        # Snapshots are copies: later updates do not change what was already published
+        assert snapshots[0]['firms']['Qwen'] == {'status': 'pending'}
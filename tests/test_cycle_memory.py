@@ -0,0 +1,111 @@
+"""
+Tests for per-phase cycle memory profiling
+"""
+
+import tracemalloc
+
+import pytest
+
+from cycle_memory import CycleMemoryProfiler, summarize_trend
+from database import TradingDatabase
+
+
+@pytest.fixture
+def profiler():
+    profiler = CycleMemoryProfiler(enabled=True, top_n=5, sample_seconds=0.01)
+    yield profiler
+    # Never leave tracing on for the rest of the suite
+    profiler.finish_cycle()
+
+
+class TestCycleMemoryProfiler:
+    """Test suite for phase records and allocation sites"""
+
+    def test_disabled_profiler_is_a_noop(self):
+        profiler = CycleMemoryProfiler(enabled=False)
+        profiler.start_cycle()
+        assert profiler.begin('fetch_events') is None
+        with profiler.phase('reconciliation'):
+            pass
+        assert profiler.finish_cycle() is None
+        assert not tracemalloc.is_tracing()
+
+    def test_phases_and_retained_allocations(self, profiler):
+        profiler.start_cycle()
+        assert tracemalloc.is_tracing()
+
+        with profiler.phase('evaluate:Qwen'):
+            retained = [bytearray(1024) for _ in range(2000)]
+        summary = profiler.finish_cycle()
+
+        assert not tracemalloc.is_tracing()
+        phase = summary['phases'][0]
+        assert phase['phase'] == 'evaluate:Qwen'
+        assert phase['overlapped'] is False
+        assert phase['traced_retained_mb'] >= 1.5
+        assert phase['traced_peak_mb'] >= phase['traced_retained_mb']
+        assert summary['rss_peak_mb'] >= summary['rss_start_mb']
+        # The list comprehension above is the site that grew the most
+        assert 'test_cycle_memory.py' in summary['top_allocations'][0]['site']
+        assert summary['top_allocations'][0]['size_diff_kb'] >= 1500
+        del retained
+
+    def test_overlapping_and_unfinished_phases(self, profiler):
+        profiler.start_cycle()
+        first = profiler.begin('evaluate:Qwen')
+        profiler.begin('evaluate:Grok')
+        profiler.end(first)
+        summary = profiler.finish_cycle()
+
+        phases = {phase['phase']: phase for phase in summary['phases']}
+        assert phases['evaluate:Qwen']['overlapped'] is True
+        assert phases['evaluate:Grok']['overlapped'] is True
+        assert phases['evaluate:Grok']['interrupted'] is True
+        assert 'interrupted' not in phases['evaluate:Qwen']
+
+    def test_rss_only(self):
+        profiler = CycleMemoryProfiler(enabled=True, trace_allocations=False, sample_seconds=0.01)
+        profiler.start_cycle()
+        with profiler.phase('order_monitoring'):
+            pass
+        summary = profiler.finish_cycle()
+        assert summary['traced_peak_mb'] is None
+        assert summary['top_allocations'] == []
+        assert 'traced_peak_mb' not in summary['phases'][0]
+
+
+class TestMemoryTrend:
+    """Test suite for the stored profiles and the cross-cycle trend"""
+
+    def test_profiles_are_stored_on_cycle_rows(self, tmp_path):
+        db = TradingDatabase(db_path=str(tmp_path / 'trading.db'))
+        first = db.save_autonomous_cycle({'timestamp': '2026-01-01T00:00:00'})
+        second = db.save_autonomous_cycle({'timestamp': '2026-01-02T00:00:00'})
+        db.save_autonomous_cycle({'timestamp': '2026-01-03T00:00:00'})
+
+        db.save_cycle_memory_profile(first, {
+            'rss_start_mb': 200.0, 'rss_peak_mb': 450.0, 'rss_end_mb': 260.0, 'traced_peak_mb': 90.0,
+            'phases': [{'phase': 'fetch_events', 'rss_peak_mb': 240.0}, {'phase': 'evaluate:Qwen', 'rss_peak_mb': 450.0}],
+            'top_allocations': [{'site': 'old.py:1'}],
+        })
+        db.save_cycle_memory_profile(second, {
+            'rss_start_mb': 260.0, 'rss_peak_mb': 520.0, 'rss_end_mb': 300.0, 'traced_peak_mb': 95.0,
+            'phases': [{'phase': 'evaluate:Grok', 'rss_peak_mb': 520.0}],
+            'top_allocations': [{'site': 'new.py:2'}],
+        })
+
+        cycles = db.get_cycle_memory_profiles()
+        assert [cycle['id'] for cycle in cycles] == [second, first]
+
+        memory = summarize_trend(cycles)
+        assert [summary['peak_phase'] for summary in memory['cycles']] == ['evaluate:Qwen', 'evaluate:Grok']
+        assert memory['trend'] == {
+            'cycles': 2,
+            'max_rss_peak_mb': 520.0,
+            'rss_start_change_mb': 60.0,
+            'rss_peak_change_mb': 70.0,
+        }
+        assert memory['latest_top_allocations'] == [{'site': 'new.py:2'}]
+
+    def test_empty_trend(self):
+        assert summarize_trend([]) == {'trend': {'cycles': 0}, 'cycles': [], 'latest_top_allocations': []}
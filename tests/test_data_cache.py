@@ -0,0 +1,90 @@
+"""
+Tests for the cross-cycle collector data cache
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from data_cache import DataCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'data_cache.db')
+
+
+class TestDataCache:
+    """Test suite for TTLs, eviction, persistence and stale fallback"""
+
+    def test_fresh_hits_persist_across_instances(self, db_path):
+        cache = DataCache(db_path=db_path, ttls={'technical': 60})
+        assert cache.get('technical', 'BTC') is None
+        cache.put('technical', 'BTC', {'indicators': {'rsi': 41.5}})
+        assert cache.get('technical', 'BTC') == {'indicators': {'rsi': 41.5}}
+
+        # A new process (next cycle after a restart) reads it from disk
+        other = DataCache(db_path=db_path, ttls={'technical': 60})
+        assert other.get('technical', 'BTC') == {'indicators': {'rsi': 41.5}}
+
+        stats = other.stats()['sources']['technical']
+        assert (stats['hits'], stats['misses'], stats['disk_hits']) == (1, 0, 1)
+        assert cache.stats()['sources']['technical']['misses'] == 1
+
+    def test_expired_entries_are_served_only_as_stale(self, db_path):
+        cache = DataCache(db_path=db_path, ttls={'news': 0.05}, max_stale_seconds=60)
+        cache.put('news', 'ETH', {'sentiment': 'bullish'})
+        time.sleep(0.06)
+
+        assert cache.get('news', 'ETH') is None
+        value, age = cache.get_stale('news', 'ETH')
+        assert value == {'sentiment': 'bullish'} and age >= 0.05
+        assert cache.stats()['sources']['news']['stale_hits'] == 1
+
+        cache.max_stale_seconds = 0.01
+        assert cache.get_stale('news', 'ETH') is None
+
+    def test_lru_eviction_bounds_both_levels(self, db_path):
+        cache = DataCache(db_path=db_path, max_entries=2)
+        cache.put('volatility', 'A', {'v': 1})
+        cache.put('volatility', 'B', {'v': 2})
+        cache.get('volatility', 'A')
+        cache.put('volatility', 'C', {'v': 3})
+
+        assert cache.stats()['evictions'] == 1
+        assert sorted(key for _, key in cache._memory) == ['A', 'C']
+        rows = cache._connection().execute('SELECT key FROM data_cache ORDER BY key').fetchall()
+        assert [row[0] for row in rows] == ['A', 'C']
+
+    def test_disk_hits_refresh_the_lru_order(self, db_path):
+        DataCache(db_path=db_path).put('news', 'A', {'v': 1})
+        time.sleep(0.01)
+        DataCache(db_path=db_path).put('news', 'B', {'v': 2})
+
+        # A fresh process reads A from disk, then a write pushes the disk level over its bound
+        cache = DataCache(db_path=db_path, max_entries=2)
+        assert cache.get('news', 'A') == {'v': 1}
+        cache.put('news', 'C', {'v': 3})
+
+        rows = cache._connection().execute('SELECT key FROM data_cache ORDER BY key').fetchall()
+        assert [row[0] for row in rows] == ['A', 'C']
+
+    def test_tables_without_access_times_are_migrated(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE data_cache (source TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, '
+                     'value TEXT NOT NULL, PRIMARY KEY (source, key))')
+        conn.execute("INSERT INTO data_cache VALUES ('news', 'OLD', ?, '{}')", (time.time(),))
+        conn.commit()
+        conn.close()
+
+        cache = DataCache(db_path=db_path)
+        assert cache.get('news', 'OLD') == {}
+        cache.put('news', 'NEW', {'v': 1})
+        assert cache.get('news', 'NEW') == {'v': 1}
+
+    def test_memory_only(self):
+        cache = DataCache(db_path=None)
+        cache.put('technical', 'NVDA', {'indicators': {}})
+        assert cache.get('technical', 'NVDA') == {'indicators': {}}
+        assert cache.stats()['persistent'] is False
@@ -0,0 +1,78 @@
+"""
+Tests for the array-backed DepthBook fill estimator and its use in order pricing.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+os.environ['OPINION_TRADE_API_KEY'] = 'test_key_123'
+os.environ['OPINION_WALLET_PRIVATE_KEY'] = '0x' + '1' * 64
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from depth_book import DepthBook
+from opinion_trade_api import OpinionTradeAPI
+
+
+ORDERBOOK = {
+    # Deliberately unsorted: the SDK does not guarantee level order
+    'asks': [{'price': 0.52, 'amount': 100}, {'price': 0.50, 'amount': 20}, {'price': 0.55, 'amount': 1000}],
+    'bids': [{'price': 0.45, 'amount': 50}, {'price': 0.48, 'amount': 10}, {'price': 0.0, 'amount': 99}],
+}
+
+
+class TestDepthBook:
+
+    def test_fill_within_best_level_has_no_slippage(self):
+        fill = DepthBook.from_orderbook(ORDERBOOK).estimate_fill(5.0, 'BUY')
+
+        assert fill['vwap'] == pytest.approx(0.50)
+        assert fill['shares'] == pytest.approx(10.0)
+        assert fill['levels_consumed'] == 1
+        assert fill['slippage'] == pytest.approx(0.0)
+
+    def test_fill_walks_levels_and_reports_vwap(self):
+        # 10 USDT at 0.50 (20 shares) + 52 USDT at 0.52 (100 shares) + 5.5 USDT at 0.55 (10 shares)
+        fill = DepthBook.from_orderbook(ORDERBOOK).estimate_fill(67.5, 'BUY')
+
+        assert fill['shares'] == pytest.approx(130.0)
+        assert fill['vwap'] == pytest.approx(67.5 / 130.0)
+        assert fill['worst_price'] == pytest.approx(0.55)
+        assert fill['levels_consumed'] == 3
+        assert fill['fully_filled'] is True
+
+    def test_sell_walks_bids_from_highest(self):
+        fill = DepthBook.from_orderbook(ORDERBOOK).estimate_fill(4.8 + 4.5, 'SELL')
+
+        assert fill['best_price'] == pytest.approx(0.48)
+        assert fill['worst_price'] == pytest.approx(0.45)
+        assert fill['shares'] == pytest.approx(20.0)
+
+    def test_thin_book_reports_partial_fill(self):
+        fill = DepthBook.from_orderbook({'asks': [{'price': 0.5, 'amount': 10}], 'bids': []}).estimate_fill(100.0)
+
+        assert fill['fully_filled'] is False
+        assert fill['filled_usdt'] == pytest.approx(5.0)
+
+    def test_empty_side_returns_none(self):
+        assert DepthBook.from_orderbook({'asks': [], 'bids': []}).estimate_fill(10.0) is None
+
+
+class TestOrderPricingUsesDepth:
+
+    def test_buy_limit_covers_levels_consumed(self):
+        with patch('opinion_trade_api.OpinionTradeAPI._initialize_client'):
+            api = OpinionTradeAPI()
+        api.client = Mock()
+        api.get_orderbook = Mock(return_value={'success': True, 'orderbook': {
+            **ORDERBOOK, 'best_ask': {'price': 0.50, 'amount': 20}, 'best_bid': {'price': 0.48, 'amount': 10}
+        }})
+        api.client.place_order.return_value = Mock(errno=0, result=Mock(orderId='o1'))
+
+        response = api.submit_prediction({'market_id': 1, 'token_id': 'tok', 'amount': 30, 'side': 'BUY'})
+
+        assert response['success'] is True
+        # 30 USDT reaches the 0.52 level; the old top-of-book price would have been 0.505
+        assert response['data']['price'] == '0.520'
+        assert response['data']['expected_fill_price'] == pytest.approx(30 / (20 + 20 / 0.52))
@@ -0,0 +1,180 @@
+"""
+Tests for concurrent event evaluation and the prediction fan-out
+"""
+
+import random
+import threading
+import time
+from types import MappingProxyType, SimpleNamespace
+
+from autonomous_engine import AutonomousEngine
+from cycle_memory import CycleMemoryProfiler
+from event_stream import EventStream
+from firm_concurrency import DailyLimitLedger, ProviderSlots
+from open_orders_index import OpenOrdersIndex
+
+
+def _engine(eval_workers):
+    # Only the evaluation helpers are exercised: skip the heavy constructor
+    engine = AutonomousEngine.__new__(AutonomousEngine)
+    engine.eval_workers = eval_workers
+    engine.prescreen = None
+    engine.event_scheduler = None
+    engine.checkpoints = None
+    return engine
+
+
+def _events_by_category():
+    return {
+        'Crypto': [{'id': f'c{i}', 'category': 'Crypto'} for i in range(5)],
+        'Politics': [{'id': f'p{i}', 'category': 'Politics'} for i in range(2)],
+    }
+
+
+class TestEvaluateCandidates:
+
+    def _run(self, engine, events):
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'peak': 0}
+
+        def evaluate(firm_name, event, bankroll_manager, active_positions):
+            with lock:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+            time.sleep(random.uniform(0.005, 0.03))
+            with lock:
+                state['in_flight'] -= 1
+            return {'event_id': event['id']}
+
+        engine._evaluate_event_opportunity = evaluate
+        results = [(category, evaluation['event_id'])
+                   for category, evaluation in engine._evaluate_candidates('ChatGPT', events, None, [])]
+        return results, state['peak']
+
+    def test_results_keep_candidate_order(self):
+        expected = [('Crypto', 'c0'), ('Crypto', 'c1'), ('Crypto', 'c2'), ('Politics', 'p0'), ('Politics', 'p1')]
+
+        serial, serial_peak = self._run(_engine(1), _events_by_category())
+        parallel, parallel_peak = self._run(_engine(4), _events_by_category())
+
+        assert serial == parallel == expected
+        assert serial_peak == 1
+        assert parallel_peak > 1
+
+    def test_streamed_events_are_evaluated_as_they_arrive(self):
+        events = [event for group in _events_by_category().values() for event in group]
+        stream = EventStream(iter(events)).start()
+
+        results, _ = self._run(_engine(3), stream)
+
+        assert [event_id for _, event_id in results] == ['c0', 'c1', 'c2', 'p0', 'p1']
+
+
+class TestPredictionFanout:
+
+    def _engine(self, fanout):
+        engine = _engine(1)
+        engine.prediction_fanout = fanout
+        engine.provider_slots = ProviderSlots(default=1)
+        engine._data_cache = {}
+        engine._data_cache_guard = threading.Lock()
+        engine._data_cache_locks = {}
+        engine.collected = []
+        engine.prompts = []
+
+        def collect(event_description, symbol, market_id):
+            engine.collected.append(market_id)
+            return MappingProxyType({
+                'event_key': engine._event_key(event_description, market_id),
+                'event_description': event_description, 'technical_report': 't',
+                'fundamental_report': 'f', 'sentiment_report': 's', 'news_report': 'n', 'volatility_report': 'v',
+            })
+
+        class Firm:
+            def __init__(self, name):
+                self.name = name
+
+            def generate_prediction(self, prompt):
+                engine.prompts.append(self.name)
+                return {'firm': self.name, 'thread': threading.current_thread().name, 'prompt': prompt}
+
+        firms = {name: Firm(name) for name in ('ChatGPT', 'Gemini', 'Qwen')}
+        engine.orchestrator = SimpleNamespace(get_firm_names=lambda: list(firms), get_firm=firms.get)
+        engine._collect_event_context = collect
+        return engine
+
+    def test_context_collected_once_and_fanned_out_to_all_firms(self):
+        engine = self._engine(fanout=True)
+
+        first = engine._get_firm_prediction('Gemini', 'BTC above 100k?', 'BTC', 'm1')
+        assert sorted(engine.prompts) == ['ChatGPT', 'Gemini', 'Qwen']
+        assert first['firm'] == 'Gemini' and first['thread'].startswith('predict')
+
+        for name in ('ChatGPT', 'Qwen'):
+            assert engine._get_firm_prediction(name, 'BTC above 100k?', 'BTC', 'm1')['firm'] == name
+        assert engine.collected == ['m1']
+        assert len(engine.prompts) == 3
+
+    def test_without_fanout_each_firm_predicts_on_demand(self):
+        engine = self._engine(fanout=False)
+
+        engine._get_firm_prediction('Qwen', 'BTC above 100k?', 'BTC', 'm1')
+        engine._get_firm_prediction('Gemini', 'BTC above 100k?', 'BTC', 'm1')
+
+        assert engine.prompts == ['Qwen', 'Gemini']
+        assert engine.collected == ['m1']
+
+    def test_categorical_options_of_one_market_get_their_own_prediction(self):
+        # Every option of a CATEGORICAL market shares the market_id
+        for fanout in (True, False):
+            engine = self._engine(fanout=fanout)
+            first = engine._get_firm_prediction('Qwen', 'Fed rate cut? - Option: 50+ bps decrease', '', 'm1013')
+            second = engine._get_firm_prediction('Qwen', 'Fed rate cut? - Option: No change', '', 'm1013')
+
+            assert 'Option: 50+ bps decrease' in first['prompt']
+            assert 'Option: No change' in second['prompt']
+            assert engine.collected == ['m1013', 'm1013']
+
+
+class TestParallelExecution:
+
+    def test_two_firms_racing_on_one_market_place_a_single_order(self):
+        engine = _engine(1)
+        engine._open_orders_index = OpenOrdersIndex()
+        engine._market_locks_guard = threading.Lock()
+        engine._market_locks = {}
+        engine.memory_profiler = CycleMemoryProfiler(enabled=False)
+        engine.daily_bet_limit = None
+        engine.daily_ledger = DailyLimitLedger(None, limit=None)
+        engine.bankroll_managers = {'Qwen': None, 'Grok': None}
+        engine.risk_guard = SimpleNamespace(get_tier_status=lambda firm_name: {
+            'tier_config': {'max_concurrent_positions': 2}})
+        engine.opinion_api = SimpleNamespace(get_active_positions=lambda: {'success': True, 'positions': []})
+        event = {'event_id': 'e1', 'market_id': 42, 'category': 'Crypto'}
+        # Both firms evaluate before either has placed its order
+        evaluated = threading.Barrier(2)
+
+        def evaluate_candidates(firm_name, events_by_category, bankroll_manager, active_positions):
+            evaluated.wait()
+            yield 'Crypto', {'event': event, 'event_id': 'e1', 'is_opportunity': True, 'expected_value': 1.0}
+
+        def execute_opportunity(firm_name, opportunity, bankroll_manager):
+            time.sleep(0.02)
+            engine._open_orders_index.add({'order_id': firm_name, 'market_id': 42, 'token_id': 't42'})
+            return {'action': 'BET', 'bet_size': 5.0}
+
+        engine._evaluate_candidates = evaluate_candidates
+        engine._execute_opportunity = execute_opportunity
+
+        results = {}
+        threads = [threading.Thread(target=lambda name=name: results.update(
+            {name: engine._process_firm_multi_category_cycle(name, {'Crypto': [event]})})) for name in ('Qwen', 'Grok')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(result['bets_placed'] for result in results.values()) == [0, 1]
+        assert len(engine._open_orders_index.orders_for_market(42)) == 1
+        skipped = [decision for result in results.values() for decision in result['decisions'] if decision['action'] == 'SKIP']
+        assert skipped[0]['duplicate_at_execution'] is True
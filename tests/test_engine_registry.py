@@ -0,0 +1,100 @@
+"""
+Tests for the per-worker engine/client registry
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from engine_registry import EngineRegistry
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv('OPINION_TRADE_API_KEY', 'key-1')
+    monkeypatch.setenv('OPINION_WALLET_PRIVATE_KEY', '0x' + '1' * 64)
+
+
+def _registry(**kwargs):
+    built = {'api': 0, 'engine': 0}
+
+    def api_factory(api_key, private_key):
+        built['api'] += 1
+        return SimpleNamespace(client=object(), api_key=api_key)
+
+    def engine_factory(database, api_key, private_key, opinion_api):
+        built['engine'] += 1
+        return SimpleNamespace(opinion_api=opinion_api, database=database)
+
+    registry = EngineRegistry('db', api_factory=api_factory, engine_factory=engine_factory, **kwargs)
+    return registry, built
+
+
+class TestEngineRegistry:
+    """Test suite for shared instances and their refresh path"""
+
+    def test_instances_are_built_once_and_shared(self):
+        registry, built = _registry()
+        engines = []
+        threads = [threading.Thread(target=lambda: engines.append(registry.get_engine())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert built == {'api': 1, 'engine': 1}
+        assert all(engine is engines[0] for engine in engines)
+        assert registry.get_opinion_api() is engines[0].opinion_api
+        assert engines[0].database == 'db'
+        assert registry.snapshot()['engine']['hits'] == 8
+
+    def test_health_checks_trigger_rebuild(self, monkeypatch):
+        registry, built = _registry()
+        first = registry.get_engine()
+
+        # SDK client failed to initialize while credentials are set
+        first.opinion_api.client = None
+        second = registry.get_engine()
+        assert second is not first
+        assert second.opinion_api is not first.opinion_api
+
+        monkeypatch.setenv('OPINION_TRADE_API_KEY', 'key-2')
+        third = registry.get_engine()
+        assert third.opinion_api.api_key == 'key-2'
+
+        with patch('engine_registry.os.getpid', return_value=os.getpid() + 1):
+            registry.get_opinion_api()
+
+        assert registry.snapshot()['refreshes'] == {'client_unavailable': 1, 'credentials_changed': 1, 'forked': 1}
+        assert built['api'] == 4
+
+    def test_expired_and_manual_refresh(self):
+        registry, built = _registry(max_age_seconds=0)
+        registry.get_opinion_api()
+        registry.get_opinion_api()
+        assert built['api'] == 2
+
+        registry.max_age_seconds = 3600
+        registry.get_engine()
+        registry.refresh()
+        assert registry.snapshot()['engine'] is None
+        registry.get_engine()
+        assert built['engine'] == 2
+
+    def test_cycle_lease_serializes_cycles(self):
+        registry, _ = _registry()
+        with registry.cycle_lease() as engine:
+            assert engine is not None
+            assert registry.snapshot()['cycle_running'] is True
+            with registry.cycle_lease() as busy:
+                assert busy is None
+        with registry.cycle_lease() as engine_again:
+            assert engine_again is engine
+
+    def test_warm_up_builds_in_background(self):
+        registry, built = _registry()
+        registry.warm_up().join(timeout=5)
+        assert built == {'api': 1, 'engine': 1}
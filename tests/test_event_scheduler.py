@@ -0,0 +1,99 @@
+"""
+Tests for the value-of-information event scheduler
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from autonomous_engine import AutonomousEngine
+from event_scheduler import EventScheduler, parse_weights
+from prescreen import PreScreen
+
+NOW = 1_700_000_000.0
+
+
+def _event(event_id, category, cutoff_days=10):
+    return {'event_id': event_id, 'description': f'desc {event_id}', 'category': category,
+            'cutoff_at': NOW + cutoff_days * 86400}
+
+
+def _screen(mid, spread=0.02):
+    return {'passed': True, 'mid': mid, 'spread': spread}
+
+
+class TestEventScheduler:
+    """Test suite for ranking signals, diversity and budget"""
+
+    def test_signals(self):
+        scheduler = EventScheduler(budget=5)
+        signals = scheduler.signals(_event('a', 'Crypto', cutoff_days=30), _screen(0.5, spread=0.05),
+                                    last_decision_at=NOW - 6 * 3600, now=NOW)
+        assert signals == {'liquidity': 0.75, 'uncertainty': 1.0, 'cutoff': 0.5, 'staleness': 0.25}
+
+        neutral = scheduler.signals({'cutoff_at': 0}, None, None, NOW)
+        assert neutral == {'liquidity': 0.5, 'uncertainty': 0.5, 'cutoff': 0.5, 'staleness': 1.0}
+
+    def test_ranks_globally_with_category_diversity(self):
+        scheduler = EventScheduler(budget=3, diversity_decay=0.5)
+        candidates = [
+            (_event('c1', 'Crypto'), _screen(0.50)),
+            (_event('c2', 'Crypto'), _screen(0.48)),
+            (_event('c3', 'Crypto'), _screen(0.52)),
+            (_event('p1', 'Politics'), _screen(0.30)),
+            (_event('e1', 'Economy'), _screen(0.95)),
+        ]
+        # c1 was decided an hour ago: it drops behind the other near-0.5 crypto markets,
+        # and a second crypto pick (c3) is halved below the near-certain economy market
+        picked = scheduler.schedule(candidates, {'desc c1': NOW - 3600}, now=NOW)
+
+        assert [entry['event']['event_id'] for entry in picked] == ['c2', 'p1', 'e1']
+        assert picked[0]['score'] > picked[1]['score'] > picked[2]['score']
+
+    def test_budget_follows_bankroll_mode(self, monkeypatch):
+        assert EventScheduler.from_env('TEST').budget == 8
+        assert EventScheduler.from_env('production').budget == 24
+        monkeypatch.setenv('EVENT_BUDGET_PRODUCTION', '40')
+        monkeypatch.setenv('EVENT_SCHEDULER_WEIGHTS', 'staleness=0.5,bogus=1')
+        scheduler = EventScheduler.from_env('PRODUCTION')
+        assert scheduler.budget == 40
+        assert scheduler.weights['staleness'] == 0.5
+        assert parse_weights('liquidity=x,cutoff=0.1') == {'cutoff': 0.1}
+
+
+class TestEngineSchedule:
+    """Test suite for the engine's per-cycle schedule"""
+
+    def test_schedule_is_built_once_and_shared_by_firms(self):
+        quotes = {'tc1': 0.5, 'tc2': 0.45, 'tp1': 0.4, 'ts1': 0.99}
+        db_calls = []
+        engine = AutonomousEngine.__new__(AutonomousEngine)
+        engine.prescreen = PreScreen()
+        engine._prescreen_results = {}
+        engine._prescreen_lock = threading.Lock()
+        engine.event_scheduler = EventScheduler(budget=2)
+        engine._schedule = None
+        engine._schedule_lock = threading.Lock()
+        engine.opinion_api = SimpleNamespace(
+            get_latest_price=lambda token_id, call_site='default': {
+                'success': True, 'price': quotes[token_id],
+                'bid_price': quotes[token_id] - 0.01, 'ask_price': quotes[token_id] + 0.01},
+            get_fee_rates=lambda use_cache=True: {'success': True, 'taker_fee': 0.02}
+        )
+        engine.db = SimpleNamespace(get_last_decision_times=lambda: db_calls.append(1) or {})
+        cutoff = time.time() + 5 * 86400
+        events = {
+            'Crypto': [{'event_id': 'c1', 'yes_token_id': 'tc1', 'category': 'Crypto', 'cutoff_at': cutoff},
+                       {'event_id': 'c2', 'yes_token_id': 'tc2', 'category': 'Crypto', 'cutoff_at': cutoff}],
+            'Politics': [{'event_id': 'p1', 'yes_token_id': 'tp1', 'category': 'Politics', 'cutoff_at': cutoff},
+                         {'event_id': 's1', 'yes_token_id': 'ts1', 'category': 'Politics', 'cutoff_at': cutoff}],
+        }
+
+        first = [event['event_id'] for _, event in engine._iter_evaluation_candidates(events)]
+        second = [event['event_id'] for _, event in engine._iter_evaluation_candidates(events)]
+
+        assert first == second == ['c1', 'p1']
+        assert db_calls == [1]
+        summary = engine._schedule_summary()
+        assert summary['categories'] == {'Crypto': 1, 'Politics': 1}
+        assert engine._prescreen_summary()['rejected'] == {'price_at_bound': 1}
@@ -0,0 +1,56 @@
+"""
+Tests for the background-filled, replayable EventStream.
+"""
+
+import threading
+import time
+
+from event_stream import EventStream
+
+
+def _slow_events(count, delay=0.01, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError('pagination failed')
+        time.sleep(delay)
+        yield {'market_id': i}
+
+
+class TestEventStream:
+
+    def test_consumer_starts_before_producer_finishes(self):
+        release = threading.Event()
+
+        def gated():
+            yield {'market_id': 0}
+            release.wait(timeout=5)
+            yield {'market_id': 1}
+
+        stream = EventStream(gated()).start()
+        iterator = iter(stream)
+
+        assert next(iterator) == {'market_id': 0}
+        assert not stream.done
+        release.set()
+        assert next(iterator) == {'market_id': 1}
+
+    def test_every_consumer_replays_all_events(self):
+        stream = EventStream(_slow_events(5)).start()
+
+        first = [e['market_id'] for e in stream]
+        second = [e['market_id'] for e in stream]
+
+        assert first == second == [0, 1, 2, 3, 4]
+        assert stream.first_event_seconds <= stream.total_seconds
+
+    def test_producer_error_ends_stream(self):
+        stream = EventStream(_slow_events(5, fail_at=2)).start()
+
+        assert [e['market_id'] for e in stream.wait()] == [0, 1]
+        assert isinstance(stream.error, RuntimeError)
+
+    def test_wait_for_first_on_empty_stream(self):
+        stream = EventStream(iter([])).start()
+
+        assert stream.wait_for_first(timeout=5) is False
+        assert stream.done
@@ -0,0 +1,87 @@
+"""
+Tests for the primitives behind parallel firm execution
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from firm_concurrency import DailyLimitLedger, ProviderSlots, current_rss_mb, parse_concurrency
+
+
+class _FakeDatabase:
+    def __init__(self, total=0.0):
+        self.total = total
+
+    def get_daily_bet_total(self):
+        return self.total
+
+    def add_to_daily_bet_total(self, amount):
+        self.total += amount
+        return self.total
+
+
+class TestProviderSlots:
+    """Test suite for per-provider LLM concurrency caps"""
+
+    def test_parse_concurrency(self):
+        assert parse_concurrency('ChatGPT=3, Gemini=1,bad,Qwen=0') == {'ChatGPT': 3, 'Gemini': 1, 'Qwen': 1}
+        assert parse_concurrency('') == {}
+        assert parse_concurrency('ChatGPT=x,Gemini=2,Qwen=') == {'Gemini': 2}
+
+    def test_in_flight_calls_are_capped_per_provider(self):
+        slots = ProviderSlots(limits={'Gemini': 1}, default=2)
+        in_flight = {'Gemini': 0, 'ChatGPT': 0}
+        peak = {'Gemini': 0, 'ChatGPT': 0}
+        lock = threading.Lock()
+
+        def call(provider):
+            with slots.slot(provider):
+                with lock:
+                    in_flight[provider] += 1
+                    peak[provider] = max(peak[provider], in_flight[provider])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[provider] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(call, ['Gemini'] * 4 + ['ChatGPT'] * 4))
+
+        assert peak == {'Gemini': 1, 'ChatGPT': 2}
+
+
+class TestDailyLimitLedger:
+    """Test suite for the shared daily limit"""
+
+    def test_concurrent_reservations_never_exceed_limit(self):
+        database = _FakeDatabase(total=10.0)
+        ledger = DailyLimitLedger(database, limit=50.0)
+
+        def bet(_):
+            if ledger.reserve(10.0) is None:
+                return False
+            time.sleep(0.01)
+            ledger.commit(10.0, 10.0)
+            return True
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            placed = list(pool.map(bet, range(10)))
+
+        assert placed.count(True) == 4
+        assert database.total == 50.0
+        assert ledger.reserved == 0.0
+
+    def test_release_frees_the_reservation(self):
+        ledger = DailyLimitLedger(_FakeDatabase(), limit=10.0)
+        assert ledger.reserve(8.0) == 0.0
+        assert ledger.reserve(5.0) is None
+        ledger.release(8.0)
+        assert ledger.reserve(5.0) == 0.0
+
+    def test_no_limit(self):
+        ledger = DailyLimitLedger(_FakeDatabase(total=1e6), limit=None)
+        assert ledger.reserve(1e6) == 1e6
+
+
+def test_current_rss_mb_is_positive():
+    assert current_rss_mb() > 0
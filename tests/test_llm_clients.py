@@ -0,0 +1,67 @@
+"""
+Tests for lazy firm construction in FirmOrchestrator
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from llm_clients import FIRM_FACTORIES, FirmOrchestrator, TradingFirm
+
+
+class _FakeFirm(TradingFirm):
+    built = []
+
+    def __init__(self, name):
+        super().__init__(name)
+        _FakeFirm.built.append(name)
+
+
+def _factories():
+    _FakeFirm.built = []
+    return {name: (lambda name=name: _FakeFirm(name)) for name in ('ChatGPT', 'Gemini', 'Qwen')}
+
+
+class TestFirmOrchestrator:
+    """Test suite for firm factories, lazy creation and firm subsets"""
+
+    def test_firms_are_built_on_first_use_only(self):
+        orchestrator = FirmOrchestrator(enabled_firms=None, factories=_factories())
+
+        assert orchestrator.get_firm_names() == ['ChatGPT', 'Gemini', 'Qwen']
+        assert _FakeFirm.built == []
+
+        gemini = orchestrator.get_firm('Gemini')
+        assert orchestrator.get_firm('Gemini') is gemini
+        assert _FakeFirm.built == ['Gemini']
+        assert orchestrator.get_firm('Grok') is None
+
+        assert list(orchestrator.get_all_firms()) == ['ChatGPT', 'Gemini', 'Qwen']
+        assert sorted(orchestrator.built_firms()) == ['ChatGPT', 'Gemini', 'Qwen']
+
+    def test_enabled_subset_from_env(self, monkeypatch):
+        monkeypatch.setenv('ENABLED_FIRMS', 'Qwen, ChatGPT')
+        orchestrator = FirmOrchestrator(factories=_factories())
+
+        # Evaluation order follows the factory registry, not the env var
+        assert orchestrator.get_firm_names() == ['ChatGPT', 'Qwen']
+        assert orchestrator.get_firm('Gemini') is None
+
+        monkeypatch.setenv('ENABLED_FIRMS', 'ChatGPT,Claude')
+        with pytest.raises(ValueError):
+            FirmOrchestrator(factories=_factories())
+
+    def test_default_registry_covers_all_firms(self, monkeypatch):
+        monkeypatch.delenv('ENABLED_FIRMS', raising=False)
+        assert FirmOrchestrator().get_firm_names() == list(FIRM_FACTORIES) == \
+            ['ChatGPT', 'Gemini', 'Qwen', 'Deepseek', 'Grok']
+
+    def test_provider_sdks_not_imported_until_a_firm_is_built(self):
+        code = (
+            "import sys; from llm_clients import FirmOrchestrator; "
+            "names = FirmOrchestrator().get_firm_names(); "
+            "print(len(names), 'openai' in sys.modules, 'google.genai' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert output.stdout.split() == ['5', 'False', 'False']
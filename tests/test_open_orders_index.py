@@ -0,0 +1,41 @@
+"""
+Tests for the per-cycle open-orders index used for duplicate prevention.
+"""
+
+from unittest.mock import Mock
+
+from open_orders_index import OpenOrdersIndex
+
+
+class TestOpenOrdersIndex:
+
+    def test_lookup_by_market_and_token_normalizes_ids(self):
+        index = OpenOrdersIndex([
+            {'order_id': 'a', 'market_id': 101, 'token_id': '555'},
+            {'order_id': 'b', 'market_id': 101, 'token_id': '556'},
+            {'order_id': 'c', 'market_id': 202, 'token_id': '777'},
+        ])
+
+        assert [o['order_id'] for o in index.orders_for_market('101')] == ['a', 'b']
+        assert [o['order_id'] for o in index.orders_for_token(777)] == ['c']
+        assert index.orders_for_market(303) == []
+        assert len(index) == 3
+        assert index.market_count() == 2
+
+    def test_added_orders_are_visible_immediately(self):
+        index = OpenOrdersIndex()
+        index.add({'order_id': 'new', 'market_id': 9, 'token_id': 't9'})
+
+        assert index.orders_for_market(9)[0]['order_id'] == 'new'
+
+    def test_from_api_fetches_once_and_handles_failure(self):
+        api = Mock()
+        api.get_my_orders.return_value = {'success': True, 'orders': [{'order_id': 'x', 'market_id': 1, 'token_id': 't'}]}
+
+        index = OpenOrdersIndex.from_api(api)
+
+        api.get_my_orders.assert_called_once_with()
+        assert len(index.orders_for_market(1)) == 1
+
+        api.get_my_orders.return_value = {'success': False, 'error': 'down'}
+        assert OpenOrdersIndex.from_api(api) is None
@@ -0,0 +1,80 @@
+"""
+Tests for the short-TTL orderbook snapshot cache (TTLs, counters and request coalescing).
+"""
+
+import threading
+import time
+
+from orderbook_cache import OrderbookCache, parse_ttls
+
+
+def _book(price=0.5):
+    return {'success': True, 'orderbook': {'bids': [{'price': price, 'amount': 10.0}], 'asks': []}}
+
+
+class TestOrderbookCache:
+
+    def test_hit_within_ttl_and_fresh_bypass(self):
+        cache = OrderbookCache(ttls={'evaluation': 60.0})
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return _book()
+
+        cache.get('tok', fetch, call_site='evaluation')
+        cache.get('tok', fetch, call_site='evaluation')
+        assert len(calls) == 1
+
+        cache.get('tok', fetch, call_site='order', fresh=True)
+        assert len(calls) == 2
+
+        stats = cache.get_stats()
+        assert stats['by_call_site']['evaluation'] == {'hits': 1, 'misses': 1, 'coalesced': 0}
+        assert stats['by_call_site']['order']['misses'] == 1
+
+    def test_ttl_is_per_call_site(self):
+        cache = OrderbookCache(ttls={'liquidity': 60.0, 'monitor': 0.0})
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return _book()
+
+        cache.get('tok', fetch, call_site='liquidity')
+        cache.get('tok', fetch, call_site='monitor')
+        cache.get('tok', fetch, call_site='liquidity')
+        assert len(calls) == 2
+
+    def test_failures_are_not_cached(self):
+        cache = OrderbookCache(ttls={'default': 60.0})
+        responses = [{'success': False, 'error': 'boom'}, _book()]
+
+        assert cache.get('tok', lambda: responses.pop(0))['success'] is False
+        assert cache.get('tok', lambda: responses.pop(0))['success'] is True
+
+    def test_concurrent_requests_share_one_fetch(self):
+        cache = OrderbookCache(ttls={'default': 0.0})
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return _book()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('tok', slow_fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert len(results) == 5 and all(r['success'] for r in results)
+        assert cache.get_stats()['coalesced'] == 4
+
+    def test_parse_ttls_ignores_malformed_pairs(self):
+        assert parse_ttls("liquidity=60, monitor = 5,bad,order=x") == {'liquidity': 60.0, 'monitor': 5.0}
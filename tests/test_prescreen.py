@@ -0,0 +1,102 @@
+"""
+Tests for the pre-LLM event screen
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from autonomous_engine import AutonomousEngine
+from prescreen import PreScreen
+
+
+def _quote(bid, ask):
+    return {'success': True, 'price': (bid + ask) / 2, 'bid_price': bid, 'ask_price': ask}
+
+
+class TestPreScreen:
+    """Test suite for rejection reasons and scoring"""
+
+    def test_rejection_reasons(self):
+        screen = PreScreen(max_spread=0.2, min_seconds_to_cutoff=3600, min_volume=100)
+        now = time.time()
+        event = {'event_id': 'e1', 'cutoff_at': now + 86400, 'volume': '500'}
+
+        assert screen.screen(event, _quote(0.40, 0.44), 0.02)['passed'] is True
+        assert screen.screen(event, _quote(0.985, 0.995), 0.02)['reason'] == 'price_at_bound'
+        assert screen.screen(event, _quote(0.20, 0.60), 0.02)['reason'] == 'wide_spread'
+        assert screen.screen(event, {'success': False}, 0.02)['reason'] == 'no_quote'
+        assert screen.screen(dict(event, volume='12'), _quote(0.4, 0.44), 0.02)['reason'] == 'low_volume'
+        # cutoff_at in milliseconds, ten minutes away
+        closing = dict(event, cutoff_at=(now + 600) * 1000)
+        assert screen.screen(closing, _quote(0.4, 0.44), 0.02)['reason'] == 'closing_soon'
+
+    def test_score_is_best_edge_after_fee(self):
+        screen = PreScreen(min_price=0.01, max_price=0.99, max_spread=1.0)
+        event = {'event_id': 'e1', 'cutoff_at': 0}
+
+        # Cheapest side is NO at 1 - 0.30 = 0.70 vs YES ask 0.34
+        assert screen.screen(event, _quote(0.30, 0.34), 0.03)['score'] == round(0.97 - 0.34, 4)
+
+        # Both asks at 0.975 with a 3% fee: no probability can make it positive
+        result = screen.screen(event, _quote(0.025, 0.975), 0.03)
+        assert (result['passed'], result['reason']) == (False, 'no_edge_after_fee')
+
+
+class TestEnginePreScreen:
+    """Test suite for screening once per cycle and refilling category slots"""
+
+    def test_rejected_events_free_their_slot_and_are_screened_once(self):
+        quotes = {'t0': _quote(0.985, 0.995), 't1': _quote(0.40, 0.42), 't2': _quote(0.50, 0.52),
+                  't3': _quote(0.60, 0.62), 't4': _quote(0.30, 0.32)}
+        calls = []
+
+        def get_latest_price(token_id, call_site='default'):
+            calls.append(token_id)
+            return quotes[token_id]
+
+        engine = AutonomousEngine.__new__(AutonomousEngine)
+        engine.prescreen = PreScreen()
+        engine.event_scheduler = None
+        engine._prescreen_results = {}
+        engine._prescreen_lock = threading.Lock()
+        engine.opinion_api = SimpleNamespace(
+            get_latest_price=get_latest_price,
+            get_fee_rates=lambda use_cache=True: {'success': True, 'taker_fee': 0.02}
+        )
+        events = {'Crypto': [{'event_id': f'e{i}', 'yes_token_id': f't{i}', 'category': 'Crypto'} for i in range(5)]}
+
+        for _ in range(2):
+            selected = [event['event_id'] for _, event in engine._iter_evaluation_candidates(events)]
+            assert selected == ['e1', 'e2', 'e3']
+
+        assert calls == ['t0', 't1', 't2', 't3']
+        summary = engine._prescreen_summary()
+        assert summary['rejected'] == {'price_at_bound': 1}
+        # Sorted by score: e3 (NO ask 0.40), e1 (YES ask 0.42), e2 (NO ask 0.50)
+        assert [r['event_id'] for r in summary['top']] == ['e3', 'e1', 'e2']
+
+    def test_probe_quote_is_reused(self):
+        calls = []
+
+        def get_latest_price(token_id, call_site='default'):
+            calls.append(token_id)
+            return _quote(0.40, 0.42)
+
+        engine = AutonomousEngine.__new__(AutonomousEngine)
+        engine.prescreen = PreScreen()
+        engine._prescreen_results = {}
+        engine._prescreen_lock = threading.Lock()
+        engine.opinion_api = SimpleNamespace(
+            get_latest_price=get_latest_price,
+            get_fee_rates=lambda use_cache=True: {'success': True, 'taker_fee': 0.02}
+        )
+
+        probed = {'event_id': 'e1', 'yes_token_id': 't1', 'liquidity_quote': _quote(0.985, 0.995)}
+        unprobed = {'event_id': 'e2', 'yes_token_id': 't2'}
+
+        assert engine._passes_prescreen(probed) is False
+        assert engine._prescreen_results['e1']['reason'] == 'price_at_bound'
+        assert engine._passes_prescreen(unprobed) is True
+        # Only the option the liquidity probe never looked at needs a book
+        assert calls == ['t2']
@@ -0,0 +1,48 @@
+"""
+Tests for the SQLite-backed token-bucket rate limiter shared across processes.
+"""
+
+import time
+
+import pytest
+
+from rate_limiter import RateLimitExceeded, SharedRateLimiter, parse_limits
+
+
+class TestSharedRateLimiter:
+
+    def test_burst_is_free_then_calls_are_spaced(self, tmp_path):
+        limiter = SharedRateLimiter(db_path=str(tmp_path / 'rl.db'), limits={'orders': (4.0, 2.0)})
+
+        waits = [limiter.acquire('orders') for _ in range(4)]
+
+        assert waits[0] == 0 and waits[1] == 0
+        # Sequential callers are spaced roughly 1/rate apart
+        assert 0 < waits[2] <= 0.25 + 1e-6 and 0 < waits[3] <= 0.25 + 1e-6
+        metrics = limiter.get_metrics()['orders']
+        assert metrics['calls'] == 4 and metrics['queued'] == 2
+
+    def test_buckets_are_shared_between_instances(self, tmp_path):
+        db_path = str(tmp_path / 'rl.db')
+        first = SharedRateLimiter(db_path=db_path, limits={'account': (0.5, 1.0)}, max_wait=0.1)
+        second = SharedRateLimiter(db_path=db_path, limits={'account': (0.5, 1.0)}, max_wait=0.1)
+
+        first.acquire('account')
+
+        # The other "process" sees the empty bucket and would need to wait ~2s
+        with pytest.raises(RateLimitExceeded):
+            second.acquire('account')
+
+    def test_unknown_bucket_is_not_limited(self, tmp_path):
+        limiter = SharedRateLimiter(db_path=str(tmp_path / 'rl.db'))
+
+        started = time.monotonic()
+        for _ in range(50):
+            assert limiter.acquire('not_configured') == 0.0
+        assert time.monotonic() - started < 1.0
+
+    def test_parse_limits(self):
+        assert parse_limits("market_data=10:20, orders=2,bad,account=x:1") == {
+            'market_data': (10.0, 20.0),
+            'orders': (2.0, 2.0),
+        }
@@ -0,0 +1,111 @@
+"""
+Tests for the health-scored BNB RPC pool and the failover web3 provider.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from rpc_pool import PooledHTTPProvider, RpcEndpointPool
+
+
+URLS = ['https://rpc-a.example', 'https://rpc-b.example', 'https://rpc-c.example']
+
+
+def _mock_posts(provider, post):
+    for endpoint in provider._providers.values():
+        endpoint._request_session_manager = Mock(make_post_request=Mock(side_effect=post))
+
+
+class TestRpcEndpointPool:
+
+    def test_ranking_prefers_low_error_rate_then_latency(self):
+        pool = RpcEndpointPool(URLS)
+        pool.record_success(URLS[0], 0.9)
+        pool.record_success(URLS[1], 0.1)
+        pool.record_success(URLS[2], 0.05)
+        pool.record_failure(URLS[2], 'timeout')
+
+        ranked = pool.ranked()
+
+        assert ranked[0] == URLS[1]
+        assert ranked[-1] == URLS[2]  # failing endpoint is in cooldown
+
+    def test_from_env_puts_custom_rpc_first_and_dedupes(self, monkeypatch):
+        monkeypatch.setenv('BNB_RPC_URL', 'https://custom.example')
+        monkeypatch.setenv('BNB_RPC_URLS', 'https://extra.example, https://custom.example')
+
+        pool = RpcEndpointPool.from_env()
+
+        assert pool.urls[:2] == ['https://custom.example', 'https://extra.example']
+        assert len(pool.urls) == len(set(pool.urls))
+
+    def test_snapshot_reports_every_endpoint(self):
+        pool = RpcEndpointPool(URLS)
+        pool.record_failure(URLS[0], 'blocked')
+
+        snapshot = pool.snapshot()
+
+        assert snapshot['best'] != URLS[0]
+        assert {e['url'] for e in snapshot['endpoints']} == set(URLS)
+
+
+class TestPooledHTTPProvider:
+
+    def test_fails_over_within_one_request(self):
+        pool = RpcEndpointPool(URLS)
+        provider = PooledHTTPProvider(pool)
+        attempted = []
+
+        def post(url, data, **kwargs):
+            attempted.append(url)
+            if url != URLS[2]:
+                raise ConnectionError('refused')
+            return b'{"jsonrpc":"2.0","id":1,"result":"0x38"}'
+
+        _mock_posts(provider, post)
+
+        raw = provider._make_request('eth_chainId', b'{}')
+
+        assert raw.endswith(b'"0x38"}')
+        assert attempted == URLS
+        assert pool.ranked()[0] == URLS[2]
+
+    def test_raises_last_error_when_all_endpoints_fail(self):
+        pool = RpcEndpointPool(URLS[:2])
+        provider = PooledHTTPProvider(pool)
+        _mock_posts(provider, Mock(side_effect=ConnectionError('down')))
+
+        with pytest.raises(ConnectionError):
+            provider._make_request('eth_blockNumber', b'{}')
+
+    def test_concurrent_requests_are_charged_to_the_endpoint_they_used(self):
+        pool = RpcEndpointPool(URLS[:2])
+        provider = PooledHTTPProvider(pool)
+        endpoint_uri = provider.endpoint_uri
+        both_sent = threading.Barrier(2)
+        posted = []
+
+        def post(url, data, **kwargs):
+            posted.append(url)
+            if len(posted) <= 2:
+                both_sent.wait(timeout=5)
+            if url == URLS[0]:
+                raise ConnectionError('refused')
+            return b'{"jsonrpc":"2.0","id":1,"result":"0x1"}'
+
+        _mock_posts(provider, post)
+        # Each request starts on a different endpoint while the other is in flight
+        pool.ranked = Mock(side_effect=[[URLS[0], URLS[1]], [URLS[1], URLS[0]], [URLS[1], URLS[0]]])
+        pool.record_failure = Mock()
+        pool.record_success = Mock()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda _: provider._make_request('eth_blockNumber', b'{}'), range(2)))
+
+        assert sorted(posted) == [URLS[0], URLS[1], URLS[1]]
+        assert [call.args[0] for call in pool.record_failure.call_args_list] == [URLS[0]]
+        assert [call.args[0] for call in pool.record_success.call_args_list] == [URLS[1], URLS[1]]
+        assert provider.endpoint_uri == endpoint_uri
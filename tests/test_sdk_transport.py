@@ -0,0 +1,115 @@
+"""
+Tests for the shared SDK transport (PatchedSession connection pool)
+Runs against a local keep-alive HTTP server
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+from opinion_api.api_client import ApiClient
+from opinion_api.configuration import Configuration
+
+import opinion_sdk_patcher
+from opinion_sdk_patcher import (
+    PatchedSession, SessionRESTClient, install_shared_transport, parse_timeout, sdk_call_type
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        payload = json.dumps({'path': self.path, 'echo': body.decode(), 'ua': self.headers.get('User-Agent')}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestSdkTransport:
+    """Test suite for the pooled, shared SDK session"""
+
+    def test_connections_are_reused_and_counted(self, server):
+        session = PatchedSession(browser_headers=False)
+        for page in range(3):
+            assert session.get(f"{server}/markets?page={page}").status_code == 200
+
+        stats = session.connection_stats()
+        host = server.split('//')[1]
+        assert stats['hosts'][host] == {'new_connections': 1, 'requests': 3, 'reused_connections': 2}
+        assert stats['new_connections'] == 1 and stats['reused_connections'] == 2
+
+    def test_timeout_follows_call_type(self, server):
+        session = PatchedSession(browser_headers=False, timeouts={'orders': (1.0, 0.1), 'market_data': (1.0, 2.0)})
+
+        with sdk_call_type('market_data'):
+            assert session.get(f"{server}/slow").status_code == 200
+        with sdk_call_type('orders'):
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                session.get(f"{server}/slow")
+        assert session.timeout_for(None) == session.default_timeout
+
+    def test_sdk_api_client_goes_through_shared_session(self, server, monkeypatch):
+        monkeypatch.setattr(opinion_sdk_patcher, '_sdk_session', PatchedSession(browser_headers=False))
+        first = SimpleNamespace(api_client=ApiClient(Configuration(host=server)))
+        second = SimpleNamespace(api_client=ApiClient(Configuration(host=server)))
+
+        assert install_shared_transport(first) and install_shared_transport(second)
+        assert first.api_client.rest_client.session is second.api_client.rest_client.session
+        assert install_shared_transport(SimpleNamespace()) is False
+
+        for client in (first, second):
+            response = client.api_client.rest_client.request(
+                'POST', f"{server}/openapi/order", headers={'Content-Type': 'application/json'},
+                body={'side': 'BUY'}
+            )
+            assert response.status == 200
+            assert json.loads(response.read())['echo'] == '{"side": "BUY"}'
+            assert response.getheader('content-type') == 'application/json'
+
+        # Two SDK clients, one TLS/TCP connection
+        assert opinion_sdk_patcher._sdk_session.connection_stats()['new_connections'] == 1
+
+    def test_browser_headers_are_optional(self, server):
+        with_headers = PatchedSession(browser_headers=True).get(f"{server}/").json()
+        without = PatchedSession(browser_headers=False).get(f"{server}/").json()
+        assert with_headers['ua'].startswith('Mozilla/5.0')
+        assert without['ua'].startswith('python-requests')
+
+    def test_parse_timeout(self):
+        assert parse_timeout('3,20', (5.0, 15.0)) == (3.0, 20.0)
+        assert parse_timeout('7', (5.0, 15.0)) == (7.0, 7.0)
+        assert parse_timeout(None, (5.0, 15.0)) == (5.0, 15.0)
+
+    def test_rest_client_rejects_unsupported_body(self, server):
+        from opinion_api.exceptions import ApiException
+        client = SessionRESTClient(PatchedSession(browser_headers=False))
+        with pytest.raises(ApiException):
+            client.request('POST', f"{server}/x", headers={'Content-Type': 'text/plain'}, body=object())
@@ -0,0 +1,155 @@
+"""
+Tests for the in-process simulated Opinion.trade exchange.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ['RATE_LIMIT_ENABLED'] = 'false'
+
+from opinion_clob_sdk.chain.py_order_utils.model.sides import OrderSide
+from simulated_exchange import SimulatedExchange
+from opinion_trade_api import OpinionTradeAPI
+
+
+def _order(market_id, token_id, price, usdt, side=OrderSide.BUY):
+    return SimpleNamespace(marketId=market_id, tokenId=token_id, side=side, price=str(price),
+                           makerAmountInQuoteToken=usdt)
+
+
+def _binary_market(exchange):
+    return next(m for m in exchange.markets.values() if not m['options'])
+
+
+class TestMatchingEngine:
+
+    def test_same_seed_is_deterministic(self):
+        first, second = SimulatedExchange(seed=7), SimulatedExchange(seed=7)
+        token = _binary_market(first)['yes_token_id']
+
+        assert first.get_orderbook(token).result.asks == second.get_orderbook(token).result.asks
+
+    def test_marketable_buy_sweeps_asks_and_updates_account(self):
+        exchange = SimulatedExchange(seed=1, starting_balance=100)
+        market = _binary_market(exchange)
+        token = market['yes_token_id']
+        best_ask = float(exchange.get_orderbook(token).result.asks[0]['price'])
+
+        response = exchange.place_order(_order(market['market_id'], token, min(best_ask + 0.05, 0.999), 10))
+
+        assert response.errno == 0 and response.result.status == 'filled'
+        assert exchange.balance == pytest.approx(90)
+        assert exchange.positions[token] == pytest.approx(sum(
+            float(t.amount) / 1e18 / float(t.price) for t in exchange.trades
+        ))
+        assert exchange.get_my_orders().result.list == []
+
+    def test_passive_order_rests_locks_funds_and_can_be_cancelled(self):
+        exchange = SimulatedExchange(seed=1, starting_balance=100)
+        market = _binary_market(exchange)
+        token = market['yes_token_id']
+
+        response = exchange.place_order(_order(market['market_id'], token, 0.001, 5))
+
+        assert response.result.status == 'open'
+        assert exchange.available_balance == pytest.approx(95)
+        assert exchange.cancel_all_orders().result.cancelledCount == 1
+        assert exchange.available_balance == pytest.approx(100)
+
+    def test_insufficient_balance_is_rejected(self):
+        exchange = SimulatedExchange(seed=1, starting_balance=5)
+        market = _binary_market(exchange)
+
+        response = exchange.place_order(_order(market['market_id'], market['yes_token_id'], 0.9, 10))
+
+        assert response.errno != 0
+
+    def test_resolution_and_redeem_pay_winning_shares(self):
+        exchange = SimulatedExchange(seed=3, starting_balance=100, taker_fee_bps=0)
+        market = _binary_market(exchange)
+        token = market['yes_token_id']
+        exchange.place_order(_order(market['market_id'], token, 0.999, 10))
+        shares = exchange.positions[token]
+
+        exchange.resolve_market(market['market_id'], winner='YES')
+        exchange.redeem([token])
+
+        assert exchange.balance == pytest.approx(90 + shares)
+        assert exchange.get_markets(page=1, limit=100).result.list[0].status.name in ('ACTIVATED', 'RESOLVED')
+
+
+class TestOpinionTradeAPIOnSimulator:
+
+    def test_offline_event_fetch_and_order_round_trip(self):
+        exchange = SimulatedExchange(seed=11, starting_balance=200)
+        api = OpinionTradeAPI(client=exchange)
+
+        events = api.get_available_events(limit=50, max_workers=1)
+        assert events['success'] is True
+        assert {e['market_id'] for e in events['events']} == set(exchange.markets)
+        # Categorical markets produce one event per option
+        assert len(events['events']) > len(exchange.markets)
+        # The liquidity probe's quote travels with the event for the pre-screen
+        binary = [e for e in events['events'] if not exchange.markets[e['market_id']]['options']]
+        assert all(e['liquidity_quote']['success'] and 0 < e['liquidity_quote']['price'] < 1 for e in binary)
+
+        event = events['events'][0]
+        order = api.submit_prediction({'market_id': event['market_id'], 'token_id': event['yes_token_id'],
+                                       'amount': 10, 'side': 'BUY'})
+        assert order['success'] is True
+
+        positions = api.get_active_positions()
+        assert positions['count'] == 1
+        assert positions['positions'][0]['token_id'] == event['yes_token_id']
+        assert api.get_account_balance()['total_balance'] == pytest.approx(190)
+        assert api.get_my_trades()['count'] >= 1
+
+    def test_order_fetches_a_single_fresh_book(self):
+        exchange = SimulatedExchange(seed=11, starting_balance=200)
+        api = OpinionTradeAPI(client=exchange)
+        market = _binary_market(exchange)
+        fetched = []
+        get_orderbook = exchange.get_orderbook
+        exchange.get_orderbook = lambda token_id: fetched.append(token_id) or get_orderbook(token_id)
+
+        order = api.submit_prediction({'market_id': market['market_id'], 'token_id': market['yes_token_id'],
+                                       'amount': 10, 'side': 'BUY'})
+
+        assert order['success'] is True
+        assert fetched == [market['yes_token_id']]
+
+
+class TestCycleOnSimulator:
+
+    def test_offline_cycle_shortlists_and_predicts(self, tmp_path, monkeypatch):
+        from autonomous_engine import AutonomousEngine
+        from database import TradingDatabase
+
+        monkeypatch.setenv('SYSTEM_ENABLED', 'true')
+        monkeypatch.setenv('CYCLE_CHECKPOINTS_ENABLED', 'false')
+        monkeypatch.setenv('DATA_CACHE_ENABLED', 'false')
+        db = TradingDatabase(db_path=str(tmp_path / 'trading.db'))
+        engine = AutonomousEngine(db, opinion_api=OpinionTradeAPI(client=SimulatedExchange(seed=5)))
+        engine.checkpoints = None
+        # The scheduler ranks the full event list: nothing to stream
+        assert engine.event_scheduler is not None and engine.stream_events is False
+
+        prompts = []
+
+        class Firm:
+            def generate_prediction(self, prompt):
+                prompts.append(prompt)
+                return {'probability': 0.5, 'confidence': 0.5, 'reasoning': 'coin flip'}
+
+        engine.orchestrator = SimpleNamespace(get_firm_names=lambda: ['Qwen'], get_firm=lambda name: Firm())
+        engine._initialize_firms()
+
+        results = engine.run_daily_cycle()
+
+        assert results['total_events_analyzed'] > 0
+        assert results['prescreen']['shortlisted'] > 0
+        assert results['prescreen']['rejected'].get('closing_soon', 0) == 0
+        assert prompts
+